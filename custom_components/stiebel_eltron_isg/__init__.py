@@ -4,14 +4,24 @@ For more details about this integration, please refer to
 https://github.com/pail23/stiebel_eltron_isg
 """
 
+import asyncio
+from functools import partial
+import importlib
 import logging
+import sys
+from types import ModuleType
+from typing import cast
 
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
-from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    issue_registry as ir,
+)
 from homeassistant.helpers.typing import ConfigType
-from modbus_connection import ModbusError
+from modbus_connection import ModbusConnection, ModbusError
 from modbus_connection.pymodbus import connect_tcp
 from pystiebeleltron import (
     ControllerModel,
@@ -20,17 +30,21 @@ from pystiebeleltron import (
     get_controller_model,
 )
 
-from .const import DEFAULT_PORT, DOMAIN, UNIT_ID
-from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
-from .lwz_coordinator import StiebelEltronModbusLWZDataCoordinator
-from .migration import (
-    async_migrate_device_identifier,
-    async_migrate_unique_ids,
-    async_remove_legacy_circulation_pump_switch,
-    duplicate_entity_issue_id,
+from .const import (
+    CIRCULATION_PUMP,
+    CONF_MODEL_ID,
+    DEFAULT_PORT,
+    DOMAIN,
+    RENAMED_KEYS,
+    UNIT_ID,
 )
-from .wpm3i_coordinator import StiebelEltronModbusWPM3iDataCoordinator
-from .wpm_coordinator import StiebelEltronModbusWPMDataCoordinator
+from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .dead_values import dead_values_store
+from .descriptions import LWZ_MODELS, WPM_MODELS
+from .entity import build_unique_id, duplicate_entity_issue_id
+from .pool import connection_pool
+from .services import async_setup_services
+from .snapshot import snapshot_store
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -46,6 +60,22 @@ _PLATFORMS: list[Platform] = [
 
 _ISSUE_TRACKER = "https://github.com/pail23/stiebel_eltron_isg_component/issues"
 
+# The module and class of the coordinator of each controller model. Only the
+# one an entry uses is imported, together with the pystiebeleltron API it
+# builds, rather than all three families on every start.
+_COORDINATORS: dict[ControllerModel, tuple[str, str]] = {
+    ControllerModel.WPM_3i: (
+        "wpm3i_coordinator",
+        "StiebelEltronModbusWPM3iDataCoordinator",
+    ),
+    **dict.fromkeys(
+        WPM_MODELS, ("wpm_coordinator", "StiebelEltronModbusWPMDataCoordinator")
+    ),
+    **dict.fromkeys(
+        LWZ_MODELS, ("lwz_coordinator", "StiebelEltronModbusLWZDataCoordinator")
+    ),
+}
+
 
 def _unsupported_controller_issue_id(entry: StiebelEltronConfigEntry) -> str:
     """Return the stable repair issue id for a config entry."""
@@ -71,26 +101,31 @@ def _create_unsupported_controller_issue(
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up this integration using YAML is not supported."""
+    """Register the actions; set up this integration using YAML is not supported."""
+    async_setup_services(hass)
     return True
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: StiebelEltronConfigEntry,
-) -> bool:
-    """Set up this integration using UI."""
+def _cached_model(entry: StiebelEltronConfigEntry) -> ControllerModel | None:
+    """Return the controller model the entry was last set up with, if known."""
+    model_id = entry.data.get(CONF_MODEL_ID)
+    if model_id is None:
+        return None
+    try:
+        return ControllerModel(model_id)
+    except ValueError:
+        # A model the installed pystiebeleltron no longer knows.
+        return None
 
-    host = entry.data[CONF_HOST]
-    port = entry.data.get(CONF_PORT, DEFAULT_PORT)
 
+async def _async_detect_model(
+    hass: HomeAssistant,
+    entry: StiebelEltronConfigEntry,
+    connection: ModbusConnection,
+) -> ControllerModel:
+    """Ask the controller for its model."""
     try:
-        connection = await connect_tcp(host, port=port)
-    except ModbusError as exception:
-        raise ConfigEntryNotReady("Could not connect to device") from exception
-    entry.async_on_unload(connection.close)
-    try:
-        model = await get_controller_model(connection.for_unit(UNIT_ID))
+        return await get_controller_model(connection.for_unit(UNIT_ID))
     except StiebelEltronModbusError as exception:
         raise ConfigEntryNotReady("Could not read controller model") from exception
     except UnknownControllerModelError as exception:
@@ -103,63 +138,188 @@ async def async_setup_entry(
             f"Unsupported controller model: {exception}"
         ) from exception
 
-    coordinator: AnyStiebelEltronDataCoordinator
 
-    if model == ControllerModel.WPM_3i:
-        coordinator = StiebelEltronModbusWPM3iDataCoordinator(
-            hass, entry, model, connection, host
-        )
-    elif model in (
-        ControllerModel.WPMsystem,
-        ControllerModel.WPM_3,
-        ControllerModel.LWZ_R290,
+async def _async_import(hass: HomeAssistant, name: str) -> ModuleType:
+    """Return a module of this integration, imported in the executor once."""
+    module_name = f"{__package__}.{name}"
+    if (module := sys.modules.get(module_name)) is not None:
+        return module
+    return await hass.async_add_import_executor_job(
+        importlib.import_module, module_name
+    )
+
+
+def _migration_needed(hass: HomeAssistant, entry: StiebelEltronConfigEntry) -> bool:
+    """Return whether the registries still hold anything the migrations handle.
+
+    A migrated entry has nothing left for them until a key is renamed, so the
+    migration module is only imported where it has work to do.
+    """
+    prefix = build_unique_id(entry, "")
+    for registry_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry.entry_id
     ):
-        coordinator = StiebelEltronModbusWPMDataCoordinator(
-            hass, entry, model, connection, host
+        key = registry_entry.unique_id.removeprefix(prefix)
+        if (
+            key == registry_entry.unique_id
+            or key in RENAMED_KEYS
+            or (registry_entry.domain == "switch" and key == CIRCULATION_PUMP)
+        ):
+            return True
+    if any(
+        (DOMAIN, entry.entry_id) not in device.identifiers
+        for device in dr.async_entries_for_config_entry(
+            dr.async_get(hass), entry.entry_id
         )
-    elif model in (
-        ControllerModel.LWZ,
-        ControllerModel.LWZ_x04_SOL,
     ):
-        coordinator = StiebelEltronModbusLWZDataCoordinator(
-            hass,
-            entry,
-            model,
-            connection,
-            host,
+        return True
+    # The Repair of the duplicates left by an earlier run is kept in sync.
+    issue = ir.async_get(hass).async_get_issue(DOMAIN, duplicate_entity_issue_id(entry))
+    return issue is not None
+
+
+async def _async_migrate(
+    hass: HomeAssistant,
+    entry: StiebelEltronConfigEntry,
+    coordinator: AnyStiebelEltronDataCoordinator,
+) -> None:
+    """Migrate the registry entries of installations from before 2026.7."""
+    if not _migration_needed(hass, entry):
+        return
+    migration = await _async_import(hass, "migration")
+    migration.async_migrate_device_identifier(hass, entry)
+    await migration.async_migrate_unique_ids(hass, entry, coordinator.model)
+    migration.async_remove_legacy_circulation_pump_switch(
+        hass, entry, coordinator.model
+    )
+
+
+async def _async_first_refresh_and_migrate(
+    hass: HomeAssistant,
+    entry: StiebelEltronConfigEntry,
+    coordinator: AnyStiebelEltronDataCoordinator,
+) -> None:
+    """Run the registry migrations while the first refresh waits for the controller.
+
+    The migrations only touch the registries. Both have to finish before the
+    platforms are set up, so that the entities are added to the registry
+    entries and the device that already carry their new identifiers. A
+    restored snapshot stands in for the first refresh, which then runs in the
+    background and, should it fail, retries on the regular tick.
+    """
+    name = f"{DOMAIN} first refresh {coordinator.host}"
+    await coordinator.async_load_dead_values()
+    restored = await coordinator.async_restore_snapshot()
+    if restored:
+        entry.async_create_background_task(hass, coordinator.async_refresh(), name)
+    else:
+        first_refresh = hass.async_create_task(
+            coordinator.async_config_entry_first_refresh(), name
         )
+    try:
+        await _async_migrate(hass, entry, coordinator)
+    except BaseException:
+        if not restored:
+            # The migration error is the one to report, so a failing first
+            # refresh must not take its place.
+            first_refresh.cancel()
+            await asyncio.gather(first_refresh, return_exceptions=True)
+        raise
+    if not restored:
+        await first_refresh
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: StiebelEltronConfigEntry,
+) -> bool:
+    """Set up this integration using UI.
+
+    The registry migrations run while the first refresh waits for the
+    controller. The detected model is cached in the entry, so a restart does
+    not wait for it either: it polls with the cached model right away and
+    checks the controller in the background. With a snapshot of the registers
+    the last run read, the first refresh does not hold up the setup at all:
+    the entities start from the snapshot.
+    """
+
+    host = entry.data[CONF_HOST]
+    port = entry.data.get(CONF_PORT, DEFAULT_PORT)
+
+    # Entries of the same ISG share one connection, and it closes with the last.
+    pool = connection_pool(hass)
+    try:
+        connection = await pool.async_acquire(
+            entry.entry_id, (host, port), partial(connect_tcp, host, port=port)
+        )
+    except ModbusError as exception:
+        raise ConfigEntryNotReady("Could not connect to device") from exception
+    entry.async_on_unload(partial(pool.async_release, entry.entry_id))
+
+    cached_model = _cached_model(entry)
+    if cached_model is None:
+        model = await _async_detect_model(hass, entry, connection)
     else:
+        model = cached_model
+
+    if (coordinator_class := _COORDINATORS.get(model)) is None:
         _create_unsupported_controller_issue(
             hass, entry, getattr(model, "value", model)
         )
         raise ConfigEntryError(f"Unsupported controller model: {model}")
 
+    module_name, class_name = coordinator_class
+    module = await _async_import(hass, module_name)
+    coordinator = cast(
+        AnyStiebelEltronDataCoordinator,
+        getattr(module, class_name)(hass, entry, model, connection, host),
+    )
+
     # A library and integration update can add the model while this repair still
     # exists from an earlier setup attempt.
     ir.async_delete_issue(hass, DOMAIN, _unsupported_controller_issue_id(entry))
 
-    # Both have to run before the platforms are set up, so that the entities are
-    # added to the registry entries and the device that already carry their new
-    # identifiers.
-    async_migrate_device_identifier(hass, entry)
-    await async_migrate_unique_ids(hass, entry, model)
-    async_remove_legacy_circulation_pump_switch(hass, entry, model)
+    if cached_model is None:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_MODEL_ID: model.value}
+        )
 
+    coordinator.stagger_refreshes(pool.refresh_offset(entry.entry_id))
     entry.runtime_data = coordinator
 
-    await coordinator.async_config_entry_first_refresh()
+    await _async_first_refresh_and_migrate(hass, entry, coordinator)
 
-    entry.async_on_unload(
-        connection.on_connection_lost(
-            lambda: hass.config_entries.async_schedule_reload(entry.entry_id)
+    if cached_model is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_verify_model(), f"{DOMAIN} verify model {host}"
         )
+
+    # A dropped session is re-established in place; the entry is only reloaded
+    # if another controller model answers afterwards.
+    entry.async_on_unload(
+        connection.on_connection_lost(coordinator.async_connection_lost)
     )
 
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, coordinator.async_save_state)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
     return True
 
 
+async def _async_options_updated(
+    hass: HomeAssistant,
+    entry: StiebelEltronConfigEntry,
+) -> None:
+    """Apply changed polling options to the running coordinator."""
+    entry.runtime_data.apply_options(entry.options)
+    # Replaces the pending tick, which was scheduled with the old interval.
+    await entry.runtime_data.async_request_refresh()
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: StiebelEltronConfigEntry,
@@ -172,6 +332,8 @@ async def async_remove_entry(
     hass: HomeAssistant,
     entry: StiebelEltronConfigEntry,
 ) -> None:
-    """Remove repairs that belong to a deleted config entry."""
+    """Remove the repairs, the snapshot and the dead values of a deleted entry."""
     ir.async_delete_issue(hass, DOMAIN, _unsupported_controller_issue_id(entry))
     ir.async_delete_issue(hass, DOMAIN, duplicate_entity_issue_id(entry))
+    await snapshot_store(hass, entry).async_remove()
+    await dead_values_store(hass, entry).async_remove()
@@ -73,7 +73,9 @@ from .const import (
     VENTILATION,
 )
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .descriptions import descriptions_by_model
 from .entity import StiebelEltronISGEntity
+from .references import ApiField, RegisterBit, ValueReference, operating_status
 
 PARALLEL_UPDATES = 1
 
@@ -90,74 +92,74 @@ WPM_3I_BINARY_SENSOR_TYPES = [
     StiebelEltronBinarySensorEntityDescription(
         translation_key=PUMP_ON_HK1,
         key=PUMP_ON_HK1,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=PUMP_ON_HK2,
         key=PUMP_ON_HK2,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=1,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_UP_PROGRAM,
         key=HEAT_UP_PROGRAM,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=2,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=NHZ_STAGES_RUNNING,
         key=NHZ_STAGES_RUNNING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=3,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_HEATING,
         key=IS_HEATING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=4,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_HEATING_WATER,
         key=IS_HEATING_WATER,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=5,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=COMPRESSOR_ON,
         key=COMPRESSOR_ON,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=6,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_SUMMER_MODE,
         key=IS_SUMMER_MODE,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=7,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_COOLING,
         key=IS_COOLING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=8,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=EVAPORATOR_DEFROST,
         key=EVAPORATOR_DEFROST,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=9,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=POWER_OFF,
         key=POWER_OFF,
-        modbus_register=lambda api: api.system_state.power_off,
+        modbus_register=ApiField("system_state.power_off"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=ERROR_STATUS,
         key=ERROR_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
-        modbus_register=lambda api: api.system_state.fault_status,
+        modbus_register=ApiField("system_state.fault_status"),
         bit_number=0,
     ),
 ]
@@ -168,193 +170,193 @@ WPM_BINARY_SENSOR_TYPES = [
     StiebelEltronBinarySensorEntityDescription(
         translation_key=COOLING_MODE,
         key=COOLING_MODE,
-        modbus_register=lambda api: api.system_state.cooling_mode,
+        modbus_register=ApiField("system_state.cooling_mode"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEATING_CIRCUIT_1_PUMP,
         key=HEATING_CIRCUIT_1_PUMP,
-        modbus_register=lambda api: api.system_state.heating_circuit_pump_1,
+        modbus_register=ApiField("system_state.heating_circuit_pump_1"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEATING_CIRCUIT_2_PUMP,
         key=HEATING_CIRCUIT_2_PUMP,
-        modbus_register=lambda api: api.system_state.heating_circuit_pump_2,
+        modbus_register=ApiField("system_state.heating_circuit_pump_2"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEATING_CIRCUIT_3_PUMP,
         key=HEATING_CIRCUIT_3_PUMP,
-        modbus_register=lambda api: api.system_state.heating_circuit_pump_3,
+        modbus_register=ApiField("system_state.heating_circuit_pump_3"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEATING_CIRCUIT_4_PUMP,
         key=HEATING_CIRCUIT_4_PUMP,
-        modbus_register=lambda api: api.system_state.heating_circuit_pump_4,
+        modbus_register=ApiField("system_state.heating_circuit_pump_4"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEATING_CIRCUIT_5_PUMP,
         key=HEATING_CIRCUIT_5_PUMP,
-        modbus_register=lambda api: api.system_state.heating_circuit_pump_5,
+        modbus_register=ApiField("system_state.heating_circuit_pump_5"),
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_1_CHARGING_PUMP,
         key=BUFFER_1_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_1,
+        modbus_register=ApiField("system_state.buffer_charging_pump_1"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_2_CHARGING_PUMP,
         key=BUFFER_2_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_2,
+        modbus_register=ApiField("system_state.buffer_charging_pump_2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_3_CHARGING_PUMP,
         key=BUFFER_3_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_3,
+        modbus_register=ApiField("system_state.buffer_charging_pump_3"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_4_CHARGING_PUMP,
         key=BUFFER_4_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_4,
+        modbus_register=ApiField("system_state.buffer_charging_pump_4"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_5_CHARGING_PUMP,
         key=BUFFER_5_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_5,
+        modbus_register=ApiField("system_state.buffer_charging_pump_5"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=BUFFER_6_CHARGING_PUMP,
         key=BUFFER_6_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.buffer_charging_pump_6,
+        modbus_register=ApiField("system_state.buffer_charging_pump_6"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=DHW_CHARGING_PUMP,
         key=DHW_CHARGING_PUMP,
-        modbus_register=lambda api: api.system_state.dhw_charging_pump,
+        modbus_register=ApiField("system_state.dhw_charging_pump"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=SOURCE_PUMP,
         key=SOURCE_PUMP,
-        modbus_register=lambda api: api.system_state.source_pump,
+        modbus_register=ApiField("system_state.source_pump"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=DIFF_CONTROLLER_1_PUMP,
         key=DIFF_CONTROLLER_1_PUMP,
-        modbus_register=lambda api: api.system_state.diff_controller_pump_1,
+        modbus_register=ApiField("system_state.diff_controller_pump_1"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=DIFF_CONTROLLER_2_PUMP,
         key=DIFF_CONTROLLER_2_PUMP,
-        modbus_register=lambda api: api.system_state.diff_controller_pump_2,
+        modbus_register=ApiField("system_state.diff_controller_pump_2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=POOL_PRIMARY_PUMP,
         key=POOL_PRIMARY_PUMP,
-        modbus_register=lambda api: api.system_state.pool_pump_primary,
+        modbus_register=ApiField("system_state.pool_pump_primary"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=POOL_SECONDARY_PUMP,
         key=POOL_SECONDARY_PUMP,
-        modbus_register=lambda api: api.system_state.pool_pump_secondary,
+        modbus_register=ApiField("system_state.pool_pump_secondary"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_1_ON,
         key=HEAT_PUMP_1_ON,
-        modbus_register=lambda api: api.system_state.compressor_1,
+        modbus_register=ApiField("system_state.compressor_1"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_2_ON,
         key=HEAT_PUMP_2_ON,
-        modbus_register=lambda api: api.system_state.compressor_2,
+        modbus_register=ApiField("system_state.compressor_2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_3_ON,
         key=HEAT_PUMP_3_ON,
-        modbus_register=lambda api: api.system_state.compressor_3,
+        modbus_register=ApiField("system_state.compressor_3"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_4_ON,
         key=HEAT_PUMP_4_ON,
-        modbus_register=lambda api: api.system_state.compressor_4,
+        modbus_register=ApiField("system_state.compressor_4"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_5_ON,
         key=HEAT_PUMP_5_ON,
-        modbus_register=lambda api: api.system_state.compressor_5,
+        modbus_register=ApiField("system_state.compressor_5"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_PUMP_6_ON,
         key=HEAT_PUMP_6_ON,
-        modbus_register=lambda api: api.system_state.compressor_6,
+        modbus_register=ApiField("system_state.compressor_6"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=SECOND_GENERATOR_DHW,
         key=SECOND_GENERATOR_DHW,
-        modbus_register=lambda api: api.system_state.we_2_dhw,
+        modbus_register=ApiField("system_state.we_2_dhw"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=SECOND_GENERATOR_HEATING,
         key=SECOND_GENERATOR_HEATING,
-        modbus_register=lambda api: api.system_state.we_2_heating,
+        modbus_register=ApiField("system_state.we_2_heating"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_OPEN_HTG_CIRCUIT_2,
         key=MIXER_OPEN_HTG_CIRCUIT_2,
-        modbus_register=lambda api: api.system_state.mixer_open_hc2,
+        modbus_register=ApiField("system_state.mixer_open_hc2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_OPEN_HTG_CIRCUIT_3,
         key=MIXER_OPEN_HTG_CIRCUIT_3,
-        modbus_register=lambda api: api.system_state.mixer_open_hc3,
+        modbus_register=ApiField("system_state.mixer_open_hc3"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_OPEN_HTG_CIRCUIT_4,
         key=MIXER_OPEN_HTG_CIRCUIT_4,
-        modbus_register=lambda api: api.system_state.mixer_open_hc4,
+        modbus_register=ApiField("system_state.mixer_open_hc4"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_OPEN_HTG_CIRCUIT_5,
         key=MIXER_OPEN_HTG_CIRCUIT_5,
-        modbus_register=lambda api: api.system_state.mixer_open_hc5,
+        modbus_register=ApiField("system_state.mixer_open_hc5"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_CLOSE_HTG_CIRCUIT_2,
         key=MIXER_CLOSE_HTG_CIRCUIT_2,
-        modbus_register=lambda api: api.system_state.mixer_close_hc2,
+        modbus_register=ApiField("system_state.mixer_close_hc2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_CLOSE_HTG_CIRCUIT_3,
         key=MIXER_CLOSE_HTG_CIRCUIT_3,
-        modbus_register=lambda api: api.system_state.mixer_close_hc3,
+        modbus_register=ApiField("system_state.mixer_close_hc3"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_CLOSE_HTG_CIRCUIT_4,
         key=MIXER_CLOSE_HTG_CIRCUIT_4,
-        modbus_register=lambda api: api.system_state.mixer_close_hc4,
+        modbus_register=ApiField("system_state.mixer_close_hc4"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=MIXER_CLOSE_HTG_CIRCUIT_5,
         key=MIXER_CLOSE_HTG_CIRCUIT_5,
-        modbus_register=lambda api: api.system_state.mixer_close_hc5,
+        modbus_register=ApiField("system_state.mixer_close_hc5"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=EMERGENCY_HEATING_1,
         key=EMERGENCY_HEATING_1,
-        modbus_register=lambda api: api.system_state.nhz_1,
+        modbus_register=ApiField("system_state.nhz_1"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=EMERGENCY_HEATING_2,
         key=EMERGENCY_HEATING_2,
-        modbus_register=lambda api: api.system_state.nhz_2,
+        modbus_register=ApiField("system_state.nhz_2"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=EMERGENCY_HEATING_1_2,
         key=EMERGENCY_HEATING_1_2,
-        modbus_register=lambda api: api.system_state.nhz_1_2,
+        modbus_register=ApiField("system_state.nhz_1_2"),
     ),
 ]
 
@@ -366,7 +368,7 @@ CIRCULATION_PUMP_BINARY_SENSOR_TYPES = [
         key=CIRCULATION_PUMP,
         translation_key=CIRCULATION_PUMP,
         device_class=BinarySensorDeviceClass.RUNNING,
-        modbus_register=lambda api: api.system_state.dhw_circulation_pump,
+        modbus_register=ApiField("system_state.dhw_circulation_pump"),
     ),
 ]
 
@@ -375,107 +377,119 @@ LWZ_BINARY_SENSOR_TYPES = [
     StiebelEltronBinarySensorEntityDescription(
         translation_key=SWITCHING_PROGRAM_ENABLED,
         key=SWITCHING_PROGRAM_ENABLED,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=0,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=COMPRESSOR_ON,
         key=COMPRESSOR_ON,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=1,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_HEATING,
         key=IS_HEATING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=2,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_COOLING,
         key=IS_COOLING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=3,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_HEATING_WATER,
         key=IS_HEATING_WATER,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=4,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=ELECTRIC_REHEATING,
         key=ELECTRIC_REHEATING,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=5,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=SERVICE,
         key=SERVICE,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=6,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=POWER_OFF,
         key=POWER_OFF,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=7,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=FILTER,
         key=FILTER,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=8,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=VENTILATION,
         key=VENTILATION,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=9,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=PUMP_ON_HK1,
         key=PUMP_ON_HK1,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=10,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=EVAPORATOR_DEFROST,
         key=EVAPORATOR_DEFROST,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=11,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=FILTER_EXTRACT_AIR,
         key=FILTER_EXTRACT_AIR,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=12,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=FILTER_VENTILATION_AIR,
         key=FILTER_VENTILATION_AIR,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=13,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=HEAT_UP_PROGRAM,
         key=HEAT_UP_PROGRAM,
-        modbus_register=lambda api: api.system_state.operating_status,
+        modbus_register=operating_status,
         bit_number=14,
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=ERROR_STATUS,
         key=ERROR_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
-        modbus_register=lambda api: api.system_state.fault_status,
+        modbus_register=ApiField("system_state.fault_status"),
     ),
     StiebelEltronBinarySensorEntityDescription(
         translation_key=IS_SUMMER_MODE,
         key=IS_SUMMER_MODE,
-        modbus_register=lambda api: api.system_state.operating_status_2,
+        modbus_register=ApiField("system_state.operating_status_2"),
     ),
 ]
 
 
+# Only the controllers that expose the circulation pump register get its status.
+BINARY_SENSOR_TYPES_BY_MODEL = descriptions_by_model(
+    wpm_3i=WPM_3I_BINARY_SENSOR_TYPES,
+    wpm=WPM_BINARY_SENSOR_TYPES,
+    lwz=LWZ_BINARY_SENSOR_TYPES,
+    extra={
+        ControllerModel.LWZ_R290: CIRCULATION_PUMP_BINARY_SENSOR_TYPES,
+        ControllerModel.WPMsystem: CIRCULATION_PUMP_BINARY_SENSOR_TYPES,
+    },
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: StiebelEltronConfigEntry,
@@ -484,49 +498,13 @@ async def async_setup_entry(
     """Set up the binary_sensor platform."""
     coordinator = entry.runtime_data
 
-    if coordinator.model == ControllerModel.WPM_3i:
-        entities = [
-            StiebelEltronISGBinarySensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_3I_BINARY_SENSOR_TYPES
-        ]
-    elif coordinator.model in (
-        ControllerModel.WPM_3,
-        ControllerModel.WPMsystem,
-        ControllerModel.LWZ_R290,
-    ):
-        entities = [
-            StiebelEltronISGBinarySensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_BINARY_SENSOR_TYPES
-        ]
-    else:
-        entities = [
-            StiebelEltronISGBinarySensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in LWZ_BINARY_SENSOR_TYPES
-        ]
-
-    if coordinator.model in (ControllerModel.LWZ_R290, ControllerModel.WPMsystem):
-        entities.extend(
-            StiebelEltronISGBinarySensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in CIRCULATION_PUMP_BINARY_SENSOR_TYPES
-        )
-
-    async_add_devices(entities)
+    coordinator.async_add_answered_entities(
+        async_add_devices,
+        BINARY_SENSOR_TYPES_BY_MODEL[coordinator.model],
+        lambda description: StiebelEltronISGBinarySensor(
+            coordinator, entry, description
+        ),
+    )
 
 
 class StiebelEltronISGBinarySensor(StiebelEltronISGEntity, BinarySensorEntity):
@@ -544,11 +522,12 @@ class StiebelEltronISGBinarySensor(StiebelEltronISGEntity, BinarySensorEntity):
         self.modbus_register = description.modbus_register
         self.bit_number = description.bit_number
 
+    @property
+    def value_references(self) -> tuple[ValueReference, ...]:
+        """Return the bit this sensor shows, not the whole status word."""
+        return (RegisterBit(self.modbus_register, self.bit_number),)
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
-        value = self.coordinator.get_value(self.modbus_register)
-        if value is None:
-            return False
-
-        return int(value) & (1 << self.bit_number) != 0
+        return bool(self._read())
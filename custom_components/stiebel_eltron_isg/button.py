@@ -89,3 +89,8 @@ class StiebelEltronISGButtonEntity(StiebelEltronISGEntity, ButtonEntity):
     def available(self) -> bool:
         """Follow connectivity without requiring a data field like other entities."""
         return self.coordinator.last_update_success
+
+    @property
+    def value_references(self) -> tuple[()]:
+        """Return no accessors, the button only follows availability."""
+        return ()
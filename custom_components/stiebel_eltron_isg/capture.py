@@ -0,0 +1,265 @@
+"""Captured Modbus exchanges: their file format, and a connection replaying them.
+
+A capture is a file of JSON lines. The first line describes the capture, with
+the controller model and when it started; every other line is an exchange: a
+register or coil request of the unit, what answered it and how long it took.
+Only ``modbus_connection`` and the standard library are used, so a capture can
+be replayed without Home Assistant.
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import json
+import math
+from pathlib import Path
+from typing import Any, Self, cast
+
+from modbus_connection import (
+    ClientClosedError,
+    IllegalDataAddressError,
+    IllegalFunctionError,
+    ModbusConnection,
+    ModbusConnectionError,
+    ModbusDesyncError,
+    ModbusError,
+    ModbusExceptionError,
+    ModbusProtocolError,
+    ModbusTcpParams,
+    ModbusTimeoutError,
+    ModbusUnit,
+)
+
+CAPTURE_VERSION = 1
+
+# The errors a replay raises again by name; any other is a ModbusError.
+_ERRORS: dict[str, type[ModbusError]] = {
+    error.__name__: error
+    for error in (
+        ClientClosedError,
+        ModbusConnectionError,
+        ModbusDesyncError,
+        ModbusProtocolError,
+        ModbusTimeoutError,
+    )
+}
+
+# What a line that is not an exchange raises when it is read as one.
+_BROKEN = (TypeError, ValueError)
+
+type Registers = list[int] | list[bool]
+
+
+@dataclass(frozen=True, slots=True)
+class Exchange:
+    """One request of a unit and what answered it.
+
+    ``argument`` is the count of a read and the value or values of a write.
+    An exchange that failed has the name of its error instead of a response,
+    and the Modbus exception code the device answered with, if any.
+    """
+
+    at: float
+    duration: float
+    request: str
+    address: int
+    argument: int | bool | Registers
+    response: Registers | None = None
+    error: str | None = None
+    code: int | None = None
+
+    def raise_error(self) -> None:
+        """Raise the error the exchange failed with, if it did."""
+        if self.error is None:
+            return
+        message = f"{self.error} replayed for {self.request} at {self.address}"
+        if self.code is not None:
+            raise ModbusExceptionError.from_code(self.code, message)
+        raise _ERRORS.get(self.error, ModbusError)(message)
+
+
+def describe_error(error: Exception) -> dict[str, Any]:
+    """Return the fields of an exchange that failed with ``error``."""
+    return {
+        "error": type(error).__name__,
+        "code": getattr(error, "exception_code", None),
+    }
+
+
+def encode_header(model: str, started: datetime) -> bytes:
+    """Return the first line of a capture."""
+    return _line({
+        "capture": CAPTURE_VERSION,
+        "model": model,
+        "started": started.isoformat(),
+    })
+
+
+def encode_exchange(exchange: Exchange) -> bytes:
+    """Return the line of one exchange, leaving out what it does not have."""
+    return _line({
+        key: value for key, value in asdict(exchange).items() if value is not None
+    })
+
+
+def _line(record: dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+def read_capture(path: Path) -> tuple[dict[str, Any], list[Exchange]]:
+    """Return the description of a capture and its exchanges.
+
+    A last line cut short, as by a crash while it was written, is left out.
+    """
+    with path.open("rb") as file:
+        lines = file.read().splitlines()
+    try:
+        header = json.loads(lines[0]) if lines else {}
+    except ValueError:
+        header = {}
+    if header.get("capture") != CAPTURE_VERSION:
+        raise ValueError(f"{path} is not a capture")
+    exchanges = []
+    for number, line in enumerate(lines[1:], start=2):
+        try:
+            exchanges.append(Exchange(**json.loads(line)))
+        except _BROKEN:
+            if number == len(lines):
+                break
+            raise ValueError(f"{path} holds a broken line {number}") from None
+    return header, exchanges
+
+
+class ReplayModbusConnection(ModbusConnection):
+    """Answer the requests of every unit with the exchanges of a capture.
+
+    A request is answered by the next captured exchange with the same request,
+    address and count, or value for a write, starting over from the first
+    once all were served. So a capture of a few polls serves any number of
+    them, in the order the controller answered. A read that was never captured
+    is refused as an illegal address, a write that was never captured is
+    acknowledged.
+
+    Each answer takes as long as it did when it was captured, divided by
+    ``speed``; an infinite speed answers right away.
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange], speed: float = 1.0) -> None:
+        """Replay ``exchanges`` at ``speed`` times the captured pace."""
+        super().__init__(ModbusTcpParams(host="replay"))
+        if not speed > 0:
+            raise ValueError("speed must be positive")
+        self._speed = speed
+        self._exchanges: dict[tuple[Any, ...], deque[Exchange]] = defaultdict(deque)
+        for exchange in exchanges:
+            self._exchanges[
+                _key(exchange.request, exchange.address, exchange.argument)
+            ].append(exchange)
+        self._units: dict[int, ModbusUnit] = {}
+        self.requests = 0
+
+    @classmethod
+    def from_file(cls, path: Path, speed: float = 1.0) -> Self:
+        """Replay the capture at ``path``. Blocks, as it reads the file."""
+        _header, exchanges = read_capture(path)
+        return cls(exchanges, speed)
+
+    async def _connect_client(self) -> object:
+        return object()
+
+    async def _close_client(self, client: object) -> None:
+        pass
+
+    def for_unit(self, unit_id: int) -> ModbusUnit:
+        """Return the unit ``unit_id``, which all answer from the same capture."""
+        if unit_id not in self._units:
+            # The unit refuses the requests it does not replay via __getattr__,
+            # which a static protocol check cannot see.
+            self._units[unit_id] = cast(ModbusUnit, _ReplayUnit(self))
+        return self._units[unit_id]
+
+    async def answer(
+        self, request: str, address: int, argument: int | bool | Registers
+    ) -> Any:
+        """Return the response to a request, after the time it took."""
+        await self.connect()
+        self.requests += 1
+        served = self._exchanges.get(_key(request, address, argument))
+        if not served:
+            if request.startswith("read"):
+                raise IllegalDataAddressError(
+                    message=f"{request} at {address} was not captured"
+                )
+            return None
+        exchange = served[0]
+        served.rotate(-1)
+        if math.isfinite(self._speed):
+            await asyncio.sleep(exchange.duration / self._speed)
+        exchange.raise_error()
+        return exchange.response
+
+
+def _key(
+    request: str, address: int, argument: int | bool | Registers
+) -> tuple[Any, ...]:
+    # JSON knows no tuples, and lists cannot be hashed.
+    if isinstance(argument, list):
+        return request, address, tuple(argument)
+    return request, address, argument
+
+
+class _ReplayUnit:
+    """Implement the register and coil requests of ``ModbusUnit`` from a capture.
+
+    The other requests are not made by the API components, and are refused as
+    an illegal function.
+    """
+
+    def __init__(self, connection: ReplayModbusConnection) -> None:
+        self._conn = connection
+
+    @property
+    def connected(self) -> bool:
+        return self._conn.connected
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        async def refuse(*_args: Any, **_kwargs: Any) -> Any:
+            raise IllegalFunctionError(message=f"{name} is not replayed")
+
+        return refuse
+
+    def set_message_spacing(self, seconds: float) -> None:
+        """Ignore the spacing, the captured durations already include it."""
+
+    def on_connection_lost(self, callback: Callable[[], None]) -> Callable[[], None]:
+        return self._conn.on_connection_lost(callback)
+
+    async def _read[R](self, request: str, address: int, count: int) -> R:
+        result: R = await self._conn.answer(request, address, count)
+        return result
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        return await self._read("read_holding_registers", address, count)
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        return await self._read("read_input_registers", address, count)
+
+    async def read_coils(self, address: int, count: int) -> list[bool]:
+        return await self._read("read_coils", address, count)
+
+    async def read_discrete_inputs(self, address: int, count: int) -> list[bool]:
+        return await self._read("read_discrete_inputs", address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        await self._conn.answer("write_register", address, value)
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        await self._conn.answer("write_registers", address, values)
+
+    async def write_coil(self, address: int, value: bool) -> None:
+        await self._conn.answer("write_coil", address, value)
+
+    async def write_coils(self, address: int, values: list[bool]) -> None:
+        await self._conn.answer("write_coils", address, values)
@@ -19,10 +19,11 @@ from homeassistant.components.climate.const import (
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pystiebeleltron import ControllerModel
 
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .descriptions import LWZ_MODELS, descriptions_by_model
 from .entity import OptimisticValueMixin, StiebelEltronISGEntity
+from .references import ApiField, ValueReference
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -114,12 +115,21 @@ LWZ_TO_HA_FAN = {0: FAN_OFF, 1: FAN_LOW, 2: FAN_MEDIUM, 3: FAN_HIGH}
 HA_TO_LWZ_FAN = {k: i for i, k in LWZ_TO_HA_FAN.items()}
 
 
+# The operating mode shared by every climate entity, and the LWZ fan stages of
+# the comfort and the eco program.
+_operating_mode = ApiField("system_parameters.operating_mode")
+_day_stage = ApiField("system_parameters.day_stage")
+_night_stage = ApiField("system_parameters.night_stage")
+
+
 def _as_accessor(register_or_accessor: Any) -> Any:
     """Return an API value accessor callable for descriptor inputs."""
     if callable(register_or_accessor):
         return register_or_accessor
 
-    raise TypeError("climate field reference must be a lambda expression")
+    raise TypeError(
+        "climate field reference must be a lambda expression or an ApiField"
+    )
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -137,7 +147,7 @@ class StiebelEltronClimateEntityDescription(ClimateEntityDescription):
     comfort_target_temp_write_field: str | None = None
 
     def __post_init__(self) -> None:
-        """Convert legacy register tokens into API value accessor lambdas."""
+        """Reject register tokens that are neither API fields nor accessors."""
         object.__setattr__(
             self,
             "humidity_modbus_register",
@@ -150,10 +160,14 @@ class StiebelEltronClimateEntityDescription(ClimateEntityDescription):
         )
 
         if not callable(self.eco_target_temp_register):
-            raise TypeError("eco_target_temp_register must be a lambda expression")
+            raise TypeError(
+                "eco_target_temp_register must be a lambda expression or an ApiField"
+            )
 
         if not callable(self.comfort_target_temp_register):
-            raise TypeError("comfort_target_temp_register must be a lambda expression")
+            raise TypeError(
+                "comfort_target_temp_register must be a lambda expression or an ApiField"
+            )
 
 
 WPM_3I_CLIMATE_TYPES = [
@@ -161,15 +175,15 @@ WPM_3I_CLIMATE_TYPES = [
         key=CLIMATE_HK_1,
         translation_key=CLIMATE_HK_1,
         humidity_modbus_register=[
-            lambda api: api.system_values.relative_humidity,
+            ApiField("system_values.relative_humidity"),
         ],
         actual_temperature_register=[
-            lambda api: api.system_values.actual_temperature_fe7,
-            lambda api: api.system_values.actual_temperature_fek,
+            ApiField("system_values.actual_temperature_fe7"),
+            ApiField("system_values.actual_temperature_fek"),
         ],
-        eco_target_temp_register=lambda api: api.system_parameters.eco_temperature_hk_1,
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.comfort_temperature_hk_1
+        eco_target_temp_register=ApiField("system_parameters.eco_temperature_hk_1"),
+        comfort_target_temp_register=ApiField(
+            "system_parameters.comfort_temperature_hk_1"
         ),
         min_temp=5,
         max_temp=30,
@@ -183,17 +197,17 @@ WPM_CLIMATE_TYPES = [
         key=CLIMATE_HK_1,
         translation_key=CLIMATE_HK_1,
         humidity_modbus_register=[
-            lambda api: api.system_values.room_temperatures[0].relative_humidity,
-            lambda api: api.system_values.relative_humidity,
+            ApiField("system_values.room_temperatures[0].relative_humidity"),
+            ApiField("system_values.relative_humidity"),
         ],
         actual_temperature_register=[
-            lambda api: api.system_values.room_temperatures[0].actual_temperature,
-            lambda api: api.system_values.actual_temperature_fe7,
-            lambda api: api.system_values.actual_temperature_fek,
+            ApiField("system_values.room_temperatures[0].actual_temperature"),
+            ApiField("system_values.actual_temperature_fe7"),
+            ApiField("system_values.actual_temperature_fek"),
         ],
-        eco_target_temp_register=lambda api: api.system_parameters.eco_temperature_hk_1,
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.comfort_temperature_hk_1
+        eco_target_temp_register=ApiField("system_parameters.eco_temperature_hk_1"),
+        comfort_target_temp_register=ApiField(
+            "system_parameters.comfort_temperature_hk_1"
         ),
         min_temp=5,
         max_temp=30,
@@ -204,14 +218,14 @@ WPM_CLIMATE_TYPES = [
         key=CLIMATE_HK_2,
         translation_key=CLIMATE_HK_2,
         humidity_modbus_register=[
-            lambda api: api.system_values.room_temperatures[1].relative_humidity
+            ApiField("system_values.room_temperatures[1].relative_humidity")
         ],
         actual_temperature_register=[
-            lambda api: api.system_values.room_temperatures[1].actual_temperature
+            ApiField("system_values.room_temperatures[1].actual_temperature")
         ],
-        eco_target_temp_register=lambda api: api.system_parameters.eco_temperature_hk_2,
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.comfort_temperature_hk_2
+        eco_target_temp_register=ApiField("system_parameters.eco_temperature_hk_2"),
+        comfort_target_temp_register=ApiField(
+            "system_parameters.comfort_temperature_hk_2"
         ),
         min_temp=5,
         max_temp=30,
@@ -222,14 +236,14 @@ WPM_CLIMATE_TYPES = [
         key=CLIMATE_HK_3,
         translation_key=CLIMATE_HK_3,
         humidity_modbus_register=[
-            lambda api: api.system_values.room_temperatures[2].relative_humidity
+            ApiField("system_values.room_temperatures[2].relative_humidity")
         ],
         actual_temperature_register=[
-            lambda api: api.system_values.room_temperatures[2].actual_temperature
+            ApiField("system_values.room_temperatures[2].actual_temperature")
         ],
-        eco_target_temp_register=lambda api: api.system_parameters.eco_temperature_hk_3,
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.comfort_temperature_hk_3
+        eco_target_temp_register=ApiField("system_parameters.eco_temperature_hk_3"),
+        comfort_target_temp_register=ApiField(
+            "system_parameters.comfort_temperature_hk_3"
         ),
         min_temp=5,
         max_temp=30,
@@ -242,13 +256,13 @@ LWZ_CLIMATE_TYPES = [
     StiebelEltronClimateEntityDescription(
         key=CLIMATE_HK_1,
         translation_key=CLIMATE_HK_1,
-        humidity_modbus_register=[lambda api: api.system_values.relative_humidity_hc1],
-        actual_temperature_register=[lambda api: api.system_values.actual_room_t_hc1],
-        eco_target_temp_register=lambda api: (
-            api.system_parameters.room_temperature_night_hk1
+        humidity_modbus_register=[ApiField("system_values.relative_humidity_hc1")],
+        actual_temperature_register=[ApiField("system_values.actual_room_t_hc1")],
+        eco_target_temp_register=ApiField(
+            "system_parameters.room_temperature_night_hk1"
         ),
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.room_temperature_day_hk1
+        comfort_target_temp_register=ApiField(
+            "system_parameters.room_temperature_day_hk1"
         ),
         min_temp=10,
         max_temp=30,
@@ -258,13 +272,13 @@ LWZ_CLIMATE_TYPES = [
     StiebelEltronClimateEntityDescription(
         key=CLIMATE_HK_2,
         translation_key=CLIMATE_HK_2,
-        humidity_modbus_register=[lambda api: api.system_values.relative_humidity_hc2],
-        actual_temperature_register=[lambda api: api.system_values.actual_room_t_hc2],
-        eco_target_temp_register=lambda api: (
-            api.system_parameters.room_temperature_night_hk2
+        humidity_modbus_register=[ApiField("system_values.relative_humidity_hc2")],
+        actual_temperature_register=[ApiField("system_values.actual_room_t_hc2")],
+        eco_target_temp_register=ApiField(
+            "system_parameters.room_temperature_night_hk2"
         ),
-        comfort_target_temp_register=lambda api: (
-            api.system_parameters.room_temperature_day_hk2
+        comfort_target_temp_register=ApiField(
+            "system_parameters.room_temperature_day_hk2"
         ),
         min_temp=10,
         max_temp=30,
@@ -274,6 +288,11 @@ LWZ_CLIMATE_TYPES = [
 ]
 
 
+CLIMATE_TYPES_BY_MODEL = descriptions_by_model(
+    wpm_3i=WPM_3I_CLIMATE_TYPES, wpm=WPM_CLIMATE_TYPES, lwz=LWZ_CLIMATE_TYPES
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: StiebelEltronConfigEntry,
@@ -281,40 +300,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the select platform."""
     coordinator = entry.runtime_data
-    entities: list[StiebelEltronWPMClimateEntity | StiebelEltronLWZClimateEntity] = []
-    if coordinator.model == ControllerModel.WPM_3i:
-        entities = [
-            StiebelEltronWPMClimateEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_3I_CLIMATE_TYPES
-        ]
-    elif coordinator.model in (
-        ControllerModel.WPM_3,
-        ControllerModel.WPMsystem,
-        ControllerModel.LWZ_R290,
-    ):
-        entities = [
-            StiebelEltronWPMClimateEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_CLIMATE_TYPES
-        ]
-    else:
-        entities = [
-            StiebelEltronLWZClimateEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in LWZ_CLIMATE_TYPES
-        ]
+    entity_class: type[StiebelEltronISGClimateEntity] = (
+        StiebelEltronLWZClimateEntity
+        if coordinator.model in LWZ_MODELS
+        else StiebelEltronWPMClimateEntity
+    )
 
-    async_add_devices(entities)
+    async_add_devices([
+        entity_class(coordinator, entry, description)
+        for description in CLIMATE_TYPES_BY_MODEL[coordinator.model]
+    ])
 
 
 class StiebelEltronISGClimateEntity(
@@ -365,7 +360,19 @@ class StiebelEltronISGClimateEntity(
     def available(self) -> bool:
         """Return True if entity is available."""
         return (
-            self.coordinator.last_update_success and self.target_temperature is not None
+            self.coordinator.is_available(self.value_references)
+            and self.target_temperature is not None
+        )
+
+    @property
+    def value_references(self) -> tuple[ValueReference, ...]:
+        """Return the accessors of every climate attribute."""
+        return (
+            *self.humidity_modbus_register,
+            *self.actual_temperature_register,
+            self.eco_target_temp_register,
+            self.comfort_target_temp_register,
+            _operating_mode,
         )
 
     @property
@@ -376,7 +383,7 @@ class StiebelEltronISGClimateEntity(
     @property
     def _raw_operation_mode(self) -> int | None:
         """Return the raw mode while preserving an unavailable read-back."""
-        value = self._read_register(lambda api: api.system_parameters.operating_mode)
+        value = self._read_register(_operating_mode)
         return int(value) if value is not None else None
 
     @property
@@ -529,6 +536,11 @@ class StiebelEltronLWZClimateEntity(StiebelEltronISGClimateEntity):
         super().__init__(coordinator, config_entry, description)
         self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
 
+    @property
+    def value_references(self) -> tuple[ValueReference, ...]:
+        """Return the accessors of every climate attribute, fan stages included."""
+        return (*super().value_references, _day_stage, _night_stage)
+
     @property
     def operation_mode(self) -> int:
         """Operating mode of the heat pump."""
@@ -562,11 +574,11 @@ class StiebelEltronLWZClimateEntity(StiebelEltronISGClimateEntity):
     def fan_mode(self) -> str | None:
         """Return the fan setting. Requires ClimateEntityFeature.FAN_MODE."""
         if self.operation_mode == ECO_MODE:
-            value = self._read_register(lambda api: api.system_parameters.night_stage)
+            value = self._read_register(_night_stage)
             if value is None:
                 return None
             return LWZ_TO_HA_FAN.get(int(value))
-        value = self._read_register(lambda api: api.system_parameters.day_stage)
+        value = self._read_register(_day_stage)
         if value is None:
             return None
         return LWZ_TO_HA_FAN.get(int(value))
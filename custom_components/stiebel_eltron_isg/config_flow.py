@@ -4,13 +4,22 @@ from dataclasses import dataclass
 import logging
 from typing import Any, override
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
     TextSelector,
 )
 from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
@@ -23,7 +32,28 @@ from pystiebeleltron import (
 )
 import voluptuous as vol
 
-from .const import DEFAULT_PORT, DOMAIN, UNIT_ID
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MODEL_ID,
+    CONF_POLLING_PROFILE,
+    CONF_RECORD_SNAPSHOTS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CAPTURE_TRAFFIC,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_POLLING_PROFILE,
+    DEFAULT_PORT,
+    DEFAULT_RECORD_SNAPSHOTS,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    POLLING_PROFILES,
+    UNIT_ID,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +68,49 @@ STEP_USER_DATA_SCHEMA = vol.Schema({
 })
 
 
+def _interval_selector() -> vol.All:
+    """Return a field for a poll interval in seconds."""
+    return vol.All(
+        NumberSelector(
+            NumberSelectorConfig(
+                min=MIN_SCAN_INTERVAL,
+                max=MAX_SCAN_INTERVAL,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Coerce(int),
+    )
+
+
+STEP_OPTIONS_DATA_SCHEMA = vol.Schema({
+    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): (
+        _interval_selector()
+    ),
+    vol.Required(CONF_POLLING_PROFILE, default=DEFAULT_POLLING_PROFILE): SelectSelector(
+        SelectSelectorConfig(
+            options=list(POLLING_PROFILES),
+            translation_key=CONF_POLLING_PROFILE,
+        )
+    ),
+    vol.Required(
+        CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING
+    ): BooleanSelector(),
+    vol.Required(CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL): (
+        _interval_selector()
+    ),
+    vol.Required(CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL): (
+        _interval_selector()
+    ),
+    vol.Required(
+        CONF_RECORD_SNAPSHOTS, default=DEFAULT_RECORD_SNAPSHOTS
+    ): BooleanSelector(),
+    vol.Required(
+        CONF_CAPTURE_TRAFFIC, default=DEFAULT_CAPTURE_TRAFFIC
+    ): BooleanSelector(),
+})
+
+
 @dataclass(frozen=True)
 class ControllerCheckResult:
     """Result of validating a controller during a config flow."""
@@ -79,6 +152,12 @@ class StiebelEltronConfigFlow(ConfigFlow, domain=DOMAIN):
 
     _discovered_host: str
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow that tunes the polling."""
+        return StiebelEltronOptionsFlow()
+
     @override
     async def async_step_dhcp(
         self, discovery_info: DhcpServiceInfo
@@ -165,9 +244,17 @@ class StiebelEltronConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = check_result.error
                 description_placeholders = check_result.description_placeholders
             else:
+                # Another address can lead to another controller, so the
+                # model is detected anew instead of taken from the cache.
+                data = {
+                    key: value
+                    for key, value in config_entry.data.items()
+                    if key != CONF_MODEL_ID
+                }
                 return self.async_update_reload_and_abort(
                     config_entry,
-                    data_updates={
+                    data={
+                        **data,
                         CONF_HOST: user_input[CONF_HOST],
                         CONF_PORT: user_input[CONF_PORT],
                     },
@@ -182,3 +269,34 @@ class StiebelEltronConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders=description_placeholders,
         )
+
+
+class StiebelEltronOptionsFlow(OptionsFlow):
+    """Tune how often the integration polls the ISG.
+
+    The running coordinator picks the options up without a reload.
+    """
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_ADAPTIVE_POLLING] and not (
+                user_input[CONF_MIN_SCAN_INTERVAL]
+                <= user_input[CONF_SCAN_INTERVAL]
+                <= user_input[CONF_MAX_SCAN_INTERVAL]
+            ):
+                errors["base"] = "invalid_interval_bounds"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_OPTIONS_DATA_SCHEMA,
+                user_input if user_input is not None else self.config_entry.options,
+            ),
+            errors=errors,
+        )
@@ -5,10 +5,144 @@ DEFAULT_NAME = "Stiebel Eltron ISG"
 ATTR_MANUFACTURER = "Stiebel Eltron"
 DOMAIN = "stiebel_eltron_isg"
 DEFAULT_HOST_NAME = ""
-DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_PORT = 502
 UNIT_ID = 1
 
+# The id of the controller model the entry was last set up with. A restart
+# starts polling with it right away and checks the controller in the background.
+CONF_MODEL_ID = "model_id"
+
+# Base poll interval in seconds: the interval of the fastest components.
+DEFAULT_SCAN_INTERVAL = 30
+MIN_SCAN_INTERVAL = 2
+MAX_SCAN_INTERVAL = 3600
+
+# Poll interval of each API component as a multiple of the base interval.
+# Temperatures and operating states move by the second, the counters by the
+# hour, and the setpoints only when they are written, which marks them due for
+# the next tick anyway. At the default base, "balanced" reads the energy
+# management every minute, the counters every 5 and the setpoints every 15
+# minutes. "minimal" keeps the load on the ISG low, "realtime" reads the energy
+# management and counters far more often.
+CONF_POLLING_PROFILE = "polling_profile"
+POLLING_PROFILE_MINIMAL = "minimal"
+POLLING_PROFILE_BALANCED = "balanced"
+POLLING_PROFILE_REALTIME = "realtime"
+DEFAULT_POLLING_PROFILE = POLLING_PROFILE_BALANCED
+POLLING_PROFILES = {
+    POLLING_PROFILE_MINIMAL: {
+        "system_values": 1,
+        "system_state": 1,
+        "energy_management_settings": 10,
+        "energy_system_information": 10,
+        "extended_energy_data": 10,
+        "extended_energy_management_settings": 10,
+        "extended_energy_system_information": 10,
+        "energy_data": 30,
+        "system_parameters": 120,
+        "extended_system_parameters": 120,
+    },
+    POLLING_PROFILE_BALANCED: {
+        "system_values": 1,
+        "system_state": 1,
+        "energy_management_settings": 2,
+        "energy_system_information": 2,
+        "extended_energy_data": 2,
+        "extended_energy_management_settings": 2,
+        "extended_energy_system_information": 2,
+        "energy_data": 10,
+        "system_parameters": 30,
+        "extended_system_parameters": 30,
+    },
+    POLLING_PROFILE_REALTIME: {
+        "system_values": 1,
+        "system_state": 1,
+        "energy_management_settings": 1,
+        "energy_system_information": 1,
+        "extended_energy_data": 1,
+        "extended_energy_management_settings": 1,
+        "extended_energy_system_information": 1,
+        "energy_data": 2,
+        "system_parameters": 10,
+        "extended_system_parameters": 10,
+    },
+}
+
+# Adaptive polling, off unless enabled: the tick of the fastest components
+# drops to the floor in seconds while the heat pump is active and backs off
+# towards the ceiling while it is idle. Off, they are read at the base interval.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 300
+
+# A component that failed to read for this many of its intervals is stale, and
+# the entities reading it go unavailable. Until then they keep the last value.
+STALE_AFTER_INTERVALS = 3
+
+# Backoff between reconnect attempts after the connection was lost, in seconds.
+# Each failed attempt doubles the delay up to the maximum, with jitter so that
+# several entries on one network do not reconnect in lockstep.
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 300
+
+# Writes to one component within this many seconds are sent together.
+WRITE_COALESCE_DELAY = 0.1
+
+# A written component is read back this many seconds after the write. The ISG
+# passes the write on over CAN, and reading right away returns the old value.
+READ_BACK_DELAY = 5
+
+# The registers last read are saved this many seconds after a poll, when the
+# entry unloads and when Home Assistant stops. Saving more often would rewrite
+# the storage of an SD card or eMMC install every minute for little gain. After
+# a restart the entities show them, marked with the time they were read, until
+# their components are read again. A snapshot older than the maximum age in
+# seconds is not restored.
+SNAPSHOT_SAVE_DELAY = 900
+SNAPSHOT_MAX_AGE = 86400
+ATTR_SNAPSHOT_READ_AT = "snapshot_read_at"
+
+# A value the controller answered with its unavailable marker on every read for
+# this many seconds, and at least this many reads, is taken for one it never
+# answers, and its entity is left out from the next setup. An optional component
+# the controller refused is tried again after the retry in seconds.
+DEAD_VALUE_READS = 50
+DEAD_VALUE_AFTER = 3 * 86400
+REFUSED_COMPONENT_RETRY = 30 * 86400
+
+# The entries that poll the same ISG share its connection, and at most this many
+# of their requests are sent to it at a time. The others wait their turn rather
+# than pile up at a gateway that answers one after the other anyway.
+MAX_REQUESTS_PER_HOST = 1
+
+# Every component read adds a sample of the fields the entities read to the
+# in-memory history, which keeps this many per field. A field that would take
+# the history of an entry beyond the budget in bytes is not kept.
+HISTORY_SAMPLES = 720
+HISTORY_MEMORY_BUDGET = 2 * 1024 * 1024
+SERVICE_GET_HISTORY = "get_history"
+
+# With the option set, every poll appends the values of the components it read
+# to a recording in the config directory, for analysis outside Home Assistant.
+# The samples are written together this many seconds after the first of them,
+# a file is rotated before it grows beyond the size in bytes, and this many
+# rotated files are kept.
+CONF_RECORD_SNAPSHOTS = "record_snapshots"
+DEFAULT_RECORD_SNAPSHOTS = False
+RECORDING_FLUSH_INTERVAL = 60
+RECORDING_MAX_BYTES = 16 * 1024 * 1024
+RECORDING_BACKUPS = 4
+# With this option set, every Modbus request and its answer is captured to a
+# file next to the recording, written and rotated the same way, to be replayed
+# by ``capture.ReplayModbusConnection``.
+CONF_CAPTURE_TRAFFIC = "capture_traffic"
+DEFAULT_CAPTURE_TRAFFIC = False
+ATTR_DURATION = "duration"
+ATTR_BUCKETS = "buckets"
+
 # Config flow error keys
 ERROR_ALREADY_CONFIGURED = "already_configured"
 ERROR_INVALID_HOST = "invalid_host_IP"
@@ -268,4 +402,21 @@ EXTRACT_AIR_HUMIDITY = "extract_air_humidity"
 
 RESET_HEATPUMP = "reset_heatpump"
 ACTIVE_ERROR = "active_error"
+
+# Diagnostic sensors of the coordinator's own instrumentation
+REFRESH_DURATION = "refresh_duration"
+WRITE_DURATION = "write_duration"
+MODBUS_READS = "modbus_reads"
+MODBUS_REGISTERS_READ = "modbus_registers_read"
+MODBUS_BYTES_READ = "modbus_bytes_read"
+MODBUS_ERRORS = "modbus_errors"
+ACCESSOR_ERRORS = "accessor_errors"
+ENTITIES_NOTIFIED = "entities_notified"
 ERROR_STATUS = "error_status"
+
+# 2026.7 renamed exactly one entity key, verified by diffing the key constants
+# of 2026.2 against the current ones. An id from an earlier release carries the
+# old key, so it has to be translated before the new id is built, otherwise the
+# entity would be migrated to an id that no entity description produces and stay
+# orphaned for the second time.
+RENAMED_KEYS = {"heating_pressure": HEATER_PRESSURE}
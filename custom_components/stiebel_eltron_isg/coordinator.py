@@ -4,26 +4,103 @@ For more details about this integration, please refer to
 https://github.com/pail23/stiebel_eltron_isg
 """
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+import inspect
 import logging
+from pathlib import Path
+import random
+from time import monotonic
 from typing import Any, Protocol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from modbus_connection import ModbusConnection, ModbusError, ModbusUnit
+from homeassistant.util import dt as dt_util
+from modbus_connection import (
+    ClientClosedError,
+    IllegalDataAddressError,
+    ModbusConnection,
+    ModbusError,
+    ModbusUnit,
+)
 from modbus_connection.cli_helper import field_rows
-from pystiebeleltron import ControllerModel, StiebelEltronModbusError
+from modbus_connection.model import Component
+from pystiebeleltron import (
+    ControllerModel,
+    StiebelEltronModbusError,
+    UnknownControllerModelError,
+    get_controller_model,
+)
 
 from custom_components.stiebel_eltron_isg.const import (
     ATTR_MANUFACTURER,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MODEL_ID,
+    CONF_POLLING_PROFILE,
+    CONF_RECORD_SNAPSHOTS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CAPTURE_TRAFFIC,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_POLLING_PROFILE,
+    DEFAULT_RECORD_SNAPSHOTS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    READ_BACK_DELAY,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+    STALE_AFTER_INTERVALS,
+    UNIT_ID,
+    WRITE_COALESCE_DELAY,
+)
+from custom_components.stiebel_eltron_isg.dead_values import (
+    DeadValues,
+    ValueDescription,
+)
+from custom_components.stiebel_eltron_isg.history import History
+from custom_components.stiebel_eltron_isg.instrumentation import (
+    Instrumentation,
+    Traffic,
+    count_traffic,
+)
+from custom_components.stiebel_eltron_isg.polling import (
+    OPTIONAL_COMPONENTS,
+    AdaptiveInterval,
+    PollSchedule,
+    component_poll_intervals,
+    components_read_by,
 )
+from custom_components.stiebel_eltron_isg.pool import interactive, wrapped_unit
+from custom_components.stiebel_eltron_isg.recorder import (
+    SnapshotRecorder,
+    TrafficRecorder,
+)
+from custom_components.stiebel_eltron_isg.references import (
+    ApiField,
+    RegisterBit,
+    ValueReference,
+)
+from custom_components.stiebel_eltron_isg.snapshot import (
+    RegisterImage,
+    SnapshotStore,
+    record_registers,
+    snapshot_unit,
+)
+from custom_components.stiebel_eltron_isg.value_table import UNREAD, ValueTable
+from custom_components.stiebel_eltron_isg.write_queue import ComponentWriteQueue
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -33,6 +110,40 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 type AnyStiebelEltronDataCoordinator = StiebelEltronDataCoordinator[Any]
 type StiebelEltronConfigEntry = ConfigEntry[AnyStiebelEltronDataCoordinator]
 
+# The listener context of an entity that reports on the coordinator itself: it
+# reads no values, so it neither asks for components to be read nor waits for
+# a value to change, and is woken by every refresh.
+EVERY_REFRESH = object()
+
+_COMPONENT_ATTRIBUTES = frozenset(dir(Component))
+_DERIVED_FIELDS: dict[type[Component], tuple[str, ...]] = {}
+
+
+def _derived_fields(component_type: type[Component]) -> tuple[str, ...]:
+    """Return the properties a component type derives from its registers.
+
+    These are the values the raw data shows besides the fields, such as the
+    sum of a day and total energy counter.
+    """
+    if component_type not in _DERIVED_FIELDS:
+        _DERIVED_FIELDS[component_type] = tuple(
+            name
+            for name in dir(component_type)
+            if not name.startswith("_")
+            and name not in _COMPONENT_ATTRIBUTES
+            and isinstance(inspect.getattr_static(component_type, name, None), property)
+        )
+    return _DERIVED_FIELDS[component_type]
+
+
+def _add_entity[D](
+    async_add_entities: AddEntitiesCallback,
+    entity: Callable[[D], Entity],
+    description: D,
+) -> None:
+    """Add the entity of ``description``."""
+    async_add_entities([entity(description)])
+
 
 def _is_read_only_write_error(err: AttributeError, field: str) -> bool:
     """Return whether modbus_connection rejected a read-only field or space."""
@@ -52,6 +163,24 @@ def coordinator_display_name(model: ControllerModel) -> str:
     return f"Stiebel Eltron {model.name}"
 
 
+def _poll_intervals(options: Mapping[str, Any]) -> dict[str, float]:
+    """Return the component poll intervals the entry options ask for."""
+    return component_poll_intervals(
+        options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        options.get(CONF_POLLING_PROFILE, DEFAULT_POLLING_PROFILE),
+    )
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Return the seconds to wait before reconnect attempt ``attempt`` + 1.
+
+    The delay doubles with every failed attempt up to the maximum, and a
+    random half of it is jitter.
+    """
+    delay = float(min(RECONNECT_MAX_DELAY, RECONNECT_MIN_DELAY * 2**attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
 class StiebelEltronApi(Protocol):
     """Protocol for Stiebel Eltron API clients."""
 
@@ -67,6 +196,25 @@ class StiebelEltronConnectionParams:
     host: str
     model: ControllerModel
     connection: ModbusConnection
+    # Counts the requests of the unit the API was built on.
+    traffic: Traffic = field(default_factory=Traffic)
+    # Records the registers that unit read, for the snapshot.
+    image: RegisterImage = field(default_factory=RegisterImage)
+
+    def api_unit(self) -> ModbusUnit:
+        """Return the unit to build the API on.
+
+        Its requests are counted and captured in ``traffic``, and the registers
+        it reads are recorded in ``image``. Both happen once a request is sent,
+        so its duration leaves out its wait for the other requests to the host.
+        """
+        return wrapped_unit(
+            self.connection,
+            UNIT_ID,
+            lambda unit: record_registers(
+                count_traffic(unit, self.traffic), self.image
+            ),
+        )
 
 
 class StiebelEltronDataCoordinator[T: StiebelEltronApi](
@@ -74,6 +222,10 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
 ):
     """Data coordinator base class for stiebel eltron isg."""
 
+    # Named values that are non-zero while the heat pump is active. The tick
+    # follows them between the configured floor and ceiling.
+    activity_signals: tuple[tuple[str, ValueReference], ...] = ()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -84,19 +236,56 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
         """Initialize the Modbus hub."""
         self._model: ControllerModel = params.model
         self._host = params.host
+        self._entry = entry
         self._connection = params.connection
         self._api = api_client
+        self.instrumentation = Instrumentation(params.traffic)
         self._refresh_generation = 0
         self._last_successful_refresh_generation = 0
+        self._values = ValueTable(self._components_of)
+        self._changed_references: set[ValueReference] = set()
+        self._notified_update_success = True
+        self._value_cache_hits = 0
+        self._value_cache_misses = 0
+        self._reference_components: dict[ValueReference, frozenset[str] | None] = {}
+        self._component_generations: dict[str, int] = {}
+        self._component_failures: dict[str, int] = {}
+        self._component_errors: dict[str, ModbusError] = {}
+        self._stale_components: set[str] = set()
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._reconnects = 0
+        self._write_queues: dict[str, ComponentWriteQueue] = {}
+        self._read_back_components: set[str] = set()
+        self._read_back_unsub: Callable[[], None] | None = None
+        self._image = params.image
+        self._snapshot = SnapshotStore(hass, entry)
+        self._dead_values = DeadValues(hass, entry, self._model.value)
+        self._descriptions: dict[str, ValueDescription] = {}
+        # Adds the entity of a value left out as never answered.
+        self._left_out: dict[str, Callable[[], None]] = {}
+        self.history = History()
+        self._recorder: SnapshotRecorder | None = None
+        self._traffic_recorder: TrafficRecorder | None = None
+        self._read_at: dict[str, datetime] = {}
+        self._restored: dict[str, datetime] = {}
+        self._restored_api: T | None = None
+        self._schedule = PollSchedule({
+            component: interval
+            for component, interval in _poll_intervals(entry.options).items()
+            if getattr(api_client, component, None) is not None
+        })
+        self._adaptive_interval = self._build_adaptive_interval(entry.options)
+        self._refresh_delay = 0.0
 
         super().__init__(
             hass,
             _LOGGER,
             name=coordinator_display_name(self._model),
             config_entry=entry,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=self._adaptive_interval.interval),
             # The coordinator holds no data of its own (the API client caches
-            # the register values), so there is nothing to diff against.
+            # the register values), so every refresh reaches
+            # ``async_update_listeners``, which diffs the values itself.
             always_update=True,
         )
 
@@ -108,6 +297,7 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
             model_id=str(self._model.value),
             manufacturer=ATTR_MANUFACTURER,
         )
+        self._apply_recording(entry.options)
 
     def _for_unit(self, unit: int) -> ModbusUnit:
         """Return a connection for a specific unit."""
@@ -122,6 +312,98 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
             return False
         return self._connection.connected
 
+    @callback
+    def async_connection_lost(self) -> None:
+        """Reconnect in the background after the connection was lost.
+
+        The entities, the API and its unit handles stay as they are; the
+        connection they share is established again in place. A loss while a
+        reconnect is running is part of that reconnect.
+        """
+        if self._reconnecting:
+            return
+        _LOGGER.warning("Lost the connection to %s, reconnecting", self._host)
+        self._reconnect_task = self._entry.async_create_background_task(
+            self.hass,
+            self._async_reconnect(),
+            f"{DOMAIN} reconnect {self._host}",
+        )
+
+    @property
+    def _reconnecting(self) -> bool:
+        """Return whether a reconnect is running."""
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    async def _async_reconnect(self) -> None:
+        """Connect again, backing off between attempts, and resume polling.
+
+        The controller is asked for its model once connected, see
+        ``async_verify_model``.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._connection.connect()
+            except ClientClosedError:
+                # The entry is being unloaded.
+                return
+            except ModbusError as err:
+                delay = _reconnect_delay(attempt)
+                _LOGGER.debug(
+                    "Reconnect attempt %s to %s failed, retrying in %.1f s: %s",
+                    attempt + 1,
+                    self._host,
+                    delay,
+                    err,
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                break
+        if not await self.async_verify_model():
+            return
+        self._reconnects += 1
+        _LOGGER.info("Reconnected to %s", self._host)
+        await self.async_request_refresh()
+
+    async def async_verify_model(self) -> bool:
+        """Return whether the controller still reports the model set up for.
+
+        Another model behind the same address needs other entities, so the
+        config entry is reloaded then, without the model it cached.
+        """
+        if await self._async_same_model():
+            return True
+        _LOGGER.warning(
+            "%s no longer reports the controller model %s, reloading",
+            self._host,
+            self._model.name,
+        )
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data={
+                key: value
+                for key, value in self._entry.data.items()
+                if key != CONF_MODEL_ID
+            },
+        )
+        self.hass.config_entries.async_schedule_reload(self._entry.entry_id)
+        return False
+
+    async def _async_same_model(self) -> bool:
+        """Return whether the controller still reports the model set up for.
+
+        If the model cannot be read, the polling that resumes finds out whether
+        the connection holds.
+        """
+        try:
+            model = await get_controller_model(self._for_unit(UNIT_ID))
+        except UnknownControllerModelError:
+            return False
+        except StiebelEltronModbusError:
+            return True
+        return model == self._model
+
     @property
     def host(self) -> str:
         """Return the host address of the Stiebel Eltron ISG."""
@@ -159,16 +441,649 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
         return result
 
     async def _async_update_data(self) -> dict[str, float | int | None]:
-        """Time to update."""
+        """Read the API components that are due on this tick.
+
+        A component that fails to read keeps its last values until it is
+        stale, so one timed out block does not take every entity down. The
+        update only fails when nothing could be read and the data it failed
+        on is stale.
+        """
+        started = monotonic()
+        try:
+            await self._async_poll(
+                self._schedule.due(started, self._wanted_components())
+            )
+        finally:
+            self.instrumentation.refresh_duration.observe(monotonic() - started)
+        self._adapt_interval()
+        return {}
+
+    async def _async_poll(self, due: list[str]) -> None:
+        """Read the ``due`` components and diff the values the listeners read."""
         self._refresh_generation += 1
         generation = self._refresh_generation
+        started = monotonic()
         try:
-            await self._api.async_update()
+            read = await self._async_read(due)
         except ModbusError as exception:
             raise UpdateFailed(exception) from exception
-        else:
-            self._last_successful_refresh_generation = generation
-            return {}
+
+        self._schedule.mark_polled(read, started)
+        read_at = dt_util.utcnow()
+        for component in read:
+            self._component_generations[component] = generation
+            self._component_failures.pop(component, None)
+            self._read_at[component] = read_at
+        if read and self._image.registers:
+            self._snapshot.schedule_save(self._model.value, self._image, self._read_at)
+        expired = self._expire_restored(read)
+        for key in self._dead_values.observe(read, self._peek_value):
+            if (add_entity := self._left_out.pop(key, None)) is not None:
+                _LOGGER.info("%s, left out as never answered, was read", key)
+                add_entity()
+        stale = self._schedule.stale(started, STALE_AFTER_INTERVALS)
+        failed = [component for component in due if component not in read]
+        if failed and not read and stale.intersection(failed):
+            if expired:
+                self._changed_references |= self._diff_references(expired)
+            error = self._component_errors[failed[-1]]
+            raise UpdateFailed(error) from error
+
+        self._log_staleness(stale)
+        refreshed = stale.symmetric_difference(self._stale_components) | expired
+        self._stale_components = stale
+        self._last_successful_refresh_generation = generation
+        # A read back can run while a poll is under way, so neither may drop
+        # the changes the other found before the listeners were woken.
+        self._changed_references |= self._diff_references(refreshed)
+        timestamp = read_at.timestamp()
+        for component in read:
+            self.history.record(component, timestamp, self._values.fields_of(component))
+        if self._recorder is not None and read:
+            self._recorder.record(timestamp, self._decoded_values(read))
+
+    def _decoded_values(self, components: Iterable[str]) -> Iterator[tuple[str, Any]]:
+        """Yield the path and decoded value of every field of ``components``.
+
+        The properties a component derives from its fields are included, so a
+        recording holds every value the raw data shows.
+        """
+        for name in components:
+            component: Component = getattr(self._api, name)
+            for field_name in (
+                *component.resolved_fields,
+                *_derived_fields(type(component)),
+            ):
+                try:
+                    value = getattr(component, field_name)
+                except StiebelEltronModbusError:
+                    value = None
+                yield f"{name}.{field_name}", value
+
+    def _expire_restored(self, read: list[str]) -> set[str]:
+        """Stop serving the snapshot for the components read live, or given up on.
+
+        A restored component is served until it was read, or until it failed
+        to read as often as makes a component stale. Return the components
+        whose entities switch over.
+        """
+        expired = {
+            component
+            for component in self._restored
+            if component in read
+            or self._component_failures.get(component, 0) >= STALE_AFTER_INTERVALS
+        }
+        for component in expired:
+            del self._restored[component]
+        if not self._restored:
+            self._restored_api = None
+        return expired
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Wake the listeners of restored values that expired while offline.
+
+        Home Assistant only wakes the listeners after an update that succeeded
+        or changed whether updates succeed.
+        """
+        super()._async_refresh_finished()
+        if self._changed_references and not self.last_update_success:
+            self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending read back along with the polling.
+
+        A snapshot waiting to be saved is saved now, so a reload finds it.
+        """
+        if self._read_back_unsub is not None:
+            self._read_back_unsub()
+            self._read_back_unsub = None
+        await super().async_shutdown()
+        await self.async_save_state()
+
+    async def async_save_state(self, _event: Event | None = None) -> None:
+        """Save the snapshot, the dead values and the recordings right away.
+
+        Called when the entry unloads and when Home Assistant stops, which does
+        not unload the entries. In between they are saved every so often only.
+        """
+        await self._snapshot.async_flush()
+        await self._dead_values.async_flush()
+        for recorder in (self._recorder, self._traffic_recorder):
+            if recorder is not None:
+                await recorder.async_flush()
+
+    def _snapshot_api(self, unit: ModbusUnit) -> T | None:
+        """Return an API client on ``unit``, or None to restore no snapshot."""
+        return None
+
+    async def async_restore_snapshot(self) -> bool:
+        """Serve the registers the last run saved until they are read again.
+
+        Every component is decoded from the snapshot as if it were read, which
+        only succeeds with every one of its registers in it. Return whether
+        any component was restored.
+        """
+        snapshot = await self._snapshot.async_load(self._model.value)
+        if snapshot is None:
+            return False
+        api = self._snapshot_api(snapshot_unit(snapshot.registers))
+        if api is None:
+            return False
+        for component, read_at in snapshot.read_at.items():
+            if component not in self._schedule.components:
+                continue
+            try:
+                await getattr(api, component).async_update(notify=False)
+            except ModbusError as err:
+                _LOGGER.debug(
+                    "Could not restore %s from the snapshot: %s", component, err
+                )
+            else:
+                self._restored[component] = read_at
+        if not self._restored:
+            return False
+        _LOGGER.debug(
+            "Restored %s from the snapshot", ", ".join(sorted(self._restored))
+        )
+        self._restored_api = api
+        # Until they are read again, the restored registers are saved as they
+        # were, so a restart before that restores them once more.
+        for space, registers in snapshot.registers.items():
+            self._image.registers.setdefault(space, {}).update(registers)
+        self._read_at.update(self._restored)
+        self._values.invalidate(None)
+        return True
+
+    async def async_load_dead_values(self) -> None:
+        """Stop polling the optional components an earlier run found refused."""
+        await self._dead_values.async_load()
+        for component in self._dead_values.refused_components:
+            self._schedule.drop(component)
+
+    @callback
+    def async_add_answered_entities[D: ValueDescription](
+        self,
+        async_add_entities: AddEntitiesCallback,
+        descriptions: Iterable[D],
+        entity: Callable[[D], Entity],
+    ) -> None:
+        """Add the ``entity`` of every description whose value is answered.
+
+        Every description is watched, so one that never answers is left out
+        from the next setup, and one left out is added once it answers. A
+        writable value is not: its entity is set up even when the device never
+        reports it, so it can still be written.
+        """
+        answered = []
+        for description in descriptions:
+            self._descriptions[description.key] = description
+            components = self._components_of(description.modbus_register)
+            writable = getattr(description, "write_component", None) is not None
+            if not writable:
+                self._dead_values.watch(
+                    description.key, description.modbus_register, components
+                )
+            if self._dead_values.answered(
+                description.key, components, writable=writable
+            ):
+                answered.append(entity(description))
+            else:
+                _LOGGER.debug("Leaving out %s, it is never answered", description.key)
+                self._left_out[description.key] = partial(
+                    _add_entity, async_add_entities, entity, description
+                )
+        async_add_entities(answered)
+
+    def history_field(self, key: str) -> tuple[str, int | None] | None:
+        """Return the API field, and bit, the history of entity ``key`` is kept by.
+
+        Only the entities that read a single API field have a history.
+        """
+        description = self._descriptions.get(key)
+        if description is None or not isinstance(
+            reference := description.modbus_register, ApiField
+        ):
+            return None
+        return reference.path, getattr(description, "bit_number", None)
+
+    @callback
+    def _schedule_read_back(self, component: str) -> None:
+        """Read ``component`` back once a write to it has settled.
+
+        Writes to several components, or several writes to one, that fall
+        within the settle delay share one read back.
+        """
+        self._read_back_components.add(component)
+        if self._read_back_unsub is None:
+            self._read_back_unsub = async_call_later(
+                self.hass, READ_BACK_DELAY, self._async_read_back
+            )
+
+    async def _async_read_back(self, _now: datetime) -> None:
+        """Read only the written components and wake the listeners that changed.
+
+        This is not a refresh: the regular tick keeps its time, and a read that
+        fails leaves the coordinator's state alone and the component due for
+        the next tick. Like the write, the read back goes ahead of polling.
+        """
+        self._read_back_unsub = None
+        components, self._read_back_components = self._read_back_components, set()
+        due = [
+            component
+            for component in self._schedule.components
+            if component in components
+        ]
+        if not due:
+            return
+        try:
+            with interactive():
+                await self._async_poll(due)
+        except UpdateFailed as err:
+            _LOGGER.debug("Failed to read back %s: %s", ", ".join(due), err)
+            return
+        self.async_update_listeners()
+
+    def _log_staleness(self, stale: set[str]) -> None:
+        """Log once when a component goes stale, and once when it recovers."""
+        for component in sorted(stale - self._stale_components):
+            if component in self._component_failures:
+                _LOGGER.warning(
+                    "%s has failed %s reads in a row, its entities are unavailable: %s",
+                    component,
+                    self._component_failures[component],
+                    self._component_errors[component],
+                )
+        for component in sorted(self._stale_components - stale):
+            _LOGGER.info("%s is read again", component)
+
+    async def _async_read(self, due: list[str]) -> list[str]:
+        """Read the due components and return those that were read."""
+        try:
+            if not self._schedule.components:
+                # An API without any scheduled component can only be read as
+                # a whole.
+                await self._api.async_update()
+                return due
+            return await self._async_update_components(due)
+        finally:
+            # Even a failed poll may have stored some of its blocks already.
+            self._values.invalidate(due if self._schedule.components else None)
+
+    async def _async_update_components(self, names: list[str]) -> list[str]:
+        """Read the named components on their own and return those that were read.
+
+        A failed read is recorded for its component and does not stop the
+        others. The read components are notified once all reads are done, and
+        an optional component the controller refuses is dropped.
+        """
+        updated = []
+        for name in names:
+            component = getattr(self._api, name)
+            read_before = self.instrumentation.traffic.read_seconds
+            try:
+                await component.async_update(notify=False)
+            except IllegalDataAddressError as err:
+                if name not in OPTIONAL_COMPONENTS:
+                    self._record_failure(name, err)
+                    continue
+                self._schedule.drop(name)
+                self._dead_values.refuse(name)
+                _LOGGER.info(
+                    "The controller does not serve the registers of %s, so they are not polled again: %s",
+                    name,
+                    err,
+                )
+            except ModbusError as err:
+                self._record_failure(name, err)
+            else:
+                updated.append(name)
+                self.instrumentation.observe_component_read(
+                    name, self.instrumentation.traffic.read_seconds - read_before
+                )
+
+        for name in updated:
+            getattr(self._api, name).notify()
+        return updated
+
+    def _record_failure(self, component: str, err: ModbusError) -> None:
+        """Count a failed read of a component and keep its error."""
+        self._component_failures[component] = (
+            self._component_failures.get(component, 0) + 1
+        )
+        self._component_errors[component] = err
+        _LOGGER.debug("Failed to read %s: %s", component, err)
+
+    def _build_adaptive_interval(self, options: Mapping[str, Any]) -> AdaptiveInterval:
+        """Return the tick around the schedule's fastest interval.
+
+        It only adapts to the heat pump's activity if the options enable it.
+        """
+        return AdaptiveInterval(
+            self._schedule.tick_interval or DEFAULT_SCAN_INTERVAL,
+            options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            adaptive=options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        )
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Poll with changed options from the next tick on, without a reload.
+
+        The schedule keeps when each component was read, so a component whose
+        new interval has already run out is read on the next tick.
+        """
+        self._schedule.reconfigure(_poll_intervals(options))
+        self._adaptive_interval = self._build_adaptive_interval(options)
+        self._schedule.set_tick_interval(self._adaptive_interval.interval)
+        self.update_interval = timedelta(seconds=self._adaptive_interval.interval)
+        self._apply_recording(options)
+
+    def _apply_recording(self, options: Mapping[str, Any]) -> None:
+        """Start or stop recording the polled values and traffic, as the options ask.
+
+        A recording and a capture are kept per entry in the config directory,
+        and a stopped one writes what it buffered.
+        """
+        if options.get(CONF_RECORD_SNAPSHOTS, DEFAULT_RECORD_SNAPSHOTS):
+            if self._recorder is None:
+                self._recorder = SnapshotRecorder(
+                    self.hass, self._recording_path("rec")
+                )
+        elif self._recorder is not None:
+            self._async_flush_in_background(self._recorder)
+            self._recorder = None
+        traffic = self.instrumentation.traffic
+        if options.get(CONF_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC):
+            if self._traffic_recorder is None:
+                self._traffic_recorder = TrafficRecorder(
+                    self.hass, self._recording_path("capture.jsonl"), self._model.name
+                )
+                traffic.capture = self._traffic_recorder.record
+        elif self._traffic_recorder is not None:
+            traffic.capture = None
+            self._async_flush_in_background(self._traffic_recorder)
+            self._traffic_recorder = None
+
+    def _recording_path(self, suffix: str) -> Path:
+        return Path(self.hass.config.path(DOMAIN, f"{self._entry.entry_id}.{suffix}"))
+
+    @callback
+    def _async_flush_in_background(
+        self, recorder: SnapshotRecorder | TrafficRecorder
+    ) -> None:
+        self._entry.async_create_background_task(
+            self.hass, recorder.async_flush(), f"{DOMAIN} flush {recorder.path.name}"
+        )
+
+    def stagger_refreshes(self, offset: float) -> None:
+        """Delay the first regular refresh by ``offset`` times the poll interval.
+
+        Every later refresh follows the one before by the interval, so entries
+        of one ISG with the same interval keep polling that far apart instead
+        of queueing behind each other for its connection. The connection pool
+        hands each entry its own offset.
+        """
+        self._refresh_delay = offset
+
+    def _active_signals(self) -> list[str] | None:
+        """Return the activity signals that are set, or None without any value."""
+        values = {
+            name: self.get_value(signal) for name, signal in self.activity_signals
+        }
+        if all(value is None for value in values.values()):
+            return None
+        return [name for name, value in values.items() if value]
+
+    def _adapt_interval(self) -> None:
+        """Tick faster while the heat pump is active and slower while it is idle."""
+        reason = self._adaptive_interval.reason
+        interval = self._adaptive_interval.update(self._active_signals())
+        if self._adaptive_interval.reason != reason:
+            _LOGGER.debug(
+                "Polling every %s seconds (%s)",
+                interval,
+                self._adaptive_interval.reason,
+            )
+        self._schedule.set_tick_interval(interval)
+        self.update_interval = timedelta(seconds=interval * (1 + self._refresh_delay))
+        self._refresh_delay = 0.0
+
+    @property
+    def poll_state(self) -> dict[str, Any]:
+        """Return the current tick, why it was chosen and its bounds."""
+        wanted = self._wanted_components()
+        now = monotonic()
+        return {
+            "interval": self._adaptive_interval.interval,
+            "reason": self._adaptive_interval.reason,
+            "floor": self._adaptive_interval.floor,
+            "ceiling": self._adaptive_interval.ceiling,
+            "components": {
+                component: self._schedule.interval(component)
+                for component in self._schedule.components
+            },
+            "component_status": {
+                component: {
+                    "age": self._schedule.age(component, now),
+                    "generation": self._component_generations.get(component),
+                    "failures": self._component_failures.get(component, 0),
+                    "stale": component in self._stale_components,
+                }
+                for component in self._schedule.components
+            },
+            "unused_components": sorted(
+                component
+                for component in self._schedule.components
+                if wanted is not None and component not in wanted
+            ),
+            "reconnecting": self._reconnecting,
+            "reconnects": self._reconnects,
+            "restored": {
+                component: read_at.isoformat()
+                for component, read_at in sorted(self._restored.items())
+            },
+            "dead_values": sorted(self._dead_values.dead_keys),
+            "refused_components": sorted(self._dead_values.refused_components),
+        }
+
+    def _wanted_components(self) -> set[str] | None:
+        """Return the components the listeners read, or None to read them all.
+
+        Disabled entities are never added and an entity disabled in the
+        registry is removed, so the listeners' value references cover exactly
+        the enabled entities, and the activity signals are read for the tick.
+        Everything is read before the entities are added, and whenever a
+        listener's reads are unknown. A listener woken by every refresh reads
+        no values.
+        """
+        if not self._listeners:
+            return None
+        references: list[ValueReference] = [
+            signal for _, signal in self.activity_signals
+        ]
+        for _, context in self._listeners.values():
+            if context is EVERY_REFRESH:
+                continue
+            if not isinstance(context, tuple):
+                return None
+            references.extend(context)
+
+        wanted: set[str] = set()
+        for reference in references:
+            components = self._components_of(reference)
+            if components is None:
+                return None
+            wanted |= components
+        return wanted
+
+    def _components_of(self, reference: ValueReference) -> frozenset[str] | None:
+        """Return the components an accessor reads, or None if that is unknown."""
+        try:
+            return self._reference_components[reference]
+        except KeyError:
+            components = self._reference_components[reference] = components_read_by(
+                reference
+            )
+            return components
+
+    def is_fresh(self, references: Iterable[ValueReference]) -> bool:
+        """Return whether no component behind ``references`` is stale.
+
+        A component is stale once it failed to read for several of its
+        intervals, and its entities go unavailable while the others stay. A
+        component served from the snapshot is not stale.
+        """
+        stale = self._stale_components.difference(self._restored)
+        for reference in references:
+            components = self._components_of(reference)
+            if components is not None and not components.isdisjoint(stale):
+                return False
+        return True
+
+    def is_available(self, references: Iterable[ValueReference]) -> bool:
+        """Return whether the entities reading ``references`` have values to show.
+
+        That is if the last update succeeded, or the values are restored from
+        the snapshot, and none of their components is stale.
+        """
+        return (
+            self.last_update_success or self.restored_at(references) is not None
+        ) and self.is_fresh(references)
+
+    def restored_at(self, references: Iterable[ValueReference]) -> datetime | None:
+        """Return when the snapshot values ``references`` read were read.
+
+        That is the oldest read of a restored component behind them, or None
+        if they are all read live.
+        """
+        if not self._restored:
+            return None
+        read_at = [
+            read for reference in references for read in self._restored_reads(reference)
+        ]
+        return min(read_at, default=None)
+
+    def _restored_reads(self, reference: ValueReference) -> list[datetime]:
+        """Return when the restored components behind ``reference`` were read.
+
+        An accessor whose components are unknown is served from the snapshot
+        until an update succeeded.
+        """
+        components = self._components_of(reference)
+        if components is None:
+            if self._last_successful_refresh_generation:
+                return []
+            return list(self._restored.values())
+        return [
+            self._restored[component]
+            for component in components
+            if component in self._restored
+        ]
+
+    def read_since(self, references: Iterable[ValueReference], generation: int) -> bool:
+        """Return whether the components behind ``references`` were read again.
+
+        Every one of them must have been read by a refresh that started after
+        the refresh ``generation``.
+        """
+        for reference in references:
+            components = self._components_of(reference)
+            if components is None:
+                if self._last_successful_refresh_generation <= generation:
+                    return False
+            elif any(
+                self._component_generations.get(component, 0) <= generation
+                for component in components
+            ):
+                return False
+        return True
+
+    def _diff_references(self, refreshed: set[str]) -> set[ValueReference]:
+        """Resolve the values read anew and return the references that changed.
+
+        A reference without a previous value - a new listener, or one expired
+        by ``expire_references`` - counts as changed, and so does one whose
+        component went stale or became fresh again, as that changes the
+        availability of its entities. Only the slots of the components a read
+        or ``refreshed`` invalidated are resolved again; the others kept their
+        values.
+        """
+        values = self._values
+        values.invalidate(refreshed)
+        for slot in values.unread():
+            values.store(slot, self._read_value(values.references[slot]))
+        references = values.references
+        return {
+            references[slot]
+            for slot in values.take_changes() | values.slots_of(refreshed)
+        }
+
+    def expire_references(self, references: Iterable[ValueReference]) -> None:
+        """Report ``references`` as changed by the next refresh, whatever it reads."""
+        self.expire_slots(self.value_slot(reference) for reference in references)
+
+    def expire_slots(self, slots: Iterable[int]) -> None:
+        """Report the values of ``slots`` as changed by the next refresh."""
+        for slot in slots:
+            self._values.expire(slot)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Give the references a listener reads their slots right away.
+
+        The next refresh then reports them as changed, and every later one
+        compares them with the rest of the table.
+        """
+        if isinstance(context, tuple):
+            for reference in context:
+                self.value_slot(reference)
+        return super().async_add_listener(update_callback, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose values changed with the last refresh.
+
+        A listener registers the value references it reads as its context and
+        is only woken when one of them changed. Every listener is woken when
+        the coordinator became available or unavailable, and a listener
+        registered with ``EVERY_REFRESH`` or without a context on every update.
+        """
+        changed = self._changed_references
+        self._changed_references = set()
+        notify_all = self.last_update_success != self._notified_update_success
+        self._notified_update_success = self.last_update_success
+        notified = 0
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                notify_all
+                or not isinstance(context, tuple)
+                or not changed.isdisjoint(context)
+            ):
+                update_callback()
+                notified += 1
+        self.instrumentation.observe_notified(notified)
 
     @property
     def refresh_generation(self) -> int:
@@ -180,14 +1095,76 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
         """Return the generation of the newest successful refresh."""
         return self._last_successful_refresh_generation
 
+    @property
+    def value_cache_stats(self) -> dict[str, int]:
+        """Return how often ``get_value`` was served from the cache."""
+        return {
+            "hits": self._value_cache_hits,
+            "misses": self._value_cache_misses,
+        }
+
+    def value_slot(self, value_reference: ValueReference) -> int:
+        """Return the slot of an accessor in the value table, giving it one."""
+        slot = self._values.find(value_reference)
+        if slot is None:
+            slot = self._values.add(value_reference)
+        return slot
+
     def get_value(
         self,
         value_reference: Callable[[T], float | int | None],
     ) -> float | int | None:
-        """Return a value from a callable accessor."""
+        """Return a value from a callable accessor.
+
+        The result is kept in the accessor's slot until the next poll has read
+        its blocks: ``available`` and the state properties of an entity, and
+        the change detection before them, all ask for the same value.
+        """
+        return self.read_slot(self.value_slot(value_reference))
+
+    def read_slot(self, slot: int) -> float | int | None:
+        """Return the value of a slot ``value_slot`` handed out.
+
+        An entity resolves its slots once and reads them by index, without
+        looking its accessors up again.
+        """
+        values = self._values
+        if values.kinds[slot] == UNREAD:
+            self._value_cache_misses += 1
+            values.store(slot, self._read_value(values.references[slot]))
+        else:
+            self._value_cache_hits += 1
+        return values.read(slot)
+
+    def _peek_value(self, value_reference: ValueReference) -> float | int | None:
+        """Return a value without giving its accessor a slot if it has none.
+
+        A value only looked at now and then, say for the entity of a disabled
+        description, is not resolved with every poll from then on.
+        """
+        if self._values.find(value_reference) is not None:
+            return self.get_value(value_reference)
+        return self._read_value(value_reference)
+
+    @property
+    def read_values(self) -> dict[str, float | int | None]:
+        """Return the values of the API fields the entities read, by path."""
+        return self._values.read_fields()
+
+    def _read_value(
+        self,
+        value_reference: Callable[[T], float | int | None],
+    ) -> float | int | None:
+        """Evaluate an accessor against the API."""
+        if isinstance(value_reference, RegisterBit):
+            return value_reference.of(self.get_value(value_reference.register))
+        api = self._api
+        if self._restored_api is not None and self._restored_reads(value_reference):
+            api = self._restored_api
         try:
-            value = value_reference(self._api)
+            value = value_reference(api)
         except StiebelEltronModbusError as err:
+            self.instrumentation.accessor_errors += 1
             _LOGGER.warning(
                 "Failed to get value from accessor %r: %s",
                 value_reference,
@@ -209,7 +1186,11 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
         field: str,
         value: int | float,
     ) -> None:
-        """Write a value to a component field."""
+        """Write a value to a component field.
+
+        Writes to the same component within a short window are sent together,
+        see ``ComponentWriteQueue``, ahead of the reads of a poll under way.
+        """
         component_obj = getattr(self._api, component, None)
         if component_obj is None or not hasattr(component_obj, field):
             _LOGGER.debug("Write target %s.%s is unsupported", component, field)
@@ -219,8 +1200,15 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
                 translation_placeholders={"field": field},
             )
 
+        queue = self._write_queues.get(component)
+        if queue is None:
+            queue = self._write_queues[component] = ComponentWriteQueue(
+                component_obj, WRITE_COALESCE_DELAY
+            )
+        started = monotonic()
         try:
-            await component_obj.write(field, value)
+            with interactive():
+                await queue.write(field, value)
         except ValueError as err:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -248,11 +1236,26 @@ class StiebelEltronDataCoordinator[T: StiebelEltronApi](
                 translation_placeholders={"field": field},
             ) from err
         except (ModbusError, StiebelEltronModbusError) as err:
+            # The write may have reached the controller before it failed.
+            self._read_back_written(component)
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="write_failed",
                 translation_placeholders={"field": field},
             ) from err
+        else:
+            self.instrumentation.write_duration.observe(monotonic() - started)
+            self._read_back_written(component)
+
+    def _read_back_written(self, component: str) -> None:
+        """Read a component that was sent a write back once it has settled.
+
+        It is also due on the next tick, should that read fail, instead of
+        waiting for its regular interval. A value rejected before it was sent
+        changes nothing, and is not read back.
+        """
+        self._schedule.mark_due(component)
+        self._schedule_read_back(component)
 
     async def async_reset_heatpump(self) -> None:
         """Reset the heat pump."""
@@ -0,0 +1,207 @@
+"""Learn which values and components an installation never answers."""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Protocol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEAD_VALUE_AFTER,
+    DEAD_VALUE_READS,
+    DOMAIN,
+    REFUSED_COMPONENT_RETRY,
+    SNAPSHOT_SAVE_DELAY,
+)
+from .references import ValueReference
+
+DEAD_VALUES_STORAGE_VERSION = 1
+
+
+class ValueDescription(Protocol):
+    """An entity description that reads one value."""
+
+    @property
+    def key(self) -> str:
+        """Return the key of the entity."""
+
+    @property
+    def modbus_register(self) -> Any:
+        """Return the accessor of the value."""
+
+
+@dataclass
+class _Unanswered:
+    """A value that held none since ``since``, over ``reads`` reads."""
+
+    since: datetime
+    reads: int = 0
+
+    def dead(self, now: datetime) -> bool:
+        """Return whether the value went unanswered for long enough to give up."""
+        return self.reads >= DEAD_VALUE_READS and now - self.since >= timedelta(
+            seconds=DEAD_VALUE_AFTER
+        )
+
+
+class DeadValues:
+    """The values and optional components a config entry's controller never answers.
+
+    A value the controller answers with its unavailable marker on every read
+    for long enough is dead, and the entity reading it is left out from the
+    next setup. Its register is still read with the rest of its block, and once
+    it holds a value its entity is added. An optional component the controller
+    refused is not polled, and the entities that only read it are left out,
+    until it is tried again after a while.
+
+    The values are known by the keys of the entities that read them, as an
+    accessor cannot be saved.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, model_id: int) -> None:
+        """Keep what the controller of ``entry``, a ``model_id``, answers."""
+        self._store = dead_values_store(hass, entry)
+        self._model_id = model_id
+        self._unanswered: dict[str, _Unanswered] = {}
+        self._refused: dict[str, datetime] = {}
+        # The keys that were dead when the entities were set up.
+        self._dead: frozenset[str] = frozenset()
+        self._watched: dict[str, tuple[ValueReference, frozenset[str]]] = {}
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self) -> None:
+        """Load what an earlier run learned about the same controller model.
+
+        A refusal older than the retry is forgotten, so the component is
+        polled again.
+        """
+        data = await self._store.async_load()
+        if data is None or data.get("model_id") != self._model_id:
+            return
+        now = dt_util.utcnow()
+        for key, value in data["values"].items():
+            if (since := dt_util.parse_datetime(value["since"])) is not None:
+                self._unanswered[key] = _Unanswered(since, value["reads"])
+        retried = now - timedelta(seconds=REFUSED_COMPONENT_RETRY)
+        self._refused = {
+            component: refused
+            for component, timestamp in data["components"].items()
+            if (refused := dt_util.parse_datetime(timestamp)) is not None
+            and refused > retried
+        }
+        self._dead = frozenset(
+            key for key, unanswered in self._unanswered.items() if unanswered.dead(now)
+        )
+
+    @property
+    def refused_components(self) -> frozenset[str]:
+        """Return the optional components not to poll."""
+        return frozenset(self._refused)
+
+    @property
+    def dead_keys(self) -> frozenset[str]:
+        """Return the keys of the entities left out for a value never answered."""
+        return self._dead
+
+    def answered(
+        self,
+        key: str,
+        components: frozenset[str] | None,
+        *,
+        writable: bool = False,
+    ) -> bool:
+        """Return whether the entity ``key``, reading ``components``, gets values.
+
+        A ``writable`` entity is not left out for a dead value, only for the
+        refused components it reads.
+        """
+        if key in self._dead and not writable:
+            return False
+        return not components or not components <= self._refused.keys()
+
+    def watch(
+        self, key: str, reference: ValueReference, components: frozenset[str] | None
+    ) -> None:
+        """Learn from the polls of ``components`` whether ``key`` is answered.
+
+        A value whose components are unknown cannot be told apart from one
+        that was not read, and is not learned about.
+        """
+        if components:
+            self._watched[key] = (reference, components)
+
+    def observe(
+        self, read: Iterable[str], value_of: Callable[[ValueReference], Any]
+    ) -> set[str]:
+        """Count the watched values the components just ``read`` held none of.
+
+        A value that answered is not watched again until the next setup.
+        Return the keys of those whose entities were left out, and are not
+        dead any longer.
+        """
+        read = set(read)
+        now = dt_util.utcnow()
+        changed = False
+        revived: set[str] = set()
+        for key, (reference, components) in list(self._watched.items()):
+            if not components <= read:
+                continue
+            if value_of(reference) is None:
+                self._unanswered.setdefault(key, _Unanswered(now)).reads += 1
+                changed = True
+                continue
+            del self._watched[key]
+            if self._unanswered.pop(key, None) is not None:
+                changed = True
+                if key in self._dead:
+                    revived.add(key)
+        if changed:
+            self._schedule_save()
+        self._dead -= revived
+        return revived
+
+    def refuse(self, component: str) -> None:
+        """Stop polling an optional component the controller refused, for a while."""
+        self._refused.setdefault(component, dt_util.utcnow())
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Save what was learned a while after the poll, or on shutdown."""
+        if self._data_func is not None:
+            return
+
+        def data() -> dict[str, Any]:
+            self._data_func = None
+            return {
+                "model_id": self._model_id,
+                "values": {
+                    key: {
+                        "since": unanswered.since.isoformat(),
+                        "reads": unanswered.reads,
+                    }
+                    for key, unanswered in self._unanswered.items()
+                },
+                "components": {
+                    component: refused.isoformat()
+                    for component, refused in self._refused.items()
+                },
+            }
+
+        self._data_func = data
+        self._store.async_delay_save(data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save what was learned right away, before the entry unloads."""
+        if self._data_func is not None:
+            await self._store.async_save(self._data_func())
+
+
+def dead_values_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store that holds what was learned about ``entry``."""
+    return Store(
+        hass, DEAD_VALUES_STORAGE_VERSION, f"{DOMAIN}.dead_values.{entry.entry_id}"
+    )
@@ -0,0 +1,40 @@
+"""Entity descriptions of each controller model, looked up once per setup."""
+
+from collections.abc import Mapping, Sequence
+
+from homeassistant.helpers.entity import EntityDescription
+from pystiebeleltron import ControllerModel
+
+# The controllers the WPM API serves. The WPM 3i has an API of its own, and
+# every model the LWZ API serves reports the LWZ registers.
+WPM_MODELS = (
+    ControllerModel.WPM_3,
+    ControllerModel.WPMsystem,
+    ControllerModel.LWZ_R290,
+)
+LWZ_MODELS = (
+    ControllerModel.LWZ,
+    ControllerModel.LWZ_x04_SOL,
+)
+SUPPORTED_MODELS = (ControllerModel.WPM_3i, *WPM_MODELS, *LWZ_MODELS)
+
+
+def descriptions_by_model[D: EntityDescription](
+    *,
+    wpm_3i: Sequence[D],
+    wpm: Sequence[D],
+    lwz: Sequence[D],
+    extra: Mapping[ControllerModel, Sequence[D]] | None = None,
+) -> dict[ControllerModel, tuple[D, ...]]:
+    """Return the descriptions of a platform by controller model.
+
+    Built once when the platform is imported, so a setup looks its model up
+    rather than putting the lists together again. ``extra`` adds descriptions
+    only some models of a family answer.
+    """
+    table = {ControllerModel.WPM_3i: tuple(wpm_3i)}
+    table.update(dict.fromkeys(WPM_MODELS, tuple(wpm)))
+    table.update(dict.fromkeys(LWZ_MODELS, tuple(lwz)))
+    for model, descriptions in (extra or {}).items():
+        table[model] = (*table[model], *descriptions)
+    return table
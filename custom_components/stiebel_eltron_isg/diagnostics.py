@@ -38,6 +38,9 @@ def _diagnostics_for_entry(
                 "model_id": coordinator.model.value,
             },
         ],
+        "values": coordinator.read_values,
+        "polling": coordinator.poll_state,
+        "instrumentation": coordinator.instrumentation.as_dict(),
     }
 
 
@@ -1,6 +1,5 @@
 """StiebelEltronISGEntity class."""
 
-from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -8,14 +7,13 @@ from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
-
-# At runtime this must remain ``object``: concrete entities place the mixin
-# before StiebelEltronISGEntity so ``super()`` reaches CoordinatorEntity.
-if TYPE_CHECKING:
-    _OptimisticValueMixinBase = CoordinatorEntity[AnyStiebelEltronDataCoordinator]
-else:
-    _OptimisticValueMixinBase = object
+from .const import ATTR_SNAPSHOT_READ_AT
+from .coordinator import (
+    EVERY_REFRESH,
+    AnyStiebelEltronDataCoordinator,
+    StiebelEltronConfigEntry,
+)
+from .references import ValueReference
 
 
 def build_unique_id(entry: StiebelEltronConfigEntry, key: str) -> str:
@@ -23,6 +21,11 @@ def build_unique_id(entry: StiebelEltronConfigEntry, key: str) -> str:
     return f"{entry.entry_id}_{key}"
 
 
+def duplicate_entity_issue_id(entry: StiebelEltronConfigEntry) -> str:
+    """Return the stable duplicate-entity Repair id for a config entry."""
+    return f"duplicate_entities_{entry.entry_id}"
+
+
 @dataclass(frozen=True, kw_only=True)
 class StiebelEltronEntityDescription(EntityDescription):
     """Entity description for stiebel eltron with modbus register."""
@@ -30,49 +33,20 @@ class StiebelEltronEntityDescription(EntityDescription):
     modbus_register: Any
 
 
-class OptimisticValueMixin(_OptimisticValueMixinBase):
-    """Report a written value right away, until the device reports its own.
-
-    A write travels ISG to CAN to heat pump and needs a moment to be reflected
-    in the registers, so an immediate read back would still return the old
-    value. The written value is therefore assumed until the coordinator has
-    polled again, at which point the device's own value takes over. If the
-    controller clamps or rounds the value, that correction appears with that
-    poll.
-
-    The mixin must precede ``CoordinatorEntity`` in the entity's MRO. It keeps
-    the assumption until a successful poll that started after the write, so a
-    poll already in flight cannot restore a value it read before the write.
-    """
-
-    _optimistic_value: float | int | None = None
-    _optimistic_after_generation: int | None = None
-
-    def _set_optimistic_value(self, value: float | int) -> None:
-        """Assume ``value`` until the device has been polled after the write."""
-        self._optimistic_value = value
-        self._optimistic_after_generation = self.coordinator.refresh_generation
-        self.async_write_ha_state()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Hand the value back to the device once it has been polled."""
-        if (
-            self._optimistic_after_generation is not None
-            and self.coordinator.last_update_success
-            and self.coordinator.last_successful_refresh_generation
-            > self._optimistic_after_generation
-        ):
-            self._optimistic_value = None
-            self._optimistic_after_generation = None
-        super()._handle_coordinator_update()
-
-
 class StiebelEltronISGEntity(CoordinatorEntity[AnyStiebelEltronDataCoordinator]):
     """stiebel_eltron_isg entity base class."""
 
     _attr_has_entity_name = True
-    modbus_register: Callable[[Any], float | int | None]
+    # An entity that reports on the coordinator itself rather than on values it
+    # reads is woken by every refresh instead of by changed values.
+    _wake_on_every_refresh = False
+    # Only marks a state restored after a restart, which the state history
+    # shows by itself.
+    _unrecorded_attributes = frozenset({ATTR_SNAPSHOT_READ_AT})
+    # The slots of ``value_references`` in the coordinator's value table. They
+    # are resolved once the entity is added and read by index from then on.
+    _value_slots: tuple[int, ...] | None = None
+    modbus_register: ValueReference
 
     def __init__(
         self,
@@ -83,24 +57,113 @@ class StiebelEltronISGEntity(CoordinatorEntity[AnyStiebelEltronDataCoordinator])
         super().__init__(coordinator)
         self.config_entry = config_entry
         self._attr_device_info = coordinator.device_info
+        # Derived from the config entry, never from a display name: a name is
+        # allowed to change, and when it did in 2026.7 it orphaned every entity.
+        self._attr_unique_id = build_unique_id(
+            config_entry, self.entity_description.key
+        )
 
     @property
-    def unique_id(self) -> str | None:
-        """Return the unique id of the entity.
+    def value_references(self) -> tuple[ValueReference, ...]:
+        """Return the accessors the state of this entity is read from.
 
-        Derived from the config entry, never from a display name: a name is
-        allowed to change, and when it did in 2026.7 it orphaned every entity.
+        The coordinator only wakes the entity when one of them changed.
         """
-        return build_unique_id(self.config_entry, self.entity_description.key)
+        return (self.modbus_register,)
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for changes of the values this entity is read from."""
+        self._value_slots = tuple(
+            self.coordinator.value_slot(reference)
+            for reference in self.value_references
+        )
+        self.coordinator_context = (
+            EVERY_REFRESH if self._wake_on_every_refresh else self.value_references
+        )
+        await super().async_added_to_hass()
+
+    def _read(self, index: int = 0) -> float | int | None:
+        """Return the value of the ``index``-th of ``value_references``."""
+        if self._value_slots is None:
+            return self.coordinator.get_value(self.value_references[index])
+        return self.coordinator.read_slot(self._value_slots[index])
+
+    def _expire_values(self) -> None:
+        """Report the values of the entity as changed by the next refresh."""
+        if self._value_slots is None:
+            self.coordinator.expire_references(self.value_references)
+        else:
+            self.coordinator.expire_slots(self._value_slots)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available.
 
         An entity is only available when the most recent coordinator update
-        succeeded; otherwise a lost connection would keep reporting the last
-        cached register value as if it were current.
+        succeeded and its own registers are not stale; otherwise a lost
+        connection would keep reporting the last cached register value as if
+        it were current. Values restored from the snapshot after a restart are
+        shown, and marked, until they are read again.
         """
-        return self.coordinator.last_update_success and self.coordinator.has_value(
-            self.modbus_register
+        return (
+            self.coordinator.is_available(self.value_references)
+            and self._read() is not None
         )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when a value restored from the snapshot was read."""
+        read_at = self.coordinator.restored_at(self.value_references)
+        if read_at is None:
+            return None
+        return {ATTR_SNAPSHOT_READ_AT: read_at.isoformat()}
+
+
+# At runtime this must remain ``object``: concrete entities place the mixin
+# before StiebelEltronISGEntity so ``super()`` reaches CoordinatorEntity.
+if TYPE_CHECKING:
+    _OptimisticValueMixinBase = StiebelEltronISGEntity
+else:
+    _OptimisticValueMixinBase = object
+
+
+class OptimisticValueMixin(_OptimisticValueMixinBase):
+    """Report a written value right away, until the device reports its own.
+
+    A write travels ISG to CAN to heat pump and needs a moment to be reflected
+    in the registers, so an immediate read back would still return the old
+    value. The written value is therefore assumed until the coordinator reads
+    the written component back once the write has settled, or polls it, at
+    which point the device's own value takes over. If the controller clamps or
+    rounds the value, that correction appears with that read.
+
+    The mixin must precede ``CoordinatorEntity`` in the entity's MRO. It keeps
+    the assumption until a poll that started after the write has read the
+    entity's registers, so neither a poll already in flight nor one whose read
+    of those registers failed can restore the value from before the write.
+    """
+
+    _optimistic_value: float | int | None = None
+    _optimistic_after_generation: int | None = None
+
+    def _set_optimistic_value(self, value: float | int) -> None:
+        """Assume ``value`` until the device has been polled after the write."""
+        self._optimistic_value = value
+        self._optimistic_after_generation = self.coordinator.refresh_generation
+        # The coordinator only wakes entities whose values changed, and the
+        # device may well report the value it had before the write.
+        self._expire_values()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Hand the value back to the device once it has been polled."""
+        if self._optimistic_after_generation is not None:
+            if self.coordinator.last_update_success and self.coordinator.read_since(
+                self.value_references, self._optimistic_after_generation
+            ):
+                self._optimistic_value = None
+                self._optimistic_after_generation = None
+            else:
+                self._expire_values()
+        super()._handle_coordinator_update()
@@ -0,0 +1,164 @@
+"""A high resolution history of the values the entities read, kept in memory."""
+
+from array import array
+from collections.abc import Iterable, Iterator
+import logging
+import math
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import HISTORY_MEMORY_BUDGET, HISTORY_SAMPLES
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# A sample the field had no value for.
+_MISSING = math.nan
+
+
+class _Ring:
+    """The last samples of one component: when it was read and each field's value.
+
+    The arrays are allocated in full when the ring or a field is added, and
+    the oldest sample is overwritten by the next one. The values are kept in
+    double precision: the energy counters add up several registers to more
+    than the 24 bits a single precision float holds exactly.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate the timestamps of ``capacity`` samples."""
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.fields: dict[str, array[float]] = {}
+        # The slot the next sample is written to, and how many are held.
+        self.head = 0
+        self.count = 0
+
+    def add_field(self, path: str) -> None:
+        """Keep the values of ``path``, missing for the samples before."""
+        self.fields[path] = array("d", [_MISSING]) * self.capacity
+
+    def append(self, timestamp: float, values: dict[str, float | int | None]) -> None:
+        """Add a sample, overwriting the oldest once the ring is full."""
+        index = self.head
+        self.times[index] = timestamp
+        for path, column in self.fields.items():
+            value = values.get(path)
+            column[index] = _MISSING if value is None else value
+        self.head = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def indexes(self) -> Iterator[int]:
+        """Yield the slots of the samples held, oldest first."""
+        first = self.head - self.count
+        for offset in range(first, self.head):
+            yield offset % self.capacity
+
+
+class History:
+    """The last samples of every field the entities read, within a memory budget.
+
+    Each component read adds a sample of all its fields with the time it was
+    read. A field is kept from the first poll after an entity reads it, for
+    as long as the budget allows; one beyond it is not kept.
+    """
+
+    def __init__(
+        self, samples: int = HISTORY_SAMPLES, budget: int = HISTORY_MEMORY_BUDGET
+    ) -> None:
+        """Keep ``samples`` per field in at most ``budget`` bytes."""
+        self._samples = samples
+        self._budget = budget
+        self._used = 0
+        self._rings: dict[str, _Ring] = {}
+        self._ring_of: dict[str, _Ring] = {}
+        self._over_budget = False
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory the samples take."""
+        return self._used
+
+    @property
+    def fields(self) -> list[str]:
+        """Return the fields whose history is kept."""
+        return sorted(self._ring_of)
+
+    def record(
+        self,
+        component: str,
+        timestamp: float,
+        values: Iterable[tuple[str, float | int | None]],
+    ) -> None:
+        """Add the ``values`` a component read at ``timestamp`` to its ring."""
+        sample = dict(values)
+        if not sample:
+            return
+        ring = self._rings.get(component)
+        if ring is None:
+            if not self._reserve(8 * self._samples):
+                return
+            ring = self._rings[component] = _Ring(self._samples)
+        for path in sample.keys() - ring.fields.keys():
+            if not self._reserve(8 * self._samples):
+                break
+            ring.add_field(path)
+            self._ring_of[path] = ring
+        ring.append(timestamp, sample)
+
+    def _reserve(self, size: int) -> bool:
+        """Take ``size`` bytes of the budget, or return False if it is spent."""
+        if self._used + size > self._budget:
+            if not self._over_budget:
+                _LOGGER.info("The history is full, further fields are not kept")
+                self._over_budget = True
+            return False
+        self._used += size
+        return True
+
+    def series(
+        self,
+        path: str,
+        start: float,
+        end: float,
+        buckets: int,
+        bit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the samples of ``path`` from ``start`` to ``end`` in buckets.
+
+        Each bucket that holds a sample has its start time and the minimum,
+        maximum and mean of its samples. With ``bit``, the series is that bit
+        of the field, whose mean is the share of the samples it was set in.
+        """
+        ring = self._ring_of.get(path)
+        if ring is None or end <= start:
+            return []
+        column = ring.fields[path]
+        width = (end - start) / buckets
+        lowest = [math.inf] * buckets
+        highest = [-math.inf] * buckets
+        total = [0.0] * buckets
+        counts = [0] * buckets
+        for index in ring.indexes():
+            timestamp = ring.times[index]
+            value = column[index]
+            if timestamp < start or timestamp > end or math.isnan(value):
+                continue
+            if bit is not None:
+                value = (int(value) >> bit) & 1
+            bucket = min(int((timestamp - start) / width), buckets - 1)
+            lowest[bucket] = min(lowest[bucket], value)
+            highest[bucket] = max(highest[bucket], value)
+            total[bucket] += value
+            counts[bucket] += 1
+        return [
+            {
+                "start": dt_util.utc_from_timestamp(start + bucket * width).isoformat(),
+                "min": lowest[bucket],
+                "max": highest[bucket],
+                "mean": total[bucket] / counts[bucket],
+                "samples": counts[bucket],
+            }
+            for bucket in range(buckets)
+            if counts[bucket]
+        ]
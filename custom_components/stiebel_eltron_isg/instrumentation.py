@@ -0,0 +1,251 @@
+"""Counters and timers for the coordinator's Modbus traffic and listener updates."""
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, cast
+
+from modbus_connection import ModbusUnit
+
+from .capture import Exchange, describe_error
+
+# Upper bounds in seconds of the duration buckets. The Modbus round trip to an
+# ISG takes tens of milliseconds, a full poll of a WPM up to a few seconds.
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Count observations into buckets and keep their sum, maximum and last."""
+
+    def __init__(self, bounds: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        """Start empty, with a bucket per upper bound and one beyond the last."""
+        self._bounds = bounds
+        self._buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum: float | None = None
+        self.last: float | None = None
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._buckets[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        self.last = value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the observations, or None without any."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for the diagnostics."""
+        labels = [f"le_{bound}" for bound in self._bounds] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": None if self.mean is None else round(self.mean, 6),
+            "max": self.maximum,
+            "last": self.last,
+            "buckets": dict(zip(labels, self._buckets, strict=True)),
+        }
+
+
+@dataclass
+class Traffic:
+    """Count the Modbus requests of a unit and the registers they carried.
+
+    ``read_seconds`` is the time the reads took, failed ones included. While
+    ``capture`` is set, it is handed every request as an exchange.
+    """
+
+    reads: int = 0
+    registers_read: int = 0
+    read_seconds: float = 0.0
+    writes: int = 0
+    registers_written: int = 0
+    errors: int = 0
+    capture: Callable[[Exchange], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def bytes_read(self) -> int:
+        """Return the register payload read, two bytes per register or bit."""
+        return 2 * self.registers_read
+
+    @property
+    def bytes_written(self) -> int:
+        """Return the register payload written, two bytes per register or bit."""
+        return 2 * self.registers_written
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters for the diagnostics."""
+        return {
+            "reads": self.reads,
+            "registers_read": self.registers_read,
+            "bytes_read": self.bytes_read,
+            "writes": self.writes,
+            "registers_written": self.registers_written,
+            "bytes_written": self.bytes_written,
+            "errors": self.errors,
+        }
+
+
+class _CountingUnit:
+    """Pass requests on to a unit and count them into a ``Traffic``.
+
+    Only the register and coil requests the API components make are counted;
+    everything else is handed to the unit as is.
+    """
+
+    def __init__(self, unit: ModbusUnit, traffic: Traffic) -> None:
+        self._unit = unit
+        self._traffic = traffic
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._unit, name)
+
+    async def _read[R](self, read: Callable[..., Any], address: int, count: int) -> R:
+        started = monotonic()
+        try:
+            result: R = await read(address, count)
+        except Exception as err:
+            self._traffic.read_seconds += monotonic() - started
+            self._traffic.errors += 1
+            self._capture_failure(started, read, address, count, err)
+            raise
+        duration = monotonic() - started
+        self._traffic.read_seconds += duration
+        self._traffic.reads += 1
+        self._traffic.registers_read += count
+        if (capture := self._traffic.capture) is not None:
+            capture(
+                Exchange(
+                    started,
+                    duration,
+                    read.__name__,
+                    address,
+                    count,
+                    list(cast(list[Any], result)),
+                )
+            )
+        return result
+
+    async def _write(
+        self, write: Callable[..., Any], address: int, values: Any
+    ) -> None:
+        started = monotonic()
+        try:
+            await write(address, values)
+        except Exception as err:
+            self._traffic.errors += 1
+            self._capture_failure(started, write, address, values, err)
+            raise
+        if (capture := self._traffic.capture) is not None:
+            capture(
+                Exchange(
+                    started, monotonic() - started, write.__name__, address, values
+                )
+            )
+        self._traffic.writes += 1
+        self._traffic.registers_written += (
+            len(values) if isinstance(values, list) else 1
+        )
+
+    def _capture_failure(
+        self,
+        started: float,
+        request: Callable[..., Any],
+        address: int,
+        argument: Any,
+        err: Exception,
+    ) -> None:
+        if (capture := self._traffic.capture) is not None:
+            capture(
+                Exchange(
+                    started,
+                    monotonic() - started,
+                    request.__name__,
+                    address,
+                    argument,
+                    **describe_error(err),
+                )
+            )
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        return await self._read(self._unit.read_holding_registers, address, count)
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        return await self._read(self._unit.read_input_registers, address, count)
+
+    async def read_coils(self, address: int, count: int) -> list[bool]:
+        return await self._read(self._unit.read_coils, address, count)
+
+    async def read_discrete_inputs(self, address: int, count: int) -> list[bool]:
+        return await self._read(self._unit.read_discrete_inputs, address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        await self._write(self._unit.write_register, address, value)
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        await self._write(self._unit.write_registers, address, values)
+
+    async def write_coil(self, address: int, value: bool) -> None:
+        await self._write(self._unit.write_coil, address, value)
+
+    async def write_coils(self, address: int, values: list[bool]) -> None:
+        await self._write(self._unit.write_coils, address, values)
+
+
+def count_traffic(unit: ModbusUnit, traffic: Traffic) -> ModbusUnit:
+    """Return ``unit`` with its register and coil requests counted in ``traffic``."""
+    # The wrapper hands every other request of the protocol on via __getattr__,
+    # which a static protocol check cannot see.
+    return cast(ModbusUnit, _CountingUnit(unit, traffic))
+
+
+class Instrumentation:
+    """Measure what a coordinator spends on polling, writing and notifying."""
+
+    def __init__(self, traffic: Traffic) -> None:
+        """Start empty, counting the Modbus requests into ``traffic``."""
+        self.traffic = traffic
+        self.refresh_duration = Histogram()
+        self.component_read_duration: dict[str, Histogram] = {}
+        self.write_duration = Histogram()
+        self.accessor_errors = 0
+        self.refreshes = 0
+        self.entities_notified = 0
+        self.entities_notified_total = 0
+
+    def observe_component_read(self, component: str, seconds: float) -> None:
+        """Record how long one component read took."""
+        self.component_read_duration.setdefault(component, Histogram()).observe(seconds)
+
+    def observe_notified(self, entities: int) -> None:
+        """Record how many listeners one refresh woke."""
+        self.refreshes += 1
+        self.entities_notified = entities
+        self.entities_notified_total += entities
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every counter and timer for the diagnostics."""
+        return {
+            "refresh_duration": self.refresh_duration.as_dict(),
+            "component_read_duration": {
+                component: histogram.as_dict()
+                for component, histogram in sorted(self.component_read_duration.items())
+            },
+            "write_duration": self.write_duration.as_dict(),
+            "traffic": self.traffic.as_dict(),
+            "accessor_errors": self.accessor_errors,
+            "entities_notified": self.entities_notified,
+            "entities_notified_mean": (
+                self.entities_notified_total / self.refreshes
+                if self.refreshes
+                else None
+            ),
+        }
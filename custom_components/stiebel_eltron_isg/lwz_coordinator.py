@@ -7,25 +7,44 @@ https://github.com/pail23/stiebel_eltron_isg
 import logging
 
 from homeassistant.core import HomeAssistant
-from modbus_connection import ModbusConnection
+from modbus_connection import ModbusConnection, ModbusUnit
 from pystiebeleltron import ControllerModel
 from pystiebeleltron.lwz import LwzStiebelEltronAPI
 
-from .const import UNIT_ID
+from .const import (
+    COMPRESSOR_ON,
+    COMPRESSOR_SPEED,
+    IS_COOLING,
+    IS_HEATING,
+    IS_HEATING_WATER,
+)
 from .coordinator import (
     StiebelEltronConfigEntry,
     StiebelEltronConnectionParams,
     StiebelEltronDataCoordinator,
 )
+from .references import ApiField, RegisterBit, operating_status
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+# The compressor speed, which is non-zero while it runs.
+_compressor_speed = ApiField("system_values.compressor_speed")
+
+
 class StiebelEltronModbusLWZDataCoordinator(
     StiebelEltronDataCoordinator[LwzStiebelEltronAPI]
 ):
     """Thread safe wrapper class for pymodbus. Communicates with LWZ or LWA controller models."""
 
+    activity_signals = (
+        (COMPRESSOR_ON, RegisterBit(operating_status, 1)),
+        (IS_HEATING, RegisterBit(operating_status, 2)),
+        (IS_COOLING, RegisterBit(operating_status, 3)),
+        (IS_HEATING_WATER, RegisterBit(operating_status, 4)),
+        (COMPRESSOR_SPEED, _compressor_speed),
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -35,17 +54,14 @@ class StiebelEltronModbusLWZDataCoordinator(
         host: str,
     ) -> None:
         """Initialize the Modbus hub."""
-
-        super().__init__(
-            hass,
-            entry,
-            LwzStiebelEltronAPI(connection.for_unit(UNIT_ID)),
-            StiebelEltronConnectionParams(
-                host=host,
-                model=model,
-                connection=connection,
-            ),
+        params = StiebelEltronConnectionParams(
+            host=host, model=model, connection=connection
         )
+        super().__init__(hass, entry, LwzStiebelEltronAPI(params.api_unit()), params)
+
+    def _snapshot_api(self, unit: ModbusUnit) -> LwzStiebelEltronAPI:
+        """Return an API client on ``unit``, to restore the snapshot with."""
+        return LwzStiebelEltronAPI(unit)
 
     async def async_reset_heatpump(self) -> None:
         """Reset the heat pump."""
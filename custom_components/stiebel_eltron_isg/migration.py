@@ -23,24 +23,12 @@ from homeassistant.helpers import (
 )
 from pystiebeleltron import ControllerModel
 
-from .const import CIRCULATION_PUMP, DOMAIN, HEATER_PRESSURE
+from .const import CIRCULATION_PUMP, DOMAIN, RENAMED_KEYS
 from .coordinator import StiebelEltronConfigEntry, coordinator_display_name
-from .entity import build_unique_id
+from .entity import build_unique_id, duplicate_entity_issue_id
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
-# 2026.7 renamed exactly one entity key, verified by diffing the key constants
-# of 2026.2 against the current ones. An id from an earlier release carries the
-# old key, so it has to be translated before the new id is built, otherwise the
-# entity would be migrated to an id that no entity description produces and stay
-# orphaned for the second time.
-_RENAMED_KEYS = {"heating_pressure": HEATER_PRESSURE}
-
-
-def duplicate_entity_issue_id(entry: StiebelEltronConfigEntry) -> str:
-    """Return the stable duplicate-entity Repair id for a config entry."""
-    return f"duplicate_entities_{entry.entry_id}"
-
 
 @callback
 def async_remove_legacy_circulation_pump_switch(
@@ -119,7 +107,7 @@ def _match_prefix(unique_id: str, prefixes: list[str]) -> tuple[int, str] | None
         return None
     priority, prefix = max(matching, key=lambda match: len(match[1]))
     key = unique_id.removeprefix(prefix)
-    return priority, _RENAMED_KEYS.get(key, key)
+    return priority, RENAMED_KEYS.get(key, key)
 
 
 def _plan_migration(
@@ -138,7 +126,7 @@ def _plan_migration(
 
     # The target scheme is a source as well. An entity that an earlier run has
     # migrated still has to follow a key that is renamed after that, otherwise
-    # the rename orphans it and the entry in _RENAMED_KEYS would do nothing. It
+    # the rename orphans it and the entry in RENAMED_KEYS would do nothing. It
     # comes first because it is the entity that is actually provided, so it
     # outranks a legacy leftover of the same slot.
     sources = [target_prefix, *prefixes]
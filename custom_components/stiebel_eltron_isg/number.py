@@ -9,7 +9,6 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.const import EntityCategory, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pystiebeleltron import ControllerModel
 
 from .const import (
     AREA_COOLING_FLOW_TEMPERATURE_HYSTERESIS,
@@ -43,7 +42,9 @@ from .const import (
     HEATING_CURVE_RISE_HK3,
 )
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .descriptions import descriptions_by_model
 from .entity import OptimisticValueMixin, StiebelEltronISGEntity
+from .references import ApiField
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,11 +61,11 @@ class StiebelEltronNumberEntityDescription(NumberEntityDescription):
     write_field: str | None = None
 
     def __post_init__(self) -> None:
-        """Ensure value references are lambda-based."""
+        """Ensure the value reference is an API field or an accessor."""
         if callable(self.modbus_register):
             return
 
-        raise TypeError("modbus_register must be a lambda expression")
+        raise TypeError("modbus_register must be a lambda expression or an ApiField")
 
 
 NUMBER_TYPES_WPM_3I = [
@@ -75,7 +76,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.comfort_temperature_hk_1,
+        modbus_register=ApiField("system_parameters.comfort_temperature_hk_1"),
         write_field="comfort_temperature_hk_1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -85,7 +86,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.eco_temperature_hk_1,
+        modbus_register=ApiField("system_parameters.eco_temperature_hk_1"),
         write_field="eco_temperature_hk_1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -95,7 +96,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.comfort_temperature_hk_2,
+        modbus_register=ApiField("system_parameters.comfort_temperature_hk_2"),
         write_field="comfort_temperature_hk_2",
     ),
     StiebelEltronNumberEntityDescription(
@@ -105,7 +106,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.eco_temperature_hk_2,
+        modbus_register=ApiField("system_parameters.eco_temperature_hk_2"),
         write_field="eco_temperature_hk_2",
     ),
     StiebelEltronNumberEntityDescription(
@@ -115,7 +116,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=-20,
         native_max_value=40,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.dual_mode_temp_hzg,
+        modbus_register=ApiField("system_parameters.dual_mode_temp_hzg"),
         write_field="dual_mode_temp_hzg",
     ),
     StiebelEltronNumberEntityDescription(
@@ -125,7 +126,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=10,
         native_max_value=60,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.comfort_temperature_dhw,
+        modbus_register=ApiField("system_parameters.comfort_temperature_dhw"),
         write_field="comfort_temperature_dhw",
     ),
     StiebelEltronNumberEntityDescription(
@@ -135,7 +136,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=10,
         native_max_value=60,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.eco_temperature_dhw,
+        modbus_register=ApiField("system_parameters.eco_temperature_dhw"),
         write_field="eco_temperature_dhw",
     ),
     StiebelEltronNumberEntityDescription(
@@ -145,7 +146,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=-20,
         native_max_value=40,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.dual_mode_temp_ww,
+        modbus_register=ApiField("system_parameters.dual_mode_temp_ww"),
         write_field="dual_mode_temp_ww",
     ),
     StiebelEltronNumberEntityDescription(
@@ -155,7 +156,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=20,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.set_room_temperature_area,
+        modbus_register=ApiField("system_parameters.set_room_temperature_area"),
         write_field="set_room_temperature_area",
     ),
     StiebelEltronNumberEntityDescription(
@@ -165,7 +166,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=7,
         native_max_value=25,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.set_flow_temperature_area,
+        modbus_register=ApiField("system_parameters.set_flow_temperature_area"),
         write_field="set_flow_temperature_area",
     ),
     StiebelEltronNumberEntityDescription(
@@ -175,7 +176,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=1,
         native_max_value=5,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.flow_temp_hysteresis_area,
+        modbus_register=ApiField("system_parameters.flow_temp_hysteresis_area"),
         write_field="flow_temp_hysteresis_area",
     ),
     StiebelEltronNumberEntityDescription(
@@ -185,7 +186,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=20,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.set_room_temperature_fan,
+        modbus_register=ApiField("system_parameters.set_room_temperature_fan"),
         write_field="set_room_temperature_fan",
     ),
     StiebelEltronNumberEntityDescription(
@@ -195,7 +196,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=7,
         native_max_value=25,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.set_flow_temperature_fan,
+        modbus_register=ApiField("system_parameters.set_flow_temperature_fan"),
         write_field="set_flow_temperature_fan",
     ),
     StiebelEltronNumberEntityDescription(
@@ -205,7 +206,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=1,
         native_max_value=5,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.flow_temp_hysteresis_fan,
+        modbus_register=ApiField("system_parameters.flow_temp_hysteresis_fan"),
         write_field="flow_temp_hysteresis_fan",
     ),
     StiebelEltronNumberEntityDescription(
@@ -214,7 +215,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=0,
         native_max_value=3,
         native_step=0.01,
-        modbus_register=lambda api: api.system_parameters.heating_curve_rise_hk_1,
+        modbus_register=ApiField("system_parameters.heating_curve_rise_hk_1"),
         write_field="heating_curve_rise_hk_1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -223,7 +224,7 @@ NUMBER_TYPES_WPM_3I = [
         native_min_value=0,
         native_max_value=3,
         native_step=0.01,
-        modbus_register=lambda api: api.system_parameters.heating_curve_rise_hk_2,
+        modbus_register=ApiField("system_parameters.heating_curve_rise_hk_2"),
         write_field="heating_curve_rise_hk_2",
     ),
 ]
@@ -237,7 +238,7 @@ NUMBER_TYPES_WPM = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.comfort_temperature_hk_3,
+        modbus_register=ApiField("system_parameters.comfort_temperature_hk_3"),
         write_field="comfort_temperature_hk_3",
     ),
     StiebelEltronNumberEntityDescription(
@@ -247,7 +248,7 @@ NUMBER_TYPES_WPM = [
         native_min_value=5,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.eco_temperature_hk_3,
+        modbus_register=ApiField("system_parameters.eco_temperature_hk_3"),
         write_field="eco_temperature_hk_3",
     ),
     StiebelEltronNumberEntityDescription(
@@ -256,7 +257,7 @@ NUMBER_TYPES_WPM = [
         native_min_value=0,
         native_max_value=3,
         native_step=0.01,
-        modbus_register=lambda api: api.system_parameters.heating_curve_rise_hk_3,
+        modbus_register=ApiField("system_parameters.heating_curve_rise_hk_3"),
         write_field="heating_curve_rise_hk_3",
     ),
 ]
@@ -269,7 +270,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.room_temperature_day_hk1,
+        modbus_register=ApiField("system_parameters.room_temperature_day_hk1"),
         write_field="room_temperature_day_hk1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -279,7 +280,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.room_temperature_night_hk1,
+        modbus_register=ApiField("system_parameters.room_temperature_night_hk1"),
         write_field="room_temperature_night_hk1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -289,7 +290,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.room_temperature_day_hk2,
+        modbus_register=ApiField("system_parameters.room_temperature_day_hk2"),
         write_field="room_temperature_day_hk2",
     ),
     StiebelEltronNumberEntityDescription(
@@ -299,7 +300,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.room_temperature_night_hk2,
+        modbus_register=ApiField("system_parameters.room_temperature_night_hk2"),
         write_field="room_temperature_night_hk2",
     ),
     StiebelEltronNumberEntityDescription(
@@ -309,7 +310,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=55,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.dhw_set_day,
+        modbus_register=ApiField("system_parameters.dhw_set_day"),
         write_field="dhw_set_day",
     ),
     StiebelEltronNumberEntityDescription(
@@ -319,7 +320,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=55,
         native_step=0.1,
-        modbus_register=lambda api: api.system_parameters.dhw_set_night,
+        modbus_register=ApiField("system_parameters.dhw_set_night"),
         write_field="dhw_set_night",
     ),
     StiebelEltronNumberEntityDescription(
@@ -328,7 +329,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=3,
         native_step=1,
-        modbus_register=lambda api: api.system_parameters.day_stage,
+        modbus_register=ApiField("system_parameters.day_stage"),
         write_field="day_stage",
     ),
     StiebelEltronNumberEntityDescription(
@@ -337,7 +338,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=3,
         native_step=1,
-        modbus_register=lambda api: api.system_parameters.night_stage,
+        modbus_register=ApiField("system_parameters.night_stage"),
         write_field="night_stage",
     ),
     StiebelEltronNumberEntityDescription(
@@ -346,7 +347,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=3,
         native_step=1,
-        modbus_register=lambda api: api.system_parameters.party_stage,
+        modbus_register=ApiField("system_parameters.party_stage"),
         write_field="party_stage",
     ),
     StiebelEltronNumberEntityDescription(
@@ -355,7 +356,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=3,
         native_step=1,
-        modbus_register=lambda api: api.system_parameters.manual_stage,
+        modbus_register=ApiField("system_parameters.manual_stage"),
         write_field="manual_stage",
     ),
     StiebelEltronNumberEntityDescription(
@@ -365,9 +366,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: (
-            api.system_parameters.room_temperature_day_hk1_cooling
-        ),
+        modbus_register=ApiField("system_parameters.room_temperature_day_hk1_cooling"),
         write_field="room_temperature_day_hk1_cooling",
     ),
     StiebelEltronNumberEntityDescription(
@@ -377,8 +376,8 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: (
-            api.system_parameters.room_temperature_night_hk1_cooling
+        modbus_register=ApiField(
+            "system_parameters.room_temperature_night_hk1_cooling"
         ),
         write_field="room_temperature_night_hk1_cooling",
     ),
@@ -389,9 +388,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: (
-            api.system_parameters.room_temperature_day_hk2_cooling
-        ),
+        modbus_register=ApiField("system_parameters.room_temperature_day_hk2_cooling"),
         write_field="room_temperature_day_hk2_cooling",
     ),
     StiebelEltronNumberEntityDescription(
@@ -401,8 +398,8 @@ NUMBER_TYPES_LWZ = [
         native_min_value=10,
         native_max_value=30,
         native_step=0.1,
-        modbus_register=lambda api: (
-            api.system_parameters.room_temperature_night_hk2_cooling
+        modbus_register=ApiField(
+            "system_parameters.room_temperature_night_hk2_cooling"
         ),
         write_field="room_temperature_night_hk2_cooling",
     ),
@@ -412,7 +409,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=5,
         native_step=0.01,
-        modbus_register=lambda api: api.system_parameters.gradient_hk1,
+        modbus_register=ApiField("system_parameters.gradient_hk1"),
         write_field="gradient_hk1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -421,7 +418,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=5,
         native_step=0.01,
-        modbus_register=lambda api: api.system_parameters.gradient_hk2,
+        modbus_register=ApiField("system_parameters.gradient_hk2"),
         write_field="gradient_hk2",
     ),
     StiebelEltronNumberEntityDescription(
@@ -431,7 +428,7 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=20,
         native_step=0.5,
-        modbus_register=lambda api: api.system_parameters.low_end_hk1,
+        modbus_register=ApiField("system_parameters.low_end_hk1"),
         write_field="low_end_hk1",
     ),
     StiebelEltronNumberEntityDescription(
@@ -441,12 +438,17 @@ NUMBER_TYPES_LWZ = [
         native_min_value=0,
         native_max_value=20,
         native_step=0.5,
-        modbus_register=lambda api: api.system_parameters.low_end_hk2,
+        modbus_register=ApiField("system_parameters.low_end_hk2"),
         write_field="low_end_hk2",
     ),
 ]
 
 
+NUMBER_TYPES_BY_MODEL = descriptions_by_model(
+    wpm_3i=NUMBER_TYPES_WPM_3I, wpm=NUMBER_TYPES_WPM, lwz=NUMBER_TYPES_LWZ
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,  # Unused function argument: `hass`
     entry: StiebelEltronConfigEntry,
@@ -455,39 +457,13 @@ async def async_setup_entry(
     """Set up the select platform."""
     coordinator = entry.runtime_data
 
-    entities = []
-    if coordinator.model == ControllerModel.WPM_3i:
-        entities = [
-            StiebelEltronISGNumberEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in NUMBER_TYPES_WPM_3I
-        ]
-    elif coordinator.model in (
-        ControllerModel.WPM_3,
-        ControllerModel.WPMsystem,
-        ControllerModel.LWZ_R290,
-    ):
-        entities = [
-            StiebelEltronISGNumberEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in NUMBER_TYPES_WPM
-        ]
-    else:
-        entities = [
-            StiebelEltronISGNumberEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in NUMBER_TYPES_LWZ
-        ]
-    async_add_devices(entities)
+    coordinator.async_add_answered_entities(
+        async_add_devices,
+        NUMBER_TYPES_BY_MODEL[coordinator.model],
+        lambda description: StiebelEltronISGNumberEntity(
+            coordinator, entry, description
+        ),
+    )
 
 
 class StiebelEltronISGNumberEntity(
@@ -526,7 +502,7 @@ class StiebelEltronISGNumberEntity(
         current = (
             self._optimistic_value
             if self._optimistic_value is not None
-            else self.coordinator.get_value(self.modbus_register)
+            else self._read()
         )
         if current is not None and math.isclose(current, value, abs_tol=1e-9):
             return
@@ -543,4 +519,4 @@ class StiebelEltronISGNumberEntity(
         """Return the state of the sensor."""
         if self._optimistic_value is not None:
             return self._optimistic_value
-        return self.coordinator.get_value(self.modbus_register)
+        return self._read()
@@ -0,0 +1,268 @@
+"""Per-component polling schedule for the Stiebel Eltron ISG coordinator."""
+
+from collections.abc import Collection, Iterable, Mapping
+from typing import Self
+
+from .const import DEFAULT_POLLING_PROFILE, POLLING_PROFILES
+from .references import ApiField, RegisterBit, ValueReference
+
+# Components that not every controller or firmware serves. The controller
+# refuses them with illegal data address, and a refused one is dropped from the
+# schedule instead of failing the poll, the same split pystiebeleltron makes.
+OPTIONAL_COMPONENTS = frozenset({
+    "extended_system_parameters",
+    "extended_energy_data",
+    "extended_energy_management_settings",
+    "extended_energy_system_information",
+})
+
+# Every API component the coordinator can poll.
+POLLED_COMPONENTS = frozenset(POLLING_PROFILES[DEFAULT_POLLING_PROFILE])
+
+
+class _FieldProbe:
+    """Stand in for every field, item and nested value an accessor reaches."""
+
+    def __getattr__(self, name: str) -> Self:
+        """Return a probe for a field or a property of a component."""
+        return self
+
+    def __getitem__(self, key: object) -> Self:
+        """Return a probe for an item of a repeated field."""
+        return self
+
+
+class _ApiProbe:
+    """Stand in for the API and record the components an accessor reads."""
+
+    def __init__(self) -> None:
+        """Start without any component read."""
+        self.components: set[str] = set()
+
+    def __getattr__(self, name: str) -> _FieldProbe:
+        """Record the component ``name`` and return a probe for its fields."""
+        self.components.add(name)
+        return _FieldProbe()
+
+
+def components_read_by(reference: ValueReference) -> frozenset[str] | None:
+    """Return the API components an accessor reads, or None if that is unknown.
+
+    An ``ApiField`` names its component. Any other accessor runs once against
+    a stand-in for the API that records the components it reaches into. An
+    accessor that calls an API method, computes with a value or reaches
+    anything but a component cannot be resolved that way, and has to be served
+    by reading every component.
+    """
+    if isinstance(reference, RegisterBit):
+        reference = reference.register
+    if isinstance(reference, ApiField):
+        if reference.component not in POLLED_COMPONENTS:
+            return None
+        return frozenset({reference.component})
+    probe = _ApiProbe()
+    try:
+        reference(probe)
+    except TypeError:
+        # A call, a calculation or a comparison the probe does not support.
+        return None
+    if not probe.components <= POLLED_COMPONENTS:
+        return None
+    return frozenset(probe.components)
+
+
+def component_poll_intervals(base: float, profile: str) -> dict[str, float]:
+    """Return the poll interval of every component for a polling profile.
+
+    The profile sets each interval as a multiple of the base interval. An
+    unknown profile, say from a newer release, falls back to the default one.
+    """
+    multiples = POLLING_PROFILES.get(profile, POLLING_PROFILES[DEFAULT_POLLING_PROFILE])
+    return {component: base * multiple for component, multiple in multiples.items()}
+
+
+class PollSchedule:
+    """Decide which API components a coordinator tick has to read.
+
+    Every component has its own interval. The coordinator ticks at the
+    shortest one and reads only the components whose interval has run out, so
+    the temperatures stay fresh while the counters and setpoints, which change
+    far less often, are not re-read on every tick.
+
+    A component that was written is marked due right away, so a setpoint read
+    only every quarter of an hour still reflects a change on the next tick.
+    """
+
+    def __init__(self, intervals: Mapping[str, float]) -> None:
+        """Schedule every component in ``intervals`` (seconds) for the first tick."""
+        self._base_intervals = dict(intervals)
+        self._intervals = dict(intervals)
+        self._polled_at: dict[str, float | None] = dict.fromkeys(self._intervals)
+
+    @property
+    def components(self) -> tuple[str, ...]:
+        """Return the names of the scheduled components."""
+        return tuple(self._intervals)
+
+    @property
+    def tick_interval(self) -> float | None:
+        """Return the shortest interval, or None without any component."""
+        return min(self._intervals.values(), default=None)
+
+    @property
+    def base_tick_interval(self) -> float | None:
+        """Return the shortest configured interval, whatever it was set to."""
+        return min(self._base_intervals.values(), default=None)
+
+    def interval(self, component: str) -> float:
+        """Return the poll interval of a component in seconds."""
+        return self._intervals[component]
+
+    def reconfigure(self, intervals: Mapping[str, float]) -> None:
+        """Replace the intervals of the scheduled components.
+
+        Components that are not scheduled, because the API lacks them or the
+        controller refused them, stay unscheduled. The new intervals count from
+        the last read like any other.
+        """
+        self._base_intervals = {
+            component: intervals[component]
+            for component in self._base_intervals
+            if component in intervals
+        }
+        self._intervals = dict(self._base_intervals)
+        self._polled_at = {
+            component: self._polled_at[component] for component in self._intervals
+        }
+
+    def set_tick_interval(self, seconds: float) -> None:
+        """Poll the fastest components every ``seconds`` from now on.
+
+        The slower components keep their own interval unless it is shorter
+        than the new tick, as they cannot be read more often than the
+        coordinator ticks. The new intervals count from the last read, so a
+        shortened one takes effect on the next tick already.
+        """
+        fastest = self.base_tick_interval
+        self._intervals = {
+            component: seconds if interval == fastest else max(interval, seconds)
+            for component, interval in self._base_intervals.items()
+        }
+
+    def due(self, now: float, wanted: Collection[str] | None = None) -> list[str]:
+        """Return the components to read on a tick at ``now``.
+
+        A component that falls due within half a tick is read now as well.
+        Ticks do not land exactly on the interval, and waiting for the next one
+        would nearly double that component's effective interval.
+
+        A refresh requested between two ticks finds nothing due. It reads the
+        components of the shortest interval then, as a refresh that reads
+        nothing would pass the cached values off as fresh.
+
+        With ``wanted``, only those components are considered, and a component
+        nobody reads is not read at all, not even on a requested refresh.
+        """
+        tick_interval = self.tick_interval
+        if tick_interval is None:
+            return []
+        intervals = {
+            component: interval
+            for component, interval in self._intervals.items()
+            if wanted is None or component in wanted
+        }
+        due = [
+            component
+            for component, interval in intervals.items()
+            if (polled_at := self._polled_at[component]) is None
+            or polled_at + interval <= now + tick_interval / 2
+        ]
+        return due or [
+            component
+            for component, interval in intervals.items()
+            if interval == tick_interval
+        ]
+
+    def is_complete(self, components: Iterable[str]) -> bool:
+        """Return whether ``components`` covers every scheduled component."""
+        return set(components) >= self._intervals.keys()
+
+    def mark_polled(self, components: Iterable[str], now: float) -> None:
+        """Restart the interval of each component read at ``now``."""
+        for component in components:
+            if component in self._polled_at:
+                self._polled_at[component] = now
+
+    def age(self, component: str, now: float) -> float | None:
+        """Return the seconds since ``component`` was read, or None if never."""
+        polled_at = self._polled_at.get(component)
+        return None if polled_at is None else now - polled_at
+
+    def stale(self, now: float, intervals: float) -> set[str]:
+        """Return the components not read for more than ``intervals`` intervals.
+
+        A component that was never read is stale as well.
+        """
+        return {
+            component
+            for component, polled_at in self._polled_at.items()
+            if polled_at is None
+            or now - polled_at > self._intervals[component] * intervals
+        }
+
+    def mark_due(self, component: str) -> None:
+        """Read ``component`` on the next tick, whatever its interval."""
+        if component in self._polled_at:
+            self._polled_at[component] = None
+
+    def drop(self, component: str) -> None:
+        """Stop polling a component the controller does not serve."""
+        self._base_intervals.pop(component, None)
+        self._intervals.pop(component, None)
+        self._polled_at.pop(component, None)
+
+
+class AdaptiveInterval:
+    """Follow the heat pump's activity with the tick of the fastest components.
+
+    While the compressor runs, the heat pump heats, charges the hot water or
+    defrosts, the temperatures move quickly and the tick drops to the floor.
+    Once it is idle the tick returns to the configured interval and doubles
+    with every idle tick up to the ceiling, so a heat pump that is off in
+    summer is only read every so often. Any activity brings the floor back on
+    the next tick.
+
+    Unless ``adaptive``, the tick stays at the configured interval.
+    """
+
+    def __init__(
+        self, base: float, floor: float, ceiling: float, *, adaptive: bool = True
+    ) -> None:
+        """Start at ``base`` seconds, bounded by ``floor`` and ``ceiling``."""
+        self.adaptive = adaptive
+        self.floor = min(floor, base) if adaptive else base
+        self.ceiling = max(ceiling, base) if adaptive else base
+        self._base = base
+        self.interval = base
+        self.reason = "no activity data yet" if adaptive else "fixed"
+
+    def update(self, active: Iterable[str] | None) -> float:
+        """Adapt the interval to the active signals and return it.
+
+        ``active`` names the activity signals that are set, and is None when
+        the controller did not report any of them.
+        """
+        if not self.adaptive:
+            return self.interval
+        if active is None:
+            self.interval = self._base
+            self.reason = "no activity data"
+            return self.interval
+        signals = sorted(active)
+        if signals:
+            self.interval = self.floor
+            self.reason = f"active: {', '.join(signals)}"
+            return self.interval
+        self.interval = min(self.ceiling, max(self._base, self.interval * 2))
+        self.reason = "idle" if self.interval < self.ceiling else "idle, at ceiling"
+        return self.interval
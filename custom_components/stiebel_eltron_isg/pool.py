@@ -0,0 +1,273 @@
+"""Connections shared by the config entries that poll the same ISG."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+import heapq
+from itertools import count
+from typing import Any, cast
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+from modbus_connection import ModbusConnection, ModbusUnit
+
+from .const import DOMAIN, MAX_REQUESTS_PER_HOST
+
+type Address = tuple[str, int]
+
+
+class Priority(IntEnum):
+    """The order waiting requests are sent in, lowest first."""
+
+    INTERACTIVE = 0
+    POLLING = 1
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    f"{DOMAIN}_request_priority", default=Priority.POLLING
+)
+
+
+def request_priority() -> Priority:
+    """Return the priority the requests made here are sent with."""
+    return _priority.get()
+
+
+@contextmanager
+def interactive() -> Iterator[None]:
+    """Send the requests made within ahead of the polling of the same host.
+
+    The priority is inherited by the tasks started within, such as the one a
+    write queue sends its writes from.
+    """
+    token = _priority.set(Priority.INTERACTIVE)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """Let a limited number of requests to one host run at a time.
+
+    Waiting requests go by priority, and in the order they came within one,
+    so a write waits for the request under way but not for the rest of a
+    poll. The poll goes on with its next block once the write is done.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Let ``limit`` requests run at once."""
+        self._free = limit
+        self._waiting: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        self._arrivals = count()
+
+    async def __aenter__(self) -> None:
+        """Wait for the turn of a request and hold it while the request runs."""
+        await self._acquire()
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Hand the turn to the next request waiting."""
+        self._release()
+
+    async def _acquire(self) -> None:
+        if self._free and not self._waiting:
+            self._free -= 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiting, (request_priority(), next(self._arrivals), waiter)
+        )
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # A turn handed over just before the cancellation goes to the next.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiting:
+            _, _, waiter = heapq.heappop(self._waiting)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+
+class _LimitedUnit:
+    """Pass requests on to a unit once the host has room for them.
+
+    Only the register and coil requests the API components make wait for the
+    host; everything else is handed to the unit as is.
+    """
+
+    def __init__(self, unit: ModbusUnit, requests: RequestScheduler) -> None:
+        self._unit = unit
+        self._requests = requests
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._unit, name)
+
+    async def _limited[R](self, request: Callable[..., Awaitable[R]], *args: Any) -> R:
+        async with self._requests:
+            return await request(*args)
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        return await self._limited(self._unit.read_holding_registers, address, count)
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        return await self._limited(self._unit.read_input_registers, address, count)
+
+    async def read_coils(self, address: int, count: int) -> list[bool]:
+        return await self._limited(self._unit.read_coils, address, count)
+
+    async def read_discrete_inputs(self, address: int, count: int) -> list[bool]:
+        return await self._limited(self._unit.read_discrete_inputs, address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        await self._limited(self._unit.write_register, address, value)
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        await self._limited(self._unit.write_registers, address, values)
+
+    async def write_coil(self, address: int, value: bool) -> None:
+        await self._limited(self._unit.write_coil, address, value)
+
+    async def write_coils(self, address: int, values: list[bool]) -> None:
+        await self._limited(self._unit.write_coils, address, values)
+
+
+class _SharedConnection:
+    """A connection whose units share the request limit of their host."""
+
+    def __init__(
+        self, connection: ModbusConnection, requests: RequestScheduler
+    ) -> None:
+        self._connection = connection
+        self._requests = requests
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def for_unit(
+        self, unit_id: int, wrap: Callable[[ModbusUnit], ModbusUnit] | None = None
+    ) -> ModbusUnit:
+        """Return the unit handle, limited with the other units of the host.
+
+        ``wrap`` is applied to the unit within the limit, so it sees a request
+        only once it is sent.
+        """
+        unit = self._connection.for_unit(unit_id)
+        if wrap is not None:
+            unit = wrap(unit)
+        return cast(ModbusUnit, _LimitedUnit(unit, self._requests))
+
+
+def wrapped_unit(
+    connection: ModbusConnection,
+    unit_id: int,
+    wrap: Callable[[ModbusUnit], ModbusUnit],
+) -> ModbusUnit:
+    """Return the unit ``unit_id`` of ``connection`` with ``wrap`` applied.
+
+    On a connection of the pool the wrapper sits within the request limit of
+    the host, so what it measures of a request leaves out its wait for the
+    other requests.
+    """
+    if isinstance(connection, _SharedConnection):
+        return connection.for_unit(unit_id, wrap)
+    return wrap(connection.for_unit(unit_id))
+
+
+@dataclass
+class _Host:
+    """The connection to one ISG and the entries that use it."""
+
+    connection: ModbusConnection
+    entries: set[str] = field(default_factory=set)
+
+
+def _spread(slot: int) -> float:
+    """Return the ``slot``-th fraction of a sequence that keeps halving the gaps.
+
+    The fractions run 0, 1/2, 1/4, 3/4, 1/8 and on, so the ones already handed
+    out stay where they are and every new one lands in the largest gap.
+    """
+    fraction, step = 0.0, 0.5
+    while slot:
+        if slot & 1:
+            fraction += step
+        slot >>= 1
+        step /= 2
+    return fraction
+
+
+class ConnectionPool:
+    """Hand the entries one connection per ISG and spread their refreshes."""
+
+    def __init__(self) -> None:
+        """Start without any connection."""
+        self._hosts: dict[Address, _Host] = {}
+        self._connecting: dict[Address, asyncio.Lock] = {}
+        self._entry_hosts: dict[str, Address] = {}
+        self._slots: dict[str, int] = {}
+
+    async def async_acquire(
+        self,
+        entry_id: str,
+        address: Address,
+        connect: Callable[[], Awaitable[ModbusConnection]],
+    ) -> ModbusConnection:
+        """Return the connection to ``address``, connecting with ``connect`` first.
+
+        An entry that asks for an address while another entry connects to it
+        waits for that attempt, and tries again itself should it fail.
+        """
+        async with self._connecting.setdefault(address, asyncio.Lock()):
+            host = self._hosts.get(address)
+            if host is None:
+                connection = await connect()
+                requests = RequestScheduler(MAX_REQUESTS_PER_HOST)
+                host = self._hosts[address] = _Host(
+                    cast(ModbusConnection, _SharedConnection(connection, requests))
+                )
+        host.entries.add(entry_id)
+        self._entry_hosts[entry_id] = address
+        return host.connection
+
+    async def async_release(self, entry_id: str) -> None:
+        """Let go of the connection of an entry, closing it after the last one."""
+        self._slots.pop(entry_id, None)
+        address = self._entry_hosts.pop(entry_id, None)
+        if address is None:
+            return
+        host = self._hosts[address]
+        host.entries.discard(entry_id)
+        if not host.entries:
+            del self._hosts[address]
+            await host.connection.close()
+
+    def refresh_offset(self, entry_id: str) -> float:
+        """Return the fraction of its poll interval an entry delays its refreshes by.
+
+        Each entry keeps its slot until it is released, and a new entry takes
+        the first free one, so the entries set up together poll apart.
+        """
+        if (slot := self._slots.get(entry_id)) is None:
+            taken = set(self._slots.values())
+            slot = next(slot for slot in range(len(taken) + 1) if slot not in taken)
+            self._slots[entry_id] = slot
+        return _spread(slot)
+
+
+DATA_POOL: HassKey[ConnectionPool] = HassKey(DOMAIN)
+
+
+def connection_pool(hass: HomeAssistant) -> ConnectionPool:
+    """Return the connection pool of the integration, creating it on first use."""
+    if (pool := hass.data.get(DATA_POOL)) is None:
+        pool = hass.data[DATA_POOL] = ConnectionPool()
+    return pool
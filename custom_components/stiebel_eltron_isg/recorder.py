@@ -0,0 +1,159 @@
+"""Record the polled values and the Modbus traffic to disk, for use outside Home Assistant."""
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+from datetime import datetime
+import logging
+from pathlib import Path
+from time import monotonic
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .capture import Exchange, encode_exchange, encode_header
+from .const import RECORDING_BACKUPS, RECORDING_FLUSH_INTERVAL, RECORDING_MAX_BYTES
+from .recording import Encoder, Value, append
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class _BufferedRecording(ABC):
+    """Buffer the records of a rotating file and append them in the executor.
+
+    A record is encoded right away and buffered. The buffer is written by the
+    executor a while later, so a poll never waits for the disk and a write
+    covers many polls. A file is rotated before it would grow beyond
+    ``max_bytes``, and every file starts with a header of its own.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: Path, max_bytes: int, backups: int
+    ) -> None:
+        """Record to ``path``, starting a new file."""
+        self._hass = hass
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        header = self._start()
+        # The data to append, each chunk marked whether it starts a file.
+        self._chunks: list[tuple[bool, bytearray]] = [(True, bytearray(header))]
+        self._size = len(header)
+        self._write_lock = asyncio.Lock()
+        self._flush_unsub: Callable[[], None] | None = None
+
+    @property
+    def path(self) -> Path:
+        """Return the file recorded to."""
+        return self._path
+
+    @abstractmethod
+    def _start(self) -> bytes:
+        """Return the header of a new file."""
+
+    def _add(self, encode: Callable[[], bytes]) -> None:
+        """Buffer the record ``encode`` returns, in a new file if it is full."""
+        data = encode()
+        if self._size + len(data) > self._max_bytes:
+            data = self._start() + encode()
+            self._chunks.append((True, bytearray(data)))
+            self._size = len(data)
+        else:
+            if not self._chunks:
+                self._chunks.append((False, bytearray()))
+            self._chunks[-1][1].extend(data)
+            self._size += len(data)
+        if self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self._hass, RECORDING_FLUSH_INTERVAL, self._async_scheduled_flush
+            )
+
+    async def _async_scheduled_flush(self, _now: datetime) -> None:
+        self._flush_unsub = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write what is buffered, after any write under way.
+
+        A file that cannot be written is logged, and its records dropped.
+        """
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        chunks, self._chunks = self._chunks, []
+        if not chunks:
+            return
+        async with self._write_lock:
+            try:
+                await self._hass.async_add_executor_job(
+                    append,
+                    self._path,
+                    [(starts_file, bytes(data)) for starts_file, data in chunks],
+                    self._backups,
+                )
+            except OSError as err:
+                _LOGGER.warning("Failed to write the recording %s: %s", self._path, err)
+                # What was buffered since may refer to the lost records, so the
+                # next write starts a file of its own.
+                header = self._start()
+                self._chunks = [(True, bytearray(header))]
+                self._size = len(header)
+
+
+class SnapshotRecorder(_BufferedRecording):
+    """Append the values every poll read to a rotating recording."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        max_bytes: int = RECORDING_MAX_BYTES,
+        backups: int = RECORDING_BACKUPS,
+    ) -> None:
+        """Record to ``path``, starting a new file."""
+        self._encoder = Encoder()
+        super().__init__(hass, path, max_bytes, backups)
+
+    def _start(self) -> bytes:
+        return self._encoder.start()
+
+    @callback
+    def record(self, timestamp: float, values: Iterable[tuple[str, Value]]) -> None:
+        """Buffer a sample of ``values`` read at ``timestamp``."""
+        values = list(values)
+        self._add(lambda: self._encoder.encode(timestamp, values))
+
+
+class TrafficRecorder(_BufferedRecording):
+    """Append every Modbus exchange of a unit to a rotating capture.
+
+    The time of an exchange is counted from when the capture started.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        model: str,
+        max_bytes: int = RECORDING_MAX_BYTES,
+        backups: int = RECORDING_BACKUPS,
+    ) -> None:
+        """Capture the traffic with ``model`` to ``path``, starting a new file."""
+        self._model = model
+        self._started = monotonic()
+        super().__init__(hass, path, max_bytes, backups)
+
+    def _start(self) -> bytes:
+        return encode_header(self._model, dt_util.utcnow())
+
+    @callback
+    def record(self, exchange: Exchange) -> None:
+        """Buffer an exchange, timed by the monotonic clock."""
+        exchange = replace(
+            exchange,
+            at=round(exchange.at - self._started, 6),
+            duration=round(exchange.duration, 6),
+        )
+        self._add(lambda: encode_exchange(exchange))
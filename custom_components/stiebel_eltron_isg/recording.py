@@ -0,0 +1,194 @@
+"""A compact, append-only recording of the polled values, and its reader.
+
+Only the standard library is used, so that a recording can be read where Home
+Assistant is not installed, as ``scripts/read_recording.py`` does.
+
+A recording is a file and the files it was rotated to, ``<name>.1`` the newest
+of them. Each file starts with ``MAGIC`` and holds records, little-endian, each
+led by its type:
+
+- ``F``: a field, with its id (uint16), the kind of its values (``f``, ``i``
+  or ``b``) and its name (uint8 length, UTF-8).
+- ``S``: a sample, with the time it was read (float64 seconds since the
+  epoch), the number of its values (uint16) and for each the id of its field
+  (uint16) and the value (float64, NaN for none).
+
+A sample only holds the values that changed since the previous sample of the
+file, so a file is read from its start and starts over with its fields.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+import math
+import os
+from pathlib import Path
+import struct
+from typing import BinaryIO
+
+MAGIC = b"ISGREC\x01\n"
+
+_FIELD = struct.Struct("<HcB")
+_SAMPLE = struct.Struct("<dH")
+_VALUE = struct.Struct("<Hd")
+_MAX_FIELDS = 0x10000
+
+type Value = float | int | bool | None
+
+
+def _kind(value: Value) -> bytes | None:
+    """Return the kind of a value, or None for a value that is not a number."""
+    if isinstance(value, bool):
+        return b"b"
+    if isinstance(value, int):
+        return b"i"
+    if isinstance(value, float):
+        return b"f"
+    return None
+
+
+class Encoder:
+    """Turn samples into the records of one file, remembering what it holds."""
+
+    def __init__(self) -> None:
+        """Start a file."""
+        self._ids: dict[str, int] = {}
+        self._kinds: dict[int, bytes] = {}
+        self._last: dict[int, tuple[bytes | None, Value]] = {}
+
+    def start(self) -> bytes:
+        """Forget the fields and values of the last file and return a new one's start."""
+        self._ids.clear()
+        self._kinds.clear()
+        self._last.clear()
+        return MAGIC
+
+    def encode(self, timestamp: float, values: Iterable[tuple[str, Value]]) -> bytes:
+        """Return the records of a sample read at ``timestamp``.
+
+        A field is described before its first value, and again whenever its
+        values change kind. A file holds at most 65536 fields; the values of
+        any beyond are not recorded.
+        """
+        records = bytearray()
+        changed = bytearray()
+        count = 0
+        for name, value in values:
+            kind = _kind(value)
+            field = self._ids.get(name)
+            if field is None:
+                if len(self._ids) == _MAX_FIELDS:
+                    continue
+                field = self._ids[name] = len(self._ids)
+            if self._last.get(field) == (kind, value):
+                continue
+            self._last[field] = (kind, value)
+            if field not in self._kinds or (
+                kind is not None and kind != self._kinds[field]
+            ):
+                self._kinds[field] = kind or b"f"
+                encoded = name.encode()[:255]
+                records += b"F" + _FIELD.pack(field, self._kinds[field], len(encoded))
+                records += encoded
+            changed += _VALUE.pack(field, math.nan if kind is None else value)
+            count += 1
+        records += b"S" + _SAMPLE.pack(timestamp, count) + changed
+        return bytes(records)
+
+
+def append(path: Path, chunks: Iterable[tuple[bool, bytes]], backups: int) -> None:
+    """Append ``chunks`` to the recording at ``path``.
+
+    A chunk that starts a file rotates the recording first: ``path`` becomes
+    ``<path>.1``, and of the rotated files only the newest ``backups`` are kept.
+    Blocks, so it runs in the executor.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for starts_file, data in chunks:
+        if starts_file and path.exists():
+            _rotate(path, backups)
+        with path.open("ab") as file:
+            file.write(data)
+
+
+def _rotate(path: Path, backups: int) -> None:
+    """Move the files of a recording one up, dropping the oldest."""
+    for number in range(backups, 0, -1):
+        older = Path(f"{path}.{number}")
+        if not older.exists():
+            continue
+        if number == backups:
+            older.unlink()
+        else:
+            os.replace(older, f"{path}.{number + 1}")
+    if backups:
+        os.replace(path, f"{path}.1")
+    else:
+        path.unlink()
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytes | None:
+    """Return the next ``size`` bytes, or None where the file ends before."""
+    data = file.read(size)
+    return data if len(data) == size else None
+
+
+def read_file(path: Path) -> Iterator[tuple[datetime, dict[str, Value]]]:
+    """Yield when each sample of one file was read, and every value it held.
+
+    The values of a sample include those that did not change since the one
+    before. A record cut short, as by a crash while it was written, ends the
+    file.
+    """
+    with path.open("rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a recording")
+        names: dict[int, str] = {}
+        kinds: dict[int, bytes] = {}
+        values: dict[str, Value] = {}
+        while record_type := file.read(1):
+            if record_type == b"F":
+                if (head := _read_exactly(file, _FIELD.size)) is None:
+                    return
+                field, kind, length = _FIELD.unpack(head)
+                if (name := _read_exactly(file, length)) is None:
+                    return
+                names[field] = name.decode()
+                kinds[field] = kind
+                continue
+            if record_type != b"S":
+                raise ValueError(f"{path} holds an unknown record {record_type!r}")
+            if (head := _read_exactly(file, _SAMPLE.size)) is None:
+                return
+            timestamp, count = _SAMPLE.unpack(head)
+            if (body := _read_exactly(file, count * _VALUE.size)) is None:
+                return
+            for field, value in _VALUE.iter_unpack(body):
+                values[names[field]] = _decode(value, kinds[field])
+            yield datetime.fromtimestamp(timestamp, UTC), dict(values)
+
+
+def _decode(value: float, kind: bytes) -> Value:
+    """Return a recorded value as the kind it was read as."""
+    if math.isnan(value):
+        return None
+    if kind == b"i":
+        return int(value)
+    if kind == b"b":
+        return bool(value)
+    return value
+
+
+def read_recording(path: Path) -> Iterator[tuple[datetime, dict[str, Value]]]:
+    """Yield the samples of a recording and the files it was rotated to, oldest first."""
+    rotated = sorted(
+        (
+            int(suffix)
+            for file in path.parent.glob(f"{path.name}.*")
+            if (suffix := file.name.removeprefix(f"{path.name}.")).isdigit()
+        ),
+        reverse=True,
+    )
+    for number in rotated:
+        yield from read_file(Path(f"{path}.{number}"))
+    if path.exists():
+        yield from read_file(path)
@@ -0,0 +1,101 @@
+"""Value references the coordinator resolves against the API."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
+import re
+from typing import Any
+
+# An accessor that reads one value from the API, e.g. ``lambda api: api.x.y``.
+type ValueReference = Callable[[Any], float | int | None]
+
+# One step of an API field path: a name, and the index of an instance if the
+# name is a repeating group.
+_STEP = re.compile(r"(?P<name>[a-z_][a-z0-9_]*)(?:\[(?P<index>\d+)\])?")
+
+
+def _compile(steps: list[re.Match[str]]) -> Callable[[Any], Any]:
+    """Return a getter that follows ``steps`` from the API to the value.
+
+    The names between two indexes are looked up by one ``attrgetter``, so a
+    plain field path takes a single call.
+    """
+    getters: list[Callable[[Any], Any]] = []
+    names: list[str] = []
+    for step in steps:
+        names.append(step["name"])
+        if step["index"] is not None:
+            getters.append(attrgetter(".".join(names)))
+            getters.append(itemgetter(int(step["index"])))
+            names = []
+    if names:
+        getters.append(attrgetter(".".join(names)))
+    if len(getters) == 1:
+        return getters[0]
+
+    def get(api: Any) -> Any:
+        value = api
+        for getter in getters:
+            value = getter(value)
+        return value
+
+    return get
+
+
+@dataclass(frozen=True)
+class ApiField:
+    """A value named by its path through the API.
+
+    The path starts with the component, e.g. ``system_values.outdoor_temperature``,
+    and indexes the instances of a repeating group, as in
+    ``system_values.room_temperatures[0].relative_humidity``. Unlike a lambda,
+    the reference tells which component it reads without being probed, two
+    references to the same field are equal and share their cached value, and
+    it resolves through getters compiled once.
+    """
+
+    path: str
+    component: str = field(init=False, repr=False, compare=False)
+    _get: Callable[[Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the getter, rejecting a path that names no field."""
+        matches = [_STEP.fullmatch(step) for step in self.path.split(".")]
+        steps = [match for match in matches if match is not None]
+        if len(steps) != len(matches) or len(steps) < 2 or steps[0]["index"]:
+            raise ValueError(f"{self.path!r} is not a component field path")
+        object.__setattr__(self, "component", steps[0]["name"])
+        object.__setattr__(self, "_get", _compile(steps))
+
+    def __call__(self, api: Any) -> Any:
+        """Read the field from the API."""
+        return self._get(api)
+
+
+# The status word whose bits back most binary sensors.
+operating_status = ApiField("system_state.operating_status")
+
+
+@dataclass(frozen=True)
+class RegisterBit:
+    """One bit of a status register that several entities share.
+
+    The controllers pack up to sixteen states into one status word. References
+    to the same register and bit are equal, and the coordinator resolves them
+    from the cached register value, so the word is read once per poll however
+    many bits back an entity, and change detection wakes only the entities
+    whose bit flipped.
+    """
+
+    register: ValueReference
+    bit: int
+
+    def __call__(self, api: Any) -> int | None:
+        """Read the bit from the API directly."""
+        return self.of(self.register(api))
+
+    def of(self, value: float | int | None) -> int | None:
+        """Return this bit of a register value, or None without a value."""
+        if value is None:
+            return None
+        return (int(value) >> self.bit) & 1
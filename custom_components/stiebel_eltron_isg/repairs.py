@@ -13,7 +13,8 @@ from pystiebeleltron import ControllerModel
 
 from .const import DOMAIN
 from .coordinator import StiebelEltronConfigEntry
-from .migration import async_get_duplicate_entities, duplicate_entity_issue_id
+from .entity import duplicate_entity_issue_id
+from .migration import async_get_duplicate_entities
 
 
 class DuplicateEntityRepairFlow(RepairsFlow):
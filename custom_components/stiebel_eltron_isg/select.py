@@ -7,11 +7,12 @@ from typing import Any
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pystiebeleltron import ControllerModel
 
 from .const import OPERATION_MODE
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .descriptions import descriptions_by_model
 from .entity import OptimisticValueMixin, StiebelEltronISGEntity
+from .references import ApiField
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,18 +49,18 @@ class StiebelEltronSelectEntityDescription(SelectEntityDescription):
     operation_modes: dict[int, str]
 
     def __post_init__(self) -> None:
-        """Ensure value references are lambda-based."""
+        """Ensure the value reference is an API field or an accessor."""
         if callable(self.modbus_register):
             return
 
-        raise TypeError("modbus_register must be a lambda expression")
+        raise TypeError("modbus_register must be a lambda expression or an ApiField")
 
 
 WPM_SELECT_TYPES = [
     StiebelEltronSelectEntityDescription(
         key=OPERATION_MODE,
         translation_key="operation_mode",
-        modbus_register=lambda api: api.system_parameters.operating_mode,
+        modbus_register=ApiField("system_parameters.operating_mode"),
         write_field="operating_mode",
         operation_modes=OPERATION_MODE_WPM_OPTIONS,
     ),
@@ -69,13 +70,18 @@ LWZ_SELECT_TYPES = [
     StiebelEltronSelectEntityDescription(
         key=OPERATION_MODE,
         translation_key="operation_mode",
-        modbus_register=lambda api: api.system_parameters.operating_mode,
+        modbus_register=ApiField("system_parameters.operating_mode"),
         write_field="operating_mode",
         operation_modes=OPERATION_MODE_LWZ_OPTIONS,
     ),
 ]
 
 
+SELECT_TYPES_BY_MODEL = descriptions_by_model(
+    wpm_3i=WPM_SELECT_TYPES, wpm=WPM_SELECT_TYPES, lwz=LWZ_SELECT_TYPES
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: StiebelEltronConfigEntry,
@@ -84,32 +90,13 @@ async def async_setup_entry(
     """Set up the select platform."""
     coordinator = entry.runtime_data
 
-    entities = []
-    if coordinator.model in (
-        ControllerModel.WPM_3i,
-        ControllerModel.WPM_3,
-        ControllerModel.WPMsystem,
-        ControllerModel.LWZ_R290,
-    ):
-        entities = [
-            StiebelEltronISGSelectEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_SELECT_TYPES
-        ]
-    else:
-        entities = [
-            StiebelEltronISGSelectEntity(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in LWZ_SELECT_TYPES
-        ]
-
-    async_add_devices(entities)
+    coordinator.async_add_answered_entities(
+        async_add_devices,
+        SELECT_TYPES_BY_MODEL[coordinator.model],
+        lambda description: StiebelEltronISGSelectEntity(
+            coordinator, entry, description
+        ),
+    )
 
 
 def get_key_from_value(d: dict[int, str], val: str) -> int | None:
@@ -150,7 +137,7 @@ class StiebelEltronISGSelectEntity(
         value = (
             self._optimistic_value
             if self._optimistic_value is not None
-            else self.coordinator.get_value(self.modbus_register)
+            else self._read()
         )
         key = int(value) if value is not None else None
         if key is None:
@@ -16,6 +16,7 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfEnergy,
     UnitOfFrequency,
+    UnitOfInformation,
     UnitOfPower,
     UnitOfPressure,
     UnitOfTemperature,
@@ -27,6 +28,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pystiebeleltron import ControllerModel
 
 from .const import (
+    ACCESSOR_ERRORS,
     ACTIVE_ERROR,
     ACTUAL_HUMIDITY,
     ACTUAL_HUMIDITY_HK1,
@@ -81,6 +83,7 @@ from .const import (
     EFFICIENCY_HEATING_13_24_M,
     ELECTRICAL_BOOSTER_HEATING,
     ELECTRICAL_BOOSTER_HEATING_WATER,
+    ENTITIES_NOTIFIED,
     EXTRACT_AIR_ACTUAL_FAN_SPEED,
     EXTRACT_AIR_DEW_POINT,
     EXTRACT_AIR_HUMIDITY,
@@ -102,6 +105,10 @@ from .const import (
     LOW_PRESSURE_WP1,
     LOW_PRESSURE_WP2,
     MIN_SOURCE_TEMPERATURE,
+    MODBUS_BYTES_READ,
+    MODBUS_ERRORS,
+    MODBUS_READS,
+    MODBUS_REGISTERS_READ,
     OUTDOOR_TEMPERATURE,
     PRODUCED_COOLING_TOTAL,
     PRODUCED_ELECTRICAL_BOOSTER_HEATING_TOTAL,
@@ -121,6 +128,7 @@ from .const import (
     PRODUCED_WATER_HEATING,
     PRODUCED_WATER_HEATING_TODAY,
     PRODUCED_WATER_HEATING_TOTAL,
+    REFRESH_DURATION,
     RETURN_TEMPERATURE,
     RETURN_TEMPERATURE_WP1,
     RETURN_TEMPERATURE_WP2,
@@ -147,9 +155,13 @@ from .const import (
     VOLUME_STREAM,
     VOLUME_STREAM_WP1,
     VOLUME_STREAM_WP2,
+    WRITE_DURATION,
 )
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
+from .descriptions import descriptions_by_model
 from .entity import StiebelEltronISGEntity
+from .instrumentation import Instrumentation
+from .references import ApiField
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -165,11 +177,11 @@ class StiebelEltronSensorEntityDescription(SensorEntityDescription):
     modbus_register: StiebelEltronModbusRegister
 
     def __post_init__(self) -> None:
-        """Ensure value references are lambda-based."""
+        """Ensure the value reference is an API field or an accessor."""
         if callable(self.modbus_register):
             return
 
-        raise TypeError("modbus_register must be a lambda expression")
+        raise TypeError("modbus_register must be a lambda expression or an ApiField")
 
 
 def create_temperature_entity_description(
@@ -334,466 +346,466 @@ def create_runtime_entity_description(
 WPM_3I_SYSTEM_VALUES_SENSOR_TYPES = [
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE,
-        lambda api: api.system_values.actual_temperature_fe7,
+        ApiField("system_values.actual_temperature_fe7"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE,
-        lambda api: api.system_values.set_temperature_fe7,
+        ApiField("system_values.set_temperature_fe7"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_FEK,
-        lambda api: api.system_values.actual_temperature_fek,
+        ApiField("system_values.actual_temperature_fek"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_FEK,
-        lambda api: api.system_values.set_temperature_fek,
+        ApiField("system_values.set_temperature_fek"),
     ),
     create_humidity_entity_description(
-        ACTUAL_HUMIDITY, lambda api: api.system_values.relative_humidity
+        ACTUAL_HUMIDITY, ApiField("system_values.relative_humidity")
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE,
-        lambda api: api.system_values.dew_point_temperature,
+        ApiField("system_values.dew_point_temperature"),
     ),
     create_temperature_entity_description(
         OUTDOOR_TEMPERATURE,
-        lambda api: api.system_values.outside_temperature,
+        ApiField("system_values.outside_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK1,
-        lambda api: api.system_values.actual_temperature_hk_1,
+        ApiField("system_values.actual_temperature_hk_1"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK1,
-        lambda api: api.system_values.set_temperature_hk_1,
+        ApiField("system_values.set_temperature_hk_1"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK2,
-        lambda api: api.system_values.actual_temperature_hk_2,
+        ApiField("system_values.actual_temperature_hk_2"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK2,
-        lambda api: api.system_values.set_temperature_hk_2,
+        ApiField("system_values.set_temperature_hk_2"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_WP,
-        lambda api: api.system_values.actual_flow_temperature_wp,
+        ApiField("system_values.actual_flow_temperature_wp"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_NHZ,
-        lambda api: api.system_values.actual_flow_temperature_nhz,
+        ApiField("system_values.actual_flow_temperature_nhz"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE,
-        lambda api: api.system_values.actual_flow_temperature,
+        ApiField("system_values.actual_flow_temperature"),
     ),
     create_temperature_entity_description(
         RETURN_TEMPERATURE,
-        lambda api: api.system_values.actual_return_temperature,
+        ApiField("system_values.actual_return_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_BUFFER,
-        lambda api: api.system_values.actual_buffer_temperature,
+        ApiField("system_values.actual_buffer_temperature"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_BUFFER,
-        lambda api: api.system_values.set_buffer_temperature,
+        ApiField("system_values.set_buffer_temperature"),
     ),
     create_pressure_entity_description(
         HEATER_PRESSURE,
-        lambda api: api.system_values.heating_pressure,
+        ApiField("system_values.heating_pressure"),
     ),
     create_volume_stream_entity_description(
-        VOLUME_STREAM, lambda api: api.system_values.flow_rate
+        VOLUME_STREAM, ApiField("system_values.flow_rate")
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_WATER,
-        lambda api: api.system_values.actual_temperature_dhw,
+        ApiField("system_values.actual_temperature_dhw"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_WATER,
-        lambda api: api.system_values.set_temperature_dhw,
+        ApiField("system_values.set_temperature_dhw"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_COOLING_FANCOIL,
-        lambda api: api.system_values.actual_temperature_fan,
+        ApiField("system_values.actual_temperature_fan"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_COOLING_FANCOIL,
-        lambda api: api.system_values.set_temperature_fan,
+        ApiField("system_values.set_temperature_fan"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_COOLING_SURFACE,
-        lambda api: api.system_values.actual_temperature_area,
+        ApiField("system_values.actual_temperature_area"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_COOLING_SURFACE,
-        lambda api: api.system_values.set_temperature_area,
+        ApiField("system_values.set_temperature_area"),
     ),
     create_temperature_entity_description(
         SOURCE_TEMPERATURE,
-        lambda api: api.system_values.source_temperature,
+        ApiField("system_values.source_temperature"),
     ),
     create_temperature_entity_description(
         MIN_SOURCE_TEMPERATURE,
-        lambda api: api.system_values.min_source_temperature,
+        ApiField("system_values.min_source_temperature"),
     ),
     create_pressure_entity_description(
         SOURCE_PRESSURE,
-        lambda api: api.system_values.source_pressure,
+        ApiField("system_values.source_pressure"),
     ),
     create_temperature_entity_description(
         HOT_GAS_TEMPERATURE,
-        lambda api: api.system_values.hot_gas_temperature,
+        ApiField("system_values.hot_gas_temperature"),
     ),
     create_pressure_entity_description(
-        HIGH_PRESSURE, lambda api: api.system_values.high_pressure
+        HIGH_PRESSURE, ApiField("system_values.high_pressure")
     ),
     create_pressure_entity_description(
-        LOW_PRESSURE, lambda api: api.system_values.low_pressure
+        LOW_PRESSURE, ApiField("system_values.low_pressure")
     ),
     StiebelEltronSensorEntityDescription(
         key=ACTIVE_ERROR,
         translation_key=ACTIVE_ERROR,
         entity_category=EntityCategory.DIAGNOSTIC,
-        modbus_register=lambda api: api.system_state.active_error,
+        modbus_register=ApiField("system_state.active_error"),
     ),
 ]
 
 SYSTEM_VALUES_SENSOR_TYPES = [
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE,
-        lambda api: api.system_values.actual_temperature_fe7,
+        ApiField("system_values.actual_temperature_fe7"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE,
-        lambda api: api.system_values.set_temperature_fe7,
+        ApiField("system_values.set_temperature_fe7"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_FEK,
-        lambda api: api.system_values.actual_temperature_fek,
+        ApiField("system_values.actual_temperature_fek"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_FEK,
-        lambda api: api.system_values.set_temperature_fek,
+        ApiField("system_values.set_temperature_fek"),
     ),
     create_humidity_entity_description(
-        ACTUAL_HUMIDITY, lambda api: api.system_values.relative_humidity
+        ACTUAL_HUMIDITY, ApiField("system_values.relative_humidity")
     ),
     create_humidity_entity_description(
         ACTUAL_HUMIDITY_HK1,
-        lambda api: api.system_values.room_temperatures[0].relative_humidity,
+        ApiField("system_values.room_temperatures[0].relative_humidity"),
     ),
     create_humidity_entity_description(
         ACTUAL_HUMIDITY_HK2,
-        lambda api: api.system_values.room_temperatures[1].relative_humidity,
+        ApiField("system_values.room_temperatures[1].relative_humidity"),
     ),
     create_humidity_entity_description(
         ACTUAL_HUMIDITY_HK3,
-        lambda api: api.system_values.room_temperatures[2].relative_humidity,
+        ApiField("system_values.room_temperatures[2].relative_humidity"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE,
-        lambda api: api.system_values.dew_point_temperature,
+        ApiField("system_values.dew_point_temperature"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE_HK1,
-        lambda api: api.system_values.room_temperatures[0].dew_point_temperature,
+        ApiField("system_values.room_temperatures[0].dew_point_temperature"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE_HK2,
-        lambda api: api.system_values.room_temperatures[1].dew_point_temperature,
+        ApiField("system_values.room_temperatures[1].dew_point_temperature"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE_HK3,
-        lambda api: api.system_values.room_temperatures[2].dew_point_temperature,
+        ApiField("system_values.room_temperatures[2].dew_point_temperature"),
     ),
     create_temperature_entity_description(
         OUTDOOR_TEMPERATURE,
-        lambda api: api.system_values.outside_temperature,
+        ApiField("system_values.outside_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK1,
-        lambda api: api.system_values.actual_temperature_hk_1,
+        ApiField("system_values.actual_temperature_hk_1"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK1,
-        lambda api: api.system_values.set_temperature_hk_1,
+        ApiField("system_values.set_temperature_hk_1"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK2,
-        lambda api: api.system_values.actual_temperature_hk_2,
+        ApiField("system_values.actual_temperature_hk_2"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK2,
-        lambda api: api.system_values.set_temperature_hk_2,
+        ApiField("system_values.set_temperature_hk_2"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK3,
-        lambda api: api.system_values.actual_temperature_hk_3,
+        ApiField("system_values.actual_temperature_hk_3"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK3,
-        lambda api: api.system_values.set_temperature_hk_3,
+        ApiField("system_values.set_temperature_hk_3"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_COOLING_FANCOIL,
-        lambda api: api.system_values.actual_temperature_fan,
+        ApiField("system_values.actual_temperature_fan"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_COOLING_FANCOIL,
-        lambda api: api.system_values.set_temperature_fan,
+        ApiField("system_values.set_temperature_fan"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_COOLING_SURFACE,
-        lambda api: api.system_values.actual_temperature_area,
+        ApiField("system_values.actual_temperature_area"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_COOLING_SURFACE,
-        lambda api: api.system_values.set_temperature_area,
+        ApiField("system_values.set_temperature_area"),
     ),
     create_temperature_entity_description(
         SOLAR_CYLINDER_TEMPERATURE,
-        lambda api: api.system_values.cylinder_temperature,
+        ApiField("system_values.cylinder_temperature"),
     ),
     create_runtime_entity_description(
         SOLAR_RUNTIME,
-        lambda api: api.system_values.runtime,
+        ApiField("system_values.runtime"),
     ),
     create_temperature_entity_description(
         ACTUAL_ROOM_TEMPERATURE_HK1,
-        lambda api: api.system_values.room_temperatures[0].actual_temperature,
+        ApiField("system_values.room_temperatures[0].actual_temperature"),
     ),
     create_temperature_entity_description(
         TARGET_ROOM_TEMPERATURE_HK1,
-        lambda api: api.system_values.room_temperatures[0].set_temperature,
+        ApiField("system_values.room_temperatures[0].set_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_ROOM_TEMPERATURE_HK2,
-        lambda api: api.system_values.room_temperatures[1].actual_temperature,
+        ApiField("system_values.room_temperatures[1].actual_temperature"),
     ),
     create_temperature_entity_description(
         TARGET_ROOM_TEMPERATURE_HK2,
-        lambda api: api.system_values.room_temperatures[1].set_temperature,
+        ApiField("system_values.room_temperatures[1].set_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_ROOM_TEMPERATURE_HK3,
-        lambda api: api.system_values.room_temperatures[2].actual_temperature,
+        ApiField("system_values.room_temperatures[2].actual_temperature"),
     ),
     create_temperature_entity_description(
         TARGET_ROOM_TEMPERATURE_HK3,
-        lambda api: api.system_values.room_temperatures[2].set_temperature,
+        ApiField("system_values.room_temperatures[2].set_temperature"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_WP,
-        lambda api: api.system_values.actual_flow_temperature_wp,
+        ApiField("system_values.actual_flow_temperature_wp"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_NHZ,
-        lambda api: api.system_values.actual_flow_temperature_nhz,
+        ApiField("system_values.actual_flow_temperature_nhz"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE,
-        lambda api: api.system_values.actual_flow_temperature,
+        ApiField("system_values.actual_flow_temperature"),
     ),
     create_temperature_entity_description(
         RETURN_TEMPERATURE,
-        lambda api: api.system_values.actual_return_temperature,
+        ApiField("system_values.actual_return_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_BUFFER,
-        lambda api: api.system_values.actual_buffer_temperature,
+        ApiField("system_values.actual_buffer_temperature"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_BUFFER,
-        lambda api: api.system_values.set_buffer_temperature,
+        ApiField("system_values.set_buffer_temperature"),
     ),
     create_pressure_entity_description(
         HEATER_PRESSURE,
-        lambda api: api.system_values.heating_pressure,
+        ApiField("system_values.heating_pressure"),
     ),
     create_volume_stream_entity_description(
-        VOLUME_STREAM, lambda api: api.system_values.flow_rate
+        VOLUME_STREAM, ApiField("system_values.flow_rate")
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_WATER,
-        lambda api: api.system_values.actual_temperature_dhw,
+        ApiField("system_values.actual_temperature_dhw"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_WATER,
-        lambda api: api.system_values.set_temperature_dhw,
+        ApiField("system_values.set_temperature_dhw"),
     ),
     create_temperature_entity_description(
         SOLAR_COLLECTOR_TEMPERATURE,
-        lambda api: api.system_values.collector_temperature,
+        ApiField("system_values.collector_temperature"),
     ),
     create_temperature_entity_description(
         SOURCE_TEMPERATURE,
-        lambda api: api.system_values.source_temperature,
+        ApiField("system_values.source_temperature"),
     ),
     create_temperature_entity_description(
         MIN_SOURCE_TEMPERATURE,
-        lambda api: api.system_values.min_source_temperature,
+        ApiField("system_values.min_source_temperature"),
     ),
     create_pressure_entity_description(
         SOURCE_PRESSURE,
-        lambda api: api.system_values.source_pressure,
+        ApiField("system_values.source_pressure"),
     ),
     create_temperature_entity_description(
         HOT_GAS_TEMPERATURE,
-        lambda api: api.system_values.hot_gas_temperature,
+        ApiField("system_values.hot_gas_temperature"),
     ),
     create_pressure_entity_description(
-        HIGH_PRESSURE, lambda api: api.system_values.high_pressure
+        HIGH_PRESSURE, ApiField("system_values.high_pressure")
     ),
     create_pressure_entity_description(
-        LOW_PRESSURE, lambda api: api.system_values.low_pressure
+        LOW_PRESSURE, ApiField("system_values.low_pressure")
     ),
     create_temperature_entity_description(
         RETURN_TEMPERATURE_WP1,
-        lambda api: api.system_values.heat_pumps[0].return_temperature,
+        ApiField("system_values.heat_pumps[0].return_temperature"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_WP1,
-        lambda api: api.system_values.heat_pumps[0].flow_temperature,
+        ApiField("system_values.heat_pumps[0].flow_temperature"),
     ),
     create_temperature_entity_description(
         HOT_GAS_TEMPERATURE_WP1,
-        lambda api: api.system_values.heat_pumps[0].hot_gas_temperature,
+        ApiField("system_values.heat_pumps[0].hot_gas_temperature"),
     ),
     create_pressure_entity_description(
         LOW_PRESSURE_WP1,
-        lambda api: api.system_values.heat_pumps[0].low_pressure,
+        ApiField("system_values.heat_pumps[0].low_pressure"),
     ),
     create_pressure_entity_description(
         HIGH_PRESSURE_WP1,
-        lambda api: api.system_values.heat_pumps[0].high_pressure,
+        ApiField("system_values.heat_pumps[0].high_pressure"),
     ),
     create_volume_stream_entity_description(
         VOLUME_STREAM_WP1,
-        lambda api: api.system_values.heat_pumps[0].wp_water_flow_rate,
+        ApiField("system_values.heat_pumps[0].wp_water_flow_rate"),
     ),
     create_temperature_entity_description(
         RETURN_TEMPERATURE_WP2,
-        lambda api: api.system_values.heat_pumps[1].return_temperature,
+        ApiField("system_values.heat_pumps[1].return_temperature"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE_WP2,
-        lambda api: api.system_values.heat_pumps[1].flow_temperature,
+        ApiField("system_values.heat_pumps[1].flow_temperature"),
     ),
     create_temperature_entity_description(
         HOT_GAS_TEMPERATURE_WP2,
-        lambda api: api.system_values.heat_pumps[1].hot_gas_temperature,
+        ApiField("system_values.heat_pumps[1].hot_gas_temperature"),
     ),
     create_pressure_entity_description(
         LOW_PRESSURE_WP2,
-        lambda api: api.system_values.heat_pumps[1].low_pressure,
+        ApiField("system_values.heat_pumps[1].low_pressure"),
     ),
     create_pressure_entity_description(
         HIGH_PRESSURE_WP2,
-        lambda api: api.system_values.heat_pumps[1].high_pressure,
+        ApiField("system_values.heat_pumps[1].high_pressure"),
     ),
     create_volume_stream_entity_description(
         VOLUME_STREAM_WP2,
-        lambda api: api.system_values.heat_pumps[1].wp_water_flow_rate,
+        ApiField("system_values.heat_pumps[1].wp_water_flow_rate"),
     ),
     StiebelEltronSensorEntityDescription(
         key=ACTIVE_ERROR,
         translation_key=ACTIVE_ERROR,
         entity_category=EntityCategory.DIAGNOSTIC,
-        modbus_register=lambda api: api.system_state.active_error,
+        modbus_register=ApiField("system_state.active_error"),
     ),
 ]
 
 LWZ_SYSTEM_VALUES_SENSOR_TYPES = [
     create_temperature_entity_description(
         ACTUAL_ROOM_TEMPERATURE_HK1,
-        lambda api: api.system_values.actual_room_t_hc1,
+        ApiField("system_values.actual_room_t_hc1"),
     ),
     create_temperature_entity_description(
         TARGET_ROOM_TEMPERATURE_HK1,
-        lambda api: api.system_values.set_room_temperature_hc1,
+        ApiField("system_values.set_room_temperature_hc1"),
     ),
     create_temperature_entity_description(
         ACTUAL_ROOM_TEMPERATURE_HK2,
-        lambda api: api.system_values.actual_room_t_hc2,
+        ApiField("system_values.actual_room_t_hc2"),
     ),
     create_temperature_entity_description(
         TARGET_ROOM_TEMPERATURE_HK2,
-        lambda api: api.system_values.set_room_temperature_hc2,
+        ApiField("system_values.set_room_temperature_hc2"),
     ),
     create_humidity_entity_description(
         ACTUAL_HUMIDITY,
-        lambda api: api.system_values.relative_humidity_hc1,
+        ApiField("system_values.relative_humidity_hc1"),
     ),
     create_humidity_entity_description(
         ACTUAL_HUMIDITY_HK2,
-        lambda api: api.system_values.relative_humidity_hc2,
+        ApiField("system_values.relative_humidity_hc2"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE_HK1,
-        lambda api: api.system_values.dew_point_temp_hc1,
+        ApiField("system_values.dew_point_temp_hc1"),
     ),
     create_temperature_entity_description(
         DEWPOINT_TEMPERATURE_HK2,
-        lambda api: api.system_values.dew_point_temp_hc2,
+        ApiField("system_values.dew_point_temp_hc2"),
     ),
     create_temperature_entity_description(
         OUTDOOR_TEMPERATURE,
-        lambda api: api.system_values.outside_temperature,
+        ApiField("system_values.outside_temperature"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK1,
-        lambda api: api.system_values.actual_value_hc1,
+        ApiField("system_values.actual_value_hc1"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK1,
-        lambda api: api.system_values.set_value_hc1,
+        ApiField("system_values.set_value_hc1"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_HK2,
-        lambda api: api.system_values.actual_value_hc2,
+        ApiField("system_values.actual_value_hc2"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_HK2,
-        lambda api: api.system_values.set_value_hc2,
+        ApiField("system_values.set_value_hc2"),
     ),
     create_temperature_entity_description(
         FLOW_TEMPERATURE,
-        lambda api: api.system_values.flow_temperature,
+        ApiField("system_values.flow_temperature"),
     ),
     create_temperature_entity_description(
         RETURN_TEMPERATURE,
-        lambda api: api.system_values.return_temperature,
+        ApiField("system_values.return_temperature"),
     ),
     create_volume_stream_entity_description(
-        VOLUME_STREAM, lambda api: api.system_values.flow_rate
+        VOLUME_STREAM, ApiField("system_values.flow_rate")
     ),
     create_pressure_entity_description(
         HEATER_PRESSURE,
-        lambda api: api.system_values.pressure_htg_circ,
+        ApiField("system_values.pressure_htg_circ"),
     ),
     create_temperature_entity_description(
         ACTUAL_TEMPERATURE_WATER,
-        lambda api: api.system_values.actual_dhw_t,
+        ApiField("system_values.actual_dhw_t"),
     ),
     create_temperature_entity_description(
         TARGET_TEMPERATURE_WATER,
-        lambda api: api.system_values.dhw_set_temperature,
+        ApiField("system_values.dhw_set_temperature"),
     ),
     create_temperature_entity_description(
         SOLAR_COLLECTOR_TEMPERATURE,
-        lambda api: api.system_values.collector_temperature,
+        ApiField("system_values.collector_temperature"),
     ),
     create_temperature_entity_description(
         HOT_GAS_TEMPERATURE,
-        lambda api: api.system_values.hot_gas_temperature,
+        ApiField("system_values.hot_gas_temperature"),
     ),
     create_pressure_entity_description(
-        HIGH_PRESSURE, lambda api: api.system_values.high_pressure
+        HIGH_PRESSURE, ApiField("system_values.high_pressure")
     ),
     create_pressure_entity_description(
-        LOW_PRESSURE, lambda api: api.system_values.low_pressure
+        LOW_PRESSURE, ApiField("system_values.low_pressure")
     ),
 ]
 
@@ -802,212 +814,210 @@ ENERGYMANAGEMENT_SENSOR_TYPES = [
     StiebelEltronSensorEntityDescription(
         key=SG_READY_STATE,
         translation_key=SG_READY_STATE,
-        modbus_register=lambda api: (
-            api.energy_system_information.sg_ready_operating_state
-        ),
+        modbus_register=ApiField("energy_system_information.sg_ready_operating_state"),
     ),
 ]
 
 ENERGY_SENSOR_TYPES = [
     create_energy_entity_description(
         PRODUCED_HEATING_TOTAL,
-        lambda api: api.energy_data.vd_heating_total,
+        ApiField("energy_data.vd_heating_total"),
     ),
     create_energy_entity_description(
         PRODUCED_HEATING,
-        lambda api: api.energy_data.vd_heating_day_and_total,
+        ApiField("energy_data.vd_heating_day_and_total"),
     ),
     create_energy_entity_description(
         PRODUCED_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.vd_dhw_total,
+        ApiField("energy_data.vd_dhw_total"),
     ),
     create_energy_entity_description(
         PRODUCED_WATER_HEATING,
-        lambda api: api.energy_data.vd_dhw_day_and_total,
+        ApiField("energy_data.vd_dhw_day_and_total"),
     ),
     create_energy_entity_description(
         CONSUMED_HEATING_TOTAL,
-        lambda api: api.energy_data.vd_heating_total_consumed,
+        ApiField("energy_data.vd_heating_total_consumed"),
     ),
     create_energy_entity_description(
         CONSUMED_HEATING,
-        lambda api: api.energy_data.vd_heating_day_and_total_consumed,
+        ApiField("energy_data.vd_heating_day_and_total_consumed"),
     ),
     create_energy_entity_description(
         CONSUMED_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.vd_dhw_total_consumed,
+        ApiField("energy_data.vd_dhw_total_consumed"),
     ),
     create_energy_entity_description(
         CONSUMED_WATER_HEATING,
-        lambda api: api.energy_data.vd_dhw_day_and_total_consumed,
+        ApiField("energy_data.vd_dhw_day_and_total_consumed"),
     ),
     create_energy_entity_description(
         PRODUCED_ELECTRICAL_BOOSTER_HEATING_TOTAL,
-        lambda api: api.energy_data.nhz_heating_total,
+        ApiField("energy_data.nhz_heating_total"),
     ),
     create_energy_entity_description(
         PRODUCED_ELECTRICAL_BOOSTER_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.nhz_dhw_total,
+        ApiField("energy_data.nhz_dhw_total"),
     ),
 ]
 
 LWZ_ENERGY_SENSOR_TYPES = [
     create_energy_entity_description(
         PRODUCED_HEATING_TOTAL,
-        lambda api: api.energy_data.heat_meter_htg_ttl,
+        ApiField("energy_data.heat_meter_htg_ttl"),
     ),
     create_energy_entity_description(
         PRODUCED_HEATING,
-        lambda api: api.energy_data.heat_meter_htg_day_and_total,
+        ApiField("energy_data.heat_meter_htg_day_and_total"),
     ),
     create_energy_entity_description(
         PRODUCED_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.heat_meter_dhw_ttl,
+        ApiField("energy_data.heat_meter_dhw_ttl"),
     ),
     create_energy_entity_description(
         PRODUCED_WATER_HEATING,
-        lambda api: api.energy_data.heat_meter_dhw_day_and_total,
+        ApiField("energy_data.heat_meter_dhw_day_and_total"),
     ),
     create_energy_entity_description(
         CONSUMED_HEATING_TOTAL,
-        lambda api: api.energy_data.pwr_con_htg_ttl,
+        ApiField("energy_data.pwr_con_htg_ttl"),
     ),
     create_energy_entity_description(
         CONSUMED_HEATING,
-        lambda api: api.energy_data.pwr_con_htg_day_and_total,
+        ApiField("energy_data.pwr_con_htg_day_and_total"),
     ),
     create_energy_entity_description(
         CONSUMED_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.pwr_con_dhw_ttl,
+        ApiField("energy_data.pwr_con_dhw_ttl"),
     ),
     create_energy_entity_description(
         CONSUMED_WATER_HEATING,
-        lambda api: api.energy_data.pwr_con_dhw_day_and_total,
+        ApiField("energy_data.pwr_con_dhw_day_and_total"),
     ),
     create_energy_entity_description(
         PRODUCED_COOLING_TOTAL,
-        lambda api: api.energy_data.hm_cooling_total,
+        ApiField("energy_data.hm_cooling_total"),
     ),
     create_energy_entity_description(
         PRODUCED_ELECTRICAL_BOOSTER_HEATING_TOTAL,
-        lambda api: api.energy_data.heat_m_boost_htg_ttl,
+        ApiField("energy_data.heat_m_boost_htg_ttl"),
     ),
     create_energy_entity_description(
         PRODUCED_ELECTRICAL_BOOSTER_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.heat_m_boost_dhw_ttl,
+        ApiField("energy_data.heat_m_boost_dhw_ttl"),
     ),
     create_energy_entity_description(
         PRODUCED_RECOVERY,
-        lambda api: api.energy_data.heat_m_recovery_day_and_total,
+        ApiField("energy_data.heat_m_recovery_day_and_total"),
     ),
     create_energy_entity_description(
         PRODUCED_RECOVERY_TOTAL,
-        lambda api: api.energy_data.heat_m_recovery_ttl,
+        ApiField("energy_data.heat_m_recovery_ttl"),
     ),
     create_energy_entity_description(
         PRODUCED_SOLAR_HEATING,
-        lambda api: api.energy_data.hm_solar_htg_day_and_total,
+        ApiField("energy_data.hm_solar_htg_day_and_total"),
     ),
     create_energy_entity_description(
         PRODUCED_SOLAR_HEATING_TOTAL,
-        lambda api: api.energy_data.hm_solar_htg_total,
+        ApiField("energy_data.hm_solar_htg_total"),
     ),
     create_energy_entity_description(
         PRODUCED_SOLAR_WATER_HEATING_TOTAL,
-        lambda api: api.energy_data.hm_solar_dwh_total,
+        ApiField("energy_data.hm_solar_dwh_total"),
     ),
     create_energy_entity_description(
         PRODUCED_SOLAR_WATER_HEATING,
-        lambda api: api.energy_data.hm_solar_dhw_day_and_total,
+        ApiField("energy_data.hm_solar_dhw_day_and_total"),
     ),
 ]
 
 LWZ_EXTENDED_ENERGY_SENSOR_TYPES = [
     create_efficiency_entity_description(
         EFFICIENCY_HEATING_1_24_H,
-        lambda api: api.extended_energy_data.efficiency_heating_1_24_h,
+        ApiField("extended_energy_data.efficiency_heating_1_24_h"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_HEATING_1_12_M,
-        lambda api: api.extended_energy_data.efficiency_heating_1_12_m,
+        ApiField("extended_energy_data.efficiency_heating_1_12_m"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_HEATING_13_24_M,
-        lambda api: api.extended_energy_data.efficiency_heating_13_24_m,
+        ApiField("extended_energy_data.efficiency_heating_13_24_m"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_COOLING_1_24_H,
-        lambda api: api.extended_energy_data.efficiency_cooling_1_24_h,
+        ApiField("extended_energy_data.efficiency_cooling_1_24_h"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_COOLING_1_12_M,
-        lambda api: api.extended_energy_data.efficiency_cooling_1_12_m,
+        ApiField("extended_energy_data.efficiency_cooling_1_12_m"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_COOLING_13_24_M,
-        lambda api: api.extended_energy_data.efficiency_cooling_13_24_m,
+        ApiField("extended_energy_data.efficiency_cooling_13_24_m"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_DHW_1_24_H,
-        lambda api: api.extended_energy_data.efficiency_dhw_1_24_h,
+        ApiField("extended_energy_data.efficiency_dhw_1_24_h"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_DHW_1_12_M,
-        lambda api: api.extended_energy_data.efficiency_dhw_1_12_m,
+        ApiField("extended_energy_data.efficiency_dhw_1_12_m"),
     ),
     create_efficiency_entity_description(
         EFFICIENCY_DHW_13_24_M,
-        lambda api: api.extended_energy_data.efficiency_dhw_13_24_m,
+        ApiField("extended_energy_data.efficiency_dhw_13_24_m"),
     ),
 ]
 
 ENERGY_DAILY_SENSOR_TYPES = [
     create_daily_energy_entity_description(
         PRODUCED_HEATING_TODAY,
-        lambda api: api.energy_data.vd_heating_day,
+        ApiField("energy_data.vd_heating_day"),
     ),
     create_daily_energy_entity_description(
         PRODUCED_WATER_HEATING_TODAY,
-        lambda api: api.energy_data.vd_dhw_day,
+        ApiField("energy_data.vd_dhw_day"),
     ),
     create_daily_energy_entity_description(
         CONSUMED_HEATING_TODAY,
-        lambda api: api.energy_data.vd_heating_day_consumed,
+        ApiField("energy_data.vd_heating_day_consumed"),
     ),
     create_daily_energy_entity_description(
         CONSUMED_WATER_HEATING_TODAY,
-        lambda api: api.energy_data.vd_dhw_day_consumed,
+        ApiField("energy_data.vd_dhw_day_consumed"),
     ),
 ]
 
 LWZ_ENERGY_DAILY_SENSOR_TYPES = [
     create_daily_energy_entity_description(
         PRODUCED_HEATING_TODAY,
-        lambda api: api.energy_data.heat_meter_htg_day,
+        ApiField("energy_data.heat_meter_htg_day"),
     ),
     create_daily_energy_entity_description(
         PRODUCED_WATER_HEATING_TODAY,
-        lambda api: api.energy_data.heat_meter_dhw_day,
+        ApiField("energy_data.heat_meter_dhw_day"),
     ),
     create_daily_energy_entity_description(
         CONSUMED_HEATING_TODAY,
-        lambda api: api.energy_data.pwr_con_htg_day,
+        ApiField("energy_data.pwr_con_htg_day"),
     ),
     create_daily_energy_entity_description(
         CONSUMED_WATER_HEATING_TODAY,
-        lambda api: api.energy_data.pwr_con_dhw_day,
+        ApiField("energy_data.pwr_con_dhw_day"),
     ),
     create_daily_energy_entity_description(
         PRODUCED_RECOVERY_TODAY,
-        lambda api: api.energy_data.heat_m_recovery_day,
+        ApiField("energy_data.heat_m_recovery_day"),
     ),
     create_daily_energy_entity_description(
         PRODUCED_SOLAR_HEATING_TODAY,
-        lambda api: api.energy_data.hm_solar_htg_day,
+        ApiField("energy_data.hm_solar_htg_day"),
     ),
     create_daily_energy_entity_description(
         PRODUCED_SOLAR_WATER_HEATING_TODAY,
-        lambda api: api.energy_data.hm_solar_dhw_day,
+        ApiField("energy_data.hm_solar_dhw_day"),
     ),
 ]
 
@@ -1016,7 +1026,7 @@ LWZ_COMPRESSOR_SENSOR_TYPES = [
     StiebelEltronSensorEntityDescription(
         key=COMPRESSOR_STARTS,
         translation_key=COMPRESSOR_STARTS,
-        modbus_register=lambda api: api.system_values.compressor_starts,
+        modbus_register=ApiField("system_values.compressor_starts"),
     ),
     StiebelEltronSensorEntityDescription(
         key=COMPRESSOR_SPEED,
@@ -1024,27 +1034,27 @@ LWZ_COMPRESSOR_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
-        modbus_register=lambda api: api.system_values.compressor_speed,
+        modbus_register=ApiField("system_values.compressor_speed"),
     ),
     create_runtime_entity_description(
         COMPRESSOR_HEATING,
-        lambda api: api.energy_data.compressor_heating,
+        ApiField("energy_data.compressor_heating"),
     ),
     create_runtime_entity_description(
         COMPRESSOR_HEATING_WATER,
-        lambda api: api.energy_data.compressor_dhw,
+        ApiField("energy_data.compressor_dhw"),
     ),
     create_runtime_entity_description(
         COMPRESSOR_COOLING,
-        lambda api: api.energy_data.compressor_cooling,
+        ApiField("energy_data.compressor_cooling"),
     ),
     create_runtime_entity_description(
         ELECTRICAL_BOOSTER_HEATING,
-        lambda api: api.energy_data.elec_booster_heating,
+        ApiField("energy_data.elec_booster_heating"),
     ),
     create_runtime_entity_description(
         ELECTRICAL_BOOSTER_HEATING_WATER,
-        lambda api: api.energy_data.elec_booster_dhw,
+        ApiField("energy_data.elec_booster_dhw"),
     ),
 ]
 
@@ -1055,7 +1065,7 @@ LWZ_VENTILATION_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
-        modbus_register=lambda api: api.system_values.ventilation_air_actual_fan_speed,
+        modbus_register=ApiField("system_values.ventilation_air_actual_fan_speed"),
     ),
     StiebelEltronSensorEntityDescription(
         key=VENTILATION_AIR_TARGET_FLOW_RATE,
@@ -1063,7 +1073,7 @@ LWZ_VENTILATION_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
-        modbus_register=lambda api: api.system_values.ventilation_air_set_flow_rate,
+        modbus_register=ApiField("system_values.ventilation_air_set_flow_rate"),
     ),
     StiebelEltronSensorEntityDescription(
         key=EXTRACT_AIR_ACTUAL_FAN_SPEED,
@@ -1071,7 +1081,7 @@ LWZ_VENTILATION_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
-        modbus_register=lambda api: api.system_values.extract_air_actual_fan_speed,
+        modbus_register=ApiField("system_values.extract_air_actual_fan_speed"),
     ),
     StiebelEltronSensorEntityDescription(
         key=EXTRACT_AIR_TARGET_FLOW_RATE,
@@ -1079,19 +1089,19 @@ LWZ_VENTILATION_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
-        modbus_register=lambda api: api.system_values.extract_air_set_flow_rate,
+        modbus_register=ApiField("system_values.extract_air_set_flow_rate"),
     ),
     create_temperature_entity_description(
         EXTRACT_AIR_DEW_POINT,
-        lambda api: api.system_values.extract_air_dew_point,
+        ApiField("system_values.extract_air_dew_point"),
     ),
     create_humidity_entity_description(
         EXTRACT_AIR_HUMIDITY,
-        lambda api: api.system_values.extract_air_humidity,
+        ApiField("system_values.extract_air_humidity"),
     ),
     create_temperature_entity_description(
         EXTRACT_AIR_TEMPERATURE,
-        lambda api: api.system_values.extract_air_temp,
+        ApiField("system_values.extract_air_temp"),
     ),
 ]
 
@@ -1099,18 +1109,18 @@ LWZ_VENTILATION_SENSOR_TYPES = [
 WPM_COMPRESSOR_SENSOR_TYPES = [
     create_runtime_entity_description(
         COMPRESSOR_HEATING,
-        lambda api: api.energy_data.vd_heating,
+        ApiField("energy_data.vd_heating"),
     ),
     create_runtime_entity_description(
         COMPRESSOR_HEATING_WATER,
-        lambda api: api.energy_data.vd_dhw,
+        ApiField("energy_data.vd_dhw"),
     ),
     # Firmware register "VD KÜHLEN". On brine/ground-source systems cooling is
     # passive (no compressor runs), so this counts cooling operation hours
     # rather than compressor hours - hence the neutral name.
     create_runtime_entity_description(
         COOLING_RUNTIME,
-        lambda api: api.energy_data.vd_cooling,
+        ApiField("energy_data.vd_cooling"),
     ),
 ]
 
@@ -1125,42 +1135,42 @@ WPM_COMPRESSOR_SENSOR_TYPES = [
 WPM_POWER_CONSUMPTION_SENSOR_TYPES = [
     create_power_consumption_entity_description(
         CONSUMED_HEATING_LAST_24H,
-        lambda api: api.extended_energy_data.heating_24h,
+        ApiField("extended_energy_data.heating_24h"),
         UnitOfEnergy.WATT_HOUR,
     ),
     create_power_consumption_entity_description(
         CONSUMED_HEATING_12M,
-        lambda api: api.extended_energy_data.heating_12m,
+        ApiField("extended_energy_data.heating_12m"),
     ),
     create_power_consumption_entity_description(
         CONSUMED_HEATING_PREV_12M,
-        lambda api: api.extended_energy_data.heating_13_24,
+        ApiField("extended_energy_data.heating_13_24"),
     ),
     create_power_consumption_entity_description(
         CONSUMED_COOLING_LAST_24H,
-        lambda api: api.extended_energy_data.cooling_24h,
+        ApiField("extended_energy_data.cooling_24h"),
         UnitOfEnergy.WATT_HOUR,
     ),
     create_power_consumption_entity_description(
         CONSUMED_COOLING_12M,
-        lambda api: api.extended_energy_data.cooling_12m,
+        ApiField("extended_energy_data.cooling_12m"),
     ),
     create_power_consumption_entity_description(
         CONSUMED_COOLING_PREV_12M,
-        lambda api: api.extended_energy_data.cooling_13_24,
+        ApiField("extended_energy_data.cooling_13_24"),
     ),
     create_power_consumption_entity_description(
         CONSUMED_WATER_HEATING_LAST_24H,
-        lambda api: api.extended_energy_data.dhw_24h,
+        ApiField("extended_energy_data.dhw_24h"),
         UnitOfEnergy.WATT_HOUR,
     ),
     create_power_consumption_entity_description(
         CONSUMED_WATER_HEATING_12M,
-        lambda api: api.extended_energy_data.dhw_12m,
+        ApiField("extended_energy_data.dhw_12m"),
     ),
     create_power_consumption_entity_description(
         CONSUMED_WATER_HEATING_PREV_12M,
-        lambda api: api.extended_energy_data.dhw_13_24,
+        ApiField("extended_energy_data.dhw_13_24"),
     ),
 ]
 
@@ -1180,7 +1190,7 @@ WPM_INVERTER_POWER_SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER,
-        modbus_register=lambda api: api.extended_energy_data.inverter_power_iws_1,
+        modbus_register=ApiField("extended_energy_data.inverter_power_iws_1"),
     ),
 ]
 
@@ -1210,6 +1220,96 @@ LWZ_SENSOR_TYPES = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class StiebelEltronInstrumentationSensorEntityDescription(SensorEntityDescription):
+    """Entity description for a figure of the coordinator's instrumentation."""
+
+    value_fn: Callable[[Instrumentation], float | int | None]
+
+
+def _create_duration_entity_description(
+    key: str, value_fn: Callable[[Instrumentation], float | int | None]
+) -> StiebelEltronInstrumentationSensorEntityDescription:
+    """Create an entry description for the last duration of an operation."""
+    return StiebelEltronInstrumentationSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=value_fn,
+    )
+
+
+def _create_counter_entity_description(
+    key: str, value_fn: Callable[[Instrumentation], float | int | None]
+) -> StiebelEltronInstrumentationSensorEntityDescription:
+    """Create an entry description for a counter since the integration started."""
+    return StiebelEltronInstrumentationSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=value_fn,
+    )
+
+
+INSTRUMENTATION_SENSOR_TYPES = [
+    _create_duration_entity_description(
+        REFRESH_DURATION, lambda metrics: metrics.refresh_duration.last
+    ),
+    _create_duration_entity_description(
+        WRITE_DURATION, lambda metrics: metrics.write_duration.last
+    ),
+    _create_counter_entity_description(
+        MODBUS_READS, lambda metrics: metrics.traffic.reads
+    ),
+    _create_counter_entity_description(
+        MODBUS_REGISTERS_READ, lambda metrics: metrics.traffic.registers_read
+    ),
+    StiebelEltronInstrumentationSensorEntityDescription(
+        key=MODBUS_BYTES_READ,
+        translation_key=MODBUS_BYTES_READ,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.traffic.bytes_read,
+    ),
+    _create_counter_entity_description(
+        MODBUS_ERRORS, lambda metrics: metrics.traffic.errors
+    ),
+    _create_counter_entity_description(
+        ACCESSOR_ERRORS, lambda metrics: metrics.accessor_errors
+    ),
+    StiebelEltronInstrumentationSensorEntityDescription(
+        key=ENTITIES_NOTIFIED,
+        translation_key=ENTITIES_NOTIFIED,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.entities_notified,
+    ),
+]
+
+
+# Only WPMsystem is measured to answer wire 3679. A WPM 3i refuses it
+# outright, and nothing is known about WPM_3 or LWZ_R290, so the inverter sensor
+# stays off the shared list rather than risk an entity that can never hold a
+# value.
+SENSOR_TYPES_BY_MODEL = descriptions_by_model(
+    wpm_3i=[*WPM_3I_SENSOR_TYPES, *ENERGY_DAILY_SENSOR_TYPES],
+    wpm=[*WPM_SENSOR_TYPES, *ENERGY_DAILY_SENSOR_TYPES],
+    lwz=[*LWZ_SENSOR_TYPES, *LWZ_ENERGY_DAILY_SENSOR_TYPES],
+    extra={ControllerModel.WPMsystem: WPM_INVERTER_POWER_SENSOR_TYPES},
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,  # Unused function argument: `hass`
     entry: StiebelEltronConfigEntry,
@@ -1218,74 +1318,15 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = entry.runtime_data
 
-    if coordinator.model == ControllerModel.WPM_3i:
-        entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_3I_SENSOR_TYPES
-        ]
-        daily_energy_entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in ENERGY_DAILY_SENSOR_TYPES
-        ]
-        entities.extend(daily_energy_entities)
-    elif coordinator.model in (
-        ControllerModel.WPM_3,
-        ControllerModel.WPMsystem,
-        ControllerModel.LWZ_R290,
-    ):
-        entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in WPM_SENSOR_TYPES
-        ]
-        daily_energy_entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in ENERGY_DAILY_SENSOR_TYPES
-        ]
-        entities.extend(daily_energy_entities)
-        if coordinator.model == ControllerModel.WPMsystem:
-            # Only WPMsystem is measured to answer wire 3679. A WPM 3i refuses
-            # it outright, and nothing is known about WPM_3 or LWZ_R290, so the
-            # sensor stays off the shared list rather than risk an entity that
-            # can never hold a value.
-            entities.extend(
-                StiebelEltronISGSensor(coordinator, entry, description)
-                for description in WPM_INVERTER_POWER_SENSOR_TYPES
-            )
-    else:
-        entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in LWZ_SENSOR_TYPES
-        ]
-        daily_energy_entities = [
-            StiebelEltronISGSensor(
-                coordinator,
-                entry,
-                description,
-            )
-            for description in LWZ_ENERGY_DAILY_SENSOR_TYPES
-        ]
-        entities.extend(daily_energy_entities)
-    async_add_devices(entities)
+    coordinator.async_add_answered_entities(
+        async_add_devices,
+        SENSOR_TYPES_BY_MODEL[coordinator.model],
+        lambda description: StiebelEltronISGSensor(coordinator, entry, description),
+    )
+    async_add_devices(
+        StiebelEltronISGInstrumentationSensor(coordinator, entry, description)
+        for description in INSTRUMENTATION_SENSOR_TYPES
+    )
 
 
 class StiebelEltronISGSensor(StiebelEltronISGEntity, SensorEntity):
@@ -1306,11 +1347,43 @@ class StiebelEltronISGSensor(StiebelEltronISGEntity, SensorEntity):
     def native_value(self) -> str | float | None:
         """Return the state of the sensor."""
         if self.entity_description.key == ACTIVE_ERROR:
-            error_raw = self.coordinator.get_value(self.modbus_register)
+            error_raw = self._read()
             if error_raw is None:
                 return None
             error = int(error_raw)
             if error in (32768, 0):
                 return "no error"
             return f"error {error}"
-        return self.coordinator.get_value(self.modbus_register)
+        return self._read()
+
+
+class StiebelEltronISGInstrumentationSensor(StiebelEltronISGEntity, SensorEntity):
+    """Report a figure of the coordinator's own instrumentation."""
+
+    entity_description: StiebelEltronInstrumentationSensorEntityDescription
+    _wake_on_every_refresh = True
+
+    def __init__(
+        self,
+        coordinator: AnyStiebelEltronDataCoordinator,
+        config_entry: StiebelEltronConfigEntry,
+        description: StiebelEltronInstrumentationSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        super().__init__(coordinator, config_entry)
+
+    @property
+    def value_references(self) -> tuple[()]:
+        """Return no accessors, the figures are not read from the API."""
+        return ()
+
+    @property
+    def available(self) -> bool:
+        """Stay available, the figures matter most while polling fails."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the figure."""
+        return self.entity_description.value_fn(self.coordinator.instrumentation)
@@ -0,0 +1,95 @@
+"""Actions of the Stiebel Eltron ISG integration."""
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
+
+from .const import ATTR_BUCKETS, ATTR_DURATION, DOMAIN, SERVICE_GET_HISTORY
+from .coordinator import StiebelEltronConfigEntry
+from .entity import build_unique_id
+
+GET_HISTORY_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Optional(ATTR_DURATION, default=timedelta(hours=1)): vol.All(
+        cv.time_period, cv.positive_timedelta
+    ),
+    vol.Optional(ATTR_BUCKETS, default=60): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=1000)
+    ),
+})
+
+
+def _history_error(key: str, entity_id: str) -> ServiceValidationError:
+    return ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key=key,
+        translation_placeholders={"entity_id": entity_id},
+    )
+
+
+def _entity_history(
+    hass: HomeAssistant,
+    entity_id: str,
+    start: float,
+    end: float,
+    buckets: int,
+) -> dict[str, Any]:
+    """Return the history the coordinator of ``entity_id`` kept for it."""
+    registry_entry = er.async_get(hass).async_get(entity_id)
+    if registry_entry is None or registry_entry.platform != DOMAIN:
+        raise _history_error("history_unknown_entity", entity_id)
+    entry: StiebelEltronConfigEntry | None = hass.config_entries.async_get_entry(
+        registry_entry.config_entry_id or ""
+    )
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        raise _history_error("history_not_loaded", entity_id)
+    coordinator = entry.runtime_data
+    key = registry_entry.unique_id.removeprefix(build_unique_id(entry, ""))
+    if (field := coordinator.history_field(key)) is None:
+        raise _history_error("history_not_kept", entity_id)
+    path, bit = field
+    return {
+        "field": path,
+        "buckets": coordinator.history.series(path, start, end, buckets, bit),
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the actions, which serve every entry of the integration."""
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return the recent samples of entities, downsampled into buckets.
+
+        The samples come from the history the coordinators keep in memory, at
+        the resolution they were polled at, rather than from the recorder.
+        """
+        end = dt_util.utcnow().timestamp()
+        start = end - call.data[ATTR_DURATION].total_seconds()
+        return {
+            entity_id: _entity_history(
+                hass, entity_id, start, end, call.data[ATTR_BUCKETS]
+            )
+            for entity_id in call.data[ATTR_ENTITY_ID]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,194 @@
+"""Keep the registers last read from the controller across restarts."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from modbus_connection import ModbusError, ModbusUnit
+
+from .const import DOMAIN, SNAPSHOT_MAX_AGE, SNAPSHOT_SAVE_DELAY
+
+SNAPSHOT_STORAGE_VERSION = 1
+
+# The register values by address space ("holding", "input", "coil" or
+# "discrete") and address.
+type Registers = dict[str, dict[int, int | bool]]
+
+
+@dataclass
+class RegisterImage:
+    """The value each register had when it was read last."""
+
+    registers: Registers = field(default_factory=dict)
+
+    def record(self, space: str, address: int, values: list[Any]) -> None:
+        """Keep the values of a block read at ``address``."""
+        registers = self.registers.setdefault(space, {})
+        for offset, value in enumerate(values):
+            registers[address + offset] = value
+
+
+class _RecordingUnit:
+    """Pass requests on to a unit and keep what its reads answered.
+
+    Only the register and coil reads the API components make are recorded;
+    everything else is handed to the unit as is.
+    """
+
+    def __init__(self, unit: ModbusUnit, image: RegisterImage) -> None:
+        self._unit = unit
+        self._image = image
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._unit, name)
+
+    async def _read[R: list[Any]](
+        self, read: Callable[..., Any], space: str, address: int, count: int
+    ) -> R:
+        result: R = await read(address, count)
+        self._image.record(space, address, result)
+        return result
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        return await self._read(
+            self._unit.read_holding_registers, "holding", address, count
+        )
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        return await self._read(
+            self._unit.read_input_registers, "input", address, count
+        )
+
+    async def read_coils(self, address: int, count: int) -> list[bool]:
+        return await self._read(self._unit.read_coils, "coil", address, count)
+
+    async def read_discrete_inputs(self, address: int, count: int) -> list[bool]:
+        return await self._read(
+            self._unit.read_discrete_inputs, "discrete", address, count
+        )
+
+
+def record_registers(unit: ModbusUnit, image: RegisterImage) -> ModbusUnit:
+    """Return ``unit`` with the answers to its reads recorded in ``image``."""
+    # The wrapper hands every other request of the protocol on via __getattr__,
+    # which a static protocol check cannot see.
+    return cast(ModbusUnit, _RecordingUnit(unit, image))
+
+
+class _SnapshotUnit:
+    """Answer register and coil reads from a snapshot, without a device.
+
+    A read of a register the snapshot does not hold fails, so a component is
+    only restored with every one of its registers.
+    """
+
+    def __init__(self, registers: Registers) -> None:
+        self._registers = registers
+
+    def _read(self, space: str, address: int, count: int) -> list[Any]:
+        registers = self._registers.get(space, {})
+        try:
+            return [registers[address + offset] for offset in range(count)]
+        except KeyError as err:
+            raise ModbusError(f"{space} register {err} is not in the snapshot") from err
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        return self._read("holding", address, count)
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        return self._read("input", address, count)
+
+    async def read_coils(self, address: int, count: int) -> list[bool]:
+        return self._read("coil", address, count)
+
+    async def read_discrete_inputs(self, address: int, count: int) -> list[bool]:
+        return self._read("discrete", address, count)
+
+
+def snapshot_unit(registers: Registers) -> ModbusUnit:
+    """Return a unit that reads ``registers`` instead of a device."""
+    # Only the reads a component makes are served, which is all the restore
+    # asks of the unit.
+    return cast(ModbusUnit, _SnapshotUnit(registers))
+
+
+@dataclass
+class Snapshot:
+    """Registers saved by an earlier run, and when each component was read."""
+
+    registers: Registers
+    read_at: dict[str, datetime]
+
+
+class SnapshotStore:
+    """Save the registers of a config entry's controller and load them again."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Store the snapshot of ``entry`` in its own file."""
+        self._store = snapshot_store(hass, entry)
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self, model_id: int) -> Snapshot | None:
+        """Return the saved snapshot of ``model_id``, without the outdated reads.
+
+        A snapshot of another controller model would decode into the wrong
+        values, and one without a recent read is of no use.
+        """
+        data = await self._store.async_load()
+        if data is None or data.get("model_id") != model_id:
+            return None
+        oldest = dt_util.utcnow() - timedelta(seconds=SNAPSHOT_MAX_AGE)
+        read_at = {
+            component: read
+            for component, timestamp in data["read_at"].items()
+            if (read := dt_util.parse_datetime(timestamp)) is not None and read > oldest
+        }
+        if not read_at:
+            return None
+        registers: Registers = {
+            space: {int(address): value for address, value in values.items()}
+            for space, values in data["registers"].items()
+        }
+        return Snapshot(registers, read_at)
+
+    def schedule_save(
+        self, model_id: int, image: RegisterImage, read_at: dict[str, datetime]
+    ) -> None:
+        """Save the registers a while after the poll, or on shutdown.
+
+        A save that is already scheduled saves the registers as they are then,
+        and is not postponed by later polls.
+        """
+        if self._data_func is not None:
+            return
+
+        def data() -> dict[str, Any]:
+            self._data_func = None
+            return {
+                "model_id": model_id,
+                "read_at": {
+                    component: read.isoformat() for component, read in read_at.items()
+                },
+                "registers": {
+                    space: {str(address): value for address, value in values.items()}
+                    for space, values in image.registers.items()
+                },
+            }
+
+        self._data_func = data
+        self._store.async_delay_save(data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save a scheduled snapshot right away, before the entry unloads."""
+        if self._data_func is not None:
+            await self._store.async_save(self._data_func())
+
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store that holds the snapshot of ``entry``."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry.entry_id}")
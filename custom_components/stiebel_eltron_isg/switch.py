@@ -14,7 +14,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import SG_READY_ACTIVE, SG_READY_INPUT_1, SG_READY_INPUT_2
 from .coordinator import AnyStiebelEltronDataCoordinator, StiebelEltronConfigEntry
-from .entity import StiebelEltronISGEntity
+from .entity import OptimisticValueMixin, StiebelEltronISGEntity
+from .references import ApiField
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,11 +31,11 @@ class StiebelEltronSwitchEntityDescription(SwitchEntityDescription):
     write_field: str | None = None
 
     def __post_init__(self) -> None:
-        """Ensure value references are lambda-based."""
+        """Ensure the value reference is an API field or an accessor."""
         if callable(self.modbus_register):
             return
 
-        raise TypeError("modbus_register must be a lambda expression")
+        raise TypeError("modbus_register must be a lambda expression or an ApiField")
 
 
 SWITCH_TYPES = [
@@ -42,8 +43,8 @@ SWITCH_TYPES = [
         key=SG_READY_ACTIVE,
         translation_key=SG_READY_ACTIVE,
         device_class=SwitchDeviceClass.SWITCH,
-        modbus_register=lambda api: (
-            api.energy_management_settings.switch_sg_ready_on_and_off
+        modbus_register=ApiField(
+            "energy_management_settings.switch_sg_ready_on_and_off"
         ),
         write_component="energy_management_settings",
         write_field="switch_sg_ready_on_and_off",
@@ -52,7 +53,7 @@ SWITCH_TYPES = [
         key=SG_READY_INPUT_1,
         translation_key=SG_READY_INPUT_1,
         device_class=SwitchDeviceClass.SWITCH,
-        modbus_register=lambda api: api.energy_management_settings.sg_ready_input_1,
+        modbus_register=ApiField("energy_management_settings.sg_ready_input_1"),
         write_component="energy_management_settings",
         write_field="sg_ready_input_1",
     ),
@@ -60,7 +61,7 @@ SWITCH_TYPES = [
         key=SG_READY_INPUT_2,
         translation_key=SG_READY_INPUT_2,
         device_class=SwitchDeviceClass.SWITCH,
-        modbus_register=lambda api: api.energy_management_settings.sg_ready_input_2,
+        modbus_register=ApiField("energy_management_settings.sg_ready_input_2"),
         write_component="energy_management_settings",
         write_field="sg_ready_input_2",
     ),
@@ -75,19 +76,16 @@ async def async_setup_entry(
     """Set up the switch platform."""
     coordinator = entry.runtime_data
 
-    entities = [
-        StiebelEltronISGSwitch(
-            coordinator,
-            entry,
-            description,
-        )
-        for description in SWITCH_TYPES
-    ]
-
-    async_add_devices(entities)
+    coordinator.async_add_answered_entities(
+        async_add_devices,
+        SWITCH_TYPES,
+        lambda description: StiebelEltronISGSwitch(coordinator, entry, description),
+    )
 
 
-class StiebelEltronISGSwitch(StiebelEltronISGEntity, SwitchEntity):
+class StiebelEltronISGSwitch(
+    OptimisticValueMixin, StiebelEltronISGEntity, SwitchEntity
+):
     """stiebel_eltron_isg Sensor class."""
 
     def __init__(
@@ -106,7 +104,7 @@ class StiebelEltronISGSwitch(StiebelEltronISGEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return the state of the switch."""
-        value = self.coordinator.get_value(self.modbus_register)
+        value = self._current_value()
         if value is not None:
             return value != 0
         return False
@@ -119,12 +117,18 @@ class StiebelEltronISGSwitch(StiebelEltronISGEntity, SwitchEntity):
         """Turn the device off."""
         await self._async_set_state(0)
 
+    def _current_value(self) -> float | int | None:
+        """Return the written state until the device reports its own."""
+        if self._optimistic_value is not None:
+            return self._optimistic_value
+        return self._read()
+
     async def _async_set_state(self, value: int) -> None:
-        """Write a changed switch state and refresh its read-back value."""
+        """Write a changed switch state and show it until it is read back."""
         if self.write_component is None or self.write_field is None:
             return
 
-        current = self.coordinator.get_value(self.modbus_register)
+        current = self._current_value()
         if current is not None and bool(current) == bool(value):
             return
 
@@ -133,7 +137,7 @@ class StiebelEltronISGSwitch(StiebelEltronISGEntity, SwitchEntity):
             self.write_field,
             value,
         )
-        await self.async_update()
+        self._set_optimistic_value(value)
 
     @property
     def available(self) -> bool:
@@ -142,5 +146,5 @@ class StiebelEltronISGSwitch(StiebelEltronISGEntity, SwitchEntity):
             # These writable switches stay operable even when the device does
             # not report a read-back value, but must still go unavailable when
             # the coordinator can no longer reach the device.
-            return self.coordinator.last_update_success
+            return self.coordinator.is_available(self.value_references)
         return super().available
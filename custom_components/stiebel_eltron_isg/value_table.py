@@ -0,0 +1,191 @@
+"""The values the listeners read, kept in columns addressed by slot."""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from .references import ApiField, ValueReference
+
+# What a slot holds. An unread slot is resolved again when it is next asked
+# for, because a component it reads was read since.
+UNREAD = 0
+_MISSING = 1
+_INT = 2
+_FLOAT = 3
+_BOOL = 4
+# Only ever held by the notified copy, so the slot differs from any value.
+_EXPIRED = 5
+
+
+class ValueTable:
+    """One slot per value reference, the values held in a double array.
+
+    A reference gets its slot the first time it is asked for and keeps it, so
+    a listener can be told about its slots and the table compared column by
+    column. ``kinds`` tells for each slot whether the value is missing or an
+    int, float or bool, and doubles as the mask of the slots that hold a
+    value. Slots are invalidated by the components their references read, so
+    a poll only resolves the values of what it read again.
+    """
+
+    def __init__(
+        self, components_of: Callable[[ValueReference], frozenset[str] | None]
+    ) -> None:
+        """Start without any slot, placing slots by ``components_of``."""
+        self._components_of = components_of
+        self._slots: dict[ValueReference, int] = {}
+        self.references: list[ValueReference] = []
+        self.values = array("d")
+        self.kinds = bytearray()
+        self._by_component: dict[str, list[int]] = {}
+        # The slots of references whose components are unknown, which every
+        # read may have changed.
+        self._unplaced: list[int] = []
+        # The slots added since the last invalidation. Finding the components
+        # of a reference may have to run it, so that waits for the next read.
+        self._added: list[int] = []
+        # The columns as the listeners were last told about them.
+        self._notified_values = b""
+        self._notified_kinds = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return len(self.references)
+
+    def find(self, reference: ValueReference) -> int | None:
+        """Return the slot of ``reference``, or None if it has none yet."""
+        return self._slots.get(reference)
+
+    def add(self, reference: ValueReference) -> int:
+        """Give ``reference`` the next slot."""
+        slot = self._slots[reference] = len(self.references)
+        self.references.append(reference)
+        self.values.append(0.0)
+        self.kinds.append(UNREAD)
+        self._added.append(slot)
+        return slot
+
+    def _place(self) -> None:
+        """File the slots added since by the components their references read."""
+        for slot in self._added:
+            components = self._components_of(self.references[slot])
+            if components:
+                for component in components:
+                    self._by_component.setdefault(component, []).append(slot)
+            else:
+                self._unplaced.append(slot)
+        self._added.clear()
+
+    def read(self, slot: int) -> float | int | None:
+        """Return the value a resolved slot holds."""
+        kind = self.kinds[slot]
+        if kind == _FLOAT:
+            return self.values[slot]
+        if kind == _INT:
+            return int(self.values[slot])
+        if kind == _BOOL:
+            return bool(self.values[slot])
+        return None
+
+    def store(self, slot: int, value: float | int | None) -> None:
+        """Resolve a slot to ``value``."""
+        if value is None:
+            self.values[slot] = 0.0
+            self.kinds[slot] = _MISSING
+            return
+        self.values[slot] = value
+        if isinstance(value, bool):
+            self.kinds[slot] = _BOOL
+        elif isinstance(value, int):
+            self.kinds[slot] = _INT
+        else:
+            self.kinds[slot] = _FLOAT
+
+    def invalidate(self, components: Iterable[str] | None) -> None:
+        """Mark the slots reading ``components`` unread, or every slot for None."""
+        kinds = self.kinds
+        self._place()
+        if components is None:
+            kinds[:] = bytes(len(kinds))
+            return
+        for slot in self._unplaced:
+            kinds[slot] = UNREAD
+        for component in components:
+            for slot in self._by_component.get(component, ()):
+                kinds[slot] = UNREAD
+
+    def unread(self) -> Iterator[int]:
+        """Yield the slots to resolve, scanning the kinds for unread ones."""
+        kinds = self.kinds
+        slot = kinds.find(UNREAD)
+        while slot != -1:
+            yield slot
+            slot = kinds.find(UNREAD, slot + 1)
+
+    def slots_of(self, components: Iterable[str]) -> set[int]:
+        """Return the slots whose references read any of ``components``."""
+        self._place()
+        slots: set[int] = set()
+        for component in components:
+            slots.update(self._by_component.get(component, ()))
+        return slots
+
+    def fields_of(self, component: str) -> Iterator[tuple[str, float | int | None]]:
+        """Yield the path and value of each API field ``component`` holds."""
+        self._place()
+        for slot in self._by_component.get(component, ()):
+            reference = self.references[slot]
+            if isinstance(reference, ApiField):
+                yield reference.path, self.read(slot)
+
+    def expire(self, slot: int) -> None:
+        """Report ``slot`` as changed by the next ``take_changes``."""
+        if slot < len(self._notified_kinds):
+            self._notified_kinds[slot] = _EXPIRED
+
+    def take_changes(self) -> set[int]:
+        """Return the slots that changed since the last call, and remember them.
+
+        The columns are compared as a whole, and only a range that differs is
+        split in halves to find its slots, so a poll that changed nothing
+        costs two comparisons. A slot added since counts as changed.
+        """
+        values = self.values.tobytes()
+        kinds = bytes(self.kinds)
+        notified = len(self._notified_kinds)
+        changed = set(range(notified, len(kinds)))
+        self._differing(values, kinds, 0, notified, changed)
+        self._notified_values = values
+        self._notified_kinds = bytearray(kinds)
+        return changed
+
+    def _differing(
+        self, values: bytes, kinds: bytes, start: int, stop: int, changed: set[int]
+    ) -> None:
+        """Add the slots from ``start`` to ``stop`` that differ to ``changed``."""
+        if start >= stop:
+            return
+        width = self.values.itemsize
+        if (
+            kinds[start:stop] == self._notified_kinds[start:stop]
+            and values[start * width : stop * width]
+            == self._notified_values[start * width : stop * width]
+        ):
+            return
+        if stop - start == 1:
+            changed.add(start)
+            return
+        middle = (start + stop) // 2
+        self._differing(values, kinds, start, middle, changed)
+        self._differing(values, kinds, middle, stop, changed)
+
+    def read_fields(self) -> dict[str, float | int | None]:
+        """Return the resolved values of the API fields by their path.
+
+        The columns are read as they are, without resolving a value again.
+        """
+        kinds = self.kinds
+        return {
+            reference.path: self.read(slot)
+            for slot, reference in enumerate(self.references)
+            if isinstance(reference, ApiField) and kinds[slot] > _MISSING
+        }
@@ -7,17 +7,24 @@ https://github.com/pail23/stiebel_eltron_isg
 import logging
 
 from homeassistant.core import HomeAssistant
-from modbus_connection import ModbusConnection
+from modbus_connection import ModbusConnection, ModbusUnit
 from pystiebeleltron import ControllerModel
 from pystiebeleltron.wpm import WpmStiebelEltronAPI
 
-from custom_components.stiebel_eltron_isg.const import UNIT_ID
+from custom_components.stiebel_eltron_isg.const import (
+    COMPRESSOR_ON,
+    EVAPORATOR_DEFROST,
+    IS_COOLING,
+    IS_HEATING,
+    IS_HEATING_WATER,
+)
 
 from .coordinator import (
     StiebelEltronConfigEntry,
     StiebelEltronConnectionParams,
     StiebelEltronDataCoordinator,
 )
+from .references import RegisterBit, operating_status
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -27,6 +34,14 @@ class StiebelEltronModbusWPMDataCoordinator(
 ):
     """Communicates with WPM Controllers."""
 
+    activity_signals = (
+        (IS_HEATING, RegisterBit(operating_status, 4)),
+        (IS_HEATING_WATER, RegisterBit(operating_status, 5)),
+        (COMPRESSOR_ON, RegisterBit(operating_status, 6)),
+        (IS_COOLING, RegisterBit(operating_status, 8)),
+        (EVAPORATOR_DEFROST, RegisterBit(operating_status, 9)),
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -36,14 +51,11 @@ class StiebelEltronModbusWPMDataCoordinator(
         host: str,
     ) -> None:
         """Initialize the Modbus hub."""
-
-        super().__init__(
-            hass,
-            entry,
-            WpmStiebelEltronAPI(connection.for_unit(UNIT_ID)),
-            StiebelEltronConnectionParams(
-                host=host,
-                model=model,
-                connection=connection,
-            ),
+        params = StiebelEltronConnectionParams(
+            host=host, model=model, connection=connection
         )
+        super().__init__(hass, entry, WpmStiebelEltronAPI(params.api_unit()), params)
+
+    def _snapshot_api(self, unit: ModbusUnit) -> WpmStiebelEltronAPI:
+        """Return an API client on ``unit``, to restore the snapshot with."""
+        return WpmStiebelEltronAPI(unit)
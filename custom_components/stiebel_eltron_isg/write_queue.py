@@ -0,0 +1,142 @@
+"""Coalesce the writes to an API component into as few Modbus requests as possible."""
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from modbus_connection.model import PackedBitsField, RegisterField, ResolvedField
+
+
+@dataclass
+class _PendingWrite:
+    """The latest value queued for a field and everyone waiting for it."""
+
+    name: str
+    value: Any
+    # The register address and the encoded words, if the field can share a
+    # multi-register write with its neighbours.
+    registers: tuple[int, list[int]] | None
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+
+
+def _joinable(resolved: ResolvedField) -> bool:
+    """Return whether a field can be written as part of a register run.
+
+    That is a plain writable holding register. A packed bits field has to be
+    merged with the register's current value, and a scaled one needs its scale
+    register read first, so those are written on their own by the library.
+    """
+    return (
+        isinstance(resolved.field, RegisterField)
+        and not isinstance(resolved.field, PackedBitsField)
+        and bool(resolved.field.writable)
+        and resolved.space == "holding"
+        and resolved.scale_address is None
+    )
+
+
+def _runs(writes: list[_PendingWrite]) -> Iterator[list[_PendingWrite]]:
+    """Split writes into runs of contiguous registers, one run per request."""
+    joinable = sorted(
+        (
+            (write.registers[0], len(write.registers[1]), write)
+            for write in writes
+            if write.registers is not None
+        ),
+        key=lambda entry: entry[0],
+    )
+    run: list[_PendingWrite] = []
+    end = None
+    for address, count, write in joinable:
+        if run and address != end:
+            yield run
+            run = []
+        run.append(write)
+        end = address + count
+    if run:
+        yield run
+    for write in writes:
+        if write.registers is None:
+            yield [write]
+
+
+class ComponentWriteQueue:
+    """Collect the writes to one API component for a short window.
+
+    Writes that arrive within the window, say from a scene or from a climate
+    entity setting its preset and its target temperature, go out together. A
+    field written more than once is written once with the last value, and
+    fields in contiguous registers are written in one multi-register request.
+    Every caller still waits for, and gets the outcome of, the request that
+    carried its field.
+    """
+
+    def __init__(self, component: Any, delay: float) -> None:
+        """Queue the writes to ``component`` for ``delay`` seconds."""
+        self._component = component
+        self._delay = delay
+        self._pending: dict[str, _PendingWrite] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        # One window is written at a time, so a later value never overtakes an
+        # earlier one for the same field.
+        self._lock = asyncio.Lock()
+
+    async def write(self, field: str, value: Any) -> None:
+        """Write ``value`` to ``field`` with the other writes of this window.
+
+        Raises ``ValueError`` right away if the value cannot be encoded, and
+        whatever the request carrying the field raised once it was sent.
+        """
+        registers = self._encode(field, value)
+        pending = self._pending.get(field)
+        if pending is None:
+            pending = self._pending[field] = _PendingWrite(field, value, registers)
+        else:
+            pending.value, pending.registers = value, registers
+        waiter = asyncio.get_running_loop().create_future()
+        pending.waiters.append(waiter)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        await waiter
+
+    def _encode(self, field: str, value: Any) -> tuple[int, list[int]] | None:
+        """Return the address and the words of a field that can join a run."""
+        resolved = getattr(self._component, "resolved_fields", {}).get(field)
+        if resolved is None or not _joinable(resolved):
+            return None
+        register = resolved.field
+        if callable(register.writable):
+            value = register.writable(value)
+        return resolved.address, register.encode(value)
+
+    async def _flush(self) -> None:
+        """Send the writes of this window once it closes."""
+        await asyncio.sleep(self._delay)
+        writes, self._pending = list(self._pending.values()), {}
+        self._flush_task = None
+        async with self._lock:
+            runs = list(_runs(writes))
+            results = await asyncio.gather(
+                *(self._send(run) for run in runs), return_exceptions=True
+            )
+        for run, result in zip(runs, results, strict=True):
+            for write in run:
+                for waiter in write.waiters:
+                    if waiter.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        waiter.set_exception(result)
+                    else:
+                        waiter.set_result(None)
+
+    async def _send(self, run: list[_PendingWrite]) -> None:
+        """Write a run of fields in one request."""
+        first = run[0]
+        if len(run) == 1 or first.registers is None:
+            await self._component.write(first.name, first.value)
+            return
+        words = [
+            word for write in run if write.registers for word in write.registers[1]
+        ]
+        await self._component.modbus_unit.write_registers(first.registers[0], words)
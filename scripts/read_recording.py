@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Print a recording of the polled values as JSON lines, one per sample."""
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import sys
+
+RECORDING_MODULE = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "stiebel_eltron_isg"
+    / "recording.py"
+)
+
+
+def _load_recording():
+    """Load the recording module without the integration, which needs Home Assistant."""
+    spec = importlib.util.spec_from_file_location("recording", RECORDING_MODULE)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {RECORDING_MODULE}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    """Print the samples of a recording and the files it was rotated to."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recording", type=Path)
+    parser.add_argument(
+        "--field",
+        action="append",
+        default=[],
+        help="print only this field, may be given more than once",
+    )
+    args = parser.parse_args()
+    recording = _load_recording()
+    try:
+        for read_at, values in recording.read_recording(args.recording):
+            row = (
+                {name: values.get(name) for name in args.field}
+                if args.field
+                else values
+            )
+            print(json.dumps({"time": read_at.isoformat(), **row}))  # noqa: T201
+    except (OSError, ValueError) as err:
+        print(f"Cannot read {args.recording}: {err}", file=sys.stderr)  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+"""Harness for the coordinator benchmarks.
+
+The benchmarks run the integration against the real pystiebeleltron APIs on
+the in-memory Modbus connection, with every entity enabled. Each one reports
+its wall time and the memory one round allocates. The allocations are
+compared against baseline.json, as they barely vary between runs, while the
+wall time depends on the machine and is only reported.
+
+    pytest tests/benchmarks --benchmark
+    pytest tests/benchmarks --benchmark --benchmark-save  # new baseline
+"""
+
+from collections.abc import Awaitable, Callable, Generator
+from dataclasses import asdict, dataclass
+import gc
+import json
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+import tracemalloc
+from unittest.mock import PropertyMock, patch
+
+from _pytest.terminal import TerminalReporter
+import pytest
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+# How far a round may allocate beyond the baseline before the benchmark fails.
+# The slack absorbs the small differences between Python patch releases.
+ALLOWED_GROWTH = 1.25
+ALLOWED_SLACK_BYTES = 16 * 1024
+
+_RESULTS = pytest.StashKey[dict[str, "BenchmarkResult"]]()
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """What a benchmark measured, per round."""
+
+    rounds: int
+    wall_median: float
+    wall_min: float
+    # The peak of the memory allocated during one traced round, and what of
+    # it was still held afterwards.
+    peak_bytes: int
+    retained_bytes: int
+
+
+class Benchmark:
+    """Time a benchmark round and trace its allocations."""
+
+    def __init__(self, name: str, results: dict[str, BenchmarkResult]) -> None:
+        self._name = name
+        self._results = results
+
+    async def __call__(
+        self, round_: Callable[[int], Awaitable[None]], rounds: int = 20
+    ) -> BenchmarkResult:
+        """Run ``round_`` once to warm up, ``rounds`` times timed, twice traced.
+
+        Each round gets its number, so it can change what it works on.
+        """
+        await round_(0)
+        times = []
+        for number in range(1, rounds + 1):
+            started = perf_counter()
+            await round_(number)
+            times.append(perf_counter() - started)
+
+        # Tracing slows every allocation down, so it gets rounds of its own. The
+        # first one replaces what was allocated before tracing started, whose
+        # release tracemalloc cannot account for, and only the second counts.
+        tracemalloc.start()
+        try:
+            await round_(rounds + 1)
+            gc.collect()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await round_(rounds + 2)
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(
+            rounds=rounds,
+            wall_median=median(times),
+            wall_min=min(times),
+            peak_bytes=peak - before,
+            retained_bytes=after - before,
+        )
+        self._results[self._name] = result
+        return result
+
+
+def _baseline() -> dict[str, dict[str, float]]:
+    """Return the recorded results, by benchmark."""
+    if not BASELINE_FILE.exists():
+        return {}
+    baseline: dict[str, dict[str, float]] = json.loads(BASELINE_FILE.read_text())
+    return baseline
+
+
+@pytest.fixture(autouse=True)
+def _benchmarks_only_on_request(request: pytest.FixtureRequest) -> None:
+    """Skip the benchmarks unless they were asked for."""
+    if not request.config.getoption("--benchmark"):
+        pytest.skip("benchmarks only run with --benchmark")
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Generator[Benchmark]:
+    """Measure the rounds of a benchmark and check them against the baseline."""
+    results = request.config.stash.setdefault(_RESULTS, {})
+    name = request.node.name
+    yield Benchmark(name, results)
+
+    result = results.get(name)
+    recorded = _baseline().get(name)
+    if (
+        result is None
+        or recorded is None
+        or request.config.getoption("--benchmark-save")
+    ):
+        return
+    allowed = recorded["peak_bytes"] * ALLOWED_GROWTH + ALLOWED_SLACK_BYTES
+    assert result.peak_bytes <= allowed, (
+        f"{name} allocates {result.peak_bytes} bytes per round, the baseline is "
+        f"{recorded['peak_bytes']:.0f}. Run with --benchmark-save once the "
+        "growth is intended."
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_lwz_api() -> None:
+    """Use the real LWZ API on the in-memory connection."""
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_3i_api() -> None:
+    """Use the real WPM 3i API on the in-memory connection."""
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+@pytest.fixture(autouse=True)
+def all_entities_enabled() -> Generator[None]:
+    """Enable the entities that are disabled by default as well."""
+    with patch(
+        "homeassistant.helpers.entity.Entity.entity_registry_enabled_default",
+        new_callable=PropertyMock,
+        return_value=True,
+    ):
+        yield
+
+
+def pytest_terminal_summary(
+    terminalreporter: TerminalReporter, config: pytest.Config
+) -> None:
+    """Report the benchmark results and save them as the baseline if asked."""
+    results = config.stash.get(_RESULTS, {})
+    if not results:
+        return
+    baseline = _baseline()
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<48} {'median ms':>10} {'min ms':>8} "
+        f"{'peak KiB':>9} {'kept KiB':>9} {'vs base':>8}"
+    )
+    for name, result in sorted(results.items()):
+        recorded = baseline.get(name)
+        change = (
+            f"{result.peak_bytes / recorded['peak_bytes'] - 1:+.0%}"
+            if recorded and recorded["peak_bytes"]
+            else "new"
+        )
+        terminalreporter.write_line(
+            f"{name:<48} {result.wall_median * 1000:>10.2f} "
+            f"{result.wall_min * 1000:>8.2f} {result.peak_bytes / 1024:>9.1f} "
+            f"{result.retained_bytes / 1024:>9.1f} {change:>8}"
+        )
+    if config.getoption("--benchmark-save"):
+        baseline.update({name: asdict(result) for name, result in results.items()})
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        terminalreporter.write_line(f"saved the baseline to {BASELINE_FILE}")
@@ -0,0 +1,247 @@
+"""Benchmarks of the coordinator refresh, writes and setup per controller family."""
+
+from collections.abc import AsyncGenerator, Generator
+import math
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron import ControllerModel
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stiebel_eltron_isg import coordinator as coordinator_module
+from custom_components.stiebel_eltron_isg.capture import (
+    Exchange,
+    ReplayModbusConnection,
+)
+from custom_components.stiebel_eltron_isg.const import UNIT_ID
+from custom_components.stiebel_eltron_isg.coordinator import (
+    AnyStiebelEltronDataCoordinator,
+)
+from custom_components.stiebel_eltron_isg.sensor import INSTRUMENTATION_SENSOR_TYPES
+
+from .conftest import Benchmark
+
+# One controller per API the integration builds. WPMsystem and LWZ_R290 are
+# served by the WPM API, so WPM_3 stands in for them.
+FAMILIES = [
+    pytest.param(ControllerModel.WPM_3i, id="wpm_3i"),
+    pytest.param(ControllerModel.WPM_3, id="wpm"),
+    pytest.param(ControllerModel.LWZ, id="lwz"),
+]
+
+# A setpoint each family writes through its climate entities.
+WRITE_TARGETS = {
+    ControllerModel.WPM_3i: ("system_parameters", "comfort_temperature_hk_1"),
+    ControllerModel.WPM_3: ("system_parameters", "comfort_temperature_hk_1"),
+    ControllerModel.LWZ: ("system_parameters", "room_temperature_day_hk1"),
+}
+
+# Every component falls due when the clock moves on by a day.
+A_DAY = 86400.0
+
+
+class _Clock:
+    """Stand in for the coordinator's monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Generator[_Clock]:
+    """Let the benchmark decide when the components fall due."""
+    clock = _Clock()
+    with patch.object(coordinator_module, "monotonic", new=clock):
+        yield clock
+
+
+@pytest.fixture(params=FAMILIES)
+def model(
+    request: pytest.FixtureRequest, mock_get_controller_model: MagicMock
+) -> ControllerModel:
+    """Let the controller of each family answer in turn."""
+    model: ControllerModel = request.param
+    mock_get_controller_model.return_value = model
+    return model
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, model: ControllerModel
+) -> AsyncGenerator[AnyStiebelEltronDataCoordinator]:
+    """Set up the integration and return its coordinator."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield mock_config_entry.runtime_data
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+def _change_every_register(connection: MockModbusConnection, number: int) -> None:
+    """Give every register read so far a new value, so every entity changes."""
+    unit = connection.for_unit(UNIT_ID)
+    raw: dict[str, dict[int, int | bool]] = {}
+    for event in unit.read_events:
+        values = raw.setdefault(event.register_type, {})
+        for address in range(event.address, event.address + event.count):
+            values[address] = number % 2 + 1
+    unit.read_events.clear()
+    unit.load_raw(raw)
+
+
+async def test_refresh_with_every_value_changed(
+    hass: HomeAssistant,
+    coordinator: AnyStiebelEltronDataCoordinator,
+    mock_modbus_connection: MockModbusConnection,
+    clock: _Clock,
+    benchmark: Benchmark,
+) -> None:
+    """Read every component and write the state of every entity."""
+
+    async def round_(number: int) -> None:
+        _change_every_register(mock_modbus_connection, number)
+        clock.now += A_DAY
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await benchmark(round_)
+
+    assert coordinator.last_update_success
+    assert coordinator.instrumentation.entities_notified > len(
+        INSTRUMENTATION_SENSOR_TYPES
+    )
+
+
+async def test_refresh_without_changes(
+    hass: HomeAssistant,
+    coordinator: AnyStiebelEltronDataCoordinator,
+    clock: _Clock,
+    benchmark: Benchmark,
+) -> None:
+    """Read every component when nothing changed, the usual idle tick."""
+
+    async def round_(_number: int) -> None:
+        clock.now += A_DAY
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await benchmark(round_)
+
+    assert coordinator.last_update_success
+    # Only the instrumentation sensors report on every refresh.
+    assert coordinator.instrumentation.entities_notified == len(
+        INSTRUMENTATION_SENSOR_TYPES
+    )
+
+
+async def test_refresh_of_the_fastest_components(
+    hass: HomeAssistant,
+    coordinator: AnyStiebelEltronDataCoordinator,
+    clock: _Clock,
+    benchmark: Benchmark,
+) -> None:
+    """Read only what falls due on every tick, which most ticks do."""
+    await coordinator.async_refresh()
+    tick = coordinator._schedule.tick_interval
+
+    async def round_(_number: int) -> None:
+        clock.now += tick
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await benchmark(round_)
+
+    assert coordinator.last_update_success
+
+
+async def test_refresh_replayed(
+    hass: HomeAssistant,
+    coordinator: AnyStiebelEltronDataCoordinator,
+    mock_modbus_connection: MockModbusConnection,
+    clock: _Clock,
+    benchmark: Benchmark,
+) -> None:
+    """Read every component from a replay of captured traffic.
+
+    The capture is taken from the in-memory controller over polls that change
+    every value, so the replay cycles through them. A capture of a real ISG,
+    read with ``ReplayModbusConnection.from_file``, replays the same way.
+    """
+    exchanges: list[Exchange] = []
+    coordinator.instrumentation.traffic.capture = exchanges.append
+    for number in range(3):
+        _change_every_register(mock_modbus_connection, number)
+        clock.now += A_DAY
+        await coordinator.async_refresh()
+    entry = coordinator.config_entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    replay = ReplayModbusConnection(exchanges, speed=math.inf)
+    with patch(
+        "custom_components.stiebel_eltron_isg.connect_tcp",
+        new=AsyncMock(return_value=replay),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    replayed = entry.runtime_data
+
+    async def round_(_number: int) -> None:
+        clock.now += A_DAY
+        await replayed.async_refresh()
+        await hass.async_block_till_done()
+
+    await benchmark(round_)
+
+    assert replayed.last_update_success
+    assert replay.requests >= len(exchanges)
+
+
+async def test_write(
+    coordinator: AnyStiebelEltronDataCoordinator,
+    model: ControllerModel,
+    benchmark: Benchmark,
+) -> None:
+    """Write a setpoint, without the window that waits for more writes."""
+    component, field = WRITE_TARGETS[model]
+
+    async def round_(number: int) -> None:
+        await coordinator.write_component_value(component, field, 20 + number % 2)
+
+    with patch.object(coordinator_module, "WRITE_COALESCE_DELAY", 0):
+        await benchmark(round_)
+
+    assert coordinator.instrumentation.write_duration.count > 0
+
+
+async def _new_connection(*_args: object, **_kwargs: object) -> MockModbusConnection:
+    """Connect a new in-memory connection, as unloading closes the last one."""
+    connection = MockModbusConnection()
+    await connection.connect()
+    return connection
+
+
+async def test_setup(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_connect_tcp: AsyncMock,
+    model: ControllerModel,
+    benchmark: Benchmark,
+) -> None:
+    """Set up the entry with every entity and unload it again."""
+    mock_config_entry.add_to_hass(hass)
+    mock_connect_tcp.side_effect = _new_connection
+
+    async def round_(_number: int) -> None:
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    await benchmark(round_, rounds=5)
+
+    # The warm-up, the timed and the traced rounds each connected once.
+    assert mock_connect_tcp.await_count == 8
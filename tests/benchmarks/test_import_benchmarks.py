@@ -0,0 +1,71 @@
+"""Benchmarks of what importing the integration costs per controller family.
+
+Each round imports the integration and the modules a setup of the family
+imports before its platforms, with Home Assistant and modbus_connection
+already loaded, as they are when an entry is set up. ``every_family`` imports
+all three coordinators and the migrations, which is what every setup imported
+before they were loaded on demand.
+"""
+
+from collections.abc import Generator
+import importlib
+import sys
+from types import ModuleType
+
+import pytest
+
+import custom_components
+
+from .conftest import Benchmark
+
+_PACKAGE = "custom_components.stiebel_eltron_isg"
+
+# The modules each setup imports on demand, by family.
+_FAMILY_MODULES = [
+    pytest.param(["wpm3i_coordinator"], id="wpm_3i"),
+    pytest.param(["wpm_coordinator"], id="wpm"),
+    pytest.param(["lwz_coordinator"], id="lwz"),
+    pytest.param(
+        ["wpm3i_coordinator", "wpm_coordinator", "lwz_coordinator", "migration"],
+        id="every_family",
+    ),
+]
+
+
+def _imported() -> dict[str, ModuleType]:
+    """Return the loaded modules of the integration and pystiebeleltron."""
+    return {
+        name: module
+        for name, module in sys.modules.items()
+        if name == _PACKAGE or name.startswith((f"{_PACKAGE}.", "pystiebeleltron"))
+    }
+
+
+def _unload() -> None:
+    """Forget the integration and pystiebeleltron, so the next import loads them."""
+    for name in _imported():
+        del sys.modules[name]
+
+
+@pytest.fixture
+def loaded_modules() -> Generator[None]:
+    """Put the modules the other tests use back once the benchmark is done."""
+    loaded = _imported()
+    yield
+    _unload()
+    sys.modules.update(loaded)
+    custom_components.stiebel_eltron_isg = loaded[_PACKAGE]  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("modules", _FAMILY_MODULES)
+@pytest.mark.usefixtures("loaded_modules")
+async def test_import(benchmark: Benchmark, modules: list[str]) -> None:
+    """Import the integration and the modules of one family's setup."""
+
+    async def import_once(_: int) -> None:
+        _unload()
+        importlib.import_module(_PACKAGE)
+        for module in modules:
+            importlib.import_module(f"{_PACKAGE}.{module}")
+
+    await benchmark(import_once, rounds=10)
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 from homeassistant.const import CONF_HOST, CONF_PORT
 from modbus_connection.mock import MockModbusConnection
 from pystiebeleltron import ControllerModel
-from pystiebeleltron.lwz import OperatingMode
+from pystiebeleltron.lwz import LwzSystemState, LwzSystemValues, OperatingMode
 from pystiebeleltron.wpm import (
     WpmEnergyData,
     WpmEnergyManagementSettings,
@@ -32,6 +32,21 @@ from custom_components.stiebel_eltron_isg.const import DOMAIN
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the benchmarks in tests/benchmarks."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="run the benchmarks, which are skipped otherwise",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="write the measured allocations as the new benchmark baseline",
+    )
+
+
 # This fixture enables loading custom integrations in all tests.
 # Remove to enable selective use of this fixture
 @pytest.fixture(autouse=True)
@@ -62,6 +77,10 @@ def mock_get_controller_model() -> Generator[MagicMock]:
             "custom_components.stiebel_eltron_isg.config_flow.get_controller_model",
             new=mock_get_model,
         ),
+        patch(
+            "custom_components.stiebel_eltron_isg.coordinator.get_controller_model",
+            new=mock_get_model,
+        ),
     ):
         mock_get_model.return_value = ControllerModel.WPM_3
         yield mock_get_model
@@ -100,6 +119,14 @@ def mock_lwz_api() -> Generator[MagicMock]:
         api_client.get_heating_status.return_value = True
         api_client.get_cooling_status.return_value = False
         api_client.get_filter_alarm_status.return_value = False
+        # The components are built in the API constructor, so autospec does
+        # not know them. The coordinator reads the activity signals from them.
+        type(api_client).system_state = PropertyMock(
+            return_value=MagicMock(spec=LwzSystemState)
+        )
+        type(api_client).system_values = PropertyMock(
+            return_value=MagicMock(spec=LwzSystemValues)
+        )
 
         yield api_client
 
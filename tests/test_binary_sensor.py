@@ -9,9 +9,18 @@ import pytest
 
 from custom_components.stiebel_eltron_isg import binary_sensor
 from custom_components.stiebel_eltron_isg.const import CIRCULATION_PUMP
+from custom_components.stiebel_eltron_isg.references import (
+    RegisterBit,
+    operating_status,
+)
 from custom_components.stiebel_eltron_isg.switch import SWITCH_TYPES
 
 
+def _add_all(async_add_entities, descriptions, entity) -> None:
+    """Add the entities of every description, as if all were answered."""
+    async_add_entities([entity(description) for description in descriptions])
+
+
 def test_circulation_pump_is_a_running_status() -> None:
     """The read-only system-state register must be represented as a status."""
     (description,) = binary_sensor.CIRCULATION_PUMP_BINARY_SENSOR_TYPES
@@ -40,7 +49,9 @@ async def test_circulation_pump_is_only_added_for_supported_models(
     expected: bool,
 ) -> None:
     """Only controllers exposing the register get the status entity."""
-    entry = SimpleNamespace(runtime_data=SimpleNamespace(model=model))
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(model=model, async_add_answered_entities=_add_all)
+    )
     async_add_entities = MagicMock()
 
     with patch.object(
@@ -93,8 +104,42 @@ def test_binary_sensor_reads_its_configured_bit(
     entity = binary_sensor.StiebelEltronISGBinarySensor.__new__(
         binary_sensor.StiebelEltronISGBinarySensor
     )
-    entity.modbus_register = lambda api: None
+    entity.modbus_register = lambda api: api.status
     entity.bit_number = bit_number
-    entity.coordinator = SimpleNamespace(get_value=lambda accessor: value)
+    api = SimpleNamespace(status=value)
+    entity.coordinator = SimpleNamespace(get_value=lambda accessor: accessor(api))
 
     assert entity.is_on is expected
+
+
+class _FieldNames:
+    """Fake component that answers every field with the field's name."""
+
+    def __getattr__(self, name: str) -> str:
+        return name
+
+
+def test_status_bit_sensors_share_one_register_accessor() -> None:
+    """The status word is decoded once per poll, not once per bit sensor."""
+    api = SimpleNamespace(system_state=_FieldNames())
+    for descriptions in (
+        binary_sensor.WPM_3I_BINARY_SENSOR_TYPES,
+        binary_sensor.LWZ_BINARY_SENSOR_TYPES,
+    ):
+        status_accessors = {
+            description.modbus_register
+            for description in descriptions
+            if description.modbus_register(api) == "operating_status"
+        }
+        assert status_accessors == {operating_status}
+
+
+def test_binary_sensor_subscribes_to_its_bit() -> None:
+    """A flipped neighbour bit must not wake this sensor."""
+    entity = binary_sensor.StiebelEltronISGBinarySensor.__new__(
+        binary_sensor.StiebelEltronISGBinarySensor
+    )
+    entity.modbus_register = operating_status
+    entity.bit_number = 4
+
+    assert entity.value_references == (RegisterBit(operating_status, 4),)
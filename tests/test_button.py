@@ -1,7 +1,8 @@
 """Tests for the button platform."""
 
+from time import monotonic
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
@@ -10,6 +11,7 @@ from modbus_connection import ModbusError
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.stiebel_eltron_isg import coordinator as coordinator_module
 from custom_components.stiebel_eltron_isg.button import StiebelEltronISGButtonEntity
 from custom_components.stiebel_eltron_isg.const import DOMAIN, RESET_HEATPUMP
 from custom_components.stiebel_eltron_isg.entity import build_unique_id
@@ -26,6 +28,13 @@ def test_reset_button_availability_follows_coordinator(
     assert entity.available is last_update_success
 
 
+def test_reset_button_reads_no_register() -> None:
+    """The button is only woken when the coordinator's availability changes."""
+    entity = StiebelEltronISGButtonEntity.__new__(StiebelEltronISGButtonEntity)
+
+    assert entity.value_references == ()
+
+
 async def test_reset_button_becomes_unavailable_after_failed_refresh(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -44,8 +53,14 @@ async def test_reset_button_becomes_unavailable_after_failed_refresh(
     assert entity_id is not None
     assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
 
-    mock_wpm_api.async_update.side_effect = ModbusError("update failed")
-    await mock_config_entry.runtime_data.async_refresh()
+    coordinator = mock_config_entry.runtime_data
+    for component in coordinator.poll_state["components"]:
+        getattr(mock_wpm_api, component).async_update.side_effect = ModbusError(
+            "update failed"
+        )
+    # A failed read only fails the refresh once the data it left is stale.
+    with patch.object(coordinator_module, "monotonic", return_value=monotonic() + 1e6):
+        await coordinator.async_refresh()
     await hass.async_block_till_done()
 
     assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
@@ -0,0 +1,183 @@
+"""Tests for capturing the Modbus traffic and replaying it."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from modbus_connection import (
+    IllegalDataAddressError,
+    IllegalFunctionError,
+    ModbusError,
+    ModbusTimeoutError,
+)
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron.wpm import WpmSystemValues
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stiebel_eltron_isg import capture as capture_module
+from custom_components.stiebel_eltron_isg.capture import (
+    Exchange,
+    ReplayModbusConnection,
+    encode_exchange,
+    encode_header,
+    read_capture,
+)
+from custom_components.stiebel_eltron_isg.const import (
+    CONF_CAPTURE_TRAFFIC,
+    DOMAIN,
+    UNIT_ID,
+)
+from custom_components.stiebel_eltron_isg.instrumentation import Traffic, count_traffic
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+async def test_a_replay_answers_as_the_captured_controller(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """The API reads the same values from a replay of what it read before."""
+    unit = mock_modbus_connection.for_unit(UNIT_ID)
+    outside = WpmSystemValues(unit).resolved_fields["outside_temperature"]
+    unit.load_raw({outside.space: {outside.address: 0xFFEC}})
+    exchanges: list[Exchange] = []
+    captured = WpmSystemValues(count_traffic(unit, Traffic(capture=exchanges.append)))
+    await captured.async_update()
+
+    replay = ReplayModbusConnection(exchanges, speed=float("inf"))
+    replayed = WpmSystemValues(replay.for_unit(UNIT_ID))
+    await replayed.async_update()
+    await replayed.async_update()
+
+    assert replayed.outside_temperature == captured.outside_temperature == -2.0
+    assert replay.requests == 2 * len(exchanges)
+    assert all(exchange.response for exchange in exchanges)
+
+
+async def test_writes_and_errors_are_captured_and_replayed(
+    mock_modbus_connection: MockModbusConnection,
+    tmp_path: Path,
+) -> None:
+    """A replay refuses what the controller refused, and acknowledges writes."""
+    unit = mock_modbus_connection.for_unit(UNIT_ID)
+    exchanges: list[Exchange] = []
+    counted = count_traffic(unit, Traffic(capture=exchanges.append))
+    await counted.write_register(1500, 210)
+    await counted.write_coils(10, [True, False])
+    unit.fail_read(100, IllegalDataAddressError())
+    unit.fail_read(200, ModbusTimeoutError("no answer"), register_type="input")
+    unit.fail_read(300, ValueError("broken"), register_type="coil")
+    with pytest.raises(IllegalDataAddressError):
+        await counted.read_holding_registers(100, 2)
+    with pytest.raises(ModbusTimeoutError):
+        await counted.read_input_registers(200, 1)
+    with pytest.raises(ValueError, match="broken"):
+        await counted.read_coils(300, 1)
+    unit.fail_write(1502, IllegalDataAddressError())
+    with pytest.raises(IllegalDataAddressError):
+        await counted.write_register(1502, 1)
+    path = tmp_path / "entry.capture.jsonl"
+    path.write_bytes(
+        encode_header("WPM_3", datetime(2026, 1, 1))
+        + b"".join(encode_exchange(exchange) for exchange in exchanges)
+    )
+
+    replay = ReplayModbusConnection.from_file(path, speed=float("inf"))
+    replayed = replay.for_unit(UNIT_ID)
+
+    await replayed.write_register(1500, 210)
+    await replayed.write_register(1500, 220)
+    await replayed.write_coils(10, [True, False])
+    await replayed.write_coil(11, True)
+    await replayed.write_registers(1501, [1, 2])
+    with pytest.raises(IllegalDataAddressError):
+        await replayed.write_register(1502, 1)
+    with pytest.raises(IllegalDataAddressError):
+        await replayed.read_holding_registers(100, 2)
+    with pytest.raises(ModbusTimeoutError):
+        await replayed.read_input_registers(200, 1)
+    with pytest.raises(ModbusError, match="ValueError replayed"):
+        await replayed.read_coils(300, 1)
+    with pytest.raises(IllegalDataAddressError, match="not captured"):
+        await replayed.read_discrete_inputs(0, 1)
+    with pytest.raises(IllegalFunctionError):
+        await replayed.report_server_id()
+    replayed.set_message_spacing(1)
+    replayed.on_connection_lost(lambda: None)()
+    assert replayed.connected
+
+
+async def test_a_replay_takes_as_long_as_the_controller_did() -> None:
+    """The captured duration is divided by the speed."""
+    exchanges = [Exchange(0, 0.08, "read_holding_registers", 0, 1, [7])]
+    replay = ReplayModbusConnection(exchanges, speed=4)
+
+    with patch.object(capture_module.asyncio, "sleep", new=AsyncMock()) as sleep:
+        assert await replay.for_unit(UNIT_ID).read_holding_registers(0, 1) == [7]
+
+    sleep.assert_awaited_once_with(0.02)
+    with pytest.raises(ValueError, match="positive"):
+        ReplayModbusConnection(exchanges, speed=0)
+
+
+def test_only_a_last_line_may_be_cut_short(tmp_path: Path) -> None:
+    """A crash while writing loses the last exchange, not the capture."""
+    path = tmp_path / "entry.capture.jsonl"
+    exchange = encode_exchange(Exchange(0, 0.01, "read_coils", 0, 1, [True]))
+    header = encode_header("LWZ", datetime(2026, 1, 1))
+
+    path.write_bytes(header + exchange + exchange[:10])
+    description, exchanges = read_capture(path)
+    assert description["model"] == "LWZ"
+    assert len(exchanges) == 1
+
+    path.write_bytes(header + exchange[:10] + b"\n" + exchange)
+    with pytest.raises(ValueError, match="broken line 2"):
+        read_capture(path)
+
+    for content in (b"", b"not json\n", exchange):
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="not a capture"):
+            read_capture(path)
+
+
+async def test_the_option_captures_the_traffic_of_the_coordinator(
+    hass: HomeAssistant,
+    mock_modbus_connection: MockModbusConnection,
+    tmp_path: Path,
+) -> None:
+    """The capture is written when the option is turned off and at shutdown."""
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stiebel Eltron",
+        data={"host": "1.1.1.1", "port": 502},
+        options={CONF_CAPTURE_TRAFFIC: True},
+        entry_id="stiebel_eltron_001",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    path = tmp_path / DOMAIN / "stiebel_eltron_001.capture.jsonl"
+
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    description, exchanges = read_capture(path)
+    assert description["model"] == "WPM_3"
+    assert exchanges
+    assert all(exchange.at >= 0 for exchange in exchanges)
+    assert coordinator.instrumentation.traffic.capture is None
+
+    hass.config_entries.async_update_entry(entry, options={CONF_CAPTURE_TRAFFIC: True})
+    await hass.async_block_till_done()
+    await coordinator.write_component_value(
+        "system_parameters", "comfort_temperature_hk_1", 21.5
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    _description, exchanges = read_capture(path)
+    assert any(exchange.request == "write_register" for exchange in exchanges)
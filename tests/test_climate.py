@@ -21,11 +21,9 @@ from custom_components.stiebel_eltron_isg.climate import (
 
 def test_climate_unavailable_when_last_update_failed() -> None:
     """A failed coordinator update must mark the climate entity unavailable."""
-    entity = StiebelEltronWPMClimateEntity.__new__(StiebelEltronWPMClimateEntity)
-    entity.coordinator = SimpleNamespace(last_update_success=False)
+    entity = _make_lwz_climate(operating_mode=3)
+    entity.coordinator.last_update_success = False
 
-    # last_update_success is False, so availability must short-circuit to False
-    # without evaluating the (stale) target temperature.
     assert entity.available is False
 
 
@@ -68,6 +66,7 @@ class _StubCoordinator:
     def __init__(self, api) -> None:
         self._api = api
         self.writes: list[tuple] = []
+        self.expired: list = []
         self.refresh_generation = 0
         self.last_successful_refresh_generation = 0
         self.last_update_success = True
@@ -82,6 +81,18 @@ class _StubCoordinator:
     async def write_component_value(self, component, field, value) -> None:
         self.writes.append((component, field, value))
 
+    def expire_references(self, references) -> None:
+        self.expired.extend(references)
+
+    def is_fresh(self, references) -> bool:
+        return True
+
+    def is_available(self, references) -> bool:
+        return self.last_update_success and self.is_fresh(references)
+
+    def read_since(self, references, generation) -> bool:
+        return self.last_successful_refresh_generation > generation
+
 
 def _make_lwz_climate(
     operating_mode: int | None,
@@ -91,6 +102,8 @@ def _make_lwz_climate(
     entity = StiebelEltronLWZClimateEntity.__new__(StiebelEltronLWZClimateEntity)
     api = _FakeApi(_FakeSystemParameters(operating_mode, day_stage, night_stage))
     entity.coordinator = _StubCoordinator(api)
+    entity.humidity_modbus_register = []
+    entity.actual_temperature_register = []
     entity.write_component = "system_parameters"
     entity.eco_target_temp_write_field = "room_temperature_night_hk1"
     entity.comfort_target_temp_write_field = "room_temperature_day_hk1"
@@ -532,3 +545,16 @@ async def test_climate_keeps_the_assumed_target_between_non_eco_modes() -> None:
     entity.coordinator._api.system_parameters.operating_mode = 2
 
     assert entity.target_temperature == 22.5
+
+
+def test_lwz_climate_is_woken_by_every_value_it_shows() -> None:
+    """Targets, mode and fan stages all feed the climate state."""
+    entity = _make_lwz_climate(operating_mode=3)
+
+    assert set(entity.value_references) == {
+        entity.eco_target_temp_register,
+        entity.comfort_target_temp_register,
+        climate_module._operating_mode,
+        climate_module._day_stage,
+        climate_module._night_stage,
+    }
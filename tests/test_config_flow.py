@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock
 
 from homeassistant.config_entries import SOURCE_DHCP, SOURCE_RECONFIGURE, SOURCE_USER
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
@@ -17,10 +17,28 @@ from pystiebeleltron import (
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.stiebel_eltron_isg.const import DOMAIN
+from custom_components.stiebel_eltron_isg.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MODEL_ID,
+    CONF_POLLING_PROFILE,
+    CONF_RECORD_SNAPSHOTS,
+    DOMAIN,
+)
 
 USER_INPUT = {CONF_HOST: "1.1.1.1", CONF_PORT: 502}
 RECONFIGURE_INPUT = {CONF_HOST: "2.2.2.2", CONF_PORT: 502}
+OPTIONS_INPUT = {
+    CONF_SCAN_INTERVAL: 20,
+    CONF_POLLING_PROFILE: "minimal",
+    CONF_ADAPTIVE_POLLING: True,
+    CONF_MIN_SCAN_INTERVAL: 10,
+    CONF_MAX_SCAN_INTERVAL: 300,
+    CONF_RECORD_SNAPSHOTS: True,
+    CONF_CAPTURE_TRAFFIC: False,
+}
 DHCP_DISCOVERY = DhcpServiceInfo(
     ip="1.1.1.2",
     hostname="servicewelt",
@@ -186,6 +204,31 @@ async def test_reconfigure_flow(
     await hass.async_block_till_done()
 
 
+async def test_reconfigure_detects_the_model_anew(
+    hass: HomeAssistant,
+    mock_get_controller_model: MagicMock,
+) -> None:
+    """The model cached for the old address must not be used for the new one."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**USER_INPUT, CONF_MODEL_ID: ControllerModel.WPM_3i.value},
+    )
+    entry.add_to_hass(hass)
+    mock_get_controller_model.return_value = ControllerModel.LWZ
+    result = await entry.start_reconfigure_flow(hass)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], RECONFIGURE_INPUT
+    )
+    await hass.async_block_till_done()
+
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.data[CONF_MODEL_ID] == ControllerModel.LWZ.value
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 @pytest.mark.parametrize(
     ("side_effect", "expected_error"),
     [
@@ -261,9 +304,13 @@ async def test_reconfigure_reports_unsupported_controller(
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "reconfigure_successful"
-    assert dict(mock_config_entry.data) == RECONFIGURE_INPUT
 
     await hass.async_block_till_done()
+    # The reload detected the model of the controller at the new address.
+    assert dict(mock_config_entry.data) == {
+        **RECONFIGURE_INPUT,
+        CONF_MODEL_ID: ControllerModel.WPM_3.value,
+    }
     assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
     await hass.async_block_till_done()
 
@@ -409,3 +456,73 @@ async def test_dhcp_discovery_errors(
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == expected_reason
+
+
+async def test_options_flow_stores_the_polling_options(hass: HomeAssistant) -> None:
+    """The options form suggests the stored options and saves the new ones."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=USER_INPUT,
+        options={CONF_SCAN_INTERVAL: 15, CONF_POLLING_PROFILE: "realtime"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert_suggested_values(
+        result, {CONF_SCAN_INTERVAL: 15, CONF_POLLING_PROFILE: "realtime"}
+    )
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], OPTIONS_INPUT
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == OPTIONS_INPUT
+
+
+@pytest.mark.parametrize(
+    ("floor", "ceiling"),
+    [pytest.param(30, 300, id="floor"), pytest.param(5, 10, id="ceiling")],
+)
+async def test_options_flow_rejects_bounds_that_exclude_the_base_interval(
+    hass: HomeAssistant, floor: int, ceiling: int
+) -> None:
+    """The adaptive bounds must enclose the base interval."""
+    entry = MockConfigEntry(domain=DOMAIN, data=USER_INPUT)
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            **OPTIONS_INPUT,
+            CONF_MIN_SCAN_INTERVAL: floor,
+            CONF_MAX_SCAN_INTERVAL: ceiling,
+        },
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_interval_bounds"}
+    assert entry.options == {}
+
+
+async def test_options_flow_ignores_the_bounds_without_adaptive_polling(
+    hass: HomeAssistant,
+) -> None:
+    """The bounds only have to enclose the base interval if they are used."""
+    entry = MockConfigEntry(domain=DOMAIN, data=USER_INPUT)
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    user_input = {
+        **OPTIONS_INPUT,
+        CONF_ADAPTIVE_POLLING: False,
+        CONF_MIN_SCAN_INTERVAL: 30,
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == user_input
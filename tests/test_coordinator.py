@@ -1,33 +1,54 @@
 """Tests for coordinator write actions."""
 
+from datetime import timedelta
 import logging
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from modbus_connection import ModbusError
+from homeassistant.util import dt as dt_util
+from modbus_connection import IllegalDataAddressError, ModbusError
+from modbus_connection.mock import MockModbusConnection
 import pystiebeleltron
 from pystiebeleltron import ControllerModel, StiebelEltronModbusError
+from pystiebeleltron.wpm import WpmStiebelEltronAPI
 import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.stiebel_eltron_isg import coordinator as coordinator_module
-from custom_components.stiebel_eltron_isg.const import DOMAIN
+from custom_components.stiebel_eltron_isg.const import DOMAIN, READ_BACK_DELAY
 from custom_components.stiebel_eltron_isg.coordinator import (
     StiebelEltronConnectionParams,
     StiebelEltronDataCoordinator,
     coordinator_display_name,
 )
+from custom_components.stiebel_eltron_isg.instrumentation import (
+    Instrumentation,
+    Traffic,
+)
 from custom_components.stiebel_eltron_isg.lwz_coordinator import (
     StiebelEltronModbusLWZDataCoordinator,
 )
+from custom_components.stiebel_eltron_isg.polling import AdaptiveInterval, PollSchedule
+from custom_components.stiebel_eltron_isg.pool import Priority, request_priority
+from custom_components.stiebel_eltron_isg.references import ApiField, RegisterBit
 from custom_components.stiebel_eltron_isg.sensor import (
+    INSTRUMENTATION_SENSOR_TYPES,
+    StiebelEltronISGInstrumentationSensor,
     StiebelEltronISGSensor,
     StiebelEltronSensorEntityDescription,
 )
+from custom_components.stiebel_eltron_isg.value_table import ValueTable
 from custom_components.stiebel_eltron_isg.wpm3i_coordinator import (
     StiebelEltronModbusWPM3iDataCoordinator,
 )
+from custom_components.stiebel_eltron_isg.wpm_coordinator import (
+    StiebelEltronModbusWPMDataCoordinator,
+)
 
 
 def test_library_modbus_error_is_the_transport_error() -> None:
@@ -39,6 +60,27 @@ def _coordinator(api) -> StiebelEltronDataCoordinator:
     """Build a coordinator without invoking Home Assistant setup."""
     coordinator = StiebelEltronDataCoordinator.__new__(StiebelEltronDataCoordinator)
     coordinator._api = api
+    coordinator._schedule = PollSchedule({})
+    coordinator._adaptive_interval = AdaptiveInterval(30, 5, 60)
+    coordinator._refresh_delay = 0.0
+    coordinator._listeners = {}
+    coordinator._value_cache_hits = 0
+    coordinator._value_cache_misses = 0
+    coordinator._reference_components = {}
+    coordinator._values = ValueTable(coordinator._components_of)
+    coordinator._component_generations = {}
+    coordinator._write_queues = {}
+    coordinator._component_failures = {}
+    coordinator._component_errors = {}
+    coordinator._stale_components = set()
+    coordinator._changed_references = set()
+    coordinator._restored = {}
+    coordinator._restored_api = None
+    coordinator._recorder = None
+    coordinator._dead_values = MagicMock(observe=MagicMock(return_value=set()))
+    coordinator.instrumentation = Instrumentation(Traffic())
+    # Reading back a write needs a running Home Assistant.
+    coordinator._schedule_read_back = MagicMock()
     return coordinator
 
 
@@ -125,7 +167,7 @@ async def test_equal_data_refreshes_still_notify_entities(
     mock_config_entry,
     mock_modbus_connection,
 ) -> None:
-    """Every successful device poll must notify entities.
+    """Every successful device poll must notify listeners without references.
 
     Register values are cached on the API client while coordinator data is
     always an empty dict. Disabling ``always_update`` would therefore suppress
@@ -254,6 +296,7 @@ def test_get_value_returns_none_for_library_read_error(
 
     assert coordinator.get_value(failed_accessor) is None
     assert "Failed to get value from accessor" in caplog.text
+    assert coordinator.instrumentation.accessor_errors == 1
 
 
 @pytest.mark.parametrize(
@@ -376,6 +419,8 @@ async def test_write_component_value_reports_invalid_value() -> None:
         "value": "99.0",
     }
     assert isinstance(error.value.__cause__, ValueError)
+    # Nothing was sent, so there is nothing to read back.
+    coordinator._schedule_read_back.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -403,6 +448,7 @@ async def test_write_component_value_reports_communication_error(
     assert error.value.translation_key == "write_failed"
     assert error.value.translation_placeholders == {"field": "target"}
     assert error.value.__cause__ is write_error
+    coordinator._schedule_read_back.assert_called_once_with("parameters")
 
 
 @pytest.mark.parametrize(
@@ -431,6 +477,21 @@ async def test_write_component_value_propagates_unexpected_error(
     assert error.value is write_error
 
 
+async def test_a_write_goes_ahead_of_polling() -> None:
+    """The requests of a write are sent before the reads of a poll waiting."""
+    priorities = []
+    component = SimpleNamespace(
+        target=21.0,
+        write=AsyncMock(side_effect=lambda *_: priorities.append(request_priority())),
+    )
+    coordinator = _coordinator(SimpleNamespace(parameters=component))
+
+    await coordinator.write_component_value("parameters", "target", 22.0)
+
+    assert priorities == [Priority.INTERACTIVE]
+    assert request_priority() is Priority.POLLING
+
+
 async def test_reset_heatpump_uses_wpm_reset_value() -> None:
     """The base WPM coordinator resets with the WPM-specific value."""
     coordinator = _coordinator(SimpleNamespace())
@@ -475,3 +536,735 @@ def test_wpm_3i_coordinator_initializes_model_specific_api(
     assert coordinator.model is ControllerModel.WPM_3i
     assert coordinator.host == "isg.local"
     assert coordinator._api is mock_wpm_3i_api
+
+
+def _wpm_coordinator(
+    hass, entry, connection: MockModbusConnection
+) -> StiebelEltronDataCoordinator:
+    """Build a coordinator around a real WPM API on the in-memory connection."""
+    return StiebelEltronDataCoordinator(
+        hass,
+        entry,
+        WpmStiebelEltronAPI(connection.for_unit(1)),
+        StiebelEltronConnectionParams(
+            host="isg.local",
+            model=ControllerModel.WPM_3,
+            connection=connection,
+        ),
+    )
+
+
+async def _refresh_at(coordinator: StiebelEltronDataCoordinator, now: float) -> None:
+    """Run one coordinator update as if the monotonic clock read ``now``."""
+    with patch.object(coordinator_module, "monotonic", return_value=now):
+        await coordinator._async_update_data()
+
+
+def _read_addresses(connection: MockModbusConnection) -> set[int]:
+    """Return and clear the block start addresses read since the last call."""
+    unit = connection.for_unit(1)
+    addresses = {event.address for event in unit.read_events}
+    unit.read_events.clear()
+    return addresses
+
+
+async def test_coordinator_ticks_at_the_fastest_component_interval(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """The fast temperatures set the tick, not the slow counters."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+
+    assert coordinator.update_interval is not None
+    assert coordinator.update_interval.total_seconds() == 30
+
+
+async def test_later_ticks_read_only_due_components(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Counters and setpoints are not re-read with every temperature poll."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+
+    await _refresh_at(coordinator, 1000)
+    assert {500, 1500, 2500, 3500} <= _read_addresses(mock_modbus_connection)
+
+    await _refresh_at(coordinator, 1030)
+    assert _read_addresses(mock_modbus_connection) == {500, 2500}
+
+    await _refresh_at(coordinator, 1300)
+    addresses = _read_addresses(mock_modbus_connection)
+    assert {500, 2500, 3500} <= addresses
+    assert 1500 not in addresses
+
+
+async def test_write_reads_the_component_back_on_the_next_tick(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A written setpoint does not wait for its quarter-hour interval."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    _read_addresses(mock_modbus_connection)
+
+    await coordinator.write_component_value(
+        "system_parameters", "comfort_temperature_hk_1", 21.0
+    )
+    await _refresh_at(coordinator, 1030)
+
+    assert 1500 in _read_addresses(mock_modbus_connection)
+    await coordinator.async_shutdown()
+
+
+async def test_refused_optional_component_is_no_longer_polled(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """An optional block the controller does not serve costs one read only."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    mock_modbus_connection.for_unit(1).fail_read(
+        3643, IllegalDataAddressError(), register_type="input"
+    )
+    _read_addresses(mock_modbus_connection)
+
+    await _refresh_at(coordinator, 1180)
+    assert 3643 in _read_addresses(mock_modbus_connection)
+    assert coordinator.last_successful_refresh_generation == 2
+
+    await _refresh_at(coordinator, 1360)
+    assert 3643 not in _read_addresses(mock_modbus_connection)
+
+
+async def test_failed_component_read_stays_due(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A block that fails to read is read again on the next tick."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    unit = mock_modbus_connection.for_unit(1)
+    unit.fail_read(500, IllegalDataAddressError(), register_type="input")
+
+    await _refresh_at(coordinator, 1030)
+
+    unit.fail_read(500, None, register_type="input")
+    _read_addresses(mock_modbus_connection)
+    await _refresh_at(coordinator, 1032)
+
+    assert _read_addresses(mock_modbus_connection) == {500}
+
+
+def _system_values(api):
+    return api.system_values.outside_temperature
+
+
+def _system_state(api):
+    return api.system_state.operating_status
+
+
+async def test_a_failed_component_only_takes_its_own_entities_down(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """The other components stay available while one of them fails to read."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    mock_modbus_connection.for_unit(1).fail_read(
+        500, ModbusError("timeout"), register_type="input"
+    )
+
+    await _refresh_at(coordinator, 1030)
+    assert coordinator.is_fresh([_system_values])
+    assert coordinator.poll_state["component_status"]["system_values"]["failures"] == 1
+
+    await _refresh_at(coordinator, 1120)
+    assert not coordinator.is_fresh([_system_values])
+    assert coordinator.is_fresh([_system_state])
+    assert coordinator.poll_state["component_status"]["system_values"]["stale"]
+
+
+async def test_the_update_fails_once_nothing_can_be_read_and_the_data_is_stale(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A short outage is bridged, a long one makes the coordinator unavailable."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    mock_modbus_connection.for_unit(1).fail_requests(ModbusError("timeout"))
+
+    await _refresh_at(coordinator, 1030)
+    with pytest.raises(UpdateFailed):
+        await _refresh_at(coordinator, 1120)
+
+
+async def test_a_component_going_stale_wakes_its_listeners(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Availability changes without a value change must still be written."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    values_listener, state_listener = MagicMock(), MagicMock()
+    removers = [
+        coordinator.async_add_listener(values_listener, (_system_values,)),
+        coordinator.async_add_listener(state_listener, (_system_state,)),
+    ]
+    try:
+        await _refresh_at(coordinator, 1000)
+        coordinator.async_update_listeners()
+        unit = mock_modbus_connection.for_unit(1)
+        unit.fail_read(500, ModbusError("timeout"), register_type="input")
+        await _refresh_at(coordinator, 1120)
+        coordinator.async_update_listeners()
+        unit.fail_read(500, None, register_type="input")
+        await _refresh_at(coordinator, 1150)
+        coordinator.async_update_listeners()
+
+        assert values_listener.call_count == 3
+        assert state_listener.call_count == 1
+    finally:
+        for remove in removers:
+            remove()
+
+
+async def test_a_write_is_only_confirmed_by_a_read_of_its_component(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A refresh that failed to read the written component confirms nothing."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    generation = coordinator.refresh_generation
+    unit = mock_modbus_connection.for_unit(1)
+    unit.fail_read(500, ModbusError("timeout"), register_type="input")
+
+    await _refresh_at(coordinator, 1010)
+    assert coordinator.read_since([_system_state], generation)
+    assert not coordinator.read_since([_system_values], generation)
+
+    unit.fail_read(500, None, register_type="input")
+    await _refresh_at(coordinator, 1020)
+    assert coordinator.read_since([_system_values], generation)
+
+
+class _ValueApi:
+    """API stub whose values a test changes between refreshes."""
+
+    def __init__(self) -> None:
+        self.first = 1
+        self.second = 2
+
+    async def async_update(self) -> None:
+        return None
+
+
+def _first(api) -> int:
+    return api.first
+
+
+def _second(api) -> int:
+    return api.second
+
+
+async def test_only_listeners_of_changed_values_are_notified(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """An unchanged value must not wake the entities that read it."""
+    api = _ValueApi()
+    coordinator = StiebelEltronDataCoordinator(
+        hass,
+        mock_config_entry,
+        api,
+        StiebelEltronConnectionParams(
+            host="isg.local",
+            model=ControllerModel.WPM_3,
+            connection=mock_modbus_connection,
+        ),
+    )
+    first_listener = MagicMock()
+    second_listener = MagicMock()
+    removers = [
+        coordinator.async_add_listener(first_listener, (_first,)),
+        coordinator.async_add_listener(second_listener, (_second,)),
+    ]
+
+    try:
+        # A value seen for the first time counts as changed.
+        await coordinator.async_refresh()
+        assert first_listener.call_count == 1
+        assert second_listener.call_count == 1
+
+        await coordinator.async_refresh()
+        assert first_listener.call_count == 1
+        assert second_listener.call_count == 1
+
+        api.second = 3
+        await coordinator.async_refresh()
+        assert first_listener.call_count == 1
+        assert second_listener.call_count == 2
+    finally:
+        for remove in removers:
+            remove()
+
+
+async def test_availability_change_notifies_every_listener(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Entities must learn of an outage and a recovery with unchanged values."""
+    api = _ValueApi()
+    api.async_update = AsyncMock()
+    coordinator = StiebelEltronDataCoordinator(
+        hass,
+        mock_config_entry,
+        api,
+        StiebelEltronConnectionParams(
+            host="isg.local",
+            model=ControllerModel.WPM_3,
+            connection=mock_modbus_connection,
+        ),
+    )
+    listener = MagicMock()
+    remove_listener = coordinator.async_add_listener(listener, (_first,))
+
+    try:
+        await coordinator.async_refresh()
+        api.async_update.side_effect = ModbusError("offline")
+        await coordinator.async_refresh()
+        assert listener.call_count == 2
+
+        api.async_update.side_effect = None
+        await coordinator.async_refresh()
+        assert listener.call_count == 3
+
+        await coordinator.async_refresh()
+        assert listener.call_count == 3
+    finally:
+        remove_listener()
+
+
+async def test_expired_references_are_notified_with_the_next_refresh(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """An entity holding an assumed value is woken even if nothing changed."""
+    coordinator = StiebelEltronDataCoordinator(
+        hass,
+        mock_config_entry,
+        _ValueApi(),
+        StiebelEltronConnectionParams(
+            host="isg.local",
+            model=ControllerModel.WPM_3,
+            connection=mock_modbus_connection,
+        ),
+    )
+    listener = MagicMock()
+    remove_listener = coordinator.async_add_listener(listener, (_first,))
+
+    try:
+        await coordinator.async_refresh()
+        coordinator.expire_references([_first])
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+        assert listener.call_count == 2
+    finally:
+        remove_listener()
+
+
+def test_get_value_evaluates_each_accessor_once_per_poll() -> None:
+    """Availability and state properties share one accessor evaluation."""
+    accessor = MagicMock(return_value=21.5)
+    coordinator = _coordinator(SimpleNamespace())
+
+    assert coordinator.has_value(accessor) is True
+    assert coordinator.get_value(accessor) == 21.5
+    assert coordinator.get_value(accessor) == 21.5
+
+    accessor.assert_called_once()
+    assert coordinator.value_cache_stats == {"hits": 2, "misses": 1}
+
+
+def test_get_value_caches_a_failed_accessor_as_missing(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A read error is logged once per poll, not once per property."""
+    coordinator = _coordinator(SimpleNamespace())
+
+    def failed_accessor(api):
+        raise StiebelEltronModbusError
+
+    assert coordinator.get_value(failed_accessor) is None
+    assert coordinator.has_value(failed_accessor) is False
+    assert caplog.text.count("Failed to get value from accessor") == 1
+
+
+@pytest.mark.parametrize("read_error", [None, ModbusError("read failed")])
+async def test_every_poll_drops_the_cached_values(read_error) -> None:
+    """A poll may store new blocks even when it fails in the end."""
+    api = SimpleNamespace(value=1, async_update=AsyncMock(side_effect=read_error))
+    coordinator = _coordinator(api)
+    coordinator._refresh_generation = 0
+    accessor = lambda api: api.value  # noqa: E731
+    assert coordinator.get_value(accessor) == 1
+
+    api.value = 2
+    assert coordinator.get_value(accessor) == 1
+    if read_error is None:
+        await coordinator._async_update_data()
+    else:
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    assert coordinator.get_value(accessor) == 2
+
+
+def test_register_bits_are_resolved_from_the_cached_word() -> None:
+    """However many bits are read, the status word is evaluated once."""
+    status = MagicMock(return_value=0b101)
+    coordinator = _coordinator(SimpleNamespace())
+
+    bits = [coordinator.get_value(RegisterBit(status, bit)) for bit in range(3)]
+
+    assert bits == [1, 0, 1]
+    status.assert_called_once()
+
+
+async def test_only_listeners_of_flipped_bits_are_notified(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A status word change wakes the sensors of the changed bits only."""
+    api = SimpleNamespace(status=0b01, async_update=AsyncMock())
+    coordinator = StiebelEltronDataCoordinator(
+        hass,
+        mock_config_entry,
+        api,
+        StiebelEltronConnectionParams(
+            host="isg.local",
+            model=ControllerModel.WPM_3,
+            connection=mock_modbus_connection,
+        ),
+    )
+
+    def status(api):
+        return api.status
+
+    listeners = [MagicMock() for _ in range(3)]
+    removers = [
+        coordinator.async_add_listener(listener, (RegisterBit(status, bit),))
+        for bit, listener in enumerate(listeners)
+    ]
+
+    try:
+        await coordinator.async_refresh()
+        api.status = 0b11
+        await coordinator.async_refresh()
+
+        assert [listener.call_count for listener in listeners] == [1, 2, 1]
+    finally:
+        for remove in removers:
+            remove()
+
+
+async def test_the_tick_follows_the_heat_pump_activity(
+    hass, mock_modbus_connection
+) -> None:
+    """A running compressor polls at the floor, an idle heat pump backs off."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "isg.local"},
+        options={
+            "scan_interval": 10,
+            "adaptive_polling": True,
+            "min_scan_interval": 5,
+            "max_scan_interval": 60,
+        },
+    )
+    coordinator = StiebelEltronModbusWPMDataCoordinator(
+        hass,
+        entry,
+        ControllerModel.WPM_3,
+        mock_modbus_connection,
+        "isg.local",
+    )
+    status = coordinator._api.system_state
+    status.operating_status = 1 << 6
+
+    await _refresh_at(coordinator, 1000)
+    assert coordinator.update_interval.total_seconds() == 5
+    assert coordinator.poll_state["reason"] == "active: compressor_on"
+    assert coordinator.poll_state["components"]["system_values"] == 5
+
+    status.operating_status = 0
+    intervals = []
+    for now in (1005, 1015, 1035, 1075):
+        await _refresh_at(coordinator, now)
+        intervals.append(coordinator.update_interval.total_seconds())
+
+    assert intervals == [10, 20, 40, 60]
+    assert coordinator.poll_state["reason"] == "idle, at ceiling"
+    assert coordinator.poll_state["components"]["energy_data"] == 100
+
+
+async def test_the_tick_stays_fixed_unless_adaptive_polling_is_enabled(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """By default a running compressor does not speed up the polling."""
+    coordinator = StiebelEltronModbusWPMDataCoordinator(
+        hass,
+        mock_config_entry,
+        ControllerModel.WPM_3,
+        mock_modbus_connection,
+        "isg.local",
+    )
+    coordinator._api.system_state.operating_status = 1 << 6
+
+    await _refresh_at(coordinator, 1000)
+
+    assert coordinator.update_interval.total_seconds() == 30
+    assert coordinator.poll_state["reason"] == "fixed"
+    assert coordinator.poll_state["floor"] == coordinator.poll_state["ceiling"] == 30
+
+
+async def test_the_adaptive_bounds_come_from_the_entry_options(
+    hass, mock_modbus_connection
+) -> None:
+    """The floor and ceiling of the adaptive tick can be configured."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "isg.local"},
+        options={
+            "adaptive_polling": True,
+            "min_scan_interval": 2,
+            "max_scan_interval": 600,
+        },
+    )
+    coordinator = StiebelEltronModbusLWZDataCoordinator(
+        hass, entry, ControllerModel.LWZ, mock_modbus_connection, "isg.local"
+    )
+    coordinator._api.system_state.operating_status = 0
+    coordinator._api.system_values.compressor_speed = 42.0
+
+    await _refresh_at(coordinator, 1000)
+
+    assert coordinator.poll_state["floor"] == 2
+    assert coordinator.poll_state["ceiling"] == 600
+    assert coordinator.poll_state["reason"] == "active: compressor_speed"
+
+
+async def test_only_components_of_enabled_entities_are_read(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """With listeners, a component no enabled entity reads is not polled."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    coordinator.activity_signals = (
+        StiebelEltronModbusWPMDataCoordinator.activity_signals
+    )
+    await _refresh_at(coordinator, 1000)
+    assert {500, 1500, 2500, 3500} <= _read_addresses(mock_modbus_connection)
+
+    def heating_total(api):
+        return api.energy_data.vd_heating_total
+
+    remove = coordinator.async_add_listener(MagicMock(), (heating_total,))
+    try:
+        await _refresh_at(coordinator, 1030)
+        assert _read_addresses(mock_modbus_connection) == {2500}
+
+        await _refresh_at(coordinator, 1900)
+        assert {2500, 3500} <= _read_addresses(mock_modbus_connection)
+        assert coordinator.poll_state["unused_components"] == sorted(
+            set(coordinator.poll_state["components"]) - {"energy_data", "system_state"}
+        )
+    finally:
+        remove()
+
+
+async def test_an_instrumentation_sensor_does_not_widen_the_reads(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A sensor reporting on the coordinator asks for no component to be read."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+
+    def heating_total(api):
+        return api.energy_data.vd_heating_total
+
+    remove = coordinator.async_add_listener(MagicMock(), (heating_total,))
+    wanted = coordinator._wanted_components()
+    sensor = StiebelEltronISGInstrumentationSensor(
+        coordinator, mock_config_entry, INSTRUMENTATION_SENSOR_TYPES[0]
+    )
+    sensor.async_write_ha_state = MagicMock()
+    try:
+        await sensor.async_added_to_hass()
+        assert coordinator._wanted_components() == wanted == {"energy_data"}
+
+        await _refresh_at(coordinator, 1000)
+        coordinator.async_update_listeners()
+        await _refresh_at(coordinator, 1030)
+        coordinator.async_update_listeners()
+        assert sensor.async_write_ha_state.call_count == 2
+    finally:
+        for unsubscribe in sensor._on_remove or ():
+            unsubscribe()
+        remove()
+
+
+async def test_a_listener_with_unknown_reads_polls_every_component(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Without a value context the coordinator cannot narrow its reads."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await _refresh_at(coordinator, 1000)
+    _read_addresses(mock_modbus_connection)
+
+    remove = coordinator.async_add_listener(MagicMock())
+    try:
+        await _refresh_at(coordinator, 1030)
+        assert _read_addresses(mock_modbus_connection) == {500, 2500}
+        assert coordinator.poll_state["unused_components"] == []
+    finally:
+        remove()
+
+
+def test_reconnect_delay_doubles_with_jitter_up_to_the_maximum() -> None:
+    """Each failed attempt doubles the delay, a random half of it is jitter."""
+    for attempt, delay in [(0, 1), (3, 8), (20, 300)]:
+        waits = {coordinator_module._reconnect_delay(attempt) for _ in range(50)}
+        assert all(delay / 2 <= wait <= delay for wait in waits)
+        assert len(waits) > 1
+
+
+def _comfort_temperature(api):
+    return api.system_parameters.comfort_temperature_hk_1
+
+
+async def test_a_poll_only_resolves_the_references_of_what_it_read(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """The values of components the poll did not read cannot have changed."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    outdoor = ApiField("system_values.outside_temperature")
+    comfort = ApiField("system_parameters.comfort_temperature_hk_1")
+    remove = coordinator.async_add_listener(MagicMock(), (outdoor, comfort))
+    try:
+        await coordinator._async_update_data()
+        coordinator.async_update_listeners()
+
+        with patch.object(
+            coordinator, "_read_value", wraps=coordinator._read_value
+        ) as read_value:
+            await coordinator._async_poll(["system_values"])
+
+        read_value.assert_called_once_with(outdoor)
+        assert coordinator.get_value(comfort) is not None
+    finally:
+        remove()
+
+
+async def _settle(hass) -> None:
+    """Let the read back of a write run."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=READ_BACK_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+
+async def test_a_write_is_read_back_on_its_own_once_it_settled(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Only the written block is read again, and its listeners are woken."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    listener = MagicMock()
+    remove = coordinator.async_add_listener(listener, (_comfort_temperature,))
+    try:
+        await coordinator._async_update_data()
+        coordinator.async_update_listeners()
+        listener.reset_mock()
+        generation = coordinator.refresh_generation
+        _read_addresses(mock_modbus_connection)
+
+        await coordinator.write_component_value(
+            "system_parameters", "comfort_temperature_hk_1", 21.5
+        )
+        await coordinator.write_component_value(
+            "system_parameters", "eco_temperature_hk_1", 19.5
+        )
+        assert _read_addresses(mock_modbus_connection) == set()
+        await _settle(hass)
+
+        assert _read_addresses(mock_modbus_connection) == {1500}
+        assert coordinator.read_since([_comfort_temperature], generation)
+        assert coordinator.get_value(_comfort_temperature) == 21.5
+        listener.assert_called_once()
+    finally:
+        remove()
+
+
+async def test_a_failed_read_back_leaves_the_component_due(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """A read back is no refresh: a failure does not mark the update failed."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await coordinator._async_update_data()
+    generation = coordinator.refresh_generation
+    unit = mock_modbus_connection.for_unit(1)
+    unit.fail_read(1500, ModbusError("timeout"), register_type="holding")
+
+    await coordinator.write_component_value(
+        "system_parameters", "comfort_temperature_hk_1", 21.5
+    )
+    await _settle(hass)
+
+    assert coordinator.last_update_success
+    assert not coordinator.read_since([_comfort_temperature], generation)
+    assert "system_parameters" in coordinator._schedule.due(0)
+
+
+async def test_a_read_back_goes_ahead_of_polling(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """The write is confirmed before the reads of a poll waiting."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    priorities = []
+    await coordinator.write_component_value(
+        "system_parameters", "comfort_temperature_hk_1", 21.5
+    )
+
+    with patch.object(
+        coordinator,
+        "_async_poll",
+        AsyncMock(side_effect=lambda _due: priorities.append(request_priority())),
+    ):
+        await _settle(hass)
+
+    assert priorities == [Priority.INTERACTIVE]
+
+
+async def test_shutdown_cancels_a_pending_read_back(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """An unloaded entry must not read from a closed connection."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    await coordinator.write_component_value(
+        "system_parameters", "comfort_temperature_hk_1", 21.5
+    )
+    _read_addresses(mock_modbus_connection)
+
+    await coordinator.async_shutdown()
+    await _settle(hass)
+
+    assert _read_addresses(mock_modbus_connection) == set()
+
+
+async def test_polls_and_writes_are_instrumented(
+    hass, mock_config_entry, mock_modbus_connection
+) -> None:
+    """Every refresh, component read and write leaves its duration behind."""
+    coordinator = _wpm_coordinator(hass, mock_config_entry, mock_modbus_connection)
+    listener = MagicMock()
+    remove = coordinator.async_add_listener(listener, (_system_values,))
+    try:
+        await _refresh_at(coordinator, 1000)
+        coordinator.async_update_listeners()
+        await coordinator.write_component_value(
+            "system_parameters", "comfort_temperature_hk_1", 21.0
+        )
+    finally:
+        remove()
+        await coordinator.async_shutdown()
+
+    instrumentation = coordinator.instrumentation
+    assert instrumentation.refresh_duration.count == 1
+    assert instrumentation.component_read_duration["system_values"].count == 1
+    assert instrumentation.write_duration.count == 1
+    assert instrumentation.entities_notified == 1
@@ -0,0 +1,275 @@
+"""Tests for learning the values and components a controller never answers."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from modbus_connection import IllegalDataAddressError
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron import ControllerModel
+from pystiebeleltron.wpm import WpmExtendedEnergyData
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stiebel_eltron_isg.const import (
+    CONSUMED_WATER_HEATING_12M,
+    DEAD_VALUE_AFTER,
+    DEAD_VALUE_READS,
+    DOMAIN,
+    OUTDOOR_TEMPERATURE,
+    REFUSED_COMPONENT_RETRY,
+    SG_READY_INPUT_1,
+)
+from custom_components.stiebel_eltron_isg.dead_values import DeadValues
+from custom_components.stiebel_eltron_isg.entity import build_unique_id
+
+MODEL_ID = ControllerModel.WPM_3.value
+COMPONENTS = frozenset({"system_values"})
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+def _never(_api: Any) -> None:
+    return None
+
+
+def _always(_api: Any) -> int:
+    return 1
+
+
+def _store_key(entry: MockConfigEntry) -> str:
+    return f"{DOMAIN}.dead_values.{entry.entry_id}"
+
+
+def _stored(
+    entry: MockConfigEntry,
+    *,
+    values: dict[str, dict[str, Any]] | None = None,
+    components: dict[str, str] | None = None,
+    model_id: int = MODEL_ID,
+) -> dict[str, Any]:
+    """Return a store holding what an earlier run learned."""
+    return {
+        _store_key(entry): {
+            "version": 1,
+            "minor_version": 1,
+            "key": _store_key(entry),
+            "data": {
+                "model_id": model_id,
+                "values": values or {},
+                "components": components or {},
+            },
+        }
+    }
+
+
+def _dead_since(days: int = 4) -> dict[str, Any]:
+    since = dt_util.utcnow() - timedelta(days=days)
+    return {"since": since.isoformat(), "reads": DEAD_VALUE_READS}
+
+
+async def _reloaded(dead_values: DeadValues, hass: HomeAssistant, entry) -> DeadValues:
+    """Save what was learned and load it as the next setup would."""
+    await dead_values.async_flush()
+    loaded = DeadValues(hass, entry, MODEL_ID)
+    await loaded.async_load()
+    return loaded
+
+
+async def test_a_value_never_answered_for_long_enough_is_dead(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Enough reads alone, or enough time alone, do not make a value dead."""
+    dead_values = DeadValues(hass, mock_config_entry, MODEL_ID)
+    dead_values.watch("never", _never, COMPONENTS)
+    dead_values.watch("answered", _always, COMPONENTS)
+
+    for _ in range(DEAD_VALUE_READS):
+        assert not dead_values.observe(COMPONENTS, lambda reference: reference(None))
+    assert (await _reloaded(dead_values, hass, mock_config_entry)).dead_keys == set()
+
+    freezer.tick(timedelta(seconds=DEAD_VALUE_AFTER))
+    loaded = await _reloaded(dead_values, hass, mock_config_entry)
+
+    assert loaded.dead_keys == {"never"}
+    assert not loaded.answered("never", COMPONENTS)
+    assert loaded.answered("answered", COMPONENTS)
+
+
+async def test_only_the_reads_of_its_components_count(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """A value not read, or whose reads are unknown, is not held against it."""
+    dead_values = DeadValues(hass, mock_config_entry, MODEL_ID)
+    dead_values.watch("other", _never, frozenset({"energy_data"}))
+    dead_values.watch("unknown", _never, None)
+
+    dead_values.observe(COMPONENTS, lambda reference: reference(None))
+
+    assert dead_values._unanswered == {}
+
+
+async def test_a_value_that_answers_starts_over(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """A value that held none for a while is not counted against any longer."""
+    values = {"key": None}
+    dead_values = DeadValues(hass, mock_config_entry, MODEL_ID)
+    dead_values.watch("key", lambda _api: values["key"], COMPONENTS)
+    dead_values.observe(COMPONENTS, lambda reference: reference(None))
+    assert "key" in dead_values._unanswered
+
+    values["key"] = 1
+    assert not dead_values.observe(COMPONENTS, lambda reference: reference(None))
+
+    assert (await _reloaded(dead_values, hass, mock_config_entry))._unanswered == {}
+
+
+async def test_what_was_learned_about_another_model_is_not_loaded(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Another controller answers other values."""
+    hass_storage.update(
+        _stored(
+            mock_config_entry,
+            values={"key": _dead_since()},
+            model_id=MODEL_ID + 1,
+        )
+    )
+    dead_values = DeadValues(hass, mock_config_entry, MODEL_ID)
+    await dead_values.async_load()
+
+    assert dead_values.dead_keys == set()
+
+
+async def test_a_refused_component_is_tried_again_after_a_while(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A firmware update may serve a component the controller refused."""
+    dead_values = DeadValues(hass, mock_config_entry, MODEL_ID)
+    dead_values.refuse("extended_energy_data")
+
+    loaded = await _reloaded(dead_values, hass, mock_config_entry)
+    assert loaded.refused_components == {"extended_energy_data"}
+    assert not loaded.answered("key", frozenset({"extended_energy_data"}))
+    assert loaded.answered("key", frozenset({"extended_energy_data", "energy_data"}))
+    assert loaded.answered("key", frozenset())
+
+    freezer.tick(timedelta(seconds=REFUSED_COMPONENT_RETRY))
+    assert (
+        await _reloaded(loaded, hass, mock_config_entry)
+    ).refused_components == set()
+
+
+def _entity_id(
+    hass: HomeAssistant, entry: MockConfigEntry, key: str, domain: str = "sensor"
+) -> str | None:
+    return er.async_get(hass).async_get_entity_id(
+        domain, DOMAIN, build_unique_id(entry, key)
+    )
+
+
+async def test_the_entity_of_a_dead_value_is_set_up_once_it_answers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A dead value is left out, and still read, so its entity returns without a reload."""
+    hass_storage.update(
+        _stored(mock_config_entry, values={OUTDOOR_TEMPERATURE: _dead_since()})
+    )
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert _entity_id(hass, mock_config_entry, OUTDOOR_TEMPERATURE) is None
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.poll_state["dead_values"] == [OUTDOOR_TEMPERATURE]
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    reload.assert_not_called()
+    entity_id = _entity_id(hass, mock_config_entry, OUTDOOR_TEMPERATURE)
+    assert entity_id is not None
+    assert hass.states.get(entity_id) is not None
+    assert mock_config_entry.runtime_data is coordinator
+    assert coordinator.poll_state["dead_values"] == []
+
+
+async def test_a_writable_value_is_set_up_though_it_never_answers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """An SG Ready input past the dead threshold stays, and is not watched."""
+    hass_storage.update(
+        _stored(mock_config_entry, values={SG_READY_INPUT_1: _dead_since()})
+    )
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert _entity_id(hass, mock_config_entry, SG_READY_INPUT_1, "switch")
+    coordinator = mock_config_entry.runtime_data
+    assert SG_READY_INPUT_1 not in coordinator._dead_values._watched
+
+
+async def test_a_refused_component_is_neither_polled_nor_set_up(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+    hass_storage: dict[str, Any],
+) -> None:
+    """The entities it never fills are left out, and later setups skip it."""
+    unit = mock_modbus_connection.for_unit(1)
+    resolved = WpmExtendedEnergyData(unit).resolved_fields["dhw_12m"]
+    unit.fail_read(resolved.address, IllegalDataAddressError(), register_type="input")
+    mock_config_entry.add_to_hass(hass)
+    # The first refresh finds the component refused before the entities are set up.
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert _entity_id(hass, mock_config_entry, CONSUMED_WATER_HEATING_12M) is None
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert _store_key(mock_config_entry) in hass_storage
+
+    unit.read_events.clear()
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.poll_state["refused_components"] == ["extended_energy_data"]
+    assert "extended_energy_data" not in coordinator.poll_state["components"]
+    assert not any(
+        event.address <= resolved.address < event.address + event.count
+        for event in unit.read_events
+    )
+    assert _entity_id(hass, mock_config_entry, CONSUMED_WATER_HEATING_12M) is None
+
+
+async def test_removing_the_entry_removes_what_was_learned(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A deleted entry leaves nothing learned behind."""
+    hass_storage.update(_stored(mock_config_entry))
+    mock_config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+
+    assert _store_key(mock_config_entry) not in hass_storage
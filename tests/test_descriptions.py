@@ -0,0 +1,69 @@
+"""Tests for the entity descriptions looked up by controller model."""
+
+from pystiebeleltron import ControllerModel
+import pytest
+
+from custom_components.stiebel_eltron_isg import (
+    binary_sensor,
+    climate,
+    number,
+    select,
+    sensor,
+)
+from custom_components.stiebel_eltron_isg.descriptions import (
+    LWZ_MODELS,
+    SUPPORTED_MODELS,
+    WPM_MODELS,
+    descriptions_by_model,
+)
+
+_TABLES = {
+    "binary_sensor": binary_sensor.BINARY_SENSOR_TYPES_BY_MODEL,
+    "climate": climate.CLIMATE_TYPES_BY_MODEL,
+    "number": number.NUMBER_TYPES_BY_MODEL,
+    "select": select.SELECT_TYPES_BY_MODEL,
+    "sensor": sensor.SENSOR_TYPES_BY_MODEL,
+}
+
+
+@pytest.mark.parametrize("platform", _TABLES)
+def test_every_supported_model_has_its_descriptions(platform: str) -> None:
+    """A setup must find its model, or the entry fails to load its platform."""
+    assert set(_TABLES[platform]) == set(SUPPORTED_MODELS)
+
+
+@pytest.mark.parametrize("platform", _TABLES)
+def test_keys_are_unique_per_model(platform: str) -> None:
+    """Two descriptions with one key would give two entities one unique id."""
+    for model, descriptions in _TABLES[platform].items():
+        keys = [description.key for description in descriptions]
+        assert len(keys) == len(set(keys)), model
+
+
+def test_models_of_a_family_share_their_lists() -> None:
+    """The families get their lists, and the extras only the models named."""
+    table = descriptions_by_model(
+        wpm_3i=["3i"], wpm=["wpm"], lwz=["lwz"], extra={WPM_MODELS[1]: ["extra"]}
+    )
+
+    assert table[ControllerModel.WPM_3i] == ("3i",)
+    assert table[WPM_MODELS[0]] == ("wpm",)
+    assert table[WPM_MODELS[1]] == ("wpm", "extra")
+    assert all(table[model] == ("lwz",) for model in LWZ_MODELS)
+
+
+def test_sensor_extras_stay_with_their_models() -> None:
+    """The inverter power and circulation pump only reach the models measured."""
+    inverter = sensor.WPM_INVERTER_POWER_SENSOR_TYPES[0]
+    pump = binary_sensor.CIRCULATION_PUMP_BINARY_SENSOR_TYPES[0]
+
+    assert [
+        model
+        for model, descriptions in sensor.SENSOR_TYPES_BY_MODEL.items()
+        if inverter in descriptions
+    ] == [ControllerModel.WPMsystem]
+    assert {
+        model
+        for model, descriptions in binary_sensor.BINARY_SENSOR_TYPES_BY_MODEL.items()
+        if pump in descriptions
+    } == {ControllerModel.WPMsystem, ControllerModel.LWZ_R290}
@@ -16,6 +16,10 @@ from custom_components.stiebel_eltron_isg.diagnostics import (
     async_get_config_entry_diagnostics,
     async_get_device_diagnostics,
 )
+from custom_components.stiebel_eltron_isg.instrumentation import (
+    Instrumentation,
+    Traffic,
+)
 
 
 def test_raw_data_privacy_audit_matches_dependency_version() -> None:
@@ -44,6 +48,15 @@ async def test_diagnostics_redact_host_and_preserve_useful_data(
             "produced_heating_total": 12345,
             "unsupported_value": None,
         },
+        read_values={"system_values.outside_temperature": 12.5},
+        poll_state={
+            "interval": 5,
+            "reason": "active: compressor_on",
+            "floor": 5,
+            "ceiling": 60,
+            "components": {"system_values": 5, "energy_data": 300},
+        },
+        instrumentation=Instrumentation(Traffic(reads=3, registers_read=120)),
     )
 
     config_diagnostics = await async_get_config_entry_diagnostics(
@@ -69,6 +82,10 @@ async def test_diagnostics_redact_host_and_preserve_useful_data(
         },
         {"model": "WPM_3", "model_id": 390},
     ]
+    assert config_diagnostics["values"] == {"system_values.outside_temperature": 12.5}
+    assert config_diagnostics["polling"]["interval"] == 5
+    assert config_diagnostics["polling"]["reason"] == "active: compressor_on"
+    assert config_diagnostics["instrumentation"]["traffic"]["bytes_read"] == 240
 
     for diagnostics in (config_diagnostics, device_diagnostics):
         downloaded_json = json.dumps(diagnostics, cls=ExtendedJSONEncoder)
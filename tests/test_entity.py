@@ -1,20 +1,46 @@
 """Tests for the shared entity base class."""
 
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.helpers.entity import Entity
+
 from custom_components.stiebel_eltron_isg.entity import StiebelEltronISGEntity
 
 
 class _StubCoordinator:
-    def __init__(self, last_update_success: bool, has_value: bool) -> None:
+    def __init__(
+        self, last_update_success: bool, has_value: bool, fresh: bool = True
+    ) -> None:
         self.last_update_success = last_update_success
         self._has_value = has_value
+        self._fresh = fresh
+        self.restored: datetime | None = None
+
+    def get_value(self, register) -> float | None:
+        return 21.5 if self._has_value else None
+
+    def value_slot(self, reference) -> int:
+        return 7
+
+    def read_slot(self, slot: int) -> float | None:
+        return 21.5 if self._has_value else None
+
+    def is_fresh(self, references) -> bool:
+        return self._fresh
+
+    def restored_at(self, references) -> datetime | None:
+        return self.restored
 
-    def has_value(self, register) -> bool:
-        return self._has_value
+    def is_available(self, references) -> bool:
+        return (self.last_update_success or self.restored is not None) and self._fresh
 
 
-def _make_entity(last_update_success: bool, has_value: bool) -> StiebelEltronISGEntity:
+def _make_entity(
+    last_update_success: bool, has_value: bool, fresh: bool = True
+) -> StiebelEltronISGEntity:
     entity = StiebelEltronISGEntity.__new__(StiebelEltronISGEntity)
-    entity.coordinator = _StubCoordinator(last_update_success, has_value)
+    entity.coordinator = _StubCoordinator(last_update_success, has_value, fresh)
     entity.modbus_register = lambda api: None
     return entity
 
@@ -24,11 +50,73 @@ def test_available_when_update_succeeded_and_value_present() -> None:
     assert _make_entity(last_update_success=True, has_value=True).available is True
 
 
+def test_unavailable_when_its_registers_are_stale() -> None:
+    """A value that failed to read for too long is not reported as current."""
+    entity = _make_entity(last_update_success=True, has_value=True, fresh=False)
+
+    assert entity.available is False
+
+
 def test_unavailable_when_last_update_failed() -> None:
     """A failed update must mark the entity unavailable, not show a stale value."""
     assert _make_entity(last_update_success=False, has_value=True).available is False
 
 
+def test_restored_value_is_available_and_marked_while_update_fails() -> None:
+    """A value from the snapshot shows, with the time it was read."""
+    entity = _make_entity(last_update_success=False, has_value=True)
+    entity.coordinator.restored = datetime(2026, 10, 1, 12, 0, tzinfo=UTC)
+
+    assert entity.available is True
+    assert entity.extra_state_attributes == {
+        "snapshot_read_at": "2026-10-01T12:00:00+00:00"
+    }
+
+
+def test_live_value_has_no_snapshot_attribute() -> None:
+    """A value read since the start carries no snapshot mark."""
+    entity = _make_entity(last_update_success=True, has_value=True)
+
+    assert entity.extra_state_attributes is None
+
+
 def test_unavailable_when_value_missing() -> None:
     """A missing register value keeps the entity unavailable."""
     assert _make_entity(last_update_success=True, has_value=False).available is False
+
+
+def test_entity_reads_its_own_register() -> None:
+    """An entity subscribes to exactly the register its state comes from."""
+    entity = _make_entity(last_update_success=True, has_value=True)
+
+    assert entity.value_references == (entity.modbus_register,)
+
+
+async def test_entity_subscribes_to_its_references_when_added() -> None:
+    """The coordinator only wakes the entity for changes it reads."""
+    entity = _make_entity(last_update_success=True, has_value=True)
+    entity.coordinator.async_add_listener = MagicMock()
+    entity.async_on_remove = MagicMock()
+
+    with patch.object(Entity, "async_added_to_hass", AsyncMock()):
+        await entity.async_added_to_hass()
+
+    entity.coordinator.async_add_listener.assert_called_once_with(
+        entity._handle_coordinator_update, (entity.modbus_register,)
+    )
+
+
+async def test_entity_reads_its_values_by_slot_once_added() -> None:
+    """The slots are resolved once, and every later read goes by index."""
+    entity = _make_entity(last_update_success=True, has_value=True)
+    entity.coordinator.async_add_listener = MagicMock()
+    entity.coordinator.get_value = MagicMock()
+    entity.coordinator.read_slot = MagicMock(return_value=21.5)
+    entity.async_on_remove = MagicMock()
+
+    with patch.object(Entity, "async_added_to_hass", AsyncMock()):
+        await entity.async_added_to_hass()
+
+    assert entity.available is True
+    entity.coordinator.read_slot.assert_called_once_with(7)
+    entity.coordinator.get_value.assert_not_called()
@@ -33,6 +33,7 @@ from custom_components.stiebel_eltron_isg import (
     switch,
 )
 from custom_components.stiebel_eltron_isg.const import UNIT_ID
+from custom_components.stiebel_eltron_isg.polling import components_read_by
 
 WPM = "wpm"
 WPM_3I = "wpm_3i"
@@ -80,6 +81,10 @@ _DESCRIPTION_LISTS: list[tuple[str, str, list[Any]]] = [
     ("ENERGY_DAILY_SENSOR_TYPES", WPM, sensor.ENERGY_DAILY_SENSOR_TYPES),
     ("ENERGY_DAILY_SENSOR_TYPES", WPM_3I, sensor.ENERGY_DAILY_SENSOR_TYPES),
     ("LWZ_ENERGY_DAILY_SENSOR_TYPES", LWZ, sensor.LWZ_ENERGY_DAILY_SENSOR_TYPES),
+    # Every model, they report on the coordinator rather than the controller.
+    ("INSTRUMENTATION_SENSOR_TYPES", WPM, sensor.INSTRUMENTATION_SENSOR_TYPES),
+    ("INSTRUMENTATION_SENSOR_TYPES", WPM_3I, sensor.INSTRUMENTATION_SENSOR_TYPES),
+    ("INSTRUMENTATION_SENSOR_TYPES", LWZ, sensor.INSTRUMENTATION_SENSOR_TYPES),
     ("WPM_BINARY_SENSOR_TYPES", WPM, binary_sensor.WPM_BINARY_SENSOR_TYPES),
     ("WPM_3I_BINARY_SENSOR_TYPES", WPM_3I, binary_sensor.WPM_3I_BINARY_SENSOR_TYPES),
     ("LWZ_BINARY_SENSOR_TYPES", LWZ, binary_sensor.LWZ_BINARY_SENSOR_TYPES),
@@ -241,6 +246,18 @@ def test_description_accessor_resolves(model: str, accessor: Any) -> None:
     accessor(_api(model))
 
 
+@pytest.mark.parametrize(("model", "accessor"), _accessor_cases())
+def test_description_accessor_names_its_component(model: str, accessor: Any) -> None:
+    """The coordinator must see which component every accessor reads.
+
+    An accessor it cannot resolve makes it poll every component again.
+    """
+    components = components_read_by(accessor)
+
+    assert components is not None
+    assert all(hasattr(_api(model), component) for component in components)
+
+
 @pytest.mark.parametrize(("model", "component", "field"), _write_field_cases())
 def test_description_write_field_resolves(
     model: str, component: str, field: str
@@ -8,7 +8,7 @@ found because a user had the sensor.
 
 The recorded set below is therefore compared against the current one on every
 run. A key that disappears has to be translated in
-``migration._RENAMED_KEYS``, so that existing installations follow the rename
+``const.RENAMED_KEYS``, so that existing installations follow the rename
 instead of losing the entity.
 """
 
@@ -25,7 +25,7 @@ from custom_components.stiebel_eltron_isg import (
     sensor,
     switch,
 )
-from custom_components.stiebel_eltron_isg.migration import _RENAMED_KEYS
+from custom_components.stiebel_eltron_isg.const import RENAMED_KEYS
 
 _PLATFORM_MODULES = (binary_sensor, button, climate, number, select, sensor, switch)
 
@@ -58,11 +58,11 @@ def _recorded_keys() -> set[str]:
 
 def test_no_entity_key_disappears_without_a_migration() -> None:
     """A key that is gone must be translated, or its entity is orphaned."""
-    disappeared = _recorded_keys() - _current_keys() - set(_RENAMED_KEYS)
+    disappeared = _recorded_keys() - _current_keys() - set(RENAMED_KEYS)
     assert not disappeared, (
         f"These entity keys no longer exist: {sorted(disappeared)}. Existing "
         "installations still hold unique ids built from them, so add each one "
-        "to _RENAMED_KEYS in migration.py, pointing at the key that replaces "
+        "to RENAMED_KEYS in const.py, pointing at the key that replaces "
         f"it. {_UPDATE_HINT}"
     )
 
@@ -76,7 +76,7 @@ def test_new_entity_keys_are_recorded() -> None:
 def test_every_renamed_key_points_at_a_key_that_exists() -> None:
     """A translation into a key nobody produces would orphan the entity too."""
     missing = {
-        old: new for old, new in _RENAMED_KEYS.items() if new not in _current_keys()
+        old: new for old, new in RENAMED_KEYS.items() if new not in _current_keys()
     }
     assert not missing, (
         f"These renames point at keys that no entity description produces: {missing}"
@@ -0,0 +1,191 @@
+"""Tests for the high resolution history kept in memory."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron.wpm import WpmSystemState, WpmSystemValues
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stiebel_eltron_isg.const import (
+    ATTR_BUCKETS,
+    ATTR_DURATION,
+    COMPRESSOR_ON,
+    DOMAIN,
+    OUTDOOR_TEMPERATURE,
+    SERVICE_GET_HISTORY,
+)
+from custom_components.stiebel_eltron_isg.entity import build_unique_id
+from custom_components.stiebel_eltron_isg.history import History
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+def test_the_oldest_samples_are_overwritten() -> None:
+    """A full ring keeps the newest samples."""
+    history = History(samples=3)
+    for second in range(5):
+        history.record("system_values", second, [("a.b", second)])
+
+    series = history.series("a.b", 0, 5, 5)
+
+    assert [bucket["min"] for bucket in series] == [2, 3, 4]
+    assert history.fields == ["a.b"]
+
+
+def test_buckets_hold_the_minimum_maximum_and_mean() -> None:
+    """Samples outside the window, or without a value, are left out."""
+    history = History()
+    samples = [(0, 1.0), (10, 3.0), (20, None), (30, 8.0), (50, 4.0), (70, 9.0)]
+    for timestamp, value in samples:
+        history.record("system_values", timestamp, [("a.b", value)])
+
+    series = history.series("a.b", 0, 60, 2)
+
+    assert [
+        (bucket["min"], bucket["max"], bucket["mean"], bucket["samples"])
+        for bucket in series
+    ] == [(1.0, 3.0, 2.0, 2), (4.0, 8.0, 6.0, 2)]
+    assert series[1]["start"] == "1970-01-01T00:00:30+00:00"
+    assert history.series("a.b", 60, 60, 2) == []
+    assert history.series("unknown.field", 0, 60, 2) == []
+
+
+def test_an_energy_counter_is_kept_exactly() -> None:
+    """A counter beyond what single precision holds keeps its last kilowatt hour."""
+    history = History()
+    history.record("energy_data", 0, [("a.total", 16_777_217)])
+
+    (bucket,) = history.series("a.total", 0, 1, 1)
+
+    assert bucket["max"] == 16_777_217
+
+
+def test_the_series_of_a_bit_is_how_often_it_was_set() -> None:
+    """The mean of a status bit is its duty cycle."""
+    history = History()
+    for second, status in enumerate([0b10, 0b11, 0b01, 0b11]):
+        history.record("system_state", second, [("a.status", status)])
+
+    (bucket,) = history.series("a.status", 0, 4, 1, bit=1)
+
+    assert (bucket["min"], bucket["max"], bucket["mean"]) == (0, 1, 0.75)
+
+
+def test_fields_beyond_the_budget_are_not_kept(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The arrays of a component and of one field fill the budget."""
+    history = History(samples=10, budget=8 * 10 + 8 * 10)
+
+    history.record("system_values", 0, [("a.b", 1), ("a.c", 2)])
+    history.record("energy_data", 0, [("d.e", 3)])
+    history.record("system_values", 0, [])
+
+    assert len(history.fields) == 1
+    assert history.nbytes == 160
+    assert caplog.text.count("The history is full") == 1
+
+
+def _entity_id(hass: HomeAssistant, entry: MockConfigEntry, domain: str, key: str):
+    return er.async_get(hass).async_get_entity_id(
+        domain, DOMAIN, build_unique_id(entry, key)
+    )
+
+
+async def _get_history(hass: HomeAssistant, *entity_ids: str, **data):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {ATTR_ENTITY_ID: list(entity_ids), **data},
+        blocking=True,
+        return_response=True,
+    )
+
+
+async def test_the_history_of_entities_is_returned_in_buckets(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Every poll of an entity's component is a sample, bits included."""
+    unit = mock_modbus_connection.for_unit(1)
+    outside = WpmSystemValues(unit).resolved_fields["outside_temperature"]
+    status = WpmSystemState(unit).resolved_fields["operating_status"]
+
+    def report(outside_raw: int, compressor: bool) -> None:
+        unit.load_raw({outside.space: {outside.address: outside_raw & 0xFFFF}})
+        unit.load_raw({status.space: {status.address: compressor << 6}})
+
+    report(-20, True)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    for outside_raw, compressor in [(-20, True), (-40, False), (-30, False)]:
+        report(outside_raw, compressor)
+        freezer.tick(timedelta(minutes=1))
+        await coordinator.async_refresh()
+
+    outdoor = _entity_id(hass, mock_config_entry, "sensor", OUTDOOR_TEMPERATURE)
+    compressor_on = _entity_id(hass, mock_config_entry, "binary_sensor", COMPRESSOR_ON)
+    response = await _get_history(
+        hass,
+        outdoor,
+        compressor_on,
+        **{ATTR_DURATION: {"minutes": 10}, ATTR_BUCKETS: 1},
+    )
+
+    assert response is not None
+    assert response[outdoor]["field"] == "system_values.outside_temperature"
+    (temperatures,) = response[outdoor]["buckets"]
+    assert temperatures["min"] == pytest.approx(-4.0)
+    assert temperatures["max"] == pytest.approx(-2.0)
+    assert response[compressor_on]["field"] == "system_state.operating_status"
+    (compressor,) = response[compressor_on]["buckets"]
+    assert compressor["max"] == 1
+    assert compressor["mean"] < 1
+    # One bucket a minute over the last hour by default, the last one closed.
+    response = await _get_history(hass, outdoor)
+    assert response is not None
+    assert [bucket["samples"] for bucket in response[outdoor]["buckets"]] == [1, 2]
+
+
+async def test_only_loaded_entities_reading_one_field_have_a_history(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Unknown entities, climate entities and unloaded entries are refused."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    registry = er.async_get(hass)
+    climate = next(
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(
+            registry, mock_config_entry.entry_id
+        )
+        if entry.domain == "climate"
+    )
+    outdoor = _entity_id(hass, mock_config_entry, "sensor", OUTDOOR_TEMPERATURE)
+
+    with pytest.raises(ServiceValidationError) as unknown:
+        await _get_history(hass, "sensor.not_a_heat_pump")
+    with pytest.raises(ServiceValidationError) as not_kept:
+        await _get_history(hass, climate)
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    with pytest.raises(ServiceValidationError) as not_loaded:
+        await _get_history(hass, outdoor)
+
+    assert unknown.value.translation_key == "history_unknown_entity"
+    assert not_kept.value.translation_key == "history_not_kept"
+    assert not_loaded.value.translation_key == "history_not_loaded"
@@ -1,11 +1,13 @@
 """Tests for the STIEBEL ELTRON integration."""
 
-from types import SimpleNamespace
+import asyncio
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er, issue_registry as ir
 from modbus_connection import ModbusError, ModbusTimeoutError
 from modbus_connection.mock import MockModbusConnection
@@ -17,9 +19,22 @@ from pystiebeleltron import (
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.stiebel_eltron_isg.const import CURRENT_POWER_CONSUMPTION, DOMAIN
-from custom_components.stiebel_eltron_isg.entity import build_unique_id
-from custom_components.stiebel_eltron_isg.migration import duplicate_entity_issue_id
+import custom_components.stiebel_eltron_isg as integration
+from custom_components.stiebel_eltron_isg import coordinator as coordinator_module
+from custom_components.stiebel_eltron_isg.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MODEL_ID,
+    CONF_POLLING_PROFILE,
+    CURRENT_POWER_CONSUMPTION,
+    DOMAIN,
+)
+from custom_components.stiebel_eltron_isg.entity import (
+    build_unique_id,
+    duplicate_entity_issue_id,
+)
+from custom_components.stiebel_eltron_isg.polling import POLLED_COMPONENTS
 from custom_components.stiebel_eltron_isg.sensor import WPM_SENSOR_TYPES
 from custom_components.stiebel_eltron_isg.wpm3i_coordinator import (
     StiebelEltronModbusWPM3iDataCoordinator,
@@ -55,6 +70,190 @@ async def test_async_setup_entry_selects_wpm_3i_coordinator(
     )
 
 
+async def test_setup_imports_only_the_coordinator_of_the_model(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_get_controller_model: MagicMock,
+) -> None:
+    """A WPM 3i entry has no use for the WPM and LWZ coordinators and APIs."""
+    mock_get_controller_model.return_value = ControllerModel.WPM_3i
+    mock_config_entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.stiebel_eltron_isg._async_import",
+        wraps=integration._async_import,
+    ) as async_import:
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    assert [call.args[1] for call in async_import.call_args_list] == [
+        "wpm3i_coordinator"
+    ]
+
+
+async def test_a_module_not_imported_yet_is_imported_in_the_executor(
+    hass: HomeAssistant,
+) -> None:
+    """Importing runs module code, which must not block the event loop."""
+    name = "custom_components.stiebel_eltron_isg.lwz_coordinator"
+    loaded = sys.modules.pop(name)
+    try:
+        with patch.object(
+            hass,
+            "async_add_import_executor_job",
+            wraps=hass.async_add_import_executor_job,
+        ) as executor_job:
+            module = await integration._async_import(hass, "lwz_coordinator")
+        executor_job.assert_called_once()
+        assert module.__name__ == name
+    finally:
+        sys.modules[name] = loaded
+
+
+async def test_a_migrated_entry_skips_the_migrations(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Ids on the config entry scheme leave the migration module unimported."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+    with patch(
+        "custom_components.stiebel_eltron_isg._async_import",
+        wraps=integration._async_import,
+    ) as async_import:
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    assert "migration" not in [call.args[1] for call in async_import.call_args_list]
+
+
+async def test_a_failed_migration_is_reported_over_a_failed_refresh(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The registry error fails the setup, not the refresh that failed with it."""
+
+    async def migrate(*_args: object) -> None:
+        # Let the first refresh fail before the migration does.
+        await asyncio.sleep(0)
+        raise RuntimeError("registry conflict")
+
+    mock_config_entry.add_to_hass(hass)
+    with (
+        patch.object(
+            coordinator_module.StiebelEltronDataCoordinator,
+            "async_config_entry_first_refresh",
+            side_effect=ConfigEntryNotReady("no answer"),
+        ),
+        patch("custom_components.stiebel_eltron_isg._async_migrate", new=migrate),
+    ):
+        assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
+    assert "registry conflict" in caplog.text
+
+
+async def test_a_stale_duplicate_repair_is_still_resolved(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """The Repair is synced even when no legacy id is left to migrate."""
+    issue_id = duplicate_entity_issue_id(mock_config_entry)
+    ir.async_create_issue(
+        hass,
+        DOMAIN,
+        issue_id,
+        is_fixable=True,
+        is_persistent=True,
+        severity=ir.IssueSeverity.WARNING,
+        translation_key="duplicate_entities",
+        translation_placeholders={"count": "1", "entities": "sensor.duplicate"},
+    )
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    assert ir.async_get(hass).async_get_issue(DOMAIN, issue_id) is None
+
+
+def _entry_with_cached_model(model_id: int) -> MockConfigEntry:
+    """Return a config entry set up before, with the model it detected then."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Stiebel Eltron",
+        data={CONF_HOST: "1.1.1.1", CONF_PORT: 502, CONF_MODEL_ID: model_id},
+        entry_id="stiebel_eltron_001",
+    )
+
+
+async def test_setup_caches_the_detected_model(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """The first setup asks the controller and keeps the answer for restarts."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    assert mock_config_entry.data[CONF_MODEL_ID] == ControllerModel.WPM_3.value
+
+
+async def test_setup_with_a_cached_model_does_not_wait_for_the_controller(
+    hass: HomeAssistant, mock_get_controller_model: MagicMock
+) -> None:
+    """A restart polls with the cached model and checks it in the background."""
+    entry = _entry_with_cached_model(ControllerModel.WPM_3i.value)
+    entry.add_to_hass(hass)
+    answered = asyncio.Event()
+
+    async def slow_model(_unit: object) -> ControllerModel:
+        await answered.wait()
+        return ControllerModel.WPM_3i
+
+    mock_get_controller_model.side_effect = slow_model
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.LOADED
+        assert isinstance(entry.runtime_data, StiebelEltronModbusWPM3iDataCoordinator)
+
+        answered.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_get_controller_model.assert_awaited_once()
+    mock_schedule_reload.assert_not_called()
+
+
+async def test_setup_reloads_when_the_cached_model_is_wrong(
+    hass: HomeAssistant, mock_get_controller_model: MagicMock
+) -> None:
+    """Another controller behind the address is detected anew on the reload."""
+    entry = _entry_with_cached_model(ControllerModel.WPM_3i.value)
+    entry.add_to_hass(hass)
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_schedule_reload.assert_called_once_with(entry.entry_id)
+    assert CONF_MODEL_ID not in entry.data
+
+
+async def test_setup_detects_the_model_if_the_cached_one_is_unknown(
+    hass: HomeAssistant, mock_get_controller_model: MagicMock
+) -> None:
+    """A model id the library no longer knows is not trusted."""
+    entry = _entry_with_cached_model(-1)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+
+    mock_get_controller_model.assert_awaited_once()
+    assert entry.data[CONF_MODEL_ID] == ControllerModel.WPM_3.value
+
+
 async def test_setup_registers_every_wpm_sensor(
     hass: HomeAssistant, mock_config_entry: MockConfigEntry
 ) -> None:
@@ -266,30 +465,18 @@ async def test_async_setup_entry_rejects_unhandled_model(
 ) -> None:
     """A detected model without a coordinator must fail with a repair."""
     assert mock_modbus_connection.connected is True
-    mock_get_controller_model.return_value = SimpleNamespace(name="FUTURE", value=166)
+    mock_get_controller_model.return_value = MagicMock(value=166)
     mock_config_entry.add_to_hass(hass)
 
-    with (
-        patch(
-            "custom_components.stiebel_eltron_isg.async_migrate_device_identifier"
-        ) as migrate_device,
-        patch(
-            "custom_components.stiebel_eltron_isg.async_migrate_unique_ids",
-            new_callable=AsyncMock,
-        ) as migrate_entities,
-        patch(
-            "custom_components.stiebel_eltron_isg."
-            "async_remove_legacy_circulation_pump_switch"
-        ) as remove_legacy,
-    ):
+    with patch(
+        "custom_components.stiebel_eltron_isg._async_migrate", new_callable=AsyncMock
+    ) as migrate:
         result = await hass.config_entries.async_setup(mock_config_entry.entry_id)
 
     assert result is False
     assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
     assert not hasattr(mock_config_entry, "runtime_data")
-    migrate_device.assert_not_called()
-    migrate_entities.assert_not_awaited()
-    remove_legacy.assert_not_called()
+    migrate.assert_not_awaited()
     issue = ir.async_get(hass).async_get_issue(
         DOMAIN, f"unsupported_controller_{mock_config_entry.entry_id}"
     )
@@ -339,7 +526,11 @@ async def test_async_setup_entry_coordinator_update_fails(
     mock_modbus_connection: MockModbusConnection,
 ) -> None:
     """Test setup retries and closes the connection when the first update fails."""
-    mock_wpm_api.async_update.side_effect = ModbusError("update failed")
+    for component in POLLED_COMPONENTS:
+        if hasattr(mock_wpm_api, component):
+            getattr(mock_wpm_api, component).async_update.side_effect = ModbusError(
+                "update failed"
+            )
     mock_config_entry.add_to_hass(hass)
 
     result = await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -349,24 +540,108 @@ async def test_async_setup_entry_coordinator_update_fails(
     assert mock_modbus_connection.connected is False
 
 
-async def test_connection_lost_reloads_entry(
+async def test_connection_lost_reconnects_in_place(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_modbus_connection: MockModbusConnection,
 ) -> None:
-    """Test a lost connection schedules a reload of the config entry."""
+    """Test a lost connection is re-established without reloading the entry."""
     mock_config_entry.add_to_hass(hass)
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
 
     with patch.object(
         hass.config_entries, "async_schedule_reload"
     ) as mock_schedule_reload:
         mock_modbus_connection.simulate_connection_lost()
+        mock_modbus_connection.simulate_connection_lost()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_schedule_reload.assert_not_called()
+    assert mock_modbus_connection.connected is True
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_config_entry.runtime_data is coordinator
+    assert coordinator.poll_state["reconnects"] == 1
+    assert coordinator.poll_state["reconnecting"] is False
+
+
+@pytest.mark.parametrize(
+    "side_effect",
+    [ControllerModel.WPM_3i, UnknownControllerModelError(999)],
+)
+async def test_connection_lost_reloads_entry_for_another_model(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_get_controller_model: MagicMock,
+    mock_modbus_connection: MockModbusConnection,
+    side_effect: object,
+) -> None:
+    """Test a reconnect that finds another controller reloads the entry."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    mock_get_controller_model.side_effect = [side_effect]
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        mock_modbus_connection.simulate_connection_lost()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     mock_schedule_reload.assert_called_once_with(mock_config_entry.entry_id)
 
 
+async def test_reconnect_backs_off_until_the_controller_answers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_get_controller_model: MagicMock,
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Test failed reconnect attempts wait longer each time and keep the entry."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    mock_get_controller_model.side_effect = [StiebelEltronModbusError()]
+    connect = AsyncMock(
+        side_effect=[ModbusTimeoutError("timeout"), ModbusTimeoutError("timeout"), None]
+    )
+
+    with (
+        patch.object(mock_modbus_connection, "connect", connect),
+        patch.object(coordinator_module, "_reconnect_delay", return_value=0) as delay,
+        patch.object(
+            hass.config_entries, "async_schedule_reload"
+        ) as mock_schedule_reload,
+    ):
+        mock_modbus_connection.simulate_connection_lost()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [call.args for call in delay.call_args_list] == [(0,), (1,)]
+    assert connect.await_count == 3
+    mock_schedule_reload.assert_not_called()
+    assert mock_config_entry.runtime_data.poll_state["reconnects"] == 1
+
+
+async def test_reconnect_stops_once_the_connection_is_closed(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Test an unloaded entry does not keep trying to reconnect."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    await mock_modbus_connection.close()
+
+    coordinator.async_connection_lost()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.poll_state["reconnecting"] is False
+    assert coordinator.poll_state["reconnects"] == 0
+
+
 async def test_unload_entry_closes_connection(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -410,3 +685,33 @@ async def test_unload_entry_does_not_close_connection_if_platform_unload_fails(
     # so the deliberately failed unload does not leak resources from the test.
     await mock_config_entry.runtime_data.async_shutdown()
     await mock_modbus_connection.close()
+
+
+async def test_changed_options_apply_without_a_reload(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """The running coordinator polls with new options, the entry stays loaded."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+
+    with patch.object(hass.config_entries, "async_reload") as mock_reload:
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={
+                CONF_SCAN_INTERVAL: 20,
+                CONF_POLLING_PROFILE: "minimal",
+                CONF_ADAPTIVE_POLLING: True,
+                CONF_MIN_SCAN_INTERVAL: 20,
+                CONF_MAX_SCAN_INTERVAL: 600,
+            },
+        )
+        await hass.async_block_till_done()
+
+    mock_reload.assert_not_called()
+    assert mock_config_entry.runtime_data is coordinator
+    assert coordinator.poll_state["ceiling"] == 600
+    assert coordinator.poll_state["components"]["energy_data"] == 600
@@ -0,0 +1,74 @@
+"""Tests for the polling and Modbus traffic instrumentation."""
+
+from modbus_connection import ModbusError
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron.wpm import WpmSystemParameters
+import pytest
+
+from custom_components.stiebel_eltron_isg.instrumentation import (
+    Histogram,
+    Instrumentation,
+    Traffic,
+    count_traffic,
+)
+
+
+def test_histogram_buckets_observations_by_their_upper_bound() -> None:
+    """An observation lands in the first bucket whose bound is not below it."""
+    histogram = Histogram((0.1, 1.0))
+
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(seconds)
+
+    assert histogram.as_dict() == {
+        "count": 4,
+        "sum": 3.65,
+        "mean": 0.9125,
+        "max": 3.0,
+        "last": 3.0,
+        "buckets": {"le_0.1": 2, "le_1.0": 1, "le_inf": 1},
+    }
+
+
+def test_an_empty_histogram_has_no_mean() -> None:
+    """Nothing observed yet must not report a duration of zero."""
+    histogram = Histogram()
+
+    assert histogram.mean is None
+    assert histogram.last is None
+
+
+async def test_counted_unit_counts_requests_registers_and_errors(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Reads and writes are counted by request and by register carried."""
+    traffic = Traffic()
+    unit = mock_modbus_connection.for_unit(1)
+    parameters = WpmSystemParameters(count_traffic(unit, traffic))
+
+    await parameters.async_update()
+    reads, registers_read = traffic.reads, traffic.registers_read
+    assert reads == len(unit.read_events)
+    await parameters.write("comfort_temperature_hk_1", 21.0)
+    unit.fail_requests(ModbusError("timeout"))
+    with pytest.raises(ModbusError):
+        await parameters.async_update()
+
+    assert registers_read > 0
+    assert traffic.bytes_read == 2 * registers_read
+    assert (traffic.writes, traffic.registers_written) == (1, 1)
+    assert traffic.errors == 1
+
+
+def test_instrumentation_reports_the_listeners_woken_per_refresh() -> None:
+    """The diagnostics show the last count and the mean over all refreshes."""
+    instrumentation = Instrumentation(Traffic())
+    instrumentation.observe_notified(4)
+    instrumentation.observe_notified(0)
+    instrumentation.observe_component_read("system_values", 0.02)
+
+    diagnostics = instrumentation.as_dict()
+
+    assert diagnostics["entities_notified"] == 0
+    assert diagnostics["entities_notified_mean"] == 2
+    assert diagnostics["component_read_duration"]["system_values"]["count"] == 1
@@ -14,7 +14,11 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.stiebel_eltron_isg import migration
-from custom_components.stiebel_eltron_isg.const import CIRCULATION_PUMP, DOMAIN
+from custom_components.stiebel_eltron_isg.const import (
+    CIRCULATION_PUMP,
+    DOMAIN,
+    RENAMED_KEYS,
+)
 from custom_components.stiebel_eltron_isg.entity import build_unique_id
 
 # The model the mock_get_controller_model fixture reports, and the display name
@@ -770,10 +774,10 @@ async def test_a_key_renamed_after_the_migration_is_followed(
 
     Once an installation is migrated, every id starts with the config entry id.
     A key renamed after that would never be rewritten if only the legacy
-    schemes were searched, so the entry in _RENAMED_KEYS would do nothing and
+    schemes were searched, so the entry in RENAMED_KEYS would do nothing and
     the entity would be orphaned by the very mechanism meant to prevent it.
     """
-    monkeypatch.setitem(migration._RENAMED_KEYS, "outdoor_temperature_of_old", KEY)
+    monkeypatch.setitem(RENAMED_KEYS, "outdoor_temperature_of_old", KEY)
     config_entry_with_name.add_to_hass(hass)
     already_migrated = _register(
         hass,
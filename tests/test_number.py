@@ -24,6 +24,7 @@ class _StubCoordinator:
     def __init__(self, current: float | None) -> None:
         self._current = current
         self.writes: list[tuple] = []
+        self.expired: list = []
         self.refresh_generation = 0
         self.last_successful_refresh_generation = 0
         self.last_update_success = True
@@ -34,6 +35,18 @@ class _StubCoordinator:
     async def write_component_value(self, component, field, value) -> None:
         self.writes.append((component, field, value))
 
+    def expire_references(self, references) -> None:
+        self.expired.extend(references)
+
+    def is_fresh(self, references) -> bool:
+        return True
+
+    def is_available(self, references) -> bool:
+        return self.last_update_success and self.is_fresh(references)
+
+    def read_since(self, references, generation) -> bool:
+        return self.last_successful_refresh_generation > generation
+
 
 def _make_number(current: float | None) -> StiebelEltronISGNumberEntity:
     entity = StiebelEltronISGNumberEntity.__new__(StiebelEltronISGNumberEntity)
@@ -260,3 +273,24 @@ def test_lwz_fan_level_numbers_resolve_against_the_lwz_api() -> None:
         assert description.write_field == field
         assert (description.native_min_value, description.native_max_value) == (0, 3)
         assert description.native_step == 1
+
+
+async def test_number_stays_subscribed_until_the_device_value_is_back() -> None:
+    """An unchanged device value must still end the assumed value."""
+    entity = _make_number(current=10.0)
+    entity.coordinator.refresh_generation = 1
+    await entity.async_set_native_value(12.0)
+
+    assert entity.coordinator.expired == [entity.modbus_register]
+
+    # A poll that was already in flight does not count, so the entity asks to
+    # be woken by the next one as well, even if the value does not change.
+    entity.coordinator.last_successful_refresh_generation = 1
+    entity._handle_coordinator_update()
+    assert entity.coordinator.expired == [entity.modbus_register] * 2
+
+    entity.coordinator.refresh_generation = 2
+    entity.coordinator.last_successful_refresh_generation = 2
+    entity._handle_coordinator_update()
+    assert entity.coordinator.expired == [entity.modbus_register] * 2
+    assert entity.native_value == 10.0
@@ -0,0 +1,229 @@
+"""Tests for the per-component polling schedule."""
+
+from custom_components.stiebel_eltron_isg.const import (
+    DEFAULT_POLLING_PROFILE,
+    DEFAULT_SCAN_INTERVAL,
+)
+from custom_components.stiebel_eltron_isg.polling import (
+    AdaptiveInterval,
+    PollSchedule,
+    component_poll_intervals,
+    components_read_by,
+)
+from custom_components.stiebel_eltron_isg.references import (
+    ApiField,
+    RegisterBit,
+    operating_status,
+)
+
+
+def test_every_component_is_due_on_the_first_tick() -> None:
+    """A fresh schedule reads everything once before the intervals apply."""
+    schedule = PollSchedule({"fast": 10, "slow": 300})
+
+    assert schedule.due(0) == ["fast", "slow"]
+    assert schedule.is_complete(schedule.due(0))
+    assert schedule.tick_interval == 10
+
+
+def test_only_expired_components_are_due() -> None:
+    """Each component waits for its own interval after it was read."""
+    schedule = PollSchedule({"fast": 10, "slow": 300})
+    schedule.mark_polled(["fast", "slow"], 100)
+
+    assert schedule.due(110) == ["fast"]
+    assert not schedule.is_complete(["fast"])
+    assert schedule.due(400) == ["fast", "slow"]
+
+
+def test_a_requested_refresh_between_ticks_reads_the_fastest_components() -> None:
+    """A refresh must never report the cached values as freshly read."""
+    schedule = PollSchedule({"fast": 10, "also_fast": 10, "slow": 300})
+    schedule.mark_polled(["fast", "also_fast", "slow"], 100)
+
+    assert schedule.due(101) == ["fast", "also_fast"]
+
+
+def test_a_component_due_within_half_a_tick_is_read_early() -> None:
+    """Tick jitter must not push a component to the tick after its interval."""
+    schedule = PollSchedule({"fast": 10, "slow": 20})
+    schedule.mark_polled(["fast", "slow"], 0)
+
+    assert schedule.due(16) == ["fast", "slow"]
+
+
+def test_mark_due_reads_a_component_on_the_next_tick() -> None:
+    """A written component does not wait for its regular interval."""
+    schedule = PollSchedule({"fast": 10, "slow": 900})
+    schedule.mark_polled(["fast", "slow"], 0)
+
+    schedule.mark_due("slow")
+    schedule.mark_due("unknown")
+
+    assert schedule.due(1) == ["slow"]
+    assert schedule.interval("slow") == 900
+
+
+def test_dropped_components_are_no_longer_scheduled() -> None:
+    """A component the controller refuses leaves the schedule for good."""
+    schedule = PollSchedule({"fast": 10, "optional": 60})
+
+    schedule.drop("optional")
+    schedule.mark_polled(["optional"], 0)
+
+    assert schedule.components == ("fast",)
+    assert schedule.due(0) == ["fast"]
+
+
+def test_an_empty_schedule_has_no_tick_interval() -> None:
+    """Without scheduled components the coordinator falls back to its default."""
+    schedule = PollSchedule({})
+
+    assert schedule.tick_interval is None
+    assert schedule.due(0) == []
+    assert schedule.is_complete([])
+
+
+def test_a_new_tick_interval_moves_the_fastest_components_only() -> None:
+    """The slow components keep their interval unless the tick outgrows it."""
+    schedule = PollSchedule({"fast": 10, "medium": 60, "slow": 300})
+    schedule.mark_polled(["fast", "medium", "slow"], 0)
+
+    schedule.set_tick_interval(5)
+    assert schedule.due(5) == ["fast"]
+    assert schedule.tick_interval == 5
+    assert schedule.base_tick_interval == 10
+
+    schedule.set_tick_interval(120)
+    assert [schedule.interval(c) for c in schedule.components] == [120, 120, 300]
+
+
+def test_the_adaptive_interval_drops_to_the_floor_while_active() -> None:
+    """Any active signal polls at the floor and names itself as the reason."""
+    adaptive = AdaptiveInterval(10, 5, 60)
+
+    assert adaptive.update(["is_heating", "compressor_on"]) == 5
+    assert adaptive.reason == "active: compressor_on, is_heating"
+
+
+def test_the_adaptive_interval_backs_off_to_the_ceiling_while_idle() -> None:
+    """Idle ticks start at the base interval and double up to the ceiling."""
+    adaptive = AdaptiveInterval(10, 5, 60)
+    adaptive.update(["compressor_on"])
+
+    assert [adaptive.update([]) for _ in range(5)] == [10, 20, 40, 60, 60]
+    assert adaptive.reason == "idle, at ceiling"
+    assert adaptive.update(["compressor_on"]) == 5
+
+
+def test_the_adaptive_interval_keeps_the_base_without_activity_data() -> None:
+    """An unreadable status must neither speed up nor back off the polling."""
+    adaptive = AdaptiveInterval(10, 5, 60)
+    adaptive.update([])
+
+    assert adaptive.update(None) == 10
+    assert adaptive.reason == "no activity data"
+
+
+def test_adaptive_bounds_always_include_the_base_interval() -> None:
+    """A misconfigured floor or ceiling cannot cut off the base interval."""
+    adaptive = AdaptiveInterval(10, 30, 5)
+
+    assert (adaptive.floor, adaptive.ceiling) == (10, 10)
+
+
+def test_profiles_scale_the_component_intervals_by_the_base_interval() -> None:
+    """A profile sets each interval as a multiple of the base interval."""
+    balanced = component_poll_intervals(10, "balanced")
+    minimal = component_poll_intervals(20, "minimal")
+
+    assert balanced["system_values"] == 10
+    assert balanced["energy_data"] == 100
+    assert minimal["system_values"] == 20
+    assert minimal["system_parameters"] == 2400
+    assert component_poll_intervals(10, "unknown") == balanced
+
+
+def test_the_default_profile_polls_at_the_component_intervals() -> None:
+    """The counters are read every 5 minutes and the setpoints every 15."""
+    assert component_poll_intervals(DEFAULT_SCAN_INTERVAL, DEFAULT_POLLING_PROFILE) == {
+        "system_values": 30,
+        "system_state": 30,
+        "energy_management_settings": 60,
+        "energy_system_information": 60,
+        "extended_energy_data": 60,
+        "extended_energy_management_settings": 60,
+        "extended_energy_system_information": 60,
+        "energy_data": 300,
+        "system_parameters": 900,
+        "extended_system_parameters": 900,
+    }
+
+
+def test_reconfigure_keeps_dropped_components_out_and_the_read_times() -> None:
+    """New intervals count from the last read and cannot revive a component."""
+    schedule = PollSchedule({"fast": 10, "slow": 300, "optional": 60})
+    schedule.drop("optional")
+    schedule.mark_polled(["fast", "slow"], 0)
+
+    schedule.reconfigure({"fast": 20, "slow": 30, "optional": 20})
+
+    assert schedule.components == ("fast", "slow")
+    assert schedule.due(25) == ["fast", "slow"]
+
+
+def test_unwanted_components_are_not_read() -> None:
+    """Only the components someone reads are due, even on a requested refresh."""
+    schedule = PollSchedule({"fast": 10, "medium": 60, "slow": 300})
+
+    assert schedule.due(0, {"fast", "slow"}) == ["fast", "slow"]
+    schedule.mark_polled(["fast", "slow"], 0)
+    assert schedule.due(1, {"fast", "slow"}) == ["fast"]
+    assert schedule.due(1, {"slow"}) == []
+
+
+def test_accessors_resolve_to_the_components_they_read() -> None:
+    """Fields, repeated fields and status bits name their component."""
+    assert components_read_by(lambda api: api.energy_data.total) == {"energy_data"}
+    assert components_read_by(
+        lambda api: api.system_values.room_temperatures[1].relative_humidity
+    ) == {"system_values"}
+    assert components_read_by(RegisterBit(operating_status, 3)) == {"system_state"}
+
+
+def test_api_fields_name_their_component_without_a_probe() -> None:
+    """A field of anything but a polled component is as unknown as a lambda's."""
+    assert components_read_by(ApiField("energy_data.total")) == {"energy_data"}
+    assert components_read_by(
+        RegisterBit(ApiField("system_state.operating_status"), 1)
+    ) == {"system_state"}
+    assert components_read_by(ApiField("client.host")) is None
+
+
+def test_accessors_the_probe_cannot_follow_are_unknown() -> None:
+    """An API method or a calculation must not hide the components it reads."""
+    assert components_read_by(lambda api: api.get_current_temp()) is None
+    assert components_read_by(lambda api: api.energy_data.total * 2) is None
+    assert components_read_by(lambda api: api.client) is None
+
+
+def test_components_go_stale_after_several_missed_intervals() -> None:
+    """Staleness counts in each component's own interval, never-read included."""
+    schedule = PollSchedule({"fast": 10, "slow": 300})
+    assert schedule.stale(0, 3) == {"fast", "slow"}
+    assert schedule.age("fast", 0) is None
+
+    schedule.mark_polled(["fast", "slow"], 100)
+
+    assert schedule.age("fast", 135) == 35
+    assert schedule.stale(130, 3) == set()
+    assert schedule.stale(135, 3) == {"fast"}
+
+
+def test_a_fixed_interval_ignores_the_activity() -> None:
+    """Without adaptive polling the tick keeps the base interval."""
+    adaptive = AdaptiveInterval(30, 5, 60, adaptive=False)
+
+    assert adaptive.update(["compressor_on"]) == 30
+    assert adaptive.update([]) == 30
+    assert (adaptive.floor, adaptive.ceiling, adaptive.reason) == (30, 30, "fixed")
@@ -0,0 +1,294 @@
+"""Tests for the connection shared by the entries of one ISG."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from modbus_connection import ModbusConnectionError
+from modbus_connection.mock import MockModbusConnection
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stiebel_eltron_isg import instrumentation
+from custom_components.stiebel_eltron_isg.const import DOMAIN
+from custom_components.stiebel_eltron_isg.instrumentation import Traffic, count_traffic
+from custom_components.stiebel_eltron_isg.pool import (
+    ConnectionPool,
+    RequestScheduler,
+    _spread,
+    connection_pool,
+    interactive,
+    wrapped_unit,
+)
+
+ADDRESS = ("1.1.1.1", 502)
+
+
+async def _connected() -> MockModbusConnection:
+    connection = MockModbusConnection()
+    await connection.connect()
+    return connection
+
+
+def _entry(entry_id: str, port: int = 502) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=entry_id,
+        data={CONF_HOST: "1.1.1.1", CONF_PORT: port},
+        entry_id=entry_id,
+    )
+
+
+async def test_entries_of_one_isg_share_its_connection(
+    hass: HomeAssistant,
+    mock_connect_tcp: AsyncMock,
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """The second entry reuses the connection, which closes with the last one."""
+    first, second = _entry("first"), _entry("second")
+    for entry in (first, second):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    mock_connect_tcp.assert_awaited_once()
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert mock_modbus_connection.connected
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert not mock_modbus_connection.connected
+
+
+async def test_another_port_gets_a_connection_of_its_own(
+    hass: HomeAssistant, mock_connect_tcp: AsyncMock
+) -> None:
+    """Only the entries of the same host and port share a connection."""
+    connections = [await _connected(), await _connected()]
+    mock_connect_tcp.side_effect = connections
+    for entry in (_entry("first"), _entry("second", port=503)):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    assert mock_connect_tcp.await_count == 2
+    assert [
+        hass.config_entries.async_get_entry(
+            entry_id
+        ).runtime_data._connection._connection
+        for entry_id in ("first", "second")
+    ] == connections
+
+
+async def test_concurrent_entries_connect_once() -> None:
+    """An entry that asks while another connects waits for that connection."""
+    pool = ConnectionPool()
+    connection = await _connected()
+    connect = AsyncMock(return_value=connection)
+
+    first, second = await asyncio.gather(
+        pool.async_acquire("first", ADDRESS, connect),
+        pool.async_acquire("second", ADDRESS, connect),
+    )
+
+    assert first is second
+    connect.assert_awaited_once()
+
+
+async def test_a_failed_connect_is_tried_again() -> None:
+    """A connection that could not be established is not kept."""
+    pool = ConnectionPool()
+    connect = AsyncMock(side_effect=[ModbusConnectionError("down"), await _connected()])
+
+    with pytest.raises(ModbusConnectionError):
+        await pool.async_acquire("first", ADDRESS, connect)
+    await pool.async_acquire("first", ADDRESS, connect)
+
+    assert connect.await_count == 2
+
+
+async def test_releasing_an_unknown_entry_does_nothing() -> None:
+    """An entry that never got a connection has nothing to let go of."""
+    await ConnectionPool().async_release("unknown")
+
+
+class _SlowUnit:
+    """Answer reads once released, counting the reads under way."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        await self.release.wait()
+        self.in_flight -= 1
+        return [0] * count
+
+
+async def test_requests_to_one_host_wait_their_turn() -> None:
+    """The entries of one ISG send one request at a time, not at once."""
+    pool = ConnectionPool()
+    unit = _SlowUnit()
+    connection = AsyncMock(for_unit=lambda _unit_id: unit)
+    shared = await pool.async_acquire(
+        "first", ADDRESS, AsyncMock(return_value=connection)
+    )
+    first, second = shared.for_unit(1), shared.for_unit(1)
+
+    reads = asyncio.gather(
+        first.read_input_registers(0, 2), second.read_input_registers(2, 2)
+    )
+    await asyncio.sleep(0)
+    unit.release.set()
+
+    assert await reads == [[0, 0], [0, 0]]
+    assert unit.most_in_flight == 1
+
+
+async def test_a_wrapped_unit_does_not_time_the_wait_for_the_host(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The wrapper sees a request once it is sent, not while it waits its turn."""
+    pool = ConnectionPool()
+    unit = _SlowUnit()
+    connection = AsyncMock(for_unit=lambda _unit_id: unit)
+    shared = await pool.async_acquire(
+        "first", ADDRESS, AsyncMock(return_value=connection)
+    )
+    traffic = Traffic()
+    counted = wrapped_unit(shared, 1, lambda unit: count_traffic(unit, traffic))
+    clock = [0.0]
+    monkeypatch.setattr(instrumentation, "monotonic", lambda: clock[0])
+
+    reads = asyncio.gather(
+        shared.for_unit(1).read_input_registers(0, 2),
+        counted.read_input_registers(2, 2),
+    )
+    await asyncio.sleep(0)
+    clock[0] = 5.0
+    unit.release.set()
+    await reads
+
+    assert traffic.reads == 1
+    assert traffic.read_seconds == 0
+
+
+async def test_every_register_and_coil_request_is_limited() -> None:
+    """Writes wait like reads, and everything else is passed on."""
+    pool = ConnectionPool()
+    connection = await _connected()
+    shared = await pool.async_acquire(
+        "first", ADDRESS, AsyncMock(return_value=connection)
+    )
+    unit = shared.for_unit(1)
+
+    await unit.write_register(1, 5)
+    await unit.write_registers(2, [6, 7])
+    await unit.write_coil(3, True)
+    await unit.write_coils(4, [True, False])
+
+    assert await unit.read_holding_registers(1, 3) == [5, 6, 7]
+    assert await unit.read_input_registers(1, 1) == [0]
+    assert await unit.read_coils(3, 3) == [True, True, False]
+    assert await unit.read_discrete_inputs(1, 1) == [False]
+    assert unit.connected
+    assert shared.connected
+
+
+async def _request(
+    scheduler: RequestScheduler, name: str, sent: list[str], *, user: bool = False
+) -> None:
+    """Send a request named ``name`` once it is its turn."""
+    if user:
+        with interactive():
+            async with scheduler:
+                sent.append(name)
+        return
+    async with scheduler:
+        sent.append(name)
+
+
+async def test_interactive_requests_go_ahead_of_polling() -> None:
+    """A write waits for the read under way, not for the rest of the poll."""
+    scheduler = RequestScheduler(1)
+    sent: list[str] = []
+    async with scheduler:
+        requests = [
+            asyncio.create_task(_request(scheduler, "poll 1", sent)),
+            asyncio.create_task(_request(scheduler, "poll 2", sent)),
+            asyncio.create_task(_request(scheduler, "write 1", sent, user=True)),
+            asyncio.create_task(_request(scheduler, "write 2", sent, user=True)),
+        ]
+        await asyncio.sleep(0)
+    await asyncio.gather(*requests)
+
+    assert sent == ["write 1", "write 2", "poll 1", "poll 2"]
+
+
+async def test_a_cancelled_request_gives_up_its_turn() -> None:
+    """Neither a request cancelled while waiting nor one cancelled on its turn blocks."""
+    scheduler = RequestScheduler(1)
+    sent: list[str] = []
+    async with scheduler:
+        waiting = asyncio.create_task(_request(scheduler, "waiting", sent))
+        handed = asyncio.create_task(_request(scheduler, "handed", sent))
+        last = asyncio.create_task(_request(scheduler, "last", sent))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.sleep(0)
+    # The turn went to ``handed``, which is cancelled before it could take it.
+    handed.cancel()
+    await last
+
+    assert sent == ["last"]
+    assert handed.cancelled()
+    async with scheduler:
+        pass
+
+
+def test_refresh_offsets_keep_their_slot_and_fill_the_largest_gap() -> None:
+    """Entries start their refreshes apart, and a freed slot is taken again."""
+    pool = ConnectionPool()
+    offsets = [pool.refresh_offset(entry) for entry in ("a", "b", "c")]
+
+    assert offsets == [0, 0.5, 0.25]
+    assert pool.refresh_offset("a") == offsets[0]
+
+
+async def test_a_released_entry_frees_its_refresh_slot() -> None:
+    """The next entry takes the slot an unloaded one left."""
+    pool = ConnectionPool()
+    pool.refresh_offset("a")
+    offset = pool.refresh_offset("b")
+    await pool.async_release("b")
+
+    assert pool.refresh_offset("c") == offset
+
+
+def test_spread_halves_the_gaps() -> None:
+    """The fractions handed out never move, every new one splits a gap."""
+    assert [_spread(slot) for slot in range(6)] == [0, 0.5, 0.25, 0.75, 0.125, 0.625]
+
+
+async def test_the_pool_is_kept_for_the_integration(hass: HomeAssistant) -> None:
+    """Every entry finds the same pool."""
+    assert connection_pool(hass) is connection_pool(hass)
+
+
+async def test_setup_staggers_the_refresh_of_the_entry(
+    hass: HomeAssistant,
+) -> None:
+    """The first tick of an entry is delayed by its share of the interval."""
+    first, second = _entry("first"), _entry("second")
+    for entry in (first, second):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    assert first.runtime_data.update_interval == timedelta(seconds=30)
+    assert second.runtime_data.update_interval == timedelta(seconds=45)
+
+    # Every later tick follows the one before by the interval.
+    await second.runtime_data.async_refresh()
+    assert second.runtime_data.update_interval == timedelta(seconds=30)
@@ -0,0 +1,278 @@
+"""Tests for the recording of the polled values and its reader."""
+
+from datetime import UTC, datetime, timedelta
+import json
+from pathlib import Path
+import sys
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron.wpm import WpmEnergyData
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.stiebel_eltron_isg.const import (
+    CONF_RECORD_SNAPSHOTS,
+    DOMAIN,
+    RECORDING_FLUSH_INTERVAL,
+)
+from custom_components.stiebel_eltron_isg.recorder import SnapshotRecorder
+from custom_components.stiebel_eltron_isg.recording import (
+    MAGIC,
+    Encoder,
+    append,
+    read_file,
+    read_recording,
+)
+from scripts import read_recording as reader_script
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+def _write(path: Path, samples: list[tuple[float, dict]]) -> None:
+    encoder = Encoder()
+    data = encoder.start()
+    for timestamp, values in samples:
+        data += encoder.encode(timestamp, values.items())
+    append(path, [(True, data)], backups=2)
+
+
+def _file_names(directory: Path) -> list[str]:
+    return sorted(file.name for file in directory.iterdir())
+
+
+def test_samples_are_read_back_with_their_kinds(tmp_path: Path) -> None:
+    """Unchanged values are carried forward, missing values read as None."""
+    path = tmp_path / "entry.rec"
+    _write(
+        path,
+        [
+            (0, {"a.int": 3, "a.float": 1.5, "a.bool": True, "a.none": None}),
+            (60, {"a.int": 3, "a.float": 2.5, "a.bool": False, "a.none": None}),
+            (120, {"a.int": None, "a.float": 7, "a.bool": False, "a.none": 1.0}),
+        ],
+    )
+
+    samples = list(read_file(path))
+
+    assert [read_at for read_at, _ in samples] == [
+        datetime(1970, 1, 1, minute=minute, tzinfo=UTC) for minute in (0, 1, 2)
+    ]
+    assert samples[0][1] == {
+        "a.int": 3,
+        "a.float": 1.5,
+        "a.bool": True,
+        "a.none": None,
+    }
+    assert samples[1][1]["a.float"] == 2.5
+    assert samples[1][1]["a.bool"] is False
+    # A field whose values change kind is described again.
+    assert samples[2][1] == {
+        "a.int": None,
+        "a.float": 7,
+        "a.bool": False,
+        "a.none": 1.0,
+    }
+    assert isinstance(samples[2][1]["a.float"], int)
+
+
+def test_a_sample_holds_only_the_changed_values() -> None:
+    """A value is written once for as long as it does not change."""
+    encoder = Encoder()
+    encoder.start()
+    first = encoder.encode(0, [("a.b", 1.0), ("a.c", 2.0)])
+    unchanged = encoder.encode(1, [("a.b", 1.0), ("a.c", 2.0)])
+
+    assert len(unchanged) < len(first)
+    assert len(unchanged) == 1 + 8 + 2
+
+
+def test_files_are_rotated_and_read_oldest_first(tmp_path: Path) -> None:
+    """Only the newest backups are kept, and read before the current file."""
+    path = tmp_path / "entry.rec"
+    for minute in range(4):
+        _write(path, [(minute * 60, {"a.b": minute})])
+
+    assert _file_names(tmp_path) == [
+        "entry.rec",
+        "entry.rec.1",
+        "entry.rec.2",
+    ]
+    assert [values["a.b"] for _, values in read_recording(path)] == [1, 2, 3]
+
+    append(path, [(True, MAGIC)], backups=0)
+    assert (tmp_path / "entry.rec").read_bytes() == MAGIC
+
+
+def test_a_record_cut_short_ends_the_file(tmp_path: Path) -> None:
+    """The samples written in full before a crash are read."""
+    path = tmp_path / "entry.rec"
+    _write(path, [(0, {"a.b": 1}), (60, {"a.b": 2})])
+    data = path.read_bytes()
+
+    for size in range(len(data) - 1, len(MAGIC), -1):
+        path.write_bytes(data[:size])
+        assert [values["a.b"] for _, values in read_file(path)] in ([], [1])
+
+
+def test_a_file_that_is_not_a_recording_is_refused(tmp_path: Path) -> None:
+    """Neither another file nor an unknown record is read as samples."""
+    path = tmp_path / "entry.rec"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError, match="not a recording"):
+        list(read_file(path))
+
+    path.write_bytes(MAGIC + b"X")
+    with pytest.raises(ValueError, match="unknown record"):
+        list(read_file(path))
+
+
+def test_the_script_prints_a_json_line_per_sample(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The reader runs without Home Assistant and can pick fields."""
+    path = tmp_path / "entry.rec"
+    _write(path, [(0, {"a.b": 1, "a.c": None}), (60, {"a.b": 2, "a.c": 0.5})])
+
+    monkeypatch.setattr(sys, "argv", ["read_recording.py", str(path)])
+    assert reader_script.main() == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines == [
+        {"time": "1970-01-01T00:00:00+00:00", "a.b": 1, "a.c": None},
+        {"time": "1970-01-01T00:01:00+00:00", "a.b": 2, "a.c": 0.5},
+    ]
+
+    monkeypatch.setattr(sys, "argv", ["read_recording.py", str(path), "--field", "a.c"])
+    assert reader_script.main() == 0
+    assert '"a.b"' not in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["read_recording.py", str(tmp_path / "none")])
+    (tmp_path / "none.1").write_bytes(b"")
+    assert reader_script.main() == 1
+    assert "Cannot read" in capsys.readouterr().err
+
+
+async def test_the_recorder_writes_what_it_buffered_later(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A write covers many polls, and a full file is rotated."""
+    path = tmp_path / DOMAIN / "entry.rec"
+    recorder = SnapshotRecorder(hass, path, max_bytes=200, backups=1)
+    for minute in range(10):
+        recorder.record(minute * 60, [("a.b", float(minute))])
+    assert not path.exists()
+
+    freezer.tick(timedelta(seconds=RECORDING_FLUSH_INTERVAL))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert recorder.path == path
+    assert _file_names(path.parent) == ["entry.rec", "entry.rec.1"]
+    assert [values["a.b"] for _, values in read_recording(path)] == [
+        float(minute) for minute in range(10)
+    ]
+    await recorder.async_flush()
+
+
+async def test_a_recording_that_cannot_be_written_starts_over(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The samples that were lost are not referred to by the next file."""
+    blocker = tmp_path / "blocker"
+    blocker.write_bytes(b"")
+    recorder = SnapshotRecorder(hass, blocker / "entry.rec")
+    recorder.record(0, [("a.b", 1.0)])
+    await recorder.async_flush()
+    assert "Failed to write the recording" in caplog.text
+
+    blocker.unlink()
+    recorder.record(60, [("a.b", 1.0)])
+    await recorder.async_flush()
+
+    assert [values for _, values in read_file(blocker / "entry.rec")] == [{"a.b": 1.0}]
+
+
+async def test_the_option_records_every_poll(
+    hass: HomeAssistant,
+    mock_modbus_connection: MockModbusConnection,
+    tmp_path: Path,
+) -> None:
+    """The recording is written at shutdown, and when the option is turned off."""
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stiebel Eltron",
+        data={"host": "1.1.1.1", "port": 502},
+        options={CONF_RECORD_SNAPSHOTS: True},
+        entry_id="stiebel_eltron_001",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    await coordinator.async_refresh()
+    path = tmp_path / DOMAIN / "stiebel_eltron_001.rec"
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_RECORD_SNAPSHOTS: False}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    samples = list(read_recording(path))
+    assert len(samples) == 2
+    assert "system_values.outside_temperature" in samples[-1][1]
+    await coordinator.async_refresh()
+    assert len(list(read_recording(path))) == 2
+
+    hass.config_entries.async_update_entry(entry, options={CONF_RECORD_SNAPSHOTS: True})
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    # Turning the option on again starts a file, the first one rotated.
+    assert len(list(read_file(path))) >= 1
+    assert len(list(read_recording(path))) == 2 + len(list(read_file(path)))
+
+
+async def test_a_derived_value_is_recorded(
+    hass: HomeAssistant,
+    mock_modbus_connection: MockModbusConnection,
+    tmp_path: Path,
+) -> None:
+    """A day and total counter reads back as the raw data shows it."""
+    unit = mock_modbus_connection.for_unit(1)
+    fields = WpmEnergyData(unit).resolved_fields
+    day, total = fields["vd_heating_day"], fields["vd_heating_total"]
+    unit.load_raw({day.space: {day.address: 12}})
+    unit.load_raw({total.space: {total.address: 3}})
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stiebel Eltron",
+        data={"host": "1.1.1.1", "port": 502},
+        options={CONF_RECORD_SNAPSHOTS: True},
+        entry_id="stiebel_eltron_001",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    raw = coordinator.get_raw_data()["vd_heating_day_and_total"]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    _read_at, values = list(
+        read_recording(tmp_path / DOMAIN / "stiebel_eltron_001.rec")
+    )[-1]
+    assert values["energy_data.vd_heating_day_and_total"] == 15
+    assert raw == "15"
@@ -0,0 +1,68 @@
+"""Tests for the value references the coordinator resolves."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.stiebel_eltron_isg.references import ApiField, RegisterBit
+
+
+def _status(api):
+    return api.status
+
+
+def test_references_to_the_same_bit_are_equal() -> None:
+    """Entities of one bit share a cache slot and a change notification."""
+    assert RegisterBit(_status, 3) == RegisterBit(_status, 3)
+    assert hash(RegisterBit(_status, 3)) == hash(RegisterBit(_status, 3))
+    assert RegisterBit(_status, 3) != RegisterBit(_status, 4)
+
+
+@pytest.mark.parametrize(
+    ("status", "bit", "expected"),
+    [(None, 0, None), (0b0101, 0, 1), (0b0101, 1, 0), (0b0101, 2, 1), (4.0, 2, 1)],
+)
+def test_register_bit_masks_the_register_value(status, bit: int, expected) -> None:
+    """A missing word stays missing, a present one yields 0 or 1."""
+    reference = RegisterBit(_status, bit)
+
+    assert reference(SimpleNamespace(status=status)) == expected
+    assert reference.of(status) == expected
+
+
+def test_an_api_field_reads_its_path() -> None:
+    """Plain fields and the fields of repeating group instances resolve."""
+    api = SimpleNamespace(
+        system_values=SimpleNamespace(
+            outdoor_temperature=4.5,
+            room_temperatures=[
+                SimpleNamespace(relative_humidity=40),
+                SimpleNamespace(relative_humidity=41),
+            ],
+        )
+    )
+    outdoor = ApiField("system_values.outdoor_temperature")
+    humidity = ApiField("system_values.room_temperatures[1].relative_humidity")
+
+    assert outdoor(api) == 4.5
+    assert humidity(api) == 41
+    assert outdoor.component == humidity.component == "system_values"
+
+
+def test_api_fields_of_one_path_are_equal() -> None:
+    """Two descriptions of one field share a cache slot and a change notification."""
+    field = ApiField("energy_data.total")
+
+    assert field == ApiField("energy_data.total")
+    assert hash(field) == hash(ApiField("energy_data.total"))
+    assert field != ApiField("energy_data.today")
+    assert RegisterBit(field, 3) == RegisterBit(ApiField("energy_data.total"), 3)
+
+
+@pytest.mark.parametrize(
+    "path", ["energy_data", "energy_data.", "energy_data[0].total", "api.x-y", ""]
+)
+def test_a_path_without_a_component_field_is_rejected(path: str) -> None:
+    """A typo fails when the description is built, not on every poll."""
+    with pytest.raises(ValueError, match="is not a component field path"):
+        ApiField(path)
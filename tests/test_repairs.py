@@ -14,7 +14,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.stiebel_eltron_isg import repairs
 from custom_components.stiebel_eltron_isg.const import DOMAIN
-from custom_components.stiebel_eltron_isg.migration import duplicate_entity_issue_id
+from custom_components.stiebel_eltron_isg.entity import duplicate_entity_issue_id
 
 MODEL = ControllerModel.WPM_3
 MODEL_NAME = "Stiebel Eltron WPM_3"
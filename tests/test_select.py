@@ -13,6 +13,7 @@ class _StubCoordinator:
     def __init__(self, current: int | None) -> None:
         self._current = current
         self.writes: list[tuple] = []
+        self.expired: list = []
         self.refresh_generation = 0
         self.last_successful_refresh_generation = 0
         self.last_update_success = True
@@ -23,6 +24,18 @@ class _StubCoordinator:
     async def write_component_value(self, component, field, value) -> None:
         self.writes.append((component, field, value))
 
+    def expire_references(self, references) -> None:
+        self.expired.extend(references)
+
+    def is_fresh(self, references) -> bool:
+        return True
+
+    def is_available(self, references) -> bool:
+        return self.last_update_success and self.is_fresh(references)
+
+    def read_since(self, references, generation) -> bool:
+        return self.last_successful_refresh_generation > generation
+
 
 def _make_select(current: int | None) -> StiebelEltronISGSelectEntity:
     entity = StiebelEltronISGSelectEntity.__new__(StiebelEltronISGSelectEntity)
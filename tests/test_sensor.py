@@ -68,19 +68,30 @@ from custom_components.stiebel_eltron_isg.const import (
     TARGET_TEMPERATURE_HK1,
 )
 from custom_components.stiebel_eltron_isg.entity import build_unique_id
+from custom_components.stiebel_eltron_isg.instrumentation import (
+    Instrumentation,
+    Traffic,
+)
 from custom_components.stiebel_eltron_isg.sensor import (
     ENERGY_DAILY_SENSOR_TYPES,
+    INSTRUMENTATION_SENSOR_TYPES,
     LWZ_ENERGY_DAILY_SENSOR_TYPES,
     LWZ_SENSOR_TYPES,
     WPM_3I_SENSOR_TYPES,
     WPM_INVERTER_POWER_SENSOR_TYPES,
     WPM_SENSOR_TYPES,
+    StiebelEltronISGInstrumentationSensor,
     StiebelEltronISGSensor,
     StiebelEltronSensorEntityDescription,
     async_setup_entry,
 )
 
 
+def _add_all(async_add_entities, descriptions, entity) -> None:
+    """Add the entities of every description, as if all were answered."""
+    async_add_entities([entity(description) for description in descriptions])
+
+
 def _wpm(key: str):
     return next(d for d in WPM_SENSOR_TYPES if d.key == key)
 
@@ -224,7 +235,9 @@ def test_sensor_description_rejects_non_callable_register() -> None:
 async def test_setup_uses_wpm_3i_sensor_lists() -> None:
     """WPM 3i receives both its regular and daily energy sensors."""
     entry = SimpleNamespace(
-        runtime_data=SimpleNamespace(model=ControllerModel.WPM_3i),
+        runtime_data=SimpleNamespace(
+            model=ControllerModel.WPM_3i, async_add_answered_entities=_add_all
+        ),
     )
     add_entities = MagicMock()
 
@@ -238,7 +251,7 @@ async def test_setup_uses_wpm_3i_sensor_lists() -> None:
     ):
         await sensor_module.async_setup_entry(None, entry, add_entities)
 
-    entities = add_entities.call_args.args[0]
+    entities = add_entities.call_args_list[0].args[0]
     assert entities == [
         *[("sensor", description.key) for description in WPM_3I_SENSOR_TYPES],
         *[
@@ -525,7 +538,9 @@ async def test_daily_energy_sensors_do_not_report_poll_time_as_reset(
     model, daily_descriptions
 ) -> None:
     """Day registers must not invent a new reset timestamp on each zero poll."""
-    coordinator = SimpleNamespace(model=model, device_info={})
+    coordinator = SimpleNamespace(
+        model=model, device_info={}, async_add_answered_entities=_add_all
+    )
     entry = SimpleNamespace(runtime_data=coordinator, entry_id="test")
     entities = []
 
@@ -685,3 +700,38 @@ def test_inverter_power_stays_out_of_the_shared_lists() -> None:
     """
     for sensor_types in (WPM_SENSOR_TYPES, WPM_3I_SENSOR_TYPES, LWZ_SENSOR_TYPES):
         assert not [d for d in sensor_types if d.key == CURRENT_POWER_CONSUMPTION]
+
+
+@pytest.mark.parametrize(
+    "model", [ControllerModel.WPM_3, ControllerModel.WPM_3i, ControllerModel.LWZ]
+)
+async def test_instrumentation_sensors_report_the_coordinator(model) -> None:
+    """Every model gets the opt-in diagnostics, available while polling fails."""
+    instrumentation = Instrumentation(Traffic(reads=2, registers_read=50))
+    instrumentation.refresh_duration.observe(0.25)
+    coordinator = SimpleNamespace(
+        model=model,
+        device_info={},
+        instrumentation=instrumentation,
+        last_update_success=False,
+        async_add_answered_entities=_add_all,
+    )
+    entry = SimpleNamespace(runtime_data=coordinator, entry_id="test")
+    entities = []
+
+    await async_setup_entry(None, entry, entities.extend)
+
+    sensors = {
+        entity.entity_description.key: entity
+        for entity in entities
+        if isinstance(entity, StiebelEltronISGInstrumentationSensor)
+    }
+    assert list(sensors) == [d.key for d in INSTRUMENTATION_SENSOR_TYPES]
+    assert all(
+        not d.entity_registry_enabled_default for d in INSTRUMENTATION_SENSOR_TYPES
+    )
+    assert sensors["refresh_duration"].native_value == 0.25
+    assert sensors["modbus_bytes_read"].native_value == 100
+    assert sensors["write_duration"].native_value is None
+    assert sensors["modbus_reads"].available
+    assert sensors["modbus_reads"].value_references == ()
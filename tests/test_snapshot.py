@@ -0,0 +1,302 @@
+"""Tests for the register snapshot restored after a restart."""
+
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from modbus_connection import ModbusError
+from modbus_connection.mock import MockModbusConnection
+from pystiebeleltron.wpm import WpmSystemValues
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.stiebel_eltron_isg.const import (
+    ATTR_SNAPSHOT_READ_AT,
+    DOMAIN,
+    OUTDOOR_TEMPERATURE,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    STALE_AFTER_INTERVALS,
+)
+from custom_components.stiebel_eltron_isg.entity import build_unique_id
+from custom_components.stiebel_eltron_isg.snapshot import (
+    RegisterImage,
+    SnapshotStore,
+    record_registers,
+    snapshot_unit,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_wpm_api() -> None:
+    """Use the real WPM API on the in-memory connection."""
+
+
+def _outside_temperature(connection: MockModbusConnection, raw: int) -> None:
+    """Let the controller report the outside temperature in tenths of °C."""
+    unit = connection.for_unit(1)
+    resolved = WpmSystemValues(unit).resolved_fields["outside_temperature"]
+    unit.load_raw({resolved.space: {resolved.address: raw}})
+
+
+async def _connected() -> MockModbusConnection:
+    """Return a new in-memory connection, as unloading closes the last one."""
+    connection = MockModbusConnection()
+    await connection.connect()
+    return connection
+
+
+async def test_recorded_registers_restore_a_component(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """A component decodes from the recorded registers as it did from the device."""
+    _outside_temperature(mock_modbus_connection, 123)
+    image = RegisterImage()
+    live = WpmSystemValues(record_registers(mock_modbus_connection.for_unit(1), image))
+    await live.async_update()
+
+    restored = WpmSystemValues(snapshot_unit(image.registers))
+    await restored.async_update()
+
+    assert restored.outside_temperature == live.outside_temperature == 12.3
+
+
+async def test_every_register_space_is_recorded_and_served(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Coils and discrete inputs are kept alongside the registers."""
+    mock_modbus_connection.for_unit(1).load_raw({
+        "holding": {10: 7},
+        "input": {20: 8},
+        "coil": {30: True},
+        "discrete": {40: True},
+    })
+    image = RegisterImage()
+    unit = record_registers(mock_modbus_connection.for_unit(1), image)
+
+    await unit.read_holding_registers(10, 1)
+    await unit.read_input_registers(20, 1)
+    await unit.read_coils(30, 2)
+    await unit.read_discrete_inputs(40, 1)
+
+    assert unit.connected
+    snapshot = snapshot_unit(image.registers)
+    assert await snapshot.read_holding_registers(10, 1) == [7]
+    assert await snapshot.read_input_registers(20, 1) == [8]
+    assert await snapshot.read_coils(30, 2) == [True, False]
+    assert await snapshot.read_discrete_inputs(40, 1) == [True]
+
+
+async def test_a_component_missing_a_register_is_not_restored() -> None:
+    """A snapshot without every register of a component fails its read."""
+    with pytest.raises(ModbusError, match="is not in the snapshot"):
+        await WpmSystemValues(snapshot_unit({})).async_update()
+
+
+async def test_the_snapshot_is_saved_and_loaded(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """The registers and read times survive the store, addresses as numbers."""
+    read_at = dt_util.utcnow()
+    image = RegisterImage({"input": {505: 123}, "coil": {3: True}})
+    store = SnapshotStore(hass, mock_config_entry)
+
+    store.schedule_save(390, image, {"system_values": read_at})
+    # A later poll does not postpone the save, which takes the registers as
+    # they are then.
+    image.record("input", 506, [124])
+    store.schedule_save(390, image, {"system_values": read_at})
+    await store.async_flush()
+    snapshot = await SnapshotStore(hass, mock_config_entry).async_load(390)
+
+    assert snapshot is not None
+    assert snapshot.registers == {"input": {505: 123, 506: 124}, "coil": {3: True}}
+    assert snapshot.read_at == {"system_values": read_at}
+
+
+async def test_the_snapshot_of_another_model_is_not_loaded(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Registers of another controller would decode into the wrong values."""
+    store = SnapshotStore(hass, mock_config_entry)
+    store.schedule_save(
+        390, RegisterImage({"input": {505: 1}}), {"x": dt_util.utcnow()}
+    )
+    await store.async_flush()
+
+    assert await store.async_load(391) is None
+
+
+async def test_outdated_reads_are_not_loaded(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Only the components read within the maximum age are restored."""
+    now = dt_util.utcnow()
+    read_at = {
+        "system_values": now,
+        "energy_data": now - timedelta(seconds=SNAPSHOT_MAX_AGE - 60),
+        "system_parameters": now - timedelta(seconds=SNAPSHOT_MAX_AGE + 60),
+    }
+    store = SnapshotStore(hass, mock_config_entry)
+    store.schedule_save(390, RegisterImage({"input": {505: 1}}), read_at)
+    await store.async_flush()
+
+    snapshot = await store.async_load(390)
+    assert snapshot is not None
+    assert set(snapshot.read_at) == {"system_values", "energy_data"}
+
+    freezer.tick(timedelta(seconds=SNAPSHOT_MAX_AGE + 1))
+    assert await store.async_load(390) is None
+
+
+async def _restart_offline(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+    mock_connect_tcp: Any,
+) -> MockModbusConnection:
+    """Poll once, unload, and set the entry up again with the controller offline."""
+    _outside_temperature(mock_modbus_connection, 123)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+    offline = await _connected()
+    offline.for_unit(1).fail_requests(ModbusError("offline"))
+    mock_connect_tcp.return_value = offline
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return offline
+
+
+def _outdoor_temperature_entity(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> str:
+    """Return the entity id of the outdoor temperature sensor."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, build_unique_id(mock_config_entry, OUTDOOR_TEMPERATURE)
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+async def test_restart_shows_the_snapshot_while_the_controller_is_offline(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+    mock_connect_tcp: Any,
+) -> None:
+    """The entities start from the snapshot, marked, until the live values arrive."""
+    offline = await _restart_offline(
+        hass, mock_config_entry, mock_modbus_connection, mock_connect_tcp
+    )
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    coordinator = mock_config_entry.runtime_data
+    assert not coordinator.last_update_success
+    entity_id = _outdoor_temperature_entity(hass, mock_config_entry)
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "12.3"
+    assert ATTR_SNAPSHOT_READ_AT in state.attributes
+    assert "system_values" in coordinator.poll_state["restored"]
+
+    offline.for_unit(1).fail_requests(None)
+    _outside_temperature(offline, 130)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "13.0"
+    assert ATTR_SNAPSHOT_READ_AT not in state.attributes
+    # The components read less often are served from the snapshot until their
+    # turn comes.
+    assert "system_values" not in coordinator.poll_state["restored"]
+
+
+async def test_the_snapshot_goes_unavailable_when_the_controller_stays_offline(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+    mock_connect_tcp: Any,
+) -> None:
+    """A restored value is given up on once it would have gone stale."""
+    await _restart_offline(
+        hass, mock_config_entry, mock_modbus_connection, mock_connect_tcp
+    )
+    coordinator = mock_config_entry.runtime_data
+
+    # The background refresh of the setup was the first failed read.
+    for _ in range(STALE_AFTER_INTERVALS - 1):
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(_outdoor_temperature_entity(hass, mock_config_entry))
+    assert state is not None
+    assert state.state == STATE_UNAVAILABLE
+
+
+async def test_no_snapshot_is_restored_without_one(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """The first setup waits for the first refresh, and fails without it."""
+    mock_modbus_connection.for_unit(1).fail_requests(ModbusError("offline"))
+    mock_config_entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_removing_the_entry_removes_its_snapshot(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A deleted entry leaves no registers behind."""
+    key = f"{DOMAIN}.snapshot.{mock_config_entry.entry_id}"
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert key in hass_storage
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+
+    assert key not in hass_storage
+
+
+async def test_the_snapshot_is_saved_when_home_assistant_stops(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Between saves every quarter hour, a stop saves what was read last."""
+    key = f"{DOMAIN}.snapshot.{mock_config_entry.entry_id}"
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(seconds=SNAPSHOT_SAVE_DELAY - 60))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert "system_values" in hass_storage[key]["data"]["read_at"]
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
@@ -16,10 +16,17 @@ from custom_components.stiebel_eltron_isg.switch import (
 )
 
 
-def _make_switch(key: str, last_update_success: bool) -> StiebelEltronISGSwitch:
+def _make_switch(
+    key: str, last_update_success: bool, fresh: bool = True
+) -> StiebelEltronISGSwitch:
     entity = StiebelEltronISGSwitch.__new__(StiebelEltronISGSwitch)
     entity.entity_description = SimpleNamespace(key=key)
-    entity.coordinator = SimpleNamespace(last_update_success=last_update_success)
+    entity.modbus_register = lambda api: None
+    entity.coordinator = SimpleNamespace(
+        last_update_success=last_update_success,
+        is_fresh=lambda references: fresh,
+        is_available=lambda references: last_update_success and fresh,
+    )
     return entity
 
 
@@ -31,6 +38,14 @@ def test_write_only_switch_unavailable_when_last_update_failed(key: str) -> None
     assert entity.available is False
 
 
+@pytest.mark.parametrize("key", [SG_READY_INPUT_1, SG_READY_INPUT_2])
+def test_write_only_switch_unavailable_when_its_registers_are_stale(key: str) -> None:
+    """A write-only switch follows the staleness of its own component."""
+    entity = _make_switch(key, last_update_success=True, fresh=False)
+
+    assert entity.available is False
+
+
 @pytest.mark.parametrize("key", [SG_READY_INPUT_1, SG_READY_INPUT_2])
 def test_write_only_switch_available_when_update_succeeded(key: str) -> None:
     """With a successful update a write-only switch stays available."""
@@ -62,27 +77,59 @@ def test_switch_state_uses_the_register_value(value, expected: bool) -> None:
     assert entity.is_on is expected
 
 
-@pytest.mark.parametrize(
-    ("method", "value"), [("async_turn_on", 1), ("async_turn_off", 0)]
-)
-async def test_switch_action_writes_and_updates(method: str, value: int) -> None:
-    """Switch actions use the central write path and then refresh their state."""
+def _make_writable_switch(current: int | None) -> StiebelEltronISGSwitch:
     entity = StiebelEltronISGSwitch.__new__(StiebelEltronISGSwitch)
     entity.write_component = "settings"
     entity.write_field = "enabled"
     entity.modbus_register = lambda api: api.value
+    device = SimpleNamespace(value=current)
     entity.coordinator = SimpleNamespace(
-        get_value=lambda accessor: accessor(SimpleNamespace(value=1 - value)),
+        get_value=lambda accessor: accessor(device),
         write_component_value=AsyncMock(),
+        expire_references=lambda references: None,
+        read_since=lambda references, generation: False,
+        refresh_generation=0,
+        last_update_success=True,
+        device=device,
     )
     entity.async_update = AsyncMock()
+    # Written state is pushed to hass, which does not exist in these unit tests.
+    entity.async_write_ha_state = lambda: None
+    return entity
+
+
+@pytest.mark.parametrize(
+    ("method", "value"), [("async_turn_on", 1), ("async_turn_off", 0)]
+)
+async def test_switch_action_writes_and_leaves_the_read_back(
+    method: str, value: int
+) -> None:
+    """Switch actions use the central write path, which reads the state back."""
+    entity = _make_writable_switch(1 - value)
 
     await getattr(entity, method)()
 
     entity.coordinator.write_component_value.assert_awaited_once_with(
         "settings", "enabled", value
     )
-    entity.async_update.assert_awaited_once()
+    entity.async_update.assert_not_awaited()
+
+
+async def test_switch_shows_the_written_state_until_it_is_read_back() -> None:
+    """The toggled state shows at once, the device's own once it was polled."""
+    entity = _make_writable_switch(0)
+
+    await entity.async_turn_on()
+    assert entity.is_on is True
+
+    # A poll that did not read the switch back keeps the written state.
+    entity._handle_coordinator_update()
+    assert entity.is_on is True
+
+    # The controller refused the write and stayed off.
+    entity.coordinator.read_since = lambda references, generation: True
+    entity._handle_coordinator_update()
+    assert entity.is_on is False
 
 
 @pytest.mark.parametrize(
@@ -110,22 +157,15 @@ async def test_switch_skips_write_when_state_is_unchanged(
 
 async def test_switch_writes_when_read_back_is_unknown() -> None:
     """An unknown read-back must not be mistaken for the off state."""
-    entity = StiebelEltronISGSwitch.__new__(StiebelEltronISGSwitch)
-    entity.write_component = "settings"
-    entity.write_field = "enabled"
-    entity.modbus_register = lambda api: api.value
-    entity.coordinator = SimpleNamespace(
-        get_value=lambda accessor: accessor(SimpleNamespace(value=None)),
-        write_component_value=AsyncMock(),
-    )
-    entity.async_update = AsyncMock()
+    entity = _make_writable_switch(None)
 
     await entity.async_turn_off()
 
     entity.coordinator.write_component_value.assert_awaited_once_with(
         "settings", "enabled", 0
     )
-    entity.async_update.assert_awaited_once()
+    # The coordinator reads the written component back, no full refresh.
+    entity.async_update.assert_not_awaited()
 
 
 @pytest.mark.parametrize("method", ["async_turn_on", "async_turn_off"])
@@ -152,7 +192,9 @@ def test_regular_switch_availability_follows_read_back_value(
     entity.modbus_register = lambda api: None
     entity.coordinator = SimpleNamespace(
         last_update_success=True,
-        has_value=lambda _register: has_value,
+        is_fresh=lambda _references: True,
+        is_available=lambda _references: True,
+        get_value=lambda _register: 1 if has_value else None,
     )
 
     assert entity.available is expected
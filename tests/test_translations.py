@@ -40,6 +40,7 @@ from custom_components.stiebel_eltron_isg import (
     sensor,
     switch,
 )
+from custom_components.stiebel_eltron_isg.const import POLLING_PROFILES
 
 _PLATFORM_MODULES = (binary_sensor, button, climate, number, select, sensor, switch)
 
@@ -470,6 +471,30 @@ def test_config_flow_strings_match_runtime_fields() -> None:
     assert "description" in steps["discovery_confirm"]
 
 
+def test_english_options_flow_matches_strings() -> None:
+    """English runtime options-flow strings must carry every declared field."""
+    strings = json.loads(_STRINGS_FILE.read_text(encoding="utf-8"))
+    english = json.loads(_RUNTIME_FILE.read_text(encoding="utf-8"))
+
+    for section in ("options", "selector"):
+        assert _key_tree(english[section]) == _key_tree(strings[section])
+
+
+def test_options_flow_strings_match_runtime_fields() -> None:
+    """Every options field and polling profile must have a label."""
+    strings = json.loads(_STRINGS_FILE.read_text(encoding="utf-8"))
+    step = strings["options"]["step"]["init"]
+    option_fields = {
+        marker.schema for marker in config_flow.STEP_OPTIONS_DATA_SCHEMA.schema
+    }
+
+    assert set(step["data"]) == option_fields
+    assert set(step["data_description"]) == option_fields
+    assert set(strings["selector"]["polling_profile"]["options"]) == set(
+        POLLING_PROFILES
+    )
+
+
 @pytest.mark.parametrize(
     "translation_file",
     sorted(file for file in _TRANSLATIONS_DIR.glob("*.json") if file != _RUNTIME_FILE),
@@ -479,9 +504,9 @@ def test_translation_invents_no_key(translation_file: pathlib.Path) -> None:
     """A language may lag behind, but may not carry keys nothing declares.
 
     Home Assistant falls back to English per key, so a language that is missing
-    recent entries still names its entities, and several of these files are
-    incomplete on purpose. A key English does not have is the other case: it
-    names nothing and marks a rename that was only carried halfway.
+    recent entries would still name its entities. A key English does not have
+    is the other case: it names nothing and marks a rename that was only
+    carried halfway.
     """
     english = _entity_names(_RUNTIME_FILE)
     translated = _entity_names(translation_file)
@@ -496,3 +521,31 @@ def test_translation_invents_no_key(translation_file: pathlib.Path) -> None:
         f"{translation_file.name} has entity keys {_RUNTIME_FILE.name} "
         f"does not: {unknown}"
     )
+
+
+def _key_paths(tree: dict, prefix: str = "") -> set[str]:
+    """Return the dotted path of every string in a translation tree."""
+    paths: set[str] = set()
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            paths |= _key_paths(value, f"{path}.")
+        else:
+            paths.add(path)
+    return paths
+
+
+@pytest.mark.parametrize(
+    "translation_file",
+    sorted(file for file in _TRANSLATIONS_DIR.glob("*.json") if file != _RUNTIME_FILE),
+    ids=lambda file: file.stem,
+)
+def test_translation_has_every_key(translation_file: pathlib.Path) -> None:
+    """Every language carries the keys English does, in English until translated."""
+    english = _key_paths(_load_json(_RUNTIME_FILE))
+    translated = _key_paths(_load_json(translation_file))
+
+    assert sorted(english - translated) == [], (
+        f"{translation_file.name} lacks keys {_RUNTIME_FILE.name} has"
+    )
+    assert sorted(translated - english) == []
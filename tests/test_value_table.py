@@ -0,0 +1,93 @@
+"""Tests for the columns of values the listeners read."""
+
+from custom_components.stiebel_eltron_isg.references import ApiField, RegisterBit
+from custom_components.stiebel_eltron_isg.value_table import ValueTable
+
+OUTDOOR = ApiField("system_values.outside_temperature")
+FLOW = ApiField("system_values.flow_temperature")
+COMFORT = ApiField("system_parameters.comfort_temperature_hk_1")
+
+
+def _components_of(reference) -> frozenset[str] | None:
+    if isinstance(reference, ApiField):
+        return frozenset({reference.component})
+    return None
+
+
+def _table(*references) -> tuple[ValueTable, list[int]]:
+    table = ValueTable(_components_of)
+    return table, [table.add(reference) for reference in references]
+
+
+def test_a_slot_keeps_the_kind_of_its_value() -> None:
+    """Ints, floats and bools read back as what they were, a missing one as None."""
+    table, slots = _table(OUTDOOR, FLOW, COMFORT, RegisterBit(OUTDOOR, 0))
+
+    for slot, value in zip(slots, [21.5, 3, True, None], strict=True):
+        table.store(slot, value)
+
+    values = [table.read(slot) for slot in slots]
+    assert values == [21.5, 3, True, None]
+    assert [type(value) for value in values] == [float, int, bool, type(None)]
+    assert table.find(FLOW) == slots[1]
+    assert table.find(ApiField("system_values.return_temperature")) is None
+    assert len(table) == 4
+
+
+def test_a_read_invalidates_the_slots_of_its_components() -> None:
+    """References of unread components keep their value, unplaced ones do not."""
+    bit = RegisterBit(lambda api: api.status, 0)
+    table, slots = _table(OUTDOOR, COMFORT, bit)
+    for slot in slots:
+        table.store(slot, 1)
+
+    table.invalidate(["system_values"])
+    assert list(table.unread()) == [slots[0], slots[2]]
+    assert table.slots_of(["system_values", "energy_data"]) == {slots[0]}
+
+    for slot in slots:
+        table.store(slot, 1)
+    table.invalidate(None)
+    assert list(table.unread()) == slots
+
+
+def test_only_the_slots_that_changed_are_reported() -> None:
+    """A new slot counts as changed, then only slots whose value differs."""
+    table, slots = _table(*(ApiField(f"system_values.value_{n}") for n in range(9)))
+    for slot in slots:
+        table.store(slot, 20.0)
+    assert table.take_changes() == set(slots)
+    assert table.take_changes() == set()
+
+    table.store(slots[2], 20.5)
+    table.store(slots[7], None)
+    assert table.take_changes() == {slots[2], slots[7]}
+
+    # The same number of another kind is a change too.
+    table.store(slots[2], 20)
+    assert table.take_changes() == {slots[2]}
+
+
+def test_an_expired_slot_is_reported_whatever_it_holds() -> None:
+    """A listener that assumed a value is woken by the next diff."""
+    table, slots = _table(OUTDOOR, FLOW)
+    for slot in slots:
+        table.store(slot, 1.0)
+    table.take_changes()
+
+    table.expire(slots[1])
+    late = table.add(COMFORT)
+    table.expire(late)
+    table.store(late, 2.0)
+
+    assert table.take_changes() == {slots[1], late}
+
+
+def test_the_read_fields_are_named_by_their_path() -> None:
+    """Unresolved and missing values and other accessors are left out."""
+    table, slots = _table(OUTDOOR, FLOW, COMFORT, lambda api: api.value)
+    table.store(slots[0], 4.5)
+    table.store(slots[1], None)
+    table.store(slots[3], 1)
+
+    assert table.read_fields() == {"system_values.outside_temperature": 4.5}
@@ -0,0 +1,92 @@
+"""Tests for the coalescing write queue."""
+
+import asyncio
+
+from modbus_connection import ModbusError
+from modbus_connection.mock import MockModbusConnection, WriteEvent
+from pystiebeleltron.wpm import WpmSystemParameters
+import pytest
+
+from custom_components.stiebel_eltron_isg.write_queue import ComponentWriteQueue
+
+
+def _queue(
+    mock_modbus_connection: MockModbusConnection,
+) -> tuple[ComponentWriteQueue, list[WriteEvent]]:
+    """Return a queue for the WPM parameters and the writes it sends."""
+    unit = mock_modbus_connection.for_unit(1)
+    writes: list[WriteEvent] = []
+    unit.on_write(writes.append)
+    return ComponentWriteQueue(WpmSystemParameters(unit), 0.01), writes
+
+
+async def test_contiguous_fields_are_written_in_one_request(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Neighbouring setpoints written together share a multi-register write."""
+    queue, writes = _queue(mock_modbus_connection)
+
+    await asyncio.gather(
+        queue.write("eco_temperature_hk_1", 19.5),
+        queue.write("comfort_temperature_hk_1", 21.5),
+        queue.write("heating_curve_rise_hk_1", 0.4),
+    )
+
+    assert writes == [WriteEvent("holding", 1501, [215, 195, 40], 0x10)]
+
+
+async def test_the_last_value_of_a_field_wins(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """Repeated writes to a field within the window send only the last value."""
+    queue, writes = _queue(mock_modbus_connection)
+
+    await asyncio.gather(
+        queue.write("comfort_temperature_hk_1", 20.0),
+        queue.write("comfort_temperature_hk_1", 22.0),
+    )
+
+    assert writes == [WriteEvent("holding", 1501, [220], 0x06)]
+
+
+async def test_each_caller_gets_the_outcome_of_its_own_request(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """A failed request fails its callers only, the others still succeed."""
+    queue, writes = _queue(mock_modbus_connection)
+    error = ModbusError("timeout")
+    mock_modbus_connection.for_unit(1).fail_write(1509, error)
+
+    results = await asyncio.gather(
+        queue.write("comfort_temperature_hk_1", 21.5),
+        queue.write("comfort_temperature_dhw", 50.0),
+        return_exceptions=True,
+    )
+
+    assert results == [None, error]
+    assert writes == [WriteEvent("holding", 1501, [215], 0x06)]
+
+
+async def test_an_invalid_value_is_rejected_before_it_is_queued(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """A value outside its range fails its caller and never reaches the window."""
+    queue, writes = _queue(mock_modbus_connection)
+
+    with pytest.raises(ValueError, match="outside the allowed range"):
+        await queue.write("comfort_temperature_hk_1", 99)
+    await queue.write("eco_temperature_hk_1", 19.0)
+
+    assert writes == [WriteEvent("holding", 1502, [190], 0x06)]
+
+
+async def test_writes_after_the_window_are_sent_on_their_own(
+    mock_modbus_connection: MockModbusConnection,
+) -> None:
+    """A write that waits for its result is never held back for a later one."""
+    queue, writes = _queue(mock_modbus_connection)
+
+    await queue.write("comfort_temperature_hk_1", 21.0)
+    await queue.write("eco_temperature_hk_1", 19.0)
+
+    assert [write.address for write in writes] == [1501, 1502]